@@ -6,6 +6,7 @@ the hierarchical .cursorrules coding governance system via Python API and
 MCP tools.
 """
 
+from codomyrmex.agentic_memory.core.embeddings import EmbeddingCache
 from codomyrmex.agentic_memory.core.memory import (
     AgentMemory,
     ConversationMemory,
@@ -16,6 +17,7 @@ from codomyrmex.agentic_memory.core.models import (
     Memory,
     MemoryImportance,
     MemoryType,
+    MergeReport,
     RetrievalResult,
 )
 from codomyrmex.agentic_memory.ki_index import KnowledgeItemIndex
@@ -36,6 +38,7 @@ from codomyrmex.agentic_memory.user_profile import UserProfile
 __all__ = [
     "AgentMemory",
     "ConversationMemory",
+    "EmbeddingCache",
     "InMemoryStore",
     "JSONFileStore",
     "KnowledgeItemIndex",
@@ -43,6 +46,7 @@ __all__ = [
     "Memory",
     "MemoryImportance",
     "MemoryType",
+    "MergeReport",
     "ObsidianMemoryBridge",
     "RetrievalResult",
     "Rule",
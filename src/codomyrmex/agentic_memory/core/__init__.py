@@ -5,6 +5,7 @@ from codomyrmex.agentic_memory.core.consolidation import (
     ConsolidationConfig,
     MemoryConsolidator,
 )
+from codomyrmex.agentic_memory.core.embeddings import EmbeddingCache
 from codomyrmex.agentic_memory.core.ki_index import KnowledgeItemIndex
 from codomyrmex.agentic_memory.core.memory import (
     AgentMemory,
@@ -16,6 +17,7 @@ from codomyrmex.agentic_memory.core.models import (
     Memory,
     MemoryImportance,
     MemoryType,
+    MergeReport,
     RetrievalResult,
 )
 from codomyrmex.agentic_memory.core.sqlite_store import SQLiteStore
@@ -27,6 +29,7 @@ __all__ = [
     "Case",
     "ConsolidationConfig",
     "ConversationMemory",
+    "EmbeddingCache",
     "InMemoryStore",
     "JSONFileStore",
     "KnowledgeItemIndex",
@@ -35,6 +38,7 @@ __all__ = [
     "MemoryConsolidator",
     "MemoryImportance",
     "MemoryType",
+    "MergeReport",
     "RetrievalResult",
     "SQLiteStore",
     "UserProfile",
@@ -0,0 +1,225 @@
+"""Embedding cache and batched Ollama embedder for KI re-ranking.
+
+``KnowledgeMemory.recall`` re-ranks its token-overlap candidates by
+embedding similarity. ``EmbeddingCache`` keeps document vectors keyed by
+``(model, sha256(content))`` in memory and, when given a path, in a SQLite
+table, so a knowledge item is embedded once rather than on every recall.
+``OllamaEmbedder`` sends the query and every uncached document in a single
+``/api/embed`` request (``urllib``), or through ``aiohttp`` for the async
+variant.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import urllib.request
+from array import array
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+
+def content_hash(text: str) -> str:
+    """Cache key for *text* (hex SHA-256)."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    """Cosine similarity of two equal-length vectors."""
+    dot = sum(x * y for x, y in zip(a, b, strict=True))
+    norm_a = sum(x * x for x in a) ** 0.5
+    norm_b = sum(x * x for x in b) ** 0.5
+    return dot / (norm_a * norm_b + 1e-9)
+
+
+class EmbeddingCache:
+    """Content-hash keyed embedding cache, optionally persisted to SQLite.
+
+    Args:
+        db_path: SQLite file for the ``ki_embeddings`` table. ``None`` keeps
+            vectors in memory only (for the lifetime of the cache).
+    """
+
+    def __init__(self, db_path: str | os.PathLike[str] | None = None) -> None:
+        self.db_path = None if db_path is None else str(db_path)
+        self._lock = threading.Lock()
+        self._vectors: dict[tuple[str, str], list[float]] = {}
+        self._conn: sqlite3.Connection | None = None
+        if self.db_path is not None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS ki_embeddings (
+                        model TEXT NOT NULL,
+                        content_hash TEXT NOT NULL,
+                        vector BLOB NOT NULL,
+                        PRIMARY KEY (model, content_hash)
+                    ) WITHOUT ROWID
+                    """
+                )
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._conn is None:
+                return len(self._vectors)
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM ki_embeddings"
+            ).fetchone()
+            return count
+
+    def get_many(self, model: str, hashes: Iterable[str]) -> dict[str, list[float]]:
+        """Return the cached vectors among *hashes*, keyed by hash."""
+        found: dict[str, list[float]] = {}
+        missing: list[str] = []
+        with self._lock:
+            for h in dict.fromkeys(hashes):
+                vector = self._vectors.get((model, h))
+                if vector is None:
+                    missing.append(h)
+                else:
+                    found[h] = vector
+            if self._conn is not None:
+                for start in range(0, len(missing), 500):
+                    chunk = missing[start : start + 500]
+                    marks = ",".join("?" * len(chunk))
+                    for h, blob in self._conn.execute(
+                        "SELECT content_hash, vector FROM ki_embeddings "
+                        f"WHERE model = ? AND content_hash IN ({marks})",
+                        (model, *chunk),
+                    ):
+                        vector = array("d", blob).tolist()
+                        self._vectors[model, h] = vector
+                        found[h] = vector
+        return found
+
+    def put_many(self, model: str, vectors: Mapping[str, Sequence[float]]) -> None:
+        """Store vectors keyed by content hash."""
+        with self._lock:
+            for h, vector in vectors.items():
+                self._vectors[model, h] = list(vector)
+            if self._conn is not None and vectors:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO ki_embeddings "
+                        "(model, content_hash, vector) VALUES (?, ?, ?)",
+                        [
+                            (model, h, array("d", vector).tobytes())
+                            for h, vector in vectors.items()
+                        ],
+                    )
+
+    def close(self) -> None:
+        """Close the SQLite connection, if any."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class OllamaEmbedder:
+    """Batched ``/api/embed`` client with an :class:`EmbeddingCache`.
+
+    Args:
+        model: Ollama embedding model name.
+        cache: Cache for document vectors (a fresh in-memory one if omitted).
+        base_url: Ollama server; defaults to ``$OLLAMA_BASE_URL`` or
+            ``DEFAULT_OLLAMA_URL``.
+        timeout: Request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        model: str = "nomic-embed-text",
+        *,
+        cache: EmbeddingCache | None = None,
+        base_url: str | None = None,
+        timeout: float = 2.0,
+    ) -> None:
+        if base_url is None:
+            from codomyrmex.config_management.defaults import DEFAULT_OLLAMA_URL
+
+            base_url = os.getenv("OLLAMA_BASE_URL", DEFAULT_OLLAMA_URL)
+        self.model = model
+        self.cache = cache if cache is not None else EmbeddingCache()
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def _payload(self, texts: list[str]) -> bytes:
+        return json.dumps({"model": self.model, "input": texts}).encode()
+
+    def _check(self, data: Any, expected: int) -> list[list[float]]:
+        embeddings = data.get("embeddings") if isinstance(data, dict) else None
+        if not isinstance(embeddings, list) or len(embeddings) != expected:
+            raise ValueError(
+                f"/api/embed returned {len(embeddings or [])} vectors for {expected} inputs"
+            )
+        return embeddings
+
+    def _plan(
+        self, query: str, documents: Sequence[str]
+    ) -> tuple[list[str], dict[str, list[float]], list[str]]:
+        hashes = [content_hash(doc) for doc in documents]
+        cached = self.cache.get_many(self.model, hashes)
+        pending = dict.fromkeys(h for h in hashes if h not in cached)
+        by_hash = dict(zip(hashes, documents, strict=True))
+        return hashes, cached, [query, *(by_hash[h] for h in pending)]
+
+    def _finish(
+        self,
+        hashes: list[str],
+        cached: dict[str, list[float]],
+        texts: list[str],
+        vectors: list[list[float]],
+    ) -> tuple[list[float], list[list[float]]]:
+        fresh = {
+            content_hash(text): vector
+            for text, vector in zip(texts[1:], vectors[1:], strict=True)
+        }
+        self.cache.put_many(self.model, fresh)
+        cached.update(fresh)
+        return vectors[0], [cached[h] for h in hashes]
+
+    def embed_with_query(
+        self, query: str, documents: Sequence[str]
+    ) -> tuple[list[float], list[list[float]]]:
+        """Return the query vector and one vector per document.
+
+        Only documents missing from the cache are sent, together with the
+        query, in one request. Query vectors are not cached.
+        """
+        hashes, cached, texts = self._plan(query, documents)
+        request = urllib.request.Request(
+            f"{self.base_url}/api/embed",
+            data=self._payload(texts),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as resp:
+            data = json.loads(resp.read())
+        return self._finish(hashes, cached, texts, self._check(data, len(texts)))
+
+    async def aembed_with_query(
+        self, query: str, documents: Sequence[str]
+    ) -> tuple[list[float], list[list[float]]]:
+        """Async variant of :meth:`embed_with_query` using ``aiohttp``."""
+        import aiohttp
+
+        hashes, cached, texts = self._plan(query, documents)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with (
+            aiohttp.ClientSession(timeout=timeout) as session,
+            session.post(
+                f"{self.base_url}/api/embed",
+                data=self._payload(texts),
+                headers={"Content-Type": "application/json"},
+            ) as response,
+        ):
+            response.raise_for_status()
+            data = await response.json(content_type=None)
+        return self._finish(hashes, cached, texts, self._check(data, len(texts)))
@@ -8,17 +8,28 @@ for turn-based dialogue and factual knowledge respectively.
 
 from __future__ import annotations
 
+import heapq
+import logging
 import time
 import uuid
 from typing import TYPE_CHECKING, Any
 
+from codomyrmex.agentic_memory.core.embeddings import (
+    EmbeddingCache,
+    OllamaEmbedder,
+    cosine,
+)
+from codomyrmex.agentic_memory.core.minhash import candidate_pairs
 from codomyrmex.agentic_memory.core.models import (
     Memory,
     MemoryImportance,
     MemoryType,
+    MergeReport,
     RetrievalResult,
+    combine_scores,
 )
 from codomyrmex.agentic_memory.core.sqlite_store import SQLiteStore
+from codomyrmex.agentic_memory.core.token_index import tokenize
 
 if TYPE_CHECKING:
     from codomyrmex.agentic_memory.core.stores import InMemoryStore
@@ -32,6 +43,8 @@ try:
 except ImportError:
     SentenceTransformer = None
 
+logger = logging.getLogger(__name__)
+
 # ── helpers ──────────────────────────────────────────────────────────
 
 
@@ -131,6 +144,16 @@ class AgentMemory:
         memory_type: MemoryType | None = None,
         min_importance: MemoryImportance | None = None,
     ) -> list[RetrievalResult]:
+        if not query and hasattr(self.store, "list_filtered"):
+            candidates = self.store.list_filtered(
+                memory_type=memory_type, min_importance=min_importance, limit=k
+            )
+            return [self._result(mem, 0.0) for mem in candidates]
+        if query and hasattr(self.store, "token_matches"):
+            return self._indexed_search(
+                query, k=k, memory_type=memory_type, min_importance=min_importance
+            )
+
         candidates = self.store.list_all()
         if memory_type is not None:
             candidates = [m for m in candidates if m.memory_type == memory_type]
@@ -139,24 +162,69 @@ class AgentMemory:
                 m for m in candidates if m.importance.value >= min_importance.value
             ]
 
-        results: list[RetrievalResult] = []
-        for mem in candidates:
-            rel = _relevance(query, mem.content) if query else 0.0
-            rec = _recency_score(mem.created_at)
-            imp = mem.importance.value / 4.0
-            results.append(
-                RetrievalResult(
-                    memory=mem,
-                    relevance_score=rel,
-                    recency_score=rec,
-                    importance_score=imp,
-                )
-            )
+        results = [
+            self._result(mem, _relevance(query, mem.content) if query else 0.0)
+            for mem in candidates
+        ]
+        # If no query, return all (filtered). Otherwise take the top k by score.
+        if not query:
+            return results[:k]
+        return heapq.nlargest(k, results, key=lambda r: r.combined_score)
+
+    @staticmethod
+    def _result(mem: Memory, relevance: float) -> RetrievalResult:
+        return RetrievalResult(
+            memory=mem,
+            relevance_score=relevance,
+            recency_score=_recency_score(mem.created_at),
+            importance_score=mem.importance.value / 4.0,
+        )
 
-        # If no query, return all (filtered). Otherwise sort by score.
-        if query:
-            results.sort(key=lambda r: r.combined_score, reverse=True)
-        return results[:k]
+    def _indexed_search(
+        self,
+        query: str,
+        *,
+        k: int,
+        memory_type: MemoryType | None,
+        min_importance: MemoryImportance | None,
+    ) -> list[RetrievalResult]:
+        """Score only the store's candidate rows, then load the top *k*.
+
+        The candidates are every memory sharing a token with *query* plus the
+        *k* newest per importance level, which always contains the exact
+        top-*k* of a full scan: a memory without token overlap can only beat
+        another one of the same importance by being newer.
+        """
+        q_tokens = tokenize(query)
+        rows = self.store.token_matches(
+            q_tokens,
+            memory_type=memory_type,
+            min_importance=min_importance,
+            recent_per_importance=k,
+        )
+        hits: dict[str, tuple[int, float, int]] = {}
+        for memory_id, count, created_at, importance in rows:
+            if memory_id not in hits or count > hits[memory_id][0]:
+                hits[memory_id] = (count, created_at, importance)
+
+        n_tokens = len(q_tokens) or 1
+        scored = [
+            (
+                combine_scores(
+                    count / n_tokens, _recency_score(created_at), importance / 4.0
+                ),
+                -created_at,
+                memory_id,
+                count / n_tokens,
+            )
+            for memory_id, (count, created_at, importance) in hits.items()
+        ]
+        top = heapq.nlargest(k, scored, key=lambda s: (s[0], s[1]))
+        relevance = {s[2]: s[3] for s in top}
+        return [
+            self._result(mem, relevance[mem.id])
+            for mem in self.store.get_many(list(relevance))
+        ]
 
     # -- forget -------------------------------------------------------
 
@@ -316,8 +384,17 @@ class KnowledgeMemory:
     semantic knowledge items built on top of :class:`AgentMemory`.
     """
 
-    def __init__(self, store: InMemoryStore | None = None) -> None:
+    def __init__(
+        self,
+        store: InMemoryStore | None = None,
+        *,
+        embedding_cache: EmbeddingCache | None = None,
+    ) -> None:
         self._agent = AgentMemory(store)
+        # In-memory unless the caller passes a persistent EmbeddingCache(path)
+        self.embedding_cache = (
+            embedding_cache if embedding_cache is not None else EmbeddingCache()
+        )
 
     def add_fact(
         self,
@@ -396,8 +473,10 @@ class KnowledgeMemory:
         When *use_ollama* is ``True``, attempts to re-rank the initial
         token-overlap candidates using cosine similarity over
         ``nomic-embed-text`` embeddings from the local Ollama server
-        (``http://localhost:11434``).  If Ollama is unreachable or returns an
-        error the method falls back to pure token-overlap ordering silently.
+        (``$OLLAMA_BASE_URL``, default ``http://localhost:11434``). The query
+        and all candidates not yet in :attr:`embedding_cache` are embedded
+        in one ``/api/embed`` request. If Ollama is unreachable or returns an
+        error the method falls back to token-overlap ordering.
 
         Args:
             query: Natural language search string.
@@ -408,71 +487,75 @@ class KnowledgeMemory:
         Returns:
             list of :class:`RetrievalResult` sorted by combined score.
         """
+        base_results = self._candidates(query, k)
+        if not use_ollama or not base_results:
+            return base_results[:k]
+
+        embedder = OllamaEmbedder(ollama_model, cache=self.embedding_cache)
+        try:
+            q_vec, doc_vecs = embedder.embed_with_query(
+                query, [rr.memory.content[:512] for rr in base_results]
+            )
+        except Exception as exc:
+            # Ollama unavailable — fall back to token scoring
+            logger.debug("KI embedding re-rank skipped: %s", exc)
+            return base_results[:k]
+        return self._rerank(base_results, q_vec, doc_vecs, k)
+
+    async def arecall(
+        self,
+        query: str,
+        k: int = 10,
+        *,
+        use_ollama: bool = True,
+        ollama_model: str = "nomic-embed-text",
+    ) -> list[RetrievalResult]:
+        """Async variant of :meth:`recall`; the embed request uses ``aiohttp``."""
+        base_results = self._candidates(query, k)
+        if not use_ollama or not base_results:
+            return base_results[:k]
+
+        embedder = OllamaEmbedder(ollama_model, cache=self.embedding_cache)
+        try:
+            q_vec, doc_vecs = await embedder.aembed_with_query(
+                query, [rr.memory.content[:512] for rr in base_results]
+            )
+        except Exception as exc:
+            logger.debug("KI embedding re-rank skipped: %s", exc)
+            return base_results[:k]
+        return self._rerank(base_results, q_vec, doc_vecs, k)
+
+    def _candidates(self, query: str, k: int) -> list[RetrievalResult]:
         # Phase 1: token-overlap recall (always works, no external deps)
-        base_results = self._agent.recall(
+        return self._agent.recall(
             query,
             k=min(k * 3, 30),
             memory_type=MemoryType.SEMANTIC,
         )
 
-        if not use_ollama or not base_results:
-            return base_results[:k]
+    @staticmethod
+    def _rerank(
+        base_results: list[RetrievalResult],
+        q_vec: list[float],
+        doc_vecs: list[list[float]],
+        k: int,
+    ) -> list[RetrievalResult]:
+        # Phase 2: blend embedding similarity with token relevance
+        scored: list[tuple[float, RetrievalResult]] = []
+        for rr, doc_vec in zip(base_results, doc_vecs, strict=True):
+            try:
+                blended = 0.7 * cosine(q_vec, doc_vec) + 0.3 * rr.relevance_score
+            except (ValueError, TypeError):
+                blended = rr.relevance_score
+            scored.append((blended, rr))
 
-        # Phase 2: Ollama embedding re-rank (best-effort, silently skipped)
-        # review:zero-mock-silent-fallback — hardcoded URL + silent except violates CLAUDE.md
-        # "No silent fallbacks" + "No hardcoded values" policies. Use
-        # codomyrmex.config_management.defaults.DEFAULT_OLLAMA_URL via os.getenv("OLLAMA_BASE_URL").
-        try:
-            import json as _json
-            import os as _os
-            import urllib.request as _req
-
-            _ollama_base = _os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-
-            def _embed(text: str) -> list[float]:
-                payload = _json.dumps({"model": ollama_model, "input": text}).encode()
-                request = _req.Request(
-                    f"{_ollama_base}/api/embed",
-                    data=payload,
-                    headers={"Content-Type": "application/json"},
-                    method="POST",
-                )
-                with _req.urlopen(request, timeout=2.0) as resp:
-                    data = _json.loads(resp.read())
-                return data["embeddings"][0]
-
-            def _cosine(a: list[float], b: list[float]) -> float:
-                dot = sum(x * y for x, y in zip(a, b, strict=True))
-                norm_a = sum(x * x for x in a) ** 0.5
-                norm_b = sum(x * x for x in b) ** 0.5
-                return dot / (norm_a * norm_b + 1e-9)
-
-            q_vec = _embed(query)
-            scored: list[tuple[float, RetrievalResult]] = []
-            for rr in base_results:
-                try:
-                    doc_vec = _embed(rr.memory.content[:512])
-                    sim = _cosine(q_vec, doc_vec)
-                    blended = 0.7 * sim + 0.3 * rr.relevance_score
-                    scored.append((blended, rr))
-                except Exception:
-                    scored.append((rr.relevance_score, rr))
-
-            scored.sort(key=lambda x: x[0], reverse=True)
-            return [rr for _, rr in scored[:k]]
-
-        except Exception:
-            # Ollama unavailable — fall back to token scoring
-            return base_results[:k]
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [rr for _, rr in scored[:k]]
 
     def merge_duplicates(self, threshold: float = 0.85) -> int:
         """Fold near-duplicate KIs into their older counterpart.
 
-        Uses token-overlap similarity (``_relevance``) to compute pairwise
-        cosine-like similarity between all SEMANTIC memories.  When a newer
-        memory exceeds *threshold* similarity to an older one, its body is
-        appended as a dated ``## Update`` section and the newer record is
-        deleted.
+        Shorthand for :meth:`deduplicate` that returns only the merge count.
 
         Args:
             threshold: Similarity threshold (0.0–1.0). Default 0.85.
@@ -480,22 +563,67 @@ class KnowledgeMemory:
         Returns:
             Number of memories merged (deleted).
         """
+        return self.deduplicate(threshold).merged
+
+    def deduplicate(
+        self, threshold: float = 0.85, *, exhaustive: bool = False
+    ) -> MergeReport:
+        """Fold near-duplicate KIs into their older counterpart.
+
+        Uses token-overlap similarity (``_relevance``) between SEMANTIC
+        memories. When a newer memory exceeds *threshold* similarity to an
+        older one, its body is appended as a dated ``## Update`` section and
+        the newer record is deleted.
+
+        For thresholds of at least ``minhash.MIN_LSH_THRESHOLD`` (0.5) only
+        the pairs proposed by ``minhash.candidate_pairs`` (MinHash/LSH for
+        similar sizes, prefix filtering for very different ones) are
+        compared instead of every pair. All updates and deletions are
+        written in one batch at the end.
+
+        Args:
+            threshold: Similarity threshold (0.0–1.0). Default 0.85.
+            exhaustive: Compare every pair even when LSH would apply.
+
+        Returns:
+            A :class:`MergeReport` with pairs compared and memories merged.
+        """
         import datetime
 
-        all_memories = self._agent.store.list_all()
+        store = self._agent.store
+        all_memories = store.list_all()
         semantic = [m for m in all_memories if m.memory_type == MemoryType.SEMANTIC]
         # Sort oldest first so we always keep the canonical older copy
         semantic.sort(key=lambda m: m.created_at)
 
-        merged = 0
-        deleted_ids: set[str] = set()
+        report = MergeReport(scanned=len(semantic))
+        pairs = (
+            None
+            if exhaustive
+            else candidate_pairs([tokenize(m.content) for m in semantic], threshold)
+        )
+        later: dict[int, list[int]] | None = None
+        if pairs is not None:
+            report.used_lsh = True
+            later = {}
+            for i, j in sorted(pairs):
+                later.setdefault(i, []).append(j)
+
+        updated: dict[str, Memory] = {}
+        deleted_ids: list[str] = []
+        deleted: set[str] = set()
 
         for i, base in enumerate(semantic):
-            if base.id in deleted_ids:
+            if base.id in deleted:
                 continue
-            for candidate in semantic[i + 1 :]:
-                if candidate.id in deleted_ids:
+            neighbours = (
+                range(i + 1, len(semantic)) if later is None else later.get(i, ())
+            )
+            for j in neighbours:
+                candidate = semantic[j]
+                if candidate.id in deleted:
                     continue
+                report.pairs_compared += 1
                 sim = _relevance(base.content, candidate.content)
                 if sim >= threshold:
                     # Append candidate body as an Update section to base
@@ -504,13 +632,25 @@ class KnowledgeMemory:
                     ).strftime("%Y-%m-%d")
                     update_text = f"\n\n## Update ({now_str})\n\n{candidate.content}"
                     base.content += update_text
-                    self._agent.store.save(base)
-                    # Remove the duplicate
-                    self._agent.store.delete(candidate.id)
-                    deleted_ids.add(candidate.id)
-                    merged += 1
+                    updated[base.id] = base
+                    deleted.add(candidate.id)
+                    deleted_ids.append(candidate.id)
+
+        if updated:
+            if hasattr(store, "save_many"):
+                store.save_many(updated.values())
+            else:
+                for mem in updated.values():
+                    store.save(mem)
+        if deleted_ids:
+            if hasattr(store, "delete_many"):
+                store.delete_many(deleted_ids)
+            else:
+                for memory_id in deleted_ids:
+                    store.delete(memory_id)
 
-        return merged
+        report.merged = len(deleted_ids)
+        return report
 
 
 __all__ = [
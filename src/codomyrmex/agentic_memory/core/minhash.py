@@ -0,0 +1,165 @@
+"""MinHash / LSH candidate generation for near-duplicate detection.
+
+``KnowledgeMemory.deduplicate`` used to compare every pair of SEMANTIC
+memories. :func:`candidate_pairs` instead proposes only the pairs that can
+reach the threshold. Its similarity is containment (the fraction of one
+set's tokens found in the other), which Jaccard-based MinHash only bounds
+when the two sets are of similar size, so pairs are split by size ratio:
+
+* Sets whose sizes are within ``1 / threshold`` of each other are hashed
+  into MinHash signatures, split into ``bands`` of ``rows`` values, and
+  paired up when they collide in at least one band. The band layout is
+  picked so that any such pair whose containment just reaches the
+  threshold collides with probability ≥ 99%.
+* A set can only reach the threshold against a set more than
+  ``1 / threshold`` times its size as the contained (smaller) side. Those
+  pairs are found exactly by prefix filtering: the smaller set must share
+  one of its rarest ``size - ceil(threshold * size) + 1`` tokens with the
+  larger one.
+
+Candidates are then verified with the exact similarity, so neither step
+ever causes a false merge.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+from collections import defaultdict
+from itertools import combinations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+
+_PRIME = (1 << 61) - 1
+
+#: Below this threshold candidate generation buys little; compare all pairs.
+MIN_LSH_THRESHOLD = 0.5
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures for token sets."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1) -> None:
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._perms = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+        self._token_values: dict[str, tuple[int, ...]] = {}
+
+    def _values(self, token: str) -> tuple[int, ...]:
+        values = self._token_values.get(token)
+        if values is None:
+            h = int.from_bytes(
+                hashlib.blake2b(token.encode(), digest_size=8).digest(), "little"
+            )
+            values = tuple((a * h + b) % _PRIME for a, b in self._perms)
+            self._token_values[token] = values
+        return values
+
+    def signature(self, tokens: Collection[str]) -> tuple[int, ...]:
+        """Return the signature of *tokens* (empty for an empty set)."""
+        if not tokens:
+            return ()
+        return tuple(map(min, zip(*(self._values(t) for t in tokens), strict=True)))
+
+
+def lsh_params(threshold: float, num_perm: int) -> tuple[int, int] | None:
+    """Return ``(bands, rows)`` for *threshold*, or ``None`` to compare all pairs.
+
+    The containment threshold ``t`` is converted to the lowest Jaccard
+    similarity a pair of sets within a size ratio of ``1 / t`` can have
+    while reaching it, ``t**2 / (1 + t - t**2)``, and the largest ``rows``
+    whose miss probability at that similarity stays under 1% is chosen.
+    """
+    if threshold < MIN_LSH_THRESHOLD:
+        return None
+    t = min(threshold, 1.0)
+    jaccard = t * t / (1.0 + t - t * t)
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if (1.0 - jaccard**rows) ** bands <= 0.01:
+            best = (bands, rows)
+    return best
+
+
+def _min_overlap(threshold: float, size: int) -> int:
+    """Smallest overlap ``m`` with ``m / size >= threshold``."""
+    m = math.ceil(threshold * size)
+    while m > 0 and (m - 1) / size >= threshold:
+        m -= 1
+    while m / size < threshold:
+        m += 1
+    return m
+
+
+def _contained_pairs(
+    token_sets: Sequence[Collection[str]], threshold: float
+) -> set[tuple[int, int]]:
+    """Pairs of very different size where the smaller set may be contained.
+
+    Exact: a set of size ``n`` overlapping another in at least
+    ``m = ceil(threshold * n)`` tokens shares one of any ``n - m + 1`` of
+    its tokens with it, so probing the rarest ones finds every such pair.
+    """
+    postings: defaultdict[str, list[int]] = defaultdict(list)
+    for i, tokens in enumerate(token_sets):
+        for token in tokens:
+            postings[token].append(i)
+    pairs: set[tuple[int, int]] = set()
+    for i, tokens in enumerate(token_sets):
+        size = len(tokens)
+        if not size:
+            continue
+        probe = size - _min_overlap(threshold, size) + 1
+        if probe <= 0:
+            continue
+        rarest = sorted(tokens, key=lambda t: (len(postings[t]), t))[:probe]
+        for token in rarest:
+            for j in postings[token]:
+                if threshold * len(token_sets[j]) > size:
+                    pairs.add((i, j) if i < j else (j, i))
+    return pairs
+
+
+def candidate_pairs(
+    token_sets: Sequence[Collection[str]],
+    threshold: float,
+    *,
+    num_perm: int = 64,
+    seed: int = 1,
+) -> set[tuple[int, int]] | None:
+    """Index pairs ``(i, j)``, ``i < j``, that are likely near-duplicates.
+
+    Covers containment in either direction: LSH proposes pairs of similar
+    size and prefix filtering the pairs of very different size. Returns
+    ``None`` when *threshold* is too low for LSH to be useful; the caller
+    should then compare every pair. Empty token sets never pair up.
+    """
+    params = lsh_params(threshold, num_perm)
+    if params is None:
+        return None
+    bands, rows = params
+    hasher = MinHasher(num_perm, seed)
+    buckets: defaultdict[tuple[int, tuple[int, ...]], list[int]] = defaultdict(list)
+    for i, tokens in enumerate(token_sets):
+        sig = hasher.signature(tokens)
+        if not sig:
+            continue
+        for band in range(bands):
+            buckets[band, sig[band * rows : (band + 1) * rows]].append(i)
+    sizes = [len(tokens) for tokens in token_sets]
+    pairs: set[tuple[int, int]] = set()
+    for members in buckets.values():
+        if len(members) > 1:
+            for i, j in combinations(members, 2):
+                small, large = sorted((sizes[i], sizes[j]))
+                if threshold * large <= small:
+                    pairs.add((i, j))
+    pairs |= _contained_pairs(token_sets, threshold)
+    return pairs
@@ -109,6 +109,12 @@ class Memory:
         )
 
 
+def combine_scores(relevance: float, recency: float, importance: float) -> float:
+    """Weighted combination of the three sub-scores, clamped to [0, 1]."""
+    raw = 0.5 * relevance + 0.3 * recency + 0.2 * importance
+    return max(0.0, min(1.0, raw))
+
+
 @dataclass
 class RetrievalResult:
     """Result of a memory recall/search operation."""
@@ -120,10 +126,22 @@ class RetrievalResult:
 
     @property
     def combined_score(self) -> float:
-        """Weighted combination of the three sub-scores, clamped to [0, 1]."""
-        raw = (
-            0.5 * self.relevance_score
-            + 0.3 * self.recency_score
-            + 0.2 * self.importance_score
+        """Weighted combination of the three sub-scores (:func:`combine_scores`)."""
+        return combine_scores(
+            self.relevance_score, self.recency_score, self.importance_score
         )
-        return max(0.0, min(1.0, raw))
+
+
+@dataclass
+class MergeReport:
+    """Counters from a ``KnowledgeMemory.deduplicate`` pass."""
+
+    scanned: int = 0
+    pairs_compared: int = 0
+    merged: int = 0
+    used_lsh: bool = False
+
+    @property
+    def total_pairs(self) -> int:
+        """Pairs an exhaustive comparison of ``scanned`` memories would check."""
+        return self.scanned * (self.scanned - 1) // 2
@@ -5,15 +5,24 @@ from __future__ import annotations
 import json
 import sqlite3
 import threading
+from typing import TYPE_CHECKING, Any
 
 from codomyrmex.agentic_memory.core.models import Memory, MemoryImportance, MemoryType
+from codomyrmex.agentic_memory.core.token_index import tokenize
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from codomyrmex.agentic_memory.core.token_index import MatchRow
 
 
 class SQLiteStore:
     """Thread-safe SQLite persistent memory store.
 
     Provides the same CRUD API as InMemoryStore and JSONFileStore,
-    but backs the data to a local SQLite database file.
+    but backs the data to a local SQLite database file. Content tokens are
+    kept in a ``memory_tokens`` table so retrieval and its type/importance
+    filters run as indexed queries.
     """
 
     def __init__(self, db_path: str = "memory.db") -> None:
@@ -50,12 +59,88 @@ class SQLiteStore:
                 conn.execute(
                     "CREATE INDEX IF NOT EXISTS idx_meminfo ON memories(memory_type, importance)"
                 )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_memrecency ON memories(importance, created_at)"
+                )
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'memory_tokens'"
+                ).fetchone()
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS memory_tokens (
+                        token TEXT NOT NULL,
+                        memory_id TEXT NOT NULL,
+                        PRIMARY KEY (token, memory_id)
+                    ) WITHOUT ROWID
+                    """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_memtokens_id ON memory_tokens(memory_id)"
+                )
+                if not exists:
+                    # Index memories written before the token table existed
+                    for row in conn.execute("SELECT id, content FROM memories"):
+                        self._index_tokens(conn, row["id"], row["content"])
+
+    @staticmethod
+    def _index_tokens(conn: sqlite3.Connection, memory_id: str, content: str) -> None:
+        conn.execute("DELETE FROM memory_tokens WHERE memory_id = ?", (memory_id,))
+        conn.executemany(
+            "INSERT INTO memory_tokens (token, memory_id) VALUES (?, ?)",
+            [(token, memory_id) for token in tokenize(content)],
+        )
+
+    @staticmethod
+    def _row_to_memory(row: sqlite3.Row) -> Memory:
+        """Build a Memory, falling back to empty defaults for corrupt JSON."""
+        try:
+            metadata = json.loads(row["metadata"])
+        except (json.JSONDecodeError, TypeError):
+            metadata = {}
+
+        try:
+            tags = json.loads(row["tags"])
+        except (json.JSONDecodeError, TypeError):
+            tags = []
+
+        return Memory(
+            id=row["id"],
+            content=row["content"],
+            memory_type=MemoryType(row["memory_type"]),
+            importance=MemoryImportance(row["importance"]),
+            metadata=metadata,
+            tags=tags,
+            created_at=row["created_at"],
+            access_count=row["access_count"],
+            last_accessed=row["last_accessed"],
+        )
+
+    @staticmethod
+    def _filters(
+        memory_type: MemoryType | None,
+        min_importance: MemoryImportance | None,
+        alias: str = "",
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if memory_type is not None:
+            clauses.append(f"{alias}memory_type = ?")
+            params.append(memory_type.value)
+        if min_importance is not None:
+            clauses.append(f"{alias}importance >= ?")
+            params.append(min_importance.value)
+        return "".join(f" AND {c}" for c in clauses), params
 
     def save(self, memory: Memory) -> None:
         """Upsert a memory entry."""
+        self.save_many([memory])
+
+    def save_many(self, memories: Iterable[Memory]) -> None:
+        """Upsert several memories in a single transaction."""
+        memories = list(memories)
         with self._lock:
             with self._get_connection() as conn:
-                conn.execute(
+                conn.executemany(
                     """
                     INSERT INTO memories
                     (id, content, memory_type, importance, metadata, tags, created_at, access_count, last_accessed)
@@ -70,18 +155,23 @@ class SQLiteStore:
                         access_count=excluded.access_count,
                         last_accessed=excluded.last_accessed
                     """,
-                    (
-                        memory.id,
-                        memory.content,
-                        memory.memory_type.value,
-                        memory.importance.value,
-                        json.dumps(memory.metadata),
-                        json.dumps(memory.tags),
-                        memory.created_at,
-                        memory.access_count,
-                        memory.last_accessed,
-                    ),
+                    [
+                        (
+                            memory.id,
+                            memory.content,
+                            memory.memory_type.value,
+                            memory.importance.value,
+                            json.dumps(memory.metadata),
+                            json.dumps(memory.tags),
+                            memory.created_at,
+                            memory.access_count,
+                            memory.last_accessed,
+                        )
+                        for memory in memories
+                    ],
                 )
+                for memory in memories:
+                    self._index_tokens(conn, memory.id, memory.content)
 
     def get(self, memory_id: str) -> Memory | None:
         """Return a memory by id or ``None``.
@@ -98,27 +188,7 @@ class SQLiteStore:
         if not row:
             return None
 
-        try:
-            metadata = json.loads(row["metadata"])
-        except (json.JSONDecodeError, TypeError):
-            metadata = {}
-
-        try:
-            tags = json.loads(row["tags"])
-        except (json.JSONDecodeError, TypeError):
-            tags = []
-
-        mem = Memory(
-            id=row["id"],
-            content=row["content"],
-            memory_type=MemoryType(row["memory_type"]),
-            importance=MemoryImportance(row["importance"]),
-            metadata=metadata,
-            tags=tags,
-            created_at=row["created_at"],
-            access_count=row["access_count"],
-            last_accessed=row["last_accessed"],
-        )
+        mem = self._row_to_memory(row)
         mem.access()
         # Save the updated access count asynchronously or right away
         # For strict thread-safety and simplicity in this implementation, we re-save it.
@@ -134,41 +204,94 @@ class SQLiteStore:
 
     def delete(self, memory_id: str) -> bool:
         """Remove a memory. Returns ``True`` if it existed."""
+        return self.delete_many([memory_id]) > 0
+
+    def delete_many(self, memory_ids: Iterable[str]) -> int:
+        """Remove several memories in one transaction; return how many existed."""
+        params = [(memory_id,) for memory_id in memory_ids]
         with self._lock, self._get_connection() as conn:
-            cursor = conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
-            return cursor.rowcount > 0
+            before = conn.total_changes
+            conn.executemany("DELETE FROM memories WHERE id = ?", params)
+            deleted = conn.total_changes - before
+            conn.executemany("DELETE FROM memory_tokens WHERE memory_id = ?", params)
+            return deleted
 
     def list_all(self) -> list[Memory]:
         """Return every stored memory."""
-        memories = []
+        return self.list_filtered()
+
+    def list_filtered(
+        self,
+        *,
+        memory_type: MemoryType | None = None,
+        min_importance: MemoryImportance | None = None,
+        limit: int | None = None,
+    ) -> list[Memory]:
+        """Return memories matching the filters, oldest first."""
+        where, params = self._filters(memory_type, min_importance)
         with self._lock:
             with self._get_connection() as conn:
                 rows = conn.execute(
-                    "SELECT * FROM memories ORDER BY created_at ASC"
+                    f"SELECT * FROM memories WHERE 1 = 1{where} "
+                    "ORDER BY created_at ASC LIMIT ?",
+                    (*params, -1 if limit is None else limit),
                 ).fetchall()
+        return [self._row_to_memory(row) for row in rows]
 
-        for row in rows:
-            try:
-                metadata = json.loads(row["metadata"])
-            except (json.JSONDecodeError, TypeError):
-                metadata = {}
-
-            try:
-                tags = json.loads(row["tags"])
-            except (json.JSONDecodeError, TypeError):
-                tags = []
-
-            memories.append(
-                Memory(
-                    id=row["id"],
-                    content=row["content"],
-                    memory_type=MemoryType(row["memory_type"]),
-                    importance=MemoryImportance(row["importance"]),
-                    metadata=metadata,
-                    tags=tags,
-                    created_at=row["created_at"],
-                    access_count=row["access_count"],
-                    last_accessed=row["last_accessed"],
-                )
-            )
-        return memories
+    def get_many(self, memory_ids: Iterable[str]) -> list[Memory]:
+        """Return the given memories in order without touching access counts."""
+        ids = list(memory_ids)
+        if not ids:
+            return []
+        marks = ",".join("?" * len(ids))
+        with self._lock:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    f"SELECT * FROM memories WHERE id IN ({marks})", ids
+                ).fetchall()
+        by_id = {row["id"]: self._row_to_memory(row) for row in rows}
+        return [by_id[i] for i in ids if i in by_id]
+
+    def token_matches(
+        self,
+        tokens: Collection[str],
+        *,
+        memory_type: MemoryType | None = None,
+        min_importance: MemoryImportance | None = None,
+        recent_per_importance: int = 0,
+    ) -> list[MatchRow]:
+        """Candidate ``(id, hits, created_at, importance)`` rows for a query.
+
+        See :mod:`codomyrmex.agentic_memory.core.token_index`.
+        """
+        tokens = list(set(tokens))
+        where, params = self._filters(memory_type, min_importance, alias="m.")
+        rows: list[MatchRow] = []
+        with self._lock:
+            with self._get_connection() as conn:
+                if tokens:
+                    marks = ",".join("?" * len(tokens))
+                    rows.extend(
+                        tuple(r)
+                        for r in conn.execute(
+                            "SELECT m.id, COUNT(*), m.created_at, m.importance "
+                            "FROM memory_tokens t JOIN memories m ON m.id = t.memory_id "
+                            f"WHERE t.token IN ({marks}){where} GROUP BY m.id",
+                            (*tokens, *params),
+                        )
+                    )
+                if recent_per_importance > 0:
+                    type_where, type_params = self._filters(memory_type, None)
+                    for level in MemoryImportance:
+                        if min_importance and level.value < min_importance.value:
+                            continue
+                        rows.extend(
+                            tuple(r)
+                            for r in conn.execute(
+                                "SELECT id, 0, created_at, importance FROM memories "
+                                f"WHERE importance = ?{type_where} "
+                                "ORDER BY created_at DESC LIMIT ?",
+                                (level.value, *type_params, recent_per_importance),
+                            )
+                        )
+        return rows
@@ -1,7 +1,13 @@
 """Memory stores — in-memory dict and JSON file-backed persistence.
 
 Both stores expose the same CRUD surface: ``save``, ``get``, ``delete``,
-``list_all``. ``JSONFileStore`` and ``SQLiteStore`` are thread-safe.
+``list_all``, plus batched ``save_many`` / ``delete_many``.
+``JSONFileStore`` and ``SQLiteStore`` are thread-safe.
+
+All three also keep a token index for ``AgentMemory`` retrieval:
+``token_matches`` (candidate rows), ``get_many`` (bulk fetch without
+touching access counts) and ``list_filtered`` (type/importance filters
+applied in the store).
 """
 
 from __future__ import annotations
@@ -9,14 +15,38 @@ from __future__ import annotations
 import json
 import logging
 import threading
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from codomyrmex.agentic_memory.core.models import Memory
 from codomyrmex.agentic_memory.core.sqlite_store import SQLiteStore
+from codomyrmex.agentic_memory.core.token_index import TokenIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from codomyrmex.agentic_memory.core.models import MemoryImportance, MemoryType
+    from codomyrmex.agentic_memory.core.token_index import MatchRow
 
 logger = logging.getLogger(__name__)
 
+
+def _filtered(
+    memories: Iterable[Memory],
+    memory_type: MemoryType | None,
+    min_importance: MemoryImportance | None,
+    limit: int | None,
+) -> list[Memory]:
+    selected = (
+        m
+        for m in memories
+        if (memory_type is None or m.memory_type == memory_type)
+        and (min_importance is None or m.importance.value >= min_importance.value)
+    )
+    return list(islice(selected, limit))
+
+
 __all__ = ["InMemoryStore", "JSONFileStore", "SQLiteStore"]
 
 
@@ -25,10 +55,17 @@ class InMemoryStore:
 
     def __init__(self) -> None:
         self._data: dict[str, Memory] = {}
+        self._index = TokenIndex()
 
     def save(self, memory: Memory) -> None:
         """Upsert a memory entry."""
         self._data[memory.id] = memory
+        self._index.add(memory)
+
+    def save_many(self, memories: Iterable[Memory]) -> None:
+        """Upsert several memory entries."""
+        for memory in memories:
+            self.save(memory)
 
     def get(self, memory_id: str) -> Memory | None:
         """Return a memory by id or ``None``."""
@@ -41,13 +78,48 @@ class InMemoryStore:
         """Remove a memory. Returns ``True`` if it existed."""
         if memory_id in self._data:
             del self._data[memory_id]
+            self._index.remove(memory_id)
             return True
         return False
 
+    def delete_many(self, memory_ids: Iterable[str]) -> int:
+        """Remove several memories; return how many existed."""
+        return sum(self.delete(memory_id) for memory_id in memory_ids)
+
     def list_all(self) -> list[Memory]:
         """Return every stored memory."""
         return list(self._data.values())
 
+    def list_filtered(
+        self,
+        *,
+        memory_type: MemoryType | None = None,
+        min_importance: MemoryImportance | None = None,
+        limit: int | None = None,
+    ) -> list[Memory]:
+        """Return memories matching the filters, in ``list_all`` order."""
+        return _filtered(self._data.values(), memory_type, min_importance, limit)
+
+    def get_many(self, memory_ids: Iterable[str]) -> list[Memory]:
+        """Return the given memories in order (unknown ids are skipped)."""
+        return [self._data[i] for i in memory_ids if i in self._data]
+
+    def token_matches(
+        self,
+        tokens: Collection[str],
+        *,
+        memory_type: MemoryType | None = None,
+        min_importance: MemoryImportance | None = None,
+        recent_per_importance: int = 0,
+    ) -> list[MatchRow]:
+        """Candidate ``(id, hits, created_at, importance)`` rows for a query."""
+        return self._index.token_matches(
+            tokens,
+            memory_type=memory_type,
+            min_importance=min_importance,
+            recent_per_importance=recent_per_importance,
+        )
+
 
 class JSONFileStore:
     """Thread-safe JSON file store that writes on every mutation.
@@ -60,6 +132,7 @@ class JSONFileStore:
         self._path = Path(path)
         self._lock = threading.Lock()
         self._data: dict[str, dict[str, Any]] = {}
+        self._index = TokenIndex()
         if self._path.exists():
             try:
                 with open(self._path) as fh:
@@ -77,6 +150,8 @@ class JSONFileStore:
                     exc,
                 )
                 self._data = {}
+        for raw in self._data.values():
+            self._index.add(Memory.from_dict(raw))
 
     # ── internal ─────────────────────────────────────────────────
 
@@ -92,6 +167,15 @@ class JSONFileStore:
         """Persist a Memory entry to the JSON file, keyed by its ID."""
         with self._lock:
             self._data[memory.id] = memory.to_dict()
+            self._index.add(memory)
+            self._flush()
+
+    def save_many(self, memories: Iterable[Memory]) -> None:
+        """Persist several Memory entries with a single file write."""
+        with self._lock:
+            for memory in memories:
+                self._data[memory.id] = memory.to_dict()
+                self._index.add(memory)
             self._flush()
 
     def get(self, memory_id: str) -> Memory | None:
@@ -107,11 +191,60 @@ class JSONFileStore:
         with self._lock:
             if memory_id in self._data:
                 del self._data[memory_id]
+                self._index.remove(memory_id)
                 self._flush()
                 return True
             return False
 
+    def delete_many(self, memory_ids: Iterable[str]) -> int:
+        """Remove several Memories with a single file write; return how many existed."""
+        with self._lock:
+            deleted = 0
+            for memory_id in memory_ids:
+                if self._data.pop(memory_id, None) is not None:
+                    self._index.remove(memory_id)
+                    deleted += 1
+            if deleted:
+                self._flush()
+            return deleted
+
     def list_all(self) -> list[Memory]:
         """Return all stored Memory objects, reconstructed from disk."""
         with self._lock:
             return [Memory.from_dict(v) for v in self._data.values()]
+
+    def list_filtered(
+        self,
+        *,
+        memory_type: MemoryType | None = None,
+        min_importance: MemoryImportance | None = None,
+        limit: int | None = None,
+    ) -> list[Memory]:
+        """Return memories matching the filters, in ``list_all`` order."""
+        with self._lock:
+            raws = list(self._data.values())
+        memories = (Memory.from_dict(raw) for raw in raws)
+        return _filtered(memories, memory_type, min_importance, limit)
+
+    def get_many(self, memory_ids: Iterable[str]) -> list[Memory]:
+        """Return the given memories in order (unknown ids are skipped)."""
+        with self._lock:
+            raws = [self._data.get(i) for i in memory_ids]
+        return [Memory.from_dict(raw) for raw in raws if raw is not None]
+
+    def token_matches(
+        self,
+        tokens: Collection[str],
+        *,
+        memory_type: MemoryType | None = None,
+        min_importance: MemoryImportance | None = None,
+        recent_per_importance: int = 0,
+    ) -> list[MatchRow]:
+        """Candidate ``(id, hits, created_at, importance)`` rows for a query."""
+        with self._lock:
+            return self._index.token_matches(
+                tokens,
+                memory_type=memory_type,
+                min_importance=min_importance,
+                recent_per_importance=recent_per_importance,
+            )
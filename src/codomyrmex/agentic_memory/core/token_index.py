@@ -0,0 +1,125 @@
+"""Token posting lists for indexed memory retrieval.
+
+``TokenIndex`` is the in-process index used by ``InMemoryStore`` and
+``JSONFileStore``; ``SQLiteStore`` keeps the same data in a
+``memory_tokens`` table. Both answer :meth:`token_matches`, which returns
+lightweight ``(id, hits, created_at, importance)`` rows for
+
+* every memory sharing at least one token with the query (``hits`` is the
+  number of shared distinct tokens), and
+* the ``recent_per_importance`` newest memories of each importance level,
+  so memories without any overlap can still win on recency + importance,
+
+honouring the ``memory_type`` / ``min_importance`` filters. Scoring those
+rows is enough to find the exact top-k of ``AgentMemory.recall``.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from codomyrmex.agentic_memory.core.models import (
+        Memory,
+        MemoryImportance,
+        MemoryType,
+    )
+
+MatchRow = tuple[str, int, float, int]
+
+
+def tokenize(text: str) -> frozenset[str]:
+    """Distinct lower-cased whitespace tokens (as used by ``_relevance``)."""
+    return frozenset(text.lower().split())
+
+
+class TokenIndex:
+    """Posting lists plus per-(type, importance) recency order."""
+
+    def __init__(self) -> None:
+        self._postings: defaultdict[str, set[str]] = defaultdict(set)
+        self._entries: dict[str, tuple[frozenset[str], MemoryType, int, float]] = {}
+        # (memory_type, importance) -> [(created_at, id)] sorted ascending
+        self._recency: defaultdict[tuple[MemoryType, int], list[tuple[float, str]]] = (
+            defaultdict(list)
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, memory: Memory) -> None:
+        """Index (or re-index) a memory."""
+        self.remove(memory.id)
+        tokens = tokenize(memory.content)
+        importance = memory.importance.value
+        self._entries[memory.id] = (
+            tokens,
+            memory.memory_type,
+            importance,
+            memory.created_at,
+        )
+        for token in tokens:
+            self._postings[token].add(memory.id)
+        bisect.insort(
+            self._recency[memory.memory_type, importance],
+            (memory.created_at, memory.id),
+        )
+
+    def remove(self, memory_id: str) -> None:
+        """Drop a memory from the index (no-op if absent)."""
+        entry = self._entries.pop(memory_id, None)
+        if entry is None:
+            return
+        tokens, memory_type, importance, created_at = entry
+        for token in tokens:
+            posting = self._postings[token]
+            posting.discard(memory_id)
+            if not posting:
+                del self._postings[token]
+        bucket = self._recency[memory_type, importance]
+        pos = bisect.bisect_left(bucket, (created_at, memory_id))
+        if pos < len(bucket) and bucket[pos][1] == memory_id:
+            del bucket[pos]
+
+    def _allowed(
+        self,
+        memory_type: MemoryType | None,
+        min_importance: MemoryImportance | None,
+        memory_type_of: MemoryType,
+        importance: int,
+    ) -> bool:
+        return (memory_type is None or memory_type_of == memory_type) and (
+            min_importance is None or importance >= min_importance.value
+        )
+
+    def token_matches(
+        self,
+        tokens: Collection[str],
+        *,
+        memory_type: MemoryType | None = None,
+        min_importance: MemoryImportance | None = None,
+        recent_per_importance: int = 0,
+    ) -> list[MatchRow]:
+        """Candidate rows for a query; see the module docstring."""
+        hits: Counter[str] = Counter()
+        for token in set(tokens):
+            posting = self._postings.get(token)
+            if posting:
+                hits.update(posting)
+        rows: list[MatchRow] = []
+        for memory_id, count in hits.items():
+            _, type_of, importance, created_at = self._entries[memory_id]
+            if self._allowed(memory_type, min_importance, type_of, importance):
+                rows.append((memory_id, count, created_at, importance))
+        if recent_per_importance > 0:
+            for (type_of, importance), bucket in self._recency.items():
+                if not self._allowed(memory_type, min_importance, type_of, importance):
+                    continue
+                for created_at, memory_id in bucket[-recent_per_importance:]:
+                    if memory_id not in hits:
+                        rows.append((memory_id, 0, created_at, importance))
+        return rows
@@ -60,6 +60,7 @@ from codomyrmex.agentic_memory.obsidian.crud import (
 )
 from codomyrmex.agentic_memory.obsidian.developer import ConsoleEntry
 from codomyrmex.agentic_memory.obsidian.graph import (
+    LinkIndex,
     build_link_graph,
     find_broken_links,
     find_dead_ends,
@@ -142,6 +143,7 @@ __all__ = [
     "DiffResult",
     "Embed",
     "HistoryEntry",
+    "LinkIndex",
     "MathBlock",
     "Note",
     "ObsidianCLI",
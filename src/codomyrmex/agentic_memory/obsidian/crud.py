@@ -82,7 +82,7 @@ def create_note(
     path.write_text("".join(parts))
 
     note = parse_note(path)
-    vault.refresh()
+    vault.update([path])
     return note
 
 
@@ -127,7 +127,7 @@ def update_note(
         note.frontmatter.update(frontmatter)
 
     path.write_text(serialize_note(note))
-    vault.refresh()
+    vault.update([path])
     return parse_note(path)
 
 
@@ -154,7 +154,7 @@ def append_note(
     existing = path.read_text()
     separator = "\n" if newline and existing and not existing.endswith("\n") else ""
     path.write_text(existing + separator + content)
-    vault.refresh()
+    vault.update([path])
     return parse_note(path)
 
 
@@ -187,7 +187,7 @@ def prepend_note(
     else:
         path.write_text(content + "\n" + existing)
 
-    vault.refresh()
+    vault.update([path])
     return parse_note(path)
 
 
@@ -202,7 +202,7 @@ def delete_note(vault: Any, name: str) -> bool:
     if not path.exists():
         return False
     path.unlink()
-    vault.refresh()
+    vault.update([path])
     return True
 
 
@@ -233,7 +233,7 @@ def remove_frontmatter_key(vault: Any, name: str, key: str) -> Note:
     note = parse_note(path)
     note.frontmatter.pop(key, None)
     path.write_text(serialize_note(note))
-    vault.refresh()
+    vault.update([path])
     return parse_note(path)
 
 
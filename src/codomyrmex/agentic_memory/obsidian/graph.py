@@ -3,10 +3,15 @@
 Uses a directed graph (dict-of-sets) so we have zero dependency on
 ``networkx`` in core.  The returned object duck-types the subset of the
 ``networkx.DiGraph`` API used by the tests.
+
+Vaults expose a :class:`LinkIndex` that is updated note by note as files
+change; the helpers below read its graph and backlinks instead of
+rebuilding them from every note.
 """
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -20,18 +25,41 @@ class _DiGraph:
 
     def __init__(self) -> None:
         self._adj: dict[str, set[str]] = {}
+        self._pred: dict[str, set[str]] = {}
 
     def add_node(self, n: str) -> None:
         """Add a node to the graph if it doesn't already exist."""
         self._adj.setdefault(n, set())
+        self._pred.setdefault(n, set())
 
     def add_edge(self, u: str, v: str) -> None:
         """Add a directed edge from node *u* to node *v*.
 
         Both nodes are created if they don't already exist.
         """
-        self._adj.setdefault(u, set()).add(v)
-        self._adj.setdefault(v, set())
+        self.add_node(u)
+        self.add_node(v)
+        self._adj[u].add(v)
+        self._pred[v].add(u)
+
+    def remove_edge(self, u: str, v: str) -> None:
+        """Remove the edge from *u* to *v* if present (nodes are kept)."""
+        self._adj.get(u, set()).discard(v)
+        self._pred.get(v, set()).discard(u)
+
+    def remove_node(self, n: str) -> None:
+        """Remove node *n* and every edge touching it."""
+        for v in self._adj.pop(n, set()):
+            self._pred[v].discard(n)
+        for u in self._pred.pop(n, set()):
+            self._adj[u].discard(n)
+
+    def copy(self) -> _DiGraph:
+        """Return an independent copy of the graph."""
+        g = _DiGraph()
+        g._adj = {n: set(vs) for n, vs in self._adj.items()}
+        g._pred = {n: set(us) for n, us in self._pred.items()}
+        return g
 
     def number_of_nodes(self) -> int:
         """Return the total number of nodes in the graph."""
@@ -51,7 +79,7 @@ class _DiGraph:
 
     def predecessors(self, n: str) -> list[str]:
         """Return a list of nodes that point to *n* (incoming neighbors)."""
-        return [u for u, vs in self._adj.items() if n in vs]
+        return list(self._pred.get(n, set()))
 
     def nodes(self) -> list[str]:
         """Return a list of all node identifiers in the graph."""
@@ -67,7 +95,7 @@ class _DiGraph:
 
     def in_degree(self, n: str) -> int:
         """Number of edges pointing to *n*."""
-        return len(self.predecessors(n))
+        return len(self._pred.get(n, set()))
 
     def out_degree(self, n: str) -> int:
         """Number of edges leaving *n*."""
@@ -78,11 +106,71 @@ class _DiGraph:
         return self.in_degree(n) + self.out_degree(n)
 
 
-# ── public API ───────────────────────────────────────────────────────
+# ── incremental index ────────────────────────────────────────────────
 
 
-def build_link_graph(vault: Any) -> _DiGraph:
-    """Build a directed link graph from vault notes."""
+class LinkIndex:
+    """Link graph and backlinks maintained note by note.
+
+    Nodes are note titles and link targets, as in :func:`build_link_graph`.
+    Several notes can share a title, so edges and nodes are reference
+    counted and only disappear once no note contributes them.
+    """
+
+    def __init__(self) -> None:
+        self.graph = _DiGraph()
+        self._sources: dict[str, set[str]] = {}  # target -> linking note paths
+        self._edge_refs: Counter[tuple[str, str]] = Counter()
+        self._node_refs: Counter[str] = Counter()
+
+    def _ref(self, n: str) -> None:
+        self._node_refs[n] += 1
+        self.graph.add_node(n)
+
+    def _unref(self, n: str) -> None:
+        self._node_refs[n] -= 1
+        if not self._node_refs[n]:
+            del self._node_refs[n]
+            self.graph.remove_node(n)
+
+    def add(self, rel: str, note: Note) -> None:
+        """Record the title and links of the note at *rel*."""
+        title = note.title
+        self._ref(title)
+        for target in dict.fromkeys(link.target for link in note.links):
+            self._sources.setdefault(target, set()).add(rel)
+            self._edge_refs[title, target] += 1
+            if self._edge_refs[title, target] == 1:
+                self.graph.add_edge(title, target)
+                self._ref(title)
+                self._ref(target)
+
+    def discard(self, rel: str, note: Note) -> None:
+        """Undo :meth:`add` for the note previously recorded at *rel*."""
+        title = note.title
+        for target in dict.fromkeys(link.target for link in note.links):
+            sources = self._sources[target]
+            sources.discard(rel)
+            if not sources:
+                del self._sources[target]
+            self._edge_refs[title, target] -= 1
+            if not self._edge_refs[title, target]:
+                del self._edge_refs[title, target]
+                self.graph.remove_edge(title, target)
+                self._unref(title)
+                self._unref(target)
+        self._unref(title)
+
+    def sources(self, target: str) -> set[str]:
+        """Relative paths of notes that link to *target*."""
+        return set(self._sources.get(target, ()))
+
+
+def _graph_of(vault: Any) -> _DiGraph:
+    """The vault's maintained graph (read-only use), or a freshly built one."""
+    index = getattr(vault, "link_index", None)
+    if index is not None:
+        return index.graph
     g = _DiGraph()
     for note in vault.notes.values():
         title = note.title
@@ -92,8 +180,27 @@ def build_link_graph(vault: Any) -> _DiGraph:
     return g
 
 
+# ── public API ───────────────────────────────────────────────────────
+
+
+def build_link_graph(vault: Any) -> _DiGraph:
+    """Build a directed link graph from vault notes."""
+    index = getattr(vault, "link_index", None)
+    if index is not None:
+        return index.graph.copy()
+    return _graph_of(vault)
+
+
 def get_backlinks(vault: Any, title: str) -> list[Note]:
     """Return notes that link *to* the given title."""
+    index = getattr(vault, "link_index", None)
+    if index is not None:
+        sources = index.sources(title)
+        return [
+            note
+            for rel, note in vault.notes.items()
+            if rel in sources and note.title != title
+        ]
     results: list[Note] = []
     for note in vault.notes.values():
         if note.title == title:
@@ -120,7 +227,7 @@ def get_forward_links(vault: Any, title: str) -> list[Note]:
 
 def find_orphans(vault: Any) -> list[Note]:
     """Return notes with no inbound or outbound links."""
-    g = build_link_graph(vault)
+    g = _graph_of(vault)
     orphans: list[Note] = []
     for note in vault.notes.values():
         title = note.title
@@ -133,7 +240,7 @@ def find_orphans(vault: Any) -> list[Note]:
 
 def find_dead_ends(vault: Any) -> list[Note]:
     """Return notes with no outgoing links (dead ends / leaf notes)."""
-    g = build_link_graph(vault)
+    g = _graph_of(vault)
     dead_ends: list[Note] = []
     for note in vault.notes.values():
         if len(g.successors(note.title)) == 0 and len(g.predecessors(note.title)) > 0:
@@ -146,7 +253,7 @@ def find_hubs(vault: Any, *, min_links: int = 5) -> list[tuple[Note, int]]:
 
     Returns ``(note, total_degree)`` tuples sorted by degree descending.
     """
-    g = build_link_graph(vault)
+    g = _graph_of(vault)
     hubs: list[tuple[Note, int]] = []
     for note in vault.notes.values():
         degree = g.degree(note.title)
@@ -170,7 +277,7 @@ def find_broken_links(vault: Any) -> list[tuple[Note, Wikilink]]:
 
 def get_link_stats(vault: Any) -> dict[str, Any]:
     """Return summary statistics about the vault link graph."""
-    g = build_link_graph(vault)
+    g = _graph_of(vault)
     n_nodes = g.number_of_nodes()
     n_edges = g.number_of_edges()
     max_possible = n_nodes * (n_nodes - 1) if n_nodes > 1 else 1
@@ -234,7 +341,7 @@ def get_shortest_path(
     Returns a list of note titles from source to target, or ``None``
     if no path exists.  Path is undirected (follows links both ways).
     """
-    g = build_link_graph(vault)
+    g = _graph_of(vault)
     if not g.has_node(source) or not g.has_node(target):
         return None
     if source == target:
@@ -0,0 +1,128 @@
+"""Note encoding for the :class:`~.vault.ObsidianVault` parse cache.
+
+The vault keeps a :class:`~codomyrmex.utils.file_cache.FileParseCache`
+whose entries hold the parsed note (or the parse ``error``) as plain JSON
+values. :func:`parse_note_entry` is its parse function and runs in worker
+processes.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+from codomyrmex.agentic_memory.obsidian.models import (
+    Callout,
+    CodeBlock,
+    DataviewField,
+    Embed,
+    MathBlock,
+    Note,
+    Tag,
+    Wikilink,
+)
+from codomyrmex.agentic_memory.obsidian.parser import (
+    _FM_RE,
+    parse_frontmatter,
+    parse_note,
+)
+
+CACHE_VERSION = 1
+
+
+# ── frontmatter encoding ─────────────────────────────────────────────
+
+
+def _encode_value(value: Any) -> Any:
+    # YAML timestamps; datetime must be tested before its date base class
+    if isinstance(value, dt.datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, dt.date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"Unsupported frontmatter value: {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        if "$datetime" in value:
+            return dt.datetime.fromisoformat(value["$datetime"])
+        if "$date" in value:
+            return dt.date.fromisoformat(value["$date"])
+    return {k: _decode(v) for k, v in value.items()}
+
+
+def _encode_frontmatter(frontmatter: dict[str, Any], raw: str) -> dict[str, Any]:
+    """Store frontmatter as JSON when it round-trips exactly, else as YAML."""
+    try:
+        encoded = json.loads(json.dumps(frontmatter, default=_encode_value))
+        if _decode(encoded) == frontmatter:
+            return {"frontmatter": encoded}
+    except (TypeError, ValueError):
+        pass
+    match = _FM_RE.match(raw)
+    return {"frontmatter_yaml": match.group(0) if match else ""}
+
+
+# ── note <-> entry ───────────────────────────────────────────────────
+
+
+def note_to_dict(note: Note, raw: str) -> dict[str, Any]:
+    """Serialise *note* (parsed from *raw*) into plain JSON values."""
+    return {
+        "title": note.title,
+        **_encode_frontmatter(note.frontmatter, raw),
+        "content": note.content,
+        "links": [[w.target, w.alias, w.heading, w.block] for w in note.links],
+        "embeds": [[e.target, e.width, e.height] for e in note.embeds],
+        "tags": [[t.name, t.source] for t in note.tags],
+        "headings": [list(h) for h in note.headings],
+        "callouts": [
+            [c.type, c.title, c.content, c.foldable, c.default_open]
+            for c in note.callouts
+        ],
+        "code_blocks": [
+            [b.language, b.content, b.line_start] for b in note.code_blocks
+        ],
+        "math_blocks": [[m.content, m.inline] for m in note.math_blocks],
+        "dataview_fields": [[f.key, f.value, f.line] for f in note.dataview_fields],
+    }
+
+
+def note_from_dict(data: dict[str, Any], path: Path) -> Note:
+    """Rebuild a :class:`Note` from :func:`note_to_dict` output."""
+    if "frontmatter_yaml" in data:
+        frontmatter, _ = parse_frontmatter(data["frontmatter_yaml"])
+    else:
+        frontmatter = _decode(data["frontmatter"])
+    return Note(
+        title=data["title"],
+        path=path,
+        frontmatter=frontmatter,
+        content=data["content"],
+        links=[Wikilink(*w) for w in data["links"]],
+        embeds=[Embed(*e) for e in data["embeds"]],
+        tags=[Tag(*t) for t in data["tags"]],
+        headings=[(level, text) for level, text in data["headings"]],
+        callouts=[Callout(*c) for c in data["callouts"]],
+        code_blocks=[CodeBlock(*b) for b in data["code_blocks"]],
+        math_blocks=[MathBlock(*m) for m in data["math_blocks"]],
+        dataview_fields=[DataviewField(*f) for f in data["dataview_fields"]],
+    )
+
+
+def parse_note_entry(path: str, data: bytes) -> dict[str, Any]:
+    """Parse one note's bytes into ``note`` (see :func:`note_to_dict`) or ``error``."""
+    try:
+        # Same decoding as Path.read_text(): locale encoding, universal newlines
+        raw = io.TextIOWrapper(io.BytesIO(data)).read()
+        note = parse_note(Path(path), raw=raw)
+        return {"note": note_to_dict(note, raw)}
+    except Exception as e:
+        return {"error": str(e)}
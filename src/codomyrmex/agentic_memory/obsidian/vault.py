@@ -3,66 +3,218 @@
 ``ObsidianVault`` scans a directory tree for ``.md`` files, parses them
 via :func:`parser.parse_note`, and caches the results.  Excludes
 ``.obsidian`` and other dot-directories.
+
+Parsed notes live in a :class:`~codomyrmex.utils.file_cache.FileParseCache`
+keyed by relative path, so :meth:`ObsidianVault.refresh` only re-parses
+notes that changed; the cache can be persisted to a JSON file across
+sessions.  The tag index and :class:`~.graph.LinkIndex` are updated note by
+note.
 """
 
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from codomyrmex.agentic_memory.obsidian.graph import LinkIndex
 from codomyrmex.agentic_memory.obsidian.models import Note, VaultMetadata
-from codomyrmex.agentic_memory.obsidian.parser import (
-    parse_note,
+from codomyrmex.agentic_memory.obsidian.note_cache import (
+    CACHE_VERSION,
+    note_from_dict,
+    parse_note_entry,
 )
 from codomyrmex.logging_monitoring import get_logger
+from codomyrmex.utils.file_cache import FileParseCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 logger = get_logger(__name__)
 
 
 class ObsidianVault:
-    """Load and navigate an Obsidian vault directory."""
+    """Load and navigate an Obsidian vault directory.
+
+    Usage::
 
-    def __init__(self, path: str | Path) -> None:
-        """Initialize the vault from a directory path."""
+        vault = ObsidianVault("~/Notes", cache_path="~/.cache/notes-vault.json")
+        vault.get_note("Inbox")
+        vault.update(["Inbox.md"])  # after editing a single note
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        cache_path: str | Path | None = None,
+        max_workers: int | None = None,
+        parallel_threshold: int = 256,
+    ) -> None:
+        """Initialize the vault from a directory path.
+
+        Args:
+            path: Vault root directory.
+            cache_path: JSON file for the parsed notes (``~`` is expanded);
+                in memory only if omitted.
+            max_workers: Passed to :class:`FileParseCache`.
+            parallel_threshold: Passed to :class:`FileParseCache`.
+        """
         path = Path(path)
         if not path.exists():
             raise FileNotFoundError(f"Vault path does not exist: {path}")
         if not path.is_dir():
             raise ValueError(f"Vault path is not a directory: {path}")
         self.path = path.resolve()
+        self._cache = FileParseCache(
+            parse_note_entry,
+            version=CACHE_VERSION,
+            cache_path=Path(cache_path).expanduser() if cache_path else None,
+            max_workers=max_workers,
+            parallel_threshold=parallel_threshold,
+        )
         self._notes: dict[str, Note] | None = None
+        self._unordered = False  # notes were added since the last _reorder
+        self._tags: dict[str, set[str]] = {}  # tag name -> note paths
+        self._links = LinkIndex()
+        self._lock = threading.RLock()
+
+    @property
+    def cache_path(self) -> Path | None:
+        return self._cache.cache_path
 
     # ── notes cache ──────────────────────────────────────────────
 
     @property
     def notes(self) -> dict[str, Note]:
         """Lazy-loaded mapping ``relative_path → Note``.  Call :meth:`refresh`
-        to invalidate."""
+        to pick up changes on disk."""
         if self._notes is None:
-            self._notes = self._scan()
+            self.refresh()
+        assert self._notes is not None  # refresh() always populates it
         return self._notes
 
+    @property
+    def link_index(self) -> LinkIndex:
+        """Link graph and backlinks, kept in step with :attr:`notes`."""
+        _ = self.notes
+        return self._links
+
     def refresh(self) -> None:
-        """Re-scan the vault directory."""
-        self._notes = self._scan()
+        """Re-scan the vault directory, re-parsing only changed notes."""
+        with self._lock:
+            rels = self._scan()
+            self._check(rels)
+            present = set(rels)
+            for rel in [r for r in self._cache.entries if r not in present]:
+                self._drop(rel)
+            self._reorder()
+            self.save_cache()
+
+    def update(self, names: Iterable[str | Path]) -> list[str]:
+        """Re-check specific notes after they were written or deleted.
 
-    def _scan(self) -> dict[str, Note]:
-        """Scan the vault for .md files, parse each, and return as dict."""
-        result: dict[str, Note] = {}
+        Args:
+            names: Note paths, relative to the vault or absolute.
+
+        Returns:
+            Relative paths of the notes that were (re)parsed or removed.
+        """
+        with self._lock:
+            _ = self.notes
+            rels: list[str] = []
+            for name in names:
+                p = Path(name)
+                rel = p.relative_to(self.path) if p.is_absolute() else p
+                if rel.suffix == ".md" and not self._hidden(rel):
+                    rels.append(str(rel))
+            changed = self._check(rels)
+            self._reorder()
+            self.save_cache()
+            return changed
+
+    def save_cache(self) -> None:
+        """Write the parse cache to ``cache_path`` if it changed."""
+        with self._lock:
+            self._cache.save()
+
+    @staticmethod
+    def _hidden(rel: Path) -> bool:
+        # Skip dot-directories (.obsidian, .trash, etc.)
+        return any(part.startswith(".") for part in rel.parts)
+
+    def _scan(self) -> list[str]:
+        """Relative paths of the vault's .md files, sorted."""
+        result: list[str] = []
         for md in sorted(self.path.rglob("*.md")):
-            rel = str(md.relative_to(self.path))
-            # Skip dot-directories (.obsidian, .trash, etc.)
-            if any(part.startswith(".") for part in md.relative_to(self.path).parts):
-                continue
-            try:
-                note = parse_note(md)
-                result[rel] = note
-            except Exception as e:
-                logger.warning("Skipping unparseable vault file %s: %s", md, e)
-                continue
+            rel = md.relative_to(self.path)
+            if not self._hidden(rel):
+                result.append(str(rel))
         return result
 
+    def _check(self, rels: list[str]) -> list[str]:
+        """Bring the notes at *rels* up to date; return those that changed."""
+        if self._notes is None:
+            self._notes = {}
+        resolved = self._cache.resolve((rel, str(self.path / rel)) for rel in rels)
+        changed: list[str] = []
+        for rel in dict.fromkeys(rels):
+            entry, parsed = resolved[rel]
+            if entry is None:
+                if self._drop(rel):
+                    changed.append(rel)
+            elif parsed or rel not in self._notes:
+                self._install(rel, entry)
+                changed.append(rel)
+        return changed
+
+    def _install(self, rel: str, entry: dict[str, Any]) -> None:
+        """Replace the note at *rel* with the one in its cache entry."""
+        notes = self._notes
+        assert notes is not None
+        old = notes.get(rel)
+        if old is not None:
+            self._unindex(rel, old)
+        if "note" not in entry:
+            notes.pop(rel, None)
+            logger.warning(
+                "Skipping unparseable vault file %s: %s",
+                self.path / rel,
+                entry.get("error"),
+            )
+            return
+        note = note_from_dict(entry["note"], self.path / rel)
+        self._unordered = self._unordered or old is None
+        notes[rel] = note
+        for name in {t.name for t in note.tags}:
+            self._tags.setdefault(name, set()).add(rel)
+        self._links.add(rel, note)
+
+    def _drop(self, rel: str) -> bool:
+        """Forget the note at *rel*; return ``True`` if it was loaded."""
+        self._cache.pop(rel)
+        old = self._notes.pop(rel, None) if self._notes is not None else None
+        if old is None:
+            return False
+        self._unindex(rel, old)
+        return True
+
+    def _unindex(self, rel: str, note: Note) -> None:
+        for name in {t.name for t in note.tags}:
+            rels = self._tags[name]
+            rels.discard(rel)
+            if not rels:
+                del self._tags[name]
+        self._links.discard(rel, note)
+
+    def _reorder(self) -> None:
+        """Keep :attr:`notes` in path order after notes were added."""
+        notes = self._notes
+        if notes is not None and self._unordered:
+            self._notes = {rel: notes[rel] for rel in sorted(notes, key=Path)}
+        self._unordered = False
+
     # ── lookup ───────────────────────────────────────────────────
 
     def get_note(self, name: str) -> Note | None:
@@ -113,15 +265,14 @@ class ObsidianVault:
         return sorted(folders)
 
     def get_notes_by_tag(self, tag: str) -> list[Note]:
-        """Return all notes containing the given tag."""
+        """Return all notes containing the given tag (or a nested tag)."""
         tag = tag.lstrip("#")
-        results: list[Note] = []
-        for note in self.notes.values():
-            for t in note.tags:
-                if t.name == tag or t.name.startswith(tag + "/"):
-                    results.append(note)
-                    break
-        return results
+        notes = self.notes
+        matched: set[str] = set()
+        for name, rels in self._tags.items():
+            if name == tag or name.startswith(tag + "/"):
+                matched |= rels
+        return [note for rel, note in notes.items() if rel in matched]
 
     # ── metadata ─────────────────────────────────────────────────
 
@@ -142,11 +293,8 @@ class ObsidianVault:
 
     def get_all_tags(self) -> set[str]:
         """Return the set of unique tag names across the vault."""
-        tags: set[str] = set()
-        for note in self.notes.values():
-            for t in note.tags:
-                tags.add(t.name)
-        return tags
+        _ = self.notes
+        return set(self._tags)
 
     # ── config ───────────────────────────────────────────────────
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import bisect
+import itertools
+import math
 import time
 from typing import Any
 
@@ -9,11 +12,32 @@ from codomyrmex.agentic_memory.stigmergy.models import StigmergyConfig, TraceMar
 
 
 class TraceField:
-    """Dict-backed traces: deposit, reinforce, sense, evaporate (tick), top_k."""
+    """Dict-backed traces: deposit, reinforce, sense, evaporate (tick), top_k.
+
+    In lazy mode (``config.lazy_evaporation``) each trace is kept as a
+    *level*, ``strength + evaporation_per_tick * base_tick`` where
+    ``base_tick`` is the tick of its last write, so the current strength is
+    ``level - evaporation_per_tick * ticks``. Every trace decays
+    at the same rate, so ordering by level is ordering by strength and the
+    sorted ``_order`` index serves :meth:`top_k` without touching traces on
+    :meth:`tick`. The stored ``TraceMarker.strength`` is then the strength
+    at the last write; read it through :meth:`sense`.
+    """
 
     def __init__(self, config: StigmergyConfig | None = None) -> None:
         self.config = config or StigmergyConfig()
         self._markers: dict[str, TraceMarker] = {}
+        # Lazy evaporation: key -> (level, -insertion seq, base tick), plus
+        # (level, -seq, key) sorted ascending; -seq keeps insertion order on ties
+        self._ticks = 0
+        self._levels: dict[str, tuple[float, int, int]] = {}
+        self._order: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+
+    @property
+    def ticks(self) -> int:
+        """Number of :meth:`tick` calls so far."""
+        return self._ticks
 
     def _clamp(self, strength: float) -> float:
         return max(
@@ -21,6 +45,60 @@ class TraceField:
             min(self.config.max_strength, strength),
         )
 
+    # ── lazy evaporation helpers ────────────────────────────────────
+
+    def _current(self, key: str) -> float:
+        level, _, _ = self._levels[key]
+        return level - self.config.evaporation_per_tick * self._ticks
+
+    def _expired(self, key: str) -> bool:
+        """True once a tick has brought the trace to or below min_strength."""
+        _, _, base = self._levels[key]
+        return self._ticks > base and self._current(key) <= self.config.min_strength
+
+    def _set_level(self, key: str, strength: float) -> None:
+        previous = self._levels.get(key)
+        if previous is None:
+            neg_seq = -next(self._seq)
+        else:
+            neg_seq = previous[1]
+            self._unindex(key)
+        level = strength + self.config.evaporation_per_tick * self._ticks
+        self._levels[key] = (level, neg_seq, self._ticks)
+        bisect.insort(self._order, (level, neg_seq, key))
+
+    def _unindex(self, key: str) -> None:
+        level, neg_seq, _ = self._levels.pop(key)
+        pos = bisect.bisect_left(self._order, (level, neg_seq, key))
+        del self._order[pos]
+
+    def _live(self, key: str) -> TraceMarker | None:
+        """Return the stored marker, dropping it first if it has expired."""
+        m = self._markers.get(key)
+        if m is not None and self.config.lazy_evaporation and self._expired(key):
+            self._unindex(key)
+            del self._markers[key]
+            return None
+        return m
+
+    def _expired_prefix(self) -> tuple[int, list[tuple[float, int, str]]]:
+        """Index entries that may have expired (the weakest levels)."""
+        threshold = (
+            self.config.min_strength + self.config.evaporation_per_tick * self._ticks
+        )
+        end = bisect.bisect_right(self._order, (threshold, math.inf))
+        return end, [e for e in self._order[:end] if self._expired(e[2])]
+
+    def _snapshot(self, m: TraceMarker, strength: float) -> TraceMarker:
+        return TraceMarker(
+            key=m.key,
+            strength=strength,
+            updated_at=m.updated_at,
+            metadata=dict(m.metadata),
+        )
+
+    # ── public API ──────────────────────────────────────────────────
+
     def deposit(
         self,
         key: str,
@@ -30,51 +108,65 @@ class TraceField:
     ) -> TraceMarker:
         """Create or add strength at *key* (environmental mark)."""
         now = time.time()
-        if key in self._markers:
-            m = self._markers[key]
-            m.strength = self._clamp(m.strength + initial)
+        lazy = self.config.lazy_evaporation
+        m = self._live(key)
+        if m is not None:
+            current = self._current(key) if lazy else m.strength
+            m.strength = self._clamp(current + initial)
             m.updated_at = now
             if metadata:
                 m.metadata.update(metadata)
-            return m
-        m = TraceMarker(
-            key=key,
-            strength=self._clamp(initial),
-            updated_at=now,
-            metadata=dict(metadata or {}),
-        )
-        self._markers[key] = m
+        else:
+            m = TraceMarker(
+                key=key,
+                strength=self._clamp(initial),
+                updated_at=now,
+                metadata=dict(metadata or {}),
+            )
+            self._markers[key] = m
+        if lazy:
+            self._set_level(key, m.strength)
         return m
 
     def reinforce(self, key: str) -> TraceMarker | None:
         """Strengthen an existing trace (e.g. after successful recall)."""
-        m = self._markers.get(key)
+        m = self._live(key)
         if m is None:
             return None
-        m.strength = self._clamp(m.strength + self.config.reinforce_on_read_delta)
+        if self.config.lazy_evaporation:
+            m.strength = self._clamp(
+                self._current(key) + self.config.reinforce_on_read_delta
+            )
+            self._set_level(key, m.strength)
+        else:
+            m.strength = self._clamp(m.strength + self.config.reinforce_on_read_delta)
         m.updated_at = time.time()
         return m
 
     def sense(self, key: str, *, reinforce: bool = False) -> TraceMarker | None:
         """Read trace at *key*; optionally reinforce (quantitative stigmergy on read)."""
-        m = self._markers.get(key)
+        m = self._live(key)
         if m is None:
             return None
         if reinforce:
             return self.reinforce(key)
-        return TraceMarker(
-            key=m.key,
-            strength=m.strength,
-            updated_at=m.updated_at,
-            metadata=dict(m.metadata),
-        )
+        strength = self._current(key) if self.config.lazy_evaporation else m.strength
+        return self._snapshot(m, strength)
 
     def tick(self) -> int:
         """Apply evaporation to all traces; remove at or below min_strength.
 
+        In lazy mode this only advances the tick counter, and every
+        ``gc_interval_ticks``-th tick runs :meth:`collect`.
+
         Returns:
             Number of keys removed.
         """
+        self._ticks += 1
+        if self.config.lazy_evaporation:
+            if self._ticks % self.config.gc_interval_ticks == 0:
+                return self.collect()
+            return 0
         removed = 0
         to_del: list[str] = []
         for key, m in self._markers.items():
@@ -86,14 +178,43 @@ class TraceField:
             removed += 1
         return removed
 
+    def collect(self) -> int:
+        """Remove every expired trace in one pass (lazy mode); return the count.
+
+        Expired traces have the lowest levels, so only the head of the
+        sorted index is examined.
+        """
+        if not self.config.lazy_evaporation:
+            return 0
+        end, expired = self._expired_prefix()
+        if not expired:
+            return 0
+        dead = {e[2] for e in expired}
+        self._order[:end] = [e for e in self._order[:end] if e[2] not in dead]
+        for key in dead:
+            del self._levels[key]
+            del self._markers[key]
+        return len(dead)
+
     def top_k(self, k: int = 10) -> list[TraceMarker]:
         """Strongest traces first."""
-        ranked = sorted(
-            self._markers.values(),
-            key=lambda x: x.strength,
-            reverse=True,
-        )
-        return ranked[:k]
+        if not self.config.lazy_evaporation:
+            ranked = sorted(
+                self._markers.values(),
+                key=lambda x: x.strength,
+                reverse=True,
+            )
+            return ranked[:k]
+        out: list[TraceMarker] = []
+        evaporated = self.config.evaporation_per_tick * self._ticks
+        for level, _, key in reversed(self._order):
+            if len(out) >= k:
+                break
+            if not self._expired(key):
+                out.append(self._snapshot(self._markers[key], level - evaporated))
+        return out
 
     def __len__(self) -> int:
+        if self.config.lazy_evaporation:
+            return len(self._markers) - len(self._expired_prefix()[1])
         return len(self._markers)
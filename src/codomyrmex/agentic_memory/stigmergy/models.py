@@ -19,12 +19,21 @@ class TraceMarker:
 
 @dataclass
 class StigmergyConfig:
-    """Rates and bounds for trace deposition, reinforcement, and evaporation."""
+    """Rates and bounds for trace deposition, reinforcement, and evaporation.
+
+    With ``lazy_evaporation`` a tick only advances a global counter: each
+    trace stores its strength at its last write plus the tick it was written
+    at, and the current strength is derived when read. Expired traces are
+    hidden from reads and removed in bulk every ``gc_interval_ticks`` ticks
+    (or on :meth:`collect`), so ``tick`` no longer costs O(traces).
+    """
 
     evaporation_per_tick: float = 0.1
     reinforce_on_read_delta: float = 0.15
     min_strength: float = 0.0
     max_strength: float = 10.0
+    lazy_evaporation: bool = False
+    gc_interval_ticks: int = 32
 
     def __post_init__(self) -> None:
         if self.evaporation_per_tick < 0:
@@ -33,3 +42,5 @@ class StigmergyConfig:
             raise ValueError("reinforce_on_read_delta must be non-negative")
         if self.min_strength > self.max_strength:
             raise ValueError("min_strength must not exceed max_strength")
+        if self.gc_interval_ticks < 1:
+            raise ValueError("gc_interval_ticks must be at least 1")
@@ -12,7 +12,17 @@ from codomyrmex.agentic_memory.stigmergy.models import StigmergyConfig, TraceMar
 
 
 class SqliteTraceLedger:
-    """Thread-safe trace ledger with the same operations as :class:`TraceField`."""
+    """Thread-safe trace ledger with the same operations as :class:`TraceField`.
+
+    Eager mode evaporates with one bulk ``UPDATE`` and one ``DELETE`` per
+    tick. Lazy mode (``config.lazy_evaporation``) stores each trace's
+    strength at its last write together with that tick (``base_tick``) and
+    an indexed ``level = strength + evaporation_per_tick * base_tick``; a
+    tick only increments the counter in ``stigmergy_clock`` and expired
+    rows are deleted with a single statement every ``gc_interval_ticks``.
+    Opening a ledger in the other mode, or with a different evaporation
+    rate, rebases the stored rows once.
+    """
 
     def __init__(
         self,
@@ -41,6 +51,63 @@ class SqliteTraceLedger:
                 )
                 """
             )
+            columns = {
+                row["name"]
+                for row in conn.execute("PRAGMA table_info(stigmergy_traces)")
+            }
+            if "base_tick" not in columns:
+                conn.execute(
+                    "ALTER TABLE stigmergy_traces "
+                    "ADD COLUMN base_tick INTEGER NOT NULL DEFAULT 0"
+                )
+            if "level" not in columns:
+                conn.execute("ALTER TABLE stigmergy_traces ADD COLUMN level REAL")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_stigmergy_level "
+                "ON stigmergy_traces(level)"
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS stigmergy_clock (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    tick INTEGER NOT NULL DEFAULT 0,
+                    evaporation REAL
+                )
+                """
+            )
+            conn.execute("INSERT OR IGNORE INTO stigmergy_clock (id) VALUES (1)")
+            self._rebase(conn)
+
+    def _rebase(self, conn: sqlite3.Connection) -> None:
+        """Bring stored rows in line with this ledger's mode and rate.
+
+        ``stigmergy_clock.evaporation`` is the rate the stored levels were
+        computed with, or NULL when ``strength`` is already current (eager).
+        """
+        tick, stored = conn.execute(
+            "SELECT tick, evaporation FROM stigmergy_clock WHERE id = 1"
+        ).fetchone()
+        evap = self.config.evaporation_per_tick
+        lazy = self.config.lazy_evaporation
+        if stored == (evap if lazy else None):
+            return
+        old = stored or 0.0
+        if stored is not None:
+            conn.execute(
+                "DELETE FROM stigmergy_traces WHERE level <= ? AND base_tick < ?",
+                (self.config.min_strength + stored * tick, tick),
+            )
+        conn.execute(
+            """UPDATE stigmergy_traces
+               SET strength = strength - ? * (? - base_tick),
+                   level = strength - ? * (? - base_tick) + ?,
+                   base_tick = ?""",
+            (old, tick, old, tick, evap * tick if lazy else None, tick),
+        )
+        conn.execute(
+            "UPDATE stigmergy_clock SET evaporation = ? WHERE id = 1",
+            (evap if lazy else None,),
+        )
 
     def _clamp(self, strength: float) -> float:
         return max(
@@ -48,6 +115,77 @@ class SqliteTraceLedger:
             min(self.config.max_strength, strength),
         )
 
+    # ── lazy evaporation helpers ────────────────────────────────────
+
+    @staticmethod
+    def _tick_of(conn: sqlite3.Connection) -> int:
+        return int(
+            conn.execute("SELECT tick FROM stigmergy_clock WHERE id = 1").fetchone()[0]
+        )
+
+    def _live_sql(self, tick: int) -> tuple[str, tuple[Any, ...]]:
+        """WHERE clause selecting rows that have not evaporated yet."""
+        if not self.config.lazy_evaporation:
+            return "1 = 1", ()
+        return (
+            "NOT (level <= ? AND base_tick < ?)",
+            (self.config.min_strength + self.config.evaporation_per_tick * tick, tick),
+        )
+
+    def _strength_sql(self, tick: int) -> tuple[str, tuple[Any, ...]]:
+        """Column expression for the current strength."""
+        if not self.config.lazy_evaporation:
+            return "strength", ()
+        return "level - ?", (self.config.evaporation_per_tick * tick,)
+
+    def _write(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        strength: float,
+        *,
+        now: float,
+        metadata: dict[str, Any],
+        tick: int,
+    ) -> None:
+        level = (
+            strength + self.config.evaporation_per_tick * tick
+            if self.config.lazy_evaporation
+            else None
+        )
+        conn.execute(
+            """INSERT INTO stigmergy_traces
+                   (key, strength, updated_at, metadata, base_tick, level)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT(key) DO UPDATE SET
+                   strength = excluded.strength,
+                   updated_at = excluded.updated_at,
+                   metadata = excluded.metadata,
+                   base_tick = excluded.base_tick,
+                   level = excluded.level""",
+            (key, strength, now, json.dumps(metadata), tick, level),
+        )
+
+    def _read(
+        self, conn: sqlite3.Connection, key: str, tick: int
+    ) -> sqlite3.Row | None:
+        live, live_params = self._live_sql(tick)
+        strength, strength_params = self._strength_sql(tick)
+        return conn.execute(
+            f"SELECT {strength} AS strength, updated_at, metadata "
+            f"FROM stigmergy_traces WHERE key = ? AND {live}",
+            (*strength_params, key, *live_params),
+        ).fetchone()
+
+    @staticmethod
+    def _metadata(row: sqlite3.Row) -> dict[str, Any]:
+        try:
+            return json.loads(row["metadata"] or "{}")
+        except (json.JSONDecodeError, TypeError):
+            return {}
+
+    # ── public API ──────────────────────────────────────────────────
+
     def deposit(
         self,
         key: str,
@@ -56,130 +194,113 @@ class SqliteTraceLedger:
         metadata: dict[str, Any] | None = None,
     ) -> TraceMarker:
         now = time.time()
-        meta_json = json.dumps(metadata or {})
         with self._lock, self._conn() as conn:
-            row = conn.execute(
-                "SELECT strength, metadata FROM stigmergy_traces WHERE key = ?",
-                (key,),
-            ).fetchone()
+            tick = self._tick_of(conn) if self.config.lazy_evaporation else 0
+            row = self._read(conn, key, tick)
             if row:
-                prev = float(row["strength"])
-                merged_meta: dict[str, Any] = {}
-                try:
-                    merged_meta = json.loads(row["metadata"] or "{}")
-                except (json.JSONDecodeError, TypeError):
-                    merged_meta = {}
+                merged_meta = self._metadata(row)
                 if metadata:
                     merged_meta.update(metadata)
-                new_s = self._clamp(prev + initial)
-                conn.execute(
-                    """UPDATE stigmergy_traces
-                       SET strength = ?, updated_at = ?, metadata = ?
-                       WHERE key = ?""",
-                    (new_s, now, json.dumps(merged_meta), key),
-                )
-                return TraceMarker(
-                    key=key, strength=new_s, updated_at=now, metadata=merged_meta
-                )
-            conn.execute(
-                """INSERT INTO stigmergy_traces (key, strength, updated_at, metadata)
-                   VALUES (?, ?, ?, ?)""",
-                (key, self._clamp(initial), now, meta_json),
-            )
+                new_s = self._clamp(float(row["strength"]) + initial)
+            else:
+                merged_meta = dict(metadata or {})
+                new_s = self._clamp(initial)
+            self._write(conn, key, new_s, now=now, metadata=merged_meta, tick=tick)
         return TraceMarker(
-            key=key,
-            strength=self._clamp(initial),
-            updated_at=now,
-            metadata=dict(metadata or {}),
+            key=key, strength=new_s, updated_at=now, metadata=merged_meta
         )
 
     def reinforce(self, key: str) -> TraceMarker | None:
         with self._lock, self._conn() as conn:
-            row = conn.execute(
-                "SELECT strength, metadata FROM stigmergy_traces WHERE key = ?",
-                (key,),
-            ).fetchone()
+            tick = self._tick_of(conn) if self.config.lazy_evaporation else 0
+            row = self._read(conn, key, tick)
             if not row:
                 return None
             new_s = self._clamp(
                 float(row["strength"]) + self.config.reinforce_on_read_delta
             )
             now = time.time()
-            meta: dict[str, Any] = {}
-            try:
-                meta = json.loads(row["metadata"] or "{}")
-            except (json.JSONDecodeError, TypeError):
-                pass
-            conn.execute(
-                "UPDATE stigmergy_traces SET strength = ?, updated_at = ? WHERE key = ?",
-                (new_s, now, key),
-            )
+            meta = self._metadata(row)
+            self._write(conn, key, new_s, now=now, metadata=meta, tick=tick)
         return TraceMarker(key=key, strength=new_s, updated_at=now, metadata=meta)
 
     def sense(self, key: str, *, reinforce: bool = False) -> TraceMarker | None:
         if reinforce:
             return self.reinforce(key)
         with self._lock, self._conn() as conn:
-            row = conn.execute(
-                "SELECT strength, updated_at, metadata FROM stigmergy_traces WHERE key = ?",
-                (key,),
-            ).fetchone()
+            tick = self._tick_of(conn) if self.config.lazy_evaporation else 0
+            row = self._read(conn, key, tick)
             if not row:
                 return None
-            meta: dict[str, Any] = {}
-            try:
-                meta = json.loads(row["metadata"] or "{}")
-            except (json.JSONDecodeError, TypeError):
-                pass
             return TraceMarker(
                 key=key,
                 strength=float(row["strength"]),
                 updated_at=float(row["updated_at"]),
-                metadata=meta,
+                metadata=self._metadata(row),
             )
 
     def tick(self) -> int:
-        removed = 0
+        """Evaporate all traces; return the number of rows removed.
+
+        Lazy mode only advances the clock and runs :meth:`collect` every
+        ``gc_interval_ticks`` ticks.
+        """
+        with self._lock, self._conn() as conn:
+            conn.execute("UPDATE stigmergy_clock SET tick = tick + 1 WHERE id = 1")
+            if self.config.lazy_evaporation:
+                tick = self._tick_of(conn)
+                if tick % self.config.gc_interval_ticks:
+                    return 0
+                return self._collect(conn, tick)
+            conn.execute(
+                "UPDATE stigmergy_traces SET strength = strength - ?, updated_at = ?",
+                (self.config.evaporation_per_tick, time.time()),
+            )
+            return conn.execute(
+                "DELETE FROM stigmergy_traces WHERE strength <= ?",
+                (self.config.min_strength,),
+            ).rowcount
+
+    def _collect(self, conn: sqlite3.Connection, tick: int) -> int:
+        live, params = self._live_sql(tick)
+        return conn.execute(
+            f"DELETE FROM stigmergy_traces WHERE NOT ({live})", params
+        ).rowcount
+
+    def collect(self) -> int:
+        """Delete every expired trace in one statement (lazy mode)."""
+        if not self.config.lazy_evaporation:
+            return 0
         with self._lock, self._conn() as conn:
-            rows = conn.execute("SELECT key, strength FROM stigmergy_traces").fetchall()
-            for row in rows:
-                key = row["key"]
-                new_s = float(row["strength"]) - self.config.evaporation_per_tick
-                if new_s <= self.config.min_strength:
-                    conn.execute("DELETE FROM stigmergy_traces WHERE key = ?", (key,))
-                    removed += 1
-                else:
-                    conn.execute(
-                        "UPDATE stigmergy_traces SET strength = ?, updated_at = ? WHERE key = ?",
-                        (new_s, time.time(), key),
-                    )
-        return removed
+            return self._collect(conn, self._tick_of(conn))
 
     def top_k(self, k: int = 10) -> list[TraceMarker]:
         with self._lock, self._conn() as conn:
+            tick = self._tick_of(conn) if self.config.lazy_evaporation else 0
+            live, live_params = self._live_sql(tick)
+            strength, strength_params = self._strength_sql(tick)
+            order = "level" if self.config.lazy_evaporation else "strength"
             rows = conn.execute(
-                """SELECT key, strength, updated_at, metadata FROM stigmergy_traces
-                   ORDER BY strength DESC LIMIT ?""",
-                (k,),
+                f"""SELECT key, {strength} AS strength, updated_at, metadata
+                    FROM stigmergy_traces WHERE {live}
+                    ORDER BY {order} DESC LIMIT ?""",
+                (*strength_params, *live_params, k),
             ).fetchall()
-        out: list[TraceMarker] = []
-        for row in rows:
-            meta: dict[str, Any] = {}
-            try:
-                meta = json.loads(row["metadata"] or "{}")
-            except (json.JSONDecodeError, TypeError):
-                pass
-            out.append(
-                TraceMarker(
-                    key=row["key"],
-                    strength=float(row["strength"]),
-                    updated_at=float(row["updated_at"]),
-                    metadata=meta,
-                )
+        return [
+            TraceMarker(
+                key=row["key"],
+                strength=float(row["strength"]),
+                updated_at=float(row["updated_at"]),
+                metadata=self._metadata(row),
             )
-        return out
+            for row in rows
+        ]
 
     def __len__(self) -> int:
         with self._lock, self._conn() as conn:
-            n = conn.execute("SELECT COUNT(*) FROM stigmergy_traces").fetchone()[0]
+            tick = self._tick_of(conn) if self.config.lazy_evaporation else 0
+            live, params = self._live_sql(tick)
+            n = conn.execute(
+                f"SELECT COUNT(*) FROM stigmergy_traces WHERE {live}", params
+            ).fetchone()[0]
         return int(n)
@@ -1,18 +1,26 @@
 """Repo indexer for symbol extraction and import graph.
 
 Scans Python files to extract function/class symbols and build
-an import dependency graph.
+an import dependency graph. Per-file results are kept in a
+:class:`~codomyrmex.utils.file_cache.FileParseCache` keyed by absolute
+path, so repeated indexing only re-parses files that changed; the cache
+can be persisted across sessions.
 """
 
 from __future__ import annotations
 
 import ast
 import os
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from codomyrmex.logging_monitoring import get_logger
+from codomyrmex.utils.file_cache import FileParseCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
 
 logger = get_logger(__name__)
 
@@ -99,16 +107,126 @@ class RepoIndex:
         }
 
 
+_SKIP_DIRS = frozenset({"__pycache__", ".venv", ".git"})
+_CACHE_VERSION = 2
+
+
+def _first_line(node: ast.AST) -> str:
+    doc = ast.get_docstring(node) or ""  # type: ignore[arg-type]
+    return doc.split("\n")[0] if doc else ""
+
+
+def _parse_source(path: str, data: bytes) -> dict[str, Any]:
+    """Parse one file's source; runs in worker processes.
+
+    Returns ``symbols`` (``None`` for unparseable files) and ``imports`` as
+    plain lists for the cache entry.
+    """
+    try:
+        tree = ast.parse(data.decode())
+    except (SyntaxError, UnicodeDecodeError):
+        return {"symbols": None, "imports": []}
+
+    symbols: list[list[Any]] = []
+    imports: list[list[Any]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            symbols.append([node.name, "function", node.lineno, _first_line(node)])
+        elif isinstance(node, ast.ClassDef):
+            symbols.append([node.name, "class", node.lineno, _first_line(node)])
+        elif isinstance(node, ast.Import):
+            imports.extend([alias.name, []] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imports.append([node.module or "", [alias.name for alias in node.names]])
+    return {"symbols": symbols, "imports": imports}
+
+
 class RepoIndexer:
     """Index a repository for symbols and imports.
 
     Usage::
 
-        indexer = RepoIndexer()
-        index = indexer.index_file("path/to/module.py")
+        indexer = RepoIndexer(cache_path=".codomyrmex/index-cache.json")
+        index = indexer.index_directory("src")
         print(f"Found {index.symbol_count} symbols")
+
+        # later: refresh only what changed
+        index = indexer.update(["src/pkg/module.py"])
+        watcher = indexer.watch("src", callback=lambda idx, changed: ...)
     """
 
+    def __init__(
+        self,
+        cache_path: str | Path | None = None,
+        *,
+        max_workers: int | None = None,
+        parallel_threshold: int = 32,
+    ):
+        """
+        Args:
+            cache_path: JSON file to persist the per-file cache in; without
+                it the cache only lives as long as this indexer.
+            max_workers: Parser processes (default ``os.cpu_count()``).
+            parallel_threshold: Minimum number of files to parse before a
+                process pool is used.
+        """
+        self._cache = FileParseCache(
+            _parse_source,
+            version=_CACHE_VERSION,
+            cache_path=cache_path,
+            max_workers=max_workers,
+            parallel_threshold=parallel_threshold,
+        )
+        self.index: RepoIndex | None = None
+        self._root: Path | None = None
+        # abspath -> (display path, cache entry) for the last indexed tree
+        self._files: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def cache_path(self) -> Path | None:
+        return self._cache.cache_path
+
+    # ── cache ────────────────────────────────────────────────────────
+
+    def save_cache(self) -> None:
+        """Write the cache to ``cache_path`` if it changed."""
+        with self._lock:
+            self._cache.save()
+
+    def _resolve(self, paths: list[str]) -> dict[str, dict[str, Any] | None]:
+        """Cache entries for ``paths`` (``None`` if unreadable), parsing misses."""
+        keys = {path: os.path.abspath(path) for path in paths}
+        resolved = self._cache.resolve((key, path) for path, key in keys.items())
+        return {path: resolved[key][0] for path, key in keys.items()}
+
+    @staticmethod
+    def _merge(items: Iterable[tuple[str, dict[str, Any]]]) -> RepoIndex:
+        merged = RepoIndex()
+        for path, entry in items:
+            if entry["symbols"] is None:
+                continue
+            merged.symbols.extend(
+                Symbol(name=name, kind=kind, file=path, line=line, docstring=doc)
+                for name, kind, line, doc in entry["symbols"]
+            )
+            merged.imports.extend(
+                ImportEdge(source=path, target=target, names=list(names))
+                for target, names in entry["imports"]
+            )
+            merged.files_indexed += 1
+        return merged
+
+    @staticmethod
+    def _walk(root: Path) -> Iterator[str]:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+            for fname in filenames:
+                if fname.endswith(".py"):
+                    yield str(Path(dirpath, fname))
+
+    # ── indexing ─────────────────────────────────────────────────────
+
     def index_file(self, file_path: str | Path) -> RepoIndex:
         """Index a single Python file.
 
@@ -121,87 +239,43 @@ class RepoIndexer:
         path = Path(file_path)
         if not path.exists() or path.suffix != ".py":
             return RepoIndex()
-
-        try:
-            source = path.read_text()
-            tree = ast.parse(source)
-        except (SyntaxError, UnicodeDecodeError):
+        with self._lock:
+            entry = self._resolve([str(path)])[str(path)]
+            self.save_cache()
+        if entry is None:
             return RepoIndex()
-
-        symbols: list[Symbol] = []
-        imports: list[ImportEdge] = []
-        rel_path = str(path)
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                doc = ast.get_docstring(node) or ""
-                symbols.append(
-                    Symbol(
-                        name=node.name,
-                        kind="function",
-                        file=rel_path,
-                        line=node.lineno,
-                        docstring=doc.split("\n")[0] if doc else "",
-                    )
-                )
-            elif isinstance(node, ast.ClassDef):
-                doc = ast.get_docstring(node) or ""
-                symbols.append(
-                    Symbol(
-                        name=node.name,
-                        kind="class",
-                        file=rel_path,
-                        line=node.lineno,
-                        docstring=doc.split("\n")[0] if doc else "",
-                    )
-                )
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(
-                        ImportEdge(
-                            source=rel_path,
-                            target=alias.name,
-                        )
-                    )
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                names = [alias.name for alias in node.names]
-                imports.append(
-                    ImportEdge(
-                        source=rel_path,
-                        target=module,
-                        names=names,
-                    )
-                )
-
-        return RepoIndex(
-            symbols=symbols,
-            imports=imports,
-            files_indexed=1,
-        )
+        return self._merge([(str(path), entry)])
 
     def index_directory(self, root: str | Path) -> RepoIndex:
         """Index all Python files in a directory.
 
+        Unchanged files are served from the cache; the rest are parsed,
+        in a process pool when there are at least ``parallel_threshold``.
+
         Args:
             root: Root directory.
 
         Returns:
             Merged ``RepoIndex`` for the entire directory.
         """
-        merged = RepoIndex()
         root_path = Path(root)
-
-        for dirpath, dirnames, filenames in os.walk(root_path):
-            dirnames[:] = [
-                d for d in dirnames if d not in {"__pycache__", ".venv", ".git"}
-            ]
-            for fname in filenames:
-                if fname.endswith(".py"):
-                    idx = self.index_file(os.path.join(dirpath, fname))
-                    merged.symbols.extend(idx.symbols)
-                    merged.imports.extend(idx.imports)
-                    merged.files_indexed += idx.files_indexed
+        paths = list(self._walk(root_path))
+        with self._lock:
+            resolved = self._resolve(paths)
+            self._root = root_path
+            self._files = {
+                os.path.abspath(path): (path, entry)
+                for path, entry in resolved.items()
+                if entry is not None
+            }
+            # Forget cached files that no longer exist under this root
+            prefix = os.path.join(os.path.abspath(root_path), "")
+            for key in [k for k in self._cache.entries if k.startswith(prefix)]:
+                if key not in self._files:
+                    self._cache.pop(key)
+            self.save_cache()
+            self.index = self._merge(self._files.values())
+            merged = self.index
 
         logger.info(
             "Directory indexed",
@@ -210,9 +284,140 @@ class RepoIndexer:
 
         return merged
 
+    def update(self, paths: Iterable[str | Path]) -> RepoIndex:
+        """Refresh the last directory index for added, changed or removed files.
+
+        Args:
+            paths: Files to re-check; missing files are dropped from the index.
+
+        Returns:
+            The updated ``RepoIndex`` (also kept as ``self.index``).
+        """
+        with self._lock:
+            changed = [str(Path(p)) for p in paths if str(p).endswith(".py")]
+            resolved = self._resolve(changed)
+            for path, entry in resolved.items():
+                key = os.path.abspath(path)
+                if entry is None:
+                    self._files.pop(key, None)
+                else:
+                    shown = self._files[key][0] if key in self._files else path
+                    self._files[key] = (shown, entry)
+            self.save_cache()
+            self.index = self._merge(self._files.values())
+            return self.index
+
+    def changed_files(self) -> list[str]:
+        """Files under the last indexed root added, modified or removed since."""
+        with self._lock:
+            if self._root is None:
+                return []
+            current = {os.path.abspath(p): p for p in self._walk(self._root)}
+            changed = []
+            for key, path in current.items():
+                known = self._files.get(key)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if known is None or (known[1]["mtime_ns"], known[1]["size"]) != (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                ):
+                    changed.append(path)
+            changed.extend(
+                path for key, (path, _) in self._files.items() if key not in current
+            )
+            return changed
+
+    def watch(
+        self,
+        root: str | Path,
+        callback: Callable[[RepoIndex, list[str]], None] | None = None,
+        interval: float = 2.0,
+    ) -> IndexWatcher:
+        """Index ``root`` and start a watcher that keeps the index current.
+
+        Args:
+            root: Root directory.
+            callback: Called with the new index and the changed paths after
+                each refresh.
+            interval: Polling interval in seconds.
+
+        Returns:
+            The started ``IndexWatcher``; call ``stop()`` when done.
+        """
+        self.index_directory(root)
+        watcher = IndexWatcher(self, callback=callback, interval=interval)
+        watcher.start()
+        return watcher
+
+
+class IndexWatcher:
+    """Polls a ``RepoIndexer``'s root for changes and refreshes its index."""
+
+    def __init__(
+        self,
+        indexer: RepoIndexer,
+        callback: Callable[[RepoIndex, list[str]], None] | None = None,
+        interval: float = 2.0,
+    ):
+        self.indexer = indexer
+        self.callback = callback
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the watcher thread."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="RepoIndexWatcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread."""
+        self._stop_event.set()
+        with self._lock:
+            if self._thread:
+                self._thread.join(timeout=max(self.interval * 2, 5.0))
+                self._thread = None
+
+    def poll(self) -> list[str]:
+        """Check once for changes, refreshing the index; returns changed paths."""
+        changed = self.indexer.changed_files()
+        if changed:
+            index = self.indexer.update(changed)
+            logger.info("Index refreshed", extra={"changed": len(changed)})
+            if self.callback is not None:
+                try:
+                    self.callback(index, changed)
+                except Exception as e:
+                    logger.error("Error in IndexWatcher callback: %s", e)
+        return changed
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error("Unexpected error in IndexWatcher loop: %s", e)
+
+    @property
+    def is_alive(self) -> bool:
+        """Check if the watcher thread is alive."""
+        with self._lock:
+            return self._thread is not None and self._thread.is_alive()
+
 
 __all__ = [
     "ImportEdge",
+    "IndexWatcher",
     "RepoIndex",
     "RepoIndexer",
     "Symbol",
@@ -281,25 +281,29 @@ def hermes_deduplicate_ki(
 ) -> dict[str, Any]:
     """Deduplicate Knowledge Items by merging similar entries.
 
-    Computes token-overlap similarity between all SEMANTIC memories.
-    Items with similarity ≥ *threshold* relative to an existing older item
-    are merged into it (body appended as ``## Update``) and deleted.
+    Computes token-overlap similarity between SEMANTIC memories (only the
+    MinHash/LSH candidate pairs for thresholds ≥ 0.5). Items with
+    similarity ≥ *threshold* relative to an existing older item are merged
+    into it (body appended as ``## Update``) and deleted.
 
     Args:
         threshold: Similarity threshold 0.0–1.0 (default 0.85).
 
     Returns:
-        dict with status, merged_count, and message.
+        dict with status, merged_count, pairs_compared, scanned, and message.
     """
     try:
         from codomyrmex.agentic_memory.core.memory import KnowledgeMemory
 
         km = KnowledgeMemory()
-        merged = km.merge_duplicates(threshold=threshold)
+        report = km.deduplicate(threshold=threshold)
+        merged = report.merged
 
         return {
             "status": "success",
             "merged_count": merged,
+            "pairs_compared": report.pairs_compared,
+            "scanned": report.scanned,
             "threshold": threshold,
             "message": f"Merged {merged} duplicate Knowledge Item(s) at threshold {threshold}.",
         }
@@ -29,18 +29,22 @@ Session Race Guard Usage::
 
 from __future__ import annotations
 
+import copy
 import json
 import sqlite3
 import threading
 import time
 import uuid
+from collections import OrderedDict
+from collections.abc import MutableSequence
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Protocol, Self, runtime_checkable
 
 from codomyrmex.logging_monitoring import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
 logger = get_logger(__name__)
@@ -187,9 +191,199 @@ class InMemorySessionStore:
         return False
 
 
+# ``(role, content, extra_json)`` columns of one stored message.
+_EncodedMessage = tuple[str | None, str | None, str | None]
+
+
+def _encode_message(message: dict[str, Any]) -> _EncodedMessage:
+    """Split a message into ``(role, content, extra_json)`` columns.
+
+    String ``role``/``content`` get their own columns (``content`` is
+    full-text indexed); every other key, or a non-string role/content, is
+    kept in ``extra``. The tuple doubles as the message's identity when
+    diffing a session against what is already stored.
+    """
+    role = message.get("role")
+    content = message.get("content")
+    extra = {k: v for k, v in message.items() if k not in ("role", "content")}
+    if not isinstance(role, str):
+        if "role" in message:
+            extra["role"] = role
+        role = None
+    if not isinstance(content, str):
+        if "content" in message:
+            extra["content"] = content
+        content = None
+    return role, content, json.dumps(extra, sort_keys=True) if extra else None
+
+
+def _decode_message(
+    role: str | None, content: str | None, extra: str | None
+) -> dict[str, Any]:
+    message: dict[str, Any] = {}
+    if role is not None:
+        message["role"] = role
+    if content is not None:
+        message["content"] = content
+    if extra:
+        message.update(json.loads(extra))
+    return message
+
+
+class PagedMessages(MutableSequence):
+    """Message list of a stored session, loaded from the database in pages.
+
+    Returned by ``SQLiteSessionStore.load(..., lazy=True)``. Reading an index
+    fetches only its page; ``append`` (and so ``HermesSession.add_message``)
+    keeps new messages in memory without loading anything, and saving the
+    session inserts just those. Any other mutation first loads every message,
+    after which the object behaves like a plain list.
+
+    Copying or pickling produces a plain ``list``.
+    """
+
+    def __init__(
+        self,
+        store: SQLiteSessionStore,
+        session_id: str,
+        stored_count: int,
+        page_size: int = 200,
+        revision: str | None = None,
+    ) -> None:
+        self._store = store
+        self._session_id = session_id
+        self._stored = stored_count
+        self._revision = revision
+        self._page_size = max(1, page_size)
+        self._pages: dict[int, list[dict[str, Any]]] = {}
+        self._tail: list[dict[str, Any]] = []
+        self._saved_tail = 0
+        self._items: list[dict[str, Any]] | None = None
+
+    def _page(self, index: int) -> list[dict[str, Any]]:
+        page = self._pages.get(index)
+        if page is None:
+            page = self._pages[index] = self._store.load_messages(
+                self._session_id,
+                offset=index * self._page_size,
+                limit=self._page_size,
+            )
+        return page
+
+    def _get(self, index: int) -> dict[str, Any]:
+        if index >= self._stored:
+            return self._tail[index - self._stored]
+        page, offset = divmod(index, self._page_size)
+        return self._page(page)[offset]
+
+    def _materialize(self) -> list[dict[str, Any]]:
+        if self._items is None:
+            self._items = [self._get(i) for i in range(self._stored)] + self._tail
+            self._pages.clear()
+            self._tail = []
+        return self._items
+
+    def __len__(self) -> int:
+        if self._items is not None:
+            return len(self._items)
+        return self._stored + len(self._tail)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if self._items is not None:
+            return self._items[index]
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("message index out of range")
+        return self._get(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if self._items is not None:
+            yield from self._items
+            return
+        for page in range(-(-self._stored // self._page_size)):
+            yield from self._page(page)
+        yield from self._tail
+
+    def __setitem__(self, index, value) -> None:  # type: ignore[override]
+        self._materialize()[index] = value
+
+    def __delitem__(self, index) -> None:  # type: ignore[override]
+        del self._materialize()[index]
+
+    def insert(self, index: int, value: dict[str, Any]) -> None:
+        """Insert a message (loads all messages first)."""
+        self._materialize().insert(index, value)
+
+    def append(self, value: dict[str, Any]) -> None:
+        """Append a message without loading stored ones."""
+        if self._items is not None:
+            self._items.append(value)
+        else:
+            self._tail.append(value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, PagedMessages)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other, strict=True)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PagedMessages(session_id={self._session_id!r}, len={len(self)})"
+
+    def __copy__(self) -> list[dict[str, Any]]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[dict[str, Any]]:
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return list, (list(self),)
+
+    def _unsaved(
+        self,
+        store: SQLiteSessionStore,
+        session_id: str,
+        stored: int,
+        revision: str | None,
+    ) -> list[dict[str, Any]] | None:
+        """New messages to append if this list is an unmodified view of the
+        ``stored`` rows at ``revision`` of ``session_id`` in ``store``, else
+        None."""
+        if (
+            self._items is not None
+            or store is not self._store
+            or session_id != self._session_id
+            or revision is None
+            or revision != self._revision
+            or stored != self._stored + self._saved_tail
+        ):
+            return None
+        return self._tail[self._saved_tail :]
+
+    def _mark_saved(self, revision: str) -> None:
+        self._saved_tail = len(self._tail)
+        self._revision = revision
+
+
 class SQLiteSessionStore:
     """SQLite-backed session persistence.
 
+    Messages live in their own table, one row per message, so ``save``
+    inserts only the turns added since the last save (a session whose
+    earlier messages were changed has its rows rewritten from the first
+    difference on). Each session row carries a revision token that every
+    message write replaces, so the cache of stored messages used for that
+    diff is only trusted while no other store (or process) has written the
+    session since. The database runs in WAL mode; saves inside
+    :meth:`batch` share one commit; ``load(..., lazy=True)`` and
+    :meth:`load_messages` read messages a page at a time.
+
     Args:
         db_path: Path to the SQLite database file.
 
@@ -199,6 +393,9 @@ class SQLiteSessionStore:
         store.save(session)
     """
 
+    # Sessions whose stored message identities are kept for diffing
+    _KNOWN_LIMIT = 256
+
     def __init__(self, db_path: str | Path = ":memory:") -> None:
         """Initialize the SQLite session store.
 
@@ -210,6 +407,11 @@ class SQLiteSessionStore:
         self._conn = sqlite3.connect(
             self._db_path, check_same_thread=False, timeout=5.0
         )
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        # session_id -> (revision, encoded messages) as last written, for
+        # append detection
+        self._known: OrderedDict[str, tuple[str, list[_EncodedMessage]]] = OrderedDict()
         self._init_schema()
 
     def _init_schema(self) -> None:
@@ -220,6 +422,8 @@ class SQLiteSessionStore:
         # set busy timeout (this is somewhat redundant with timeout=5.0, but explicit)
         self._conn.execute("PRAGMA busy_timeout=5000;")
 
+        # ``messages`` is kept for older readers; message rows live in
+        # hermes_messages and the column holds '[]'.
         self._conn.execute("""
             CREATE TABLE IF NOT EXISTS hermes_sessions (
                 session_id TEXT PRIMARY KEY,
@@ -228,11 +432,24 @@ class SQLiteSessionStore:
                 messages TEXT NOT NULL,
                 metadata TEXT NOT NULL DEFAULT '{}',
                 created_at REAL NOT NULL,
-                updated_at REAL NOT NULL
+                updated_at REAL NOT NULL,
+                message_count INTEGER,
+                message_rev TEXT
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS hermes_messages (
+                id INTEGER PRIMARY KEY,
+                session_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                role TEXT,
+                content TEXT,
+                extra TEXT,
+                UNIQUE (session_id, seq)
             )
         """)
 
-        # FTS5 virtual table for semantic retrieval
+        # FTS5 virtual tables for semantic retrieval
         self._conn.execute("""
             CREATE VIRTUAL TABLE IF NOT EXISTS hermes_sessions_fts USING fts5(
                 session_id UNINDEXED,
@@ -243,6 +460,14 @@ class SQLiteSessionStore:
                 tokenize='porter'
             )
         """)
+        self._conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS hermes_messages_fts USING fts5(
+                content,
+                content='hermes_messages',
+                content_rowid='id',
+                tokenize='porter'
+            )
+        """)
 
         # Sync triggers for FTS5
         self._conn.execute("""
@@ -265,11 +490,30 @@ class SQLiteSessionStore:
                 VALUES (new.rowid, new.session_id, new.name, new.messages);
             END;
         """)
+        self._conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS hermes_messages_ai AFTER INSERT ON hermes_messages BEGIN
+                INSERT INTO hermes_messages_fts(rowid, content) VALUES (new.id, new.content);
+            END;
+        """)
+        self._conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS hermes_messages_ad AFTER DELETE ON hermes_messages BEGIN
+                INSERT INTO hermes_messages_fts(hermes_messages_fts, rowid, content)
+                VALUES('delete', old.id, old.content);
+            END;
+        """)
+        self._conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS hermes_messages_au AFTER UPDATE OF content ON hermes_messages BEGIN
+                INSERT INTO hermes_messages_fts(hermes_messages_fts, rowid, content)
+                VALUES('delete', old.id, old.content);
+                INSERT INTO hermes_messages_fts(rowid, content) VALUES (new.id, new.content);
+            END;
+        """)
 
         self._conn.commit()
         # Migrate: add columns for existing DBs that lack them
         self._migrate_add_columns()
         self._migrate_fts()
+        self._migrate_messages()
 
     def _migrate_fts(self) -> None:
         """Populate the FTS table with any existing records that are missing."""
@@ -301,6 +545,14 @@ class SQLiteSessionStore:
                 "parent_session_id",
                 "ALTER TABLE hermes_sessions ADD COLUMN parent_session_id TEXT",
             ),
+            (
+                "message_count",
+                "ALTER TABLE hermes_sessions ADD COLUMN message_count INTEGER",
+            ),
+            (
+                "message_rev",
+                "ALTER TABLE hermes_sessions ADD COLUMN message_rev TEXT",
+            ),
         ]
 
         for col_name, sql in migrations:
@@ -314,58 +566,268 @@ class SQLiteSessionStore:
                 except sqlite3.OperationalError:
                     pass  # Column already exists or DB is read-only
 
+    def _migrate_messages(self) -> None:
+        """Move JSON message blobs of older rows into ``hermes_messages``."""
+        rows = self._conn.execute(
+            "SELECT session_id, messages FROM hermes_sessions WHERE message_count IS NULL"
+        ).fetchall()
+        if not rows:
+            return
+        try:
+            for session_id, blob in rows:
+                messages = json.loads(blob) if blob else []
+                self._insert_messages(session_id, 0, messages)
+                self._conn.execute(
+                    "UPDATE hermes_sessions SET messages = '[]', message_count = ? "
+                    "WHERE session_id = ?",
+                    (len(messages), session_id),
+                )
+            self._conn.commit()
+            logger.info("Migrated %d sessions to hermes_messages rows.", len(rows))
+        except sqlite3.OperationalError:
+            self._conn.rollback()  # read-only database: keep the old layout
+
+    @contextmanager
+    def _write(self) -> Iterator[None]:
+        """Run a read-modify-write under the store lock in one transaction.
+
+        ``BEGIN IMMEDIATE`` takes the write lock (waiting on the busy
+        timeout) before anything is read, so the reads see the latest data
+        and the later writes cannot fail with a stale WAL snapshot. Inside
+        :meth:`batch` the transaction stays open until the batch ends.
+        """
+        with self._lock:
+            if not self._conn.in_transaction:
+                self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                if self._batch_depth == 0:
+                    self._conn.rollback()
+                    self._known.clear()
+                raise
+            if self._batch_depth == 0:
+                self._conn.commit()
+
+    @contextmanager
+    def batch(self) -> Iterator[Self]:
+        """Group writes into a single transaction.
+
+        Saves and deletes inside the block are committed once on exit (or
+        rolled back together if the block raises). Other threads using the
+        store wait until the block ends.
+
+        Example::
+
+            with store.batch():
+                for session in sessions:
+                    store.save(session)
+        """
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                if self._batch_depth == 1:
+                    self._conn.rollback()
+                    self._known.clear()
+                raise
+            finally:
+                self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._conn.commit()
+
+    def _insert_messages(
+        self, session_id: str, start: int, messages: list[dict[str, Any]]
+    ) -> list[_EncodedMessage]:
+        encoded = [_encode_message(m) for m in messages]
+        self._conn.executemany(
+            "INSERT INTO hermes_messages (session_id, seq, role, content, extra) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(session_id, start + i, *columns) for i, columns in enumerate(encoded)],
+        )
+        return encoded
+
+    def _stored_encoded(self, session_id: str) -> list[_EncodedMessage]:
+        return self._conn.execute(
+            "SELECT role, content, extra FROM hermes_messages "
+            "WHERE session_id = ? ORDER BY seq",
+            (session_id,),
+        ).fetchall()
+
+    def _remember(
+        self,
+        session_id: str,
+        revision: str,
+        encoded: list[_EncodedMessage],
+    ) -> None:
+        self._known[session_id] = (revision, encoded)
+        self._known.move_to_end(session_id)
+        while len(self._known) > self._KNOWN_LIMIT:
+            self._known.popitem(last=False)
+
     def save(self, session: HermesSession) -> None:
         """Save or update a session.
 
+        Only messages that are not yet stored are written. If earlier
+        messages were edited, removed or reordered, the stored rows are
+        replaced from the first differing message onwards.
+
         Args:
             session: The session to persist.
         """
-        self._conn.execute(
-            """
-            INSERT OR REPLACE INTO hermes_sessions
-            (session_id, name, parent_session_id, messages, metadata, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                session.session_id,
-                session.name,
-                session.parent_session_id,
-                json.dumps(session.messages),
-                json.dumps(session.metadata),
-                session.created_at,
-                session.updated_at,
-            ),
-        )
-        self._conn.commit()
+        session_id = session.session_id
+        messages = session.messages
+        with self._write():
+            row = self._conn.execute(
+                "SELECT message_count, message_rev FROM hermes_sessions "
+                "WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            stored, stored_rev = ((row[0] or 0), row[1]) if row else (0, None)
+            revision = uuid.uuid4().hex
+
+            unsaved = (
+                messages._unsaved(self, session_id, stored, stored_rev)
+                if isinstance(messages, PagedMessages)
+                else None
+            )
+            if unsaved is not None:
+                self._insert_messages(session_id, stored, unsaved)
+                self._known.pop(session_id, None)
+            else:
+                encoded = [_encode_message(m) for m in messages]
+                cached = self._known.get(session_id)
+                if (
+                    cached is not None
+                    and stored_rev is not None
+                    and (cached[0] == stored_rev)
+                ):
+                    known = cached[1]
+                else:
+                    known = self._stored_encoded(session_id) if stored else []
+                common = 0
+                for old, new in zip(known, encoded, strict=False):
+                    if old != new:
+                        break
+                    common += 1
+                if common < stored:
+                    self._conn.execute(
+                        "DELETE FROM hermes_messages WHERE session_id = ? AND seq >= ?",
+                        (session_id, common),
+                    )
+                self._insert_messages(session_id, common, list(messages[common:]))
+                self._remember(session_id, revision, encoded)
+
+            self._conn.execute(
+                """
+                INSERT INTO hermes_sessions
+                (session_id, name, parent_session_id, messages, metadata,
+                 created_at, updated_at, message_count, message_rev)
+                VALUES (?, ?, ?, '[]', ?, ?, ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    name = excluded.name,
+                    parent_session_id = excluded.parent_session_id,
+                    metadata = excluded.metadata,
+                    created_at = excluded.created_at,
+                    updated_at = excluded.updated_at,
+                    message_count = excluded.message_count,
+                    message_rev = excluded.message_rev
+                """,
+                (
+                    session_id,
+                    session.name,
+                    session.parent_session_id,
+                    json.dumps(session.metadata),
+                    session.created_at,
+                    session.updated_at,
+                    len(messages),
+                    revision,
+                ),
+            )
+        if isinstance(messages, PagedMessages):
+            messages._mark_saved(revision)
 
-    def load(self, session_id: str) -> HermesSession | None:
-        """Load a session by ID.
+    def load_messages(
+        self, session_id: str, offset: int = 0, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Load a page of a session's messages.
 
         Args:
             session_id: Session identifier.
+            offset: Index of the first message to return.
+            limit: Maximum number of messages (``None`` for all).
 
         Returns:
-            The :class:`HermesSession` or ``None``.
+            The messages, oldest first (empty if the session is unknown).
         """
-        cursor = self._conn.execute(
-            "SELECT session_id, name, parent_session_id, messages, metadata, created_at, updated_at "
-            "FROM hermes_sessions WHERE session_id = ?",
-            (session_id,),
-        )
-        row = cursor.fetchone()
-        if row is None:
-            return None
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT role, content, extra FROM hermes_messages "
+                "WHERE session_id = ? AND seq >= ? ORDER BY seq LIMIT ?",
+                (session_id, offset, -1 if limit is None else limit),
+            )
+            return [_decode_message(*row) for row in cursor.fetchall()]
+
+    def iter_messages(
+        self, session_id: str, page_size: int = 500
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over a session's messages, reading ``page_size`` at a time."""
+        offset = 0
+        while True:
+            page = self.load_messages(session_id, offset, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    _SESSION_COLUMNS = (
+        "session_id, name, parent_session_id, metadata, created_at, updated_at, "
+        "message_count, message_rev"
+    )
 
+    def _row_to_session(
+        self, row: tuple[Any, ...], lazy: bool = False, page_size: int = 200
+    ) -> HermesSession:
+        session_id = row[0]
+        messages: list[dict[str, Any]] | PagedMessages
+        if lazy:
+            messages = PagedMessages(self, session_id, row[6] or 0, page_size, row[7])
+        else:
+            messages = self.load_messages(session_id)
         return HermesSession(
-            session_id=row[0],
+            session_id=session_id,
             name=row[1],
             parent_session_id=row[2],
-            messages=json.loads(row[3]),
-            metadata=json.loads(row[4]),
-            created_at=row[5],
-            updated_at=row[6],
+            messages=messages,  # type: ignore[arg-type]
+            metadata=json.loads(row[3]),
+            created_at=row[4],
+            updated_at=row[5],
         )
 
+    def load(
+        self, session_id: str, *, lazy: bool = False, page_size: int = 200
+    ) -> HermesSession | None:
+        """Load a session by ID.
+
+        Args:
+            session_id: Session identifier.
+            lazy: Return the messages as a :class:`PagedMessages` that reads
+                them from the database ``page_size`` at a time on access.
+            page_size: Messages per page when ``lazy``.
+
+        Returns:
+            The :class:`HermesSession` or ``None``.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._SESSION_COLUMNS} FROM hermes_sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            return self._row_to_session(row, lazy, page_size)
+
     def find_by_name(self, name: str) -> HermesSession | None:
         """Find a session by its human-friendly name.
 
@@ -375,23 +837,15 @@ class SQLiteSessionStore:
         Returns:
             The :class:`HermesSession` or ``None``.
         """
-        cursor = self._conn.execute(
-            "SELECT session_id, name, parent_session_id, messages, metadata, created_at, updated_at "
-            "FROM hermes_sessions WHERE name = ? ORDER BY updated_at DESC LIMIT 1",
-            (name,),
-        )
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        return HermesSession(
-            session_id=row[0],
-            name=row[1],
-            parent_session_id=row[2],
-            messages=json.loads(row[3]),
-            metadata=json.loads(row[4]),
-            created_at=row[5],
-            updated_at=row[6],
-        )
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._SESSION_COLUMNS} FROM hermes_sessions "
+                "WHERE name = ? ORDER BY updated_at DESC LIMIT 1",
+                (name,),
+            ).fetchone()
+            if row is None:
+                return None
+            return self._row_to_session(row)
 
     def search_sessions(self, query: str) -> list[dict[str, Any]]:
         """Search sessions by name substring.
@@ -413,7 +867,9 @@ class SQLiteSessionStore:
         ]
 
     def search_fts(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
-        """Perform a full-text search over session contents using FTS5.
+        """Perform a full-text search over session names and messages using FTS5.
+
+        Each session appears once, with its best-ranked matching message.
 
         Args:
             query: The FTS MATCH query.
@@ -422,20 +878,58 @@ class SQLiteSessionStore:
         Returns:
             list of dicts with ``session_id``, ``name``, ``messages_snippet``, and ``rank``.
         """
-        cursor = self._conn.execute(
-            "SELECT session_id, name, snippet(hermes_sessions_fts, 2, '<b>', '</b>', '...', 64), rank "
-            "FROM hermes_sessions_fts WHERE hermes_sessions_fts MATCH ? ORDER BY rank LIMIT ?",
-            (query, limit),
-        )
-        return [
-            {
-                "session_id": row[0],
-                "name": row[1],
-                "messages_snippet": row[2],
-                "rank": row[3],
-            }
-            for row in cursor.fetchall()
-        ]
+        best: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            # One row per session: the bare rowid comes from the row holding
+            # MIN(rank). snippet() cannot run in an aggregate, so snippets are
+            # built afterwards for the returned rows only.
+            message_hits = self._conn.execute(
+                "SELECT m.session_id, s.name, hermes_messages_fts.rowid, "
+                "MIN(hermes_messages_fts.rank) "
+                "FROM hermes_messages_fts "
+                "JOIN hermes_messages m ON m.id = hermes_messages_fts.rowid "
+                "JOIN hermes_sessions s ON s.session_id = m.session_id "
+                "WHERE hermes_messages_fts MATCH ? GROUP BY m.session_id "
+                "ORDER BY MIN(hermes_messages_fts.rank) LIMIT ?",
+                (query, limit),
+            ).fetchall()
+            snippets: dict[int, str] = {}
+            if message_hits:
+                rowids = [row[2] for row in message_hits]
+                marks = ",".join("?" * len(rowids))
+                snippets = dict(
+                    self._conn.execute(
+                        "SELECT rowid, "
+                        "snippet(hermes_messages_fts, 0, '<b>', '</b>', '...', 64) "
+                        "FROM hermes_messages_fts "
+                        f"WHERE hermes_messages_fts MATCH ? AND rowid IN ({marks})",
+                        (query, *rowids),
+                    ).fetchall()
+                )
+            for session_id, name, rowid, rank in message_hits:
+                best[session_id] = {
+                    "session_id": session_id,
+                    "name": name,
+                    "messages_snippet": snippets.get(rowid, ""),
+                    "rank": rank,
+                }
+            name_hits = self._conn.execute(
+                "SELECT session_id, name, rank FROM hermes_sessions_fts "
+                "WHERE hermes_sessions_fts MATCH ? ORDER BY rank LIMIT ?",
+                (query, limit),
+            )
+            for session_id, name, rank in name_hits:
+                hit = best.setdefault(
+                    session_id,
+                    {
+                        "session_id": session_id,
+                        "name": name,
+                        "messages_snippet": "",
+                        "rank": rank,
+                    },
+                )
+                hit["rank"] = min(hit["rank"], rank)
+        return sorted(best.values(), key=lambda hit: hit["rank"])[:limit]
 
     def prune_old_sessions(self, days_old: int = 30) -> int:
         """Archive and delete sessions older than the specified number of days.
@@ -456,8 +950,7 @@ class SQLiteSessionStore:
 
         threshold = time.time() - (days_old * 86400)
         cursor = self._conn.execute(
-            "SELECT session_id, name, parent_session_id, messages, metadata, created_at, updated_at "
-            "FROM hermes_sessions WHERE updated_at < ?",
+            f"SELECT {self._SESSION_COLUMNS} FROM hermes_sessions WHERE updated_at < ?",
             (threshold,),
         )
 
@@ -470,15 +963,7 @@ class SQLiteSessionStore:
 
         deleted_count = 0
         for row in rows:
-            session = HermesSession(
-                session_id=row[0],
-                name=row[1],
-                parent_session_id=row[2],
-                messages=json.loads(row[3]),
-                metadata=json.loads(row[4]),
-                created_at=row[5],
-                updated_at=row[6],
-            )
+            session = self._row_to_session(row)
 
             # Serialize and compress
             archive_path = archive_dir / f"{session.session_id}.json.gz"
@@ -514,11 +999,15 @@ class SQLiteSessionStore:
         Returns:
             ``True`` if the session was deleted.
         """
-        cursor = self._conn.execute(
-            "DELETE FROM hermes_sessions WHERE session_id = ?",
-            (session_id,),
-        )
-        self._conn.commit()
+        with self._write():
+            self._conn.execute(
+                "DELETE FROM hermes_messages WHERE session_id = ?", (session_id,)
+            )
+            cursor = self._conn.execute(
+                "DELETE FROM hermes_sessions WHERE session_id = ?",
+                (session_id,),
+            )
+            self._known.pop(session_id, None)
         return cursor.rowcount > 0
 
     def get_stats(self) -> dict[str, Any]:
@@ -561,7 +1050,7 @@ class SQLiteSessionStore:
         Returns:
             Markdown string, or ``None`` if the session does not exist.
         """
-        session = self.load(session_id)
+        session = self.load(session_id, lazy=True)
         if session is None:
             return None
 
@@ -596,7 +1085,8 @@ class SQLiteSessionStore:
         """Upsert a persistent system message at index 0 of the session.
 
         If the first message is already a ``system`` role, it will be replaced;
-        otherwise the new system message is prepended.
+        otherwise the new system message is prepended. Only the first message
+        row is written (plus a renumbering when prepending).
 
         Args:
             session_id: Session identifier.
@@ -605,23 +1095,48 @@ class SQLiteSessionStore:
         Returns:
             ``True`` if the session was updated.
         """
-        session = self.load(session_id)
-        if session is None:
-            return False
-
-        system_msg = {"role": "system", "content": prompt}
-        if session.messages and session.messages[0].get("role") == "system":
-            session.messages[0] = system_msg
-        else:
-            session.messages.insert(0, system_msg)
-
-        session.updated_at = time.time()
-        self.save(session)
+        with self._write():
+            row = self._conn.execute(
+                "SELECT message_count FROM hermes_sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                return False
+            first = self.load_messages(session_id, 0, 1)
+            if first and first[0].get("role") == "system":
+                self._conn.execute(
+                    "UPDATE hermes_messages SET role = 'system', content = ?, extra = NULL "
+                    "WHERE session_id = ? AND seq = 0",
+                    (prompt, session_id),
+                )
+                count = row[0] or 0
+            else:
+                # Two passes keep (session_id, seq) unique while shifting
+                self._conn.execute(
+                    "UPDATE hermes_messages SET seq = -seq - 1 WHERE session_id = ?",
+                    (session_id,),
+                )
+                self._conn.execute(
+                    "UPDATE hermes_messages SET seq = -seq WHERE session_id = ?",
+                    (session_id,),
+                )
+                self._insert_messages(
+                    session_id, 0, [{"role": "system", "content": prompt}]
+                )
+                count = (row[0] or 0) + 1
+            self._conn.execute(
+                "UPDATE hermes_sessions SET updated_at = ?, message_count = ?, "
+                "message_rev = ? WHERE session_id = ?",
+                (time.time(), count, uuid.uuid4().hex, session_id),
+            )
+            self._known.pop(session_id, None)
         return True
 
     def get_detail(self, session_id: str) -> dict[str, Any] | None:
         """Return a rich detail dictionary for a session.
 
+        Reads the first and last message only, not the whole history.
+
         Args:
             session_id: Session identifier.
 
@@ -629,25 +1144,27 @@ class SQLiteSessionStore:
             dict with all session fields plus ``message_count``, ``last_message``,
             ``has_system_prompt``, or ``None`` if not found.
         """
-        session = self.load(session_id)
-        if session is None:
-            return None
-
-        last = session.last_message
-        has_system = bool(
-            session.messages and session.messages[0].get("role") == "system"
-        )
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._SESSION_COLUMNS} FROM hermes_sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            count = row[6] or 0
+            first = self.load_messages(session_id, 0, 1)
+            last = self.load_messages(session_id, count - 1, 1) if count else []
 
         return {
-            "session_id": session.session_id,
-            "name": session.name,
-            "parent_session_id": session.parent_session_id,
-            "message_count": session.message_count,
-            "last_message": last,
-            "has_system_prompt": has_system,
-            "metadata": session.metadata,
-            "created_at": session.created_at,
-            "updated_at": session.updated_at,
+            "session_id": row[0],
+            "name": row[1],
+            "parent_session_id": row[2],
+            "message_count": count,
+            "last_message": last[0] if last else None,
+            "has_system_prompt": bool(first and first[0].get("role") == "system"),
+            "metadata": json.loads(row[3]),
+            "created_at": row[4],
+            "updated_at": row[5],
         }
 
     def close(self) -> None:
@@ -832,6 +1349,7 @@ class SessionGuardContext:
 __all__ = [
     "HermesSession",
     "InMemorySessionStore",
+    "PagedMessages",
     "SQLiteSessionStore",
     "SessionGuardContext",
     "SessionRaceGuard",
@@ -1,8 +1,12 @@
 import json
+import os
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Self
 
 from .models import Conversation, HistoryMessage, MessageRole
 
@@ -57,23 +61,117 @@ class InMemoryHistoryStore:
         """Clear all conversations."""
         self._conversations.clear()
 
+    def list_summaries(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """list conversation summaries (no messages), most recent first."""
+        return [_summary(c) for c in self.list_conversations(limit, offset)]
+
+
+def _summary(conversation: Conversation) -> dict[str, Any]:
+    """Listing fields of a conversation."""
+    return {
+        "conversation_id": conversation.conversation_id,
+        "title": conversation.title,
+        "created_at": conversation.created_at.isoformat(),
+        "updated_at": conversation.updated_at.isoformat(),
+        "message_count": len(conversation.messages),
+    }
+
 
 class FileHistoryStore:
-    """File-based conversation storage (JSON)."""
+    """File-based conversation storage (JSON).
+
+    Listing is served from a summary index (title, timestamps and message
+    count per conversation) kept in ``.history-index`` next to the
+    conversation files. Index entries are checked against each file's
+    size and modification time, so files written by other processes are
+    picked up; only new or changed files are parsed.
+    """
+
+    INDEX_NAME = ".history-index"
 
     def __init__(self, directory: str):
         self.directory = Path(directory)
         self.directory.mkdir(parents=True, exist_ok=True)
+        self._index: dict[str, dict[str, Any]] | None = None
+        self._index_dirty = False
+        self._lock = threading.RLock()
 
     def _get_path(self, conversation_id: str) -> Path:
         """Get file path for a conversation."""
         return self.directory / f"{conversation_id}.json"
 
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        if self._index is None:
+            try:
+                data = json.loads((self.directory / self.INDEX_NAME).read_text())
+                self._index = data.get("entries", {})
+            except (OSError, ValueError, AttributeError):
+                self._index = {}
+        return self._index
+
+    def _index_entry(self, conversation_id: str, summary: dict[str, Any]) -> None:
+        stat = self._get_path(conversation_id).stat()
+        self._load_index()[conversation_id] = {
+            **summary,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+        self._index_dirty = True
+
+    def _summaries(self) -> list[dict[str, Any]]:
+        """Validated index entries, most recently updated first."""
+        with self._lock:
+            index = self._load_index()
+            seen = set()
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    conversation_id = entry.name[: -len(".json")]
+                    seen.add(conversation_id)
+                    stat = entry.stat()
+                    cached = index.get(conversation_id)
+                    if (
+                        cached is not None
+                        and cached["mtime_ns"] == stat.st_mtime_ns
+                        and cached["size"] == stat.st_size
+                    ):
+                        continue
+                    conv = self.load(conversation_id)
+                    if conv is not None:
+                        self._index_entry(conversation_id, _summary(conv))
+            for conversation_id in index.keys() - seen:
+                del index[conversation_id]
+                self._index_dirty = True
+            if self._index_dirty:
+                self._write_index()
+            summaries = [
+                {k: v for k, v in entry.items() if k not in ("mtime_ns", "size")}
+                for entry in index.values()
+            ]
+        summaries.sort(
+            key=lambda s: datetime.fromisoformat(s["updated_at"]), reverse=True
+        )
+        return summaries
+
+    def _write_index(self) -> None:
+        path = self.directory / self.INDEX_NAME
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": 1, "entries": self._index}))
+        os.replace(tmp, path)
+        self._index_dirty = False
+
     def save(self, conversation: Conversation) -> None:
         """Save a conversation."""
         path = self._get_path(conversation.conversation_id)
         with open(path, "w") as f:
             json.dump(conversation.to_dict(), f, indent=2)
+        with self._lock:
+            self._index_entry(conversation.conversation_id, _summary(conversation))
 
     def load(self, conversation_id: str) -> Conversation | None:
         """Load a conversation."""
@@ -88,31 +186,42 @@ class FileHistoryStore:
         path = self._get_path(conversation_id)
         if path.exists():
             path.unlink()
+            with self._lock:
+                if self._load_index().pop(conversation_id, None) is not None:
+                    self._index_dirty = True
             return True
         return False
 
+    def list_summaries(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """list conversation summaries from the index, most recent first."""
+        return self._summaries()[offset : offset + limit]
+
     def list_conversations(
         self,
         limit: int = 100,
         offset: int = 0,
     ) -> list[Conversation]:
-        """list conversations."""
+        """list conversations, most recent first (loads only the page)."""
         conversations = []
-        for path in self.directory.glob("*.json"):
-            conv = self.load(path.stem)
+        for summary in self.list_summaries(limit, offset):
+            conv = self.load(summary["conversation_id"])
             if conv:
                 conversations.append(conv)
-
-        # Sort by updated_at
-        conversations.sort(key=lambda c: c.updated_at, reverse=True)
-        return conversations[offset : offset + limit]
+        return conversations
 
     def search(self, query: str) -> list[Conversation]:
         """Search conversations."""
         results = []
         query_lower = query.lower()
-        for conv in self.list_conversations(limit=1000):
-            if query_lower in conv.title.lower():
+        for summary in self._summaries()[:1000]:
+            conv = self.load(summary["conversation_id"])
+            if conv is None:
+                continue
+            if query_lower in summary["title"].lower():
                 results.append(conv)
                 continue
             for msg in conv.messages:
@@ -123,10 +232,27 @@ class FileHistoryStore:
 
 
 class SQLiteHistoryStore:
-    """SQLite-based conversation storage."""
+    """SQLite-based conversation storage.
 
-    def __init__(self, db_path: str):
+    Connections are pooled (up to ``pool_size``) and use WAL journaling so
+    readers are not blocked by a writer. ``save`` writes only the messages
+    that were added, changed or removed since the stored copy, and
+    ``search`` uses FTS5 trigram indexes (case-insensitive substring match)
+    when SQLite provides them, falling back to ``LIKE`` otherwise.
+    """
+
+    _MESSAGE_COLUMNS = "message_id, role, content, timestamp, tokens, metadata, seq"
+    _FETCH_CHUNK = 500
+
+    def __init__(self, db_path: str, pool_size: int = 4, timeout: float = 30.0):
         self.db_path = db_path
+        self.timeout = timeout
+        # Each connection to ":memory:" would be a separate database
+        self.pool_size = 1 if db_path == ":memory:" else max(1, pool_size)
+        self.fts_enabled = False
+        self._pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._pool_lock = threading.Lock()
+        self._created = 0
         self._init_db()
 
     def _init_db(self) -> None:
@@ -138,7 +264,8 @@ class SQLiteHistoryStore:
                     title TEXT,
                     created_at TEXT,
                     updated_at TEXT,
-                    metadata TEXT
+                    metadata TEXT,
+                    message_count INTEGER DEFAULT 0
                 )
             """)
             conn.execute("""
@@ -150,111 +277,294 @@ class SQLiteHistoryStore:
                     timestamp TEXT,
                     tokens INTEGER DEFAULT 0,
                     metadata TEXT,
+                    seq INTEGER,
                     FOREIGN KEY (conversation_id) REFERENCES conversations(conversation_id)
                 )
             """)
+            self._migrate(conn)
+            conn.execute("DROP INDEX IF EXISTS idx_messages_conv")
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_messages_conv
-                ON messages(conversation_id)
+                CREATE INDEX IF NOT EXISTS idx_messages_conv_seq
+                ON messages(conversation_id, seq)
             """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_conversations_updated
+                ON conversations(updated_at)
+            """)
+            self.fts_enabled = self._init_fts(conn)
             conn.commit()
 
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Add and backfill columns missing from databases of older versions."""
+        columns = {r[1] for r in conn.execute("PRAGMA table_info(messages)")}
+        if "seq" not in columns:
+            conn.execute("ALTER TABLE messages ADD COLUMN seq INTEGER")
+            conn.execute("""
+                UPDATE messages SET seq = (
+                    SELECT n FROM (
+                        SELECT message_id, ROW_NUMBER() OVER (
+                            PARTITION BY conversation_id ORDER BY timestamp, rowid
+                        ) - 1 AS n
+                        FROM messages
+                    ) ranked
+                    WHERE ranked.message_id = messages.message_id
+                )
+            """)
+        columns = {r[1] for r in conn.execute("PRAGMA table_info(conversations)")}
+        if "message_count" not in columns:
+            conn.execute(
+                "ALTER TABLE conversations ADD COLUMN message_count INTEGER DEFAULT 0"
+            )
+            conn.execute("""
+                UPDATE conversations SET message_count = (
+                    SELECT COUNT(*) FROM messages
+                    WHERE messages.conversation_id = conversations.conversation_id
+                )
+            """)
+
+    @staticmethod
+    def _init_fts(conn: sqlite3.Connection) -> bool:
+        """Create the FTS5 indexes and their triggers; False if unsupported."""
+        existed = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'messages_fts'"
+        ).fetchone()
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+                    content, conversation_id UNINDEXED, tokenize='trigram'
+                )
+            """)
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS conversations_fts USING fts5(
+                    title, conversation_id UNINDEXED, tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False  # FTS5 or its trigram tokenizer is not compiled in
+        for table, column, fts in (
+            ("messages", "content", "messages_fts"),
+            ("conversations", "title", "conversations_fts"),
+        ):
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {fts}(rowid, {column}, conversation_id)
+                    VALUES (new.rowid, new.{column}, new.conversation_id);
+                END
+            """)
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON {table} BEGIN
+                    DELETE FROM {fts} WHERE rowid = old.rowid;
+                END
+            """)
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_au
+                AFTER UPDATE OF {column} ON {table} BEGIN
+                    UPDATE {fts} SET {column} = new.{column} WHERE rowid = old.rowid;
+                END
+            """)
+            if not existed:
+                conn.execute(
+                    f"INSERT INTO {fts}(rowid, {column}, conversation_id) "
+                    f"SELECT rowid, {column}, conversation_id FROM {table}"
+                )
+        return True
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path, timeout=self.timeout, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            create = self._created < self.pool_size
+            if create:
+                self._created += 1
+        if create:
+            try:
+                return self._connect()
+            except BaseException:
+                with self._pool_lock:
+                    self._created -= 1
+                raise
+        try:
+            return self._pool.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(
+                f"no pooled connection available after {self.timeout}s"
+            ) from None
+
     @contextmanager
     def _get_connection(self):
-        """Get database connection."""
-        conn = sqlite3.connect(self.db_path)
+        """Borrow a pooled database connection."""
+        conn = self._acquire()
         try:
             yield conn
         finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put(conn)
+
+    def close(self) -> None:
+        """Close idle pooled connections (new ones open on next use)."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return
             conn.close()
+            with self._pool_lock:
+                self._created -= 1
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
     def save(self, conversation: Conversation) -> None:
-        """Save a conversation."""
+        """Save a conversation.
+
+        Messages are matched to stored rows by ``message_id``; only new,
+        changed and removed messages are written.
+        """
+        conversation_id = conversation.conversation_id
         with self._get_connection() as conn:
-            # Upsert conversation
+            conn.execute("BEGIN IMMEDIATE")
+            stored = {
+                row[0]: row[1:]
+                for row in conn.execute(
+                    f"SELECT {self._MESSAGE_COLUMNS} FROM messages "
+                    "WHERE conversation_id = ?",
+                    (conversation_id,),
+                )
+            }
+            inserts = []
+            updates = []
+            for seq, msg in enumerate(conversation.messages):
+                row = (
+                    msg.role.value,
+                    msg.content,
+                    msg.timestamp.isoformat(),
+                    msg.tokens,
+                    json.dumps(msg.metadata),
+                    seq,
+                )
+                old = stored.pop(msg.message_id, None)
+                if old is None:
+                    inserts.append((msg.message_id, conversation_id, *row))
+                elif old != row:
+                    updates.append((*row, msg.message_id))
+
             conn.execute(
                 """
-                INSERT OR REPLACE INTO conversations
-                (conversation_id, title, created_at, updated_at, metadata)
-                VALUES (?, ?, ?, ?, ?)
+                INSERT INTO conversations
+                (conversation_id, title, created_at, updated_at, metadata, message_count)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(conversation_id) DO UPDATE SET
+                    title = excluded.title,
+                    created_at = excluded.created_at,
+                    updated_at = excluded.updated_at,
+                    metadata = excluded.metadata,
+                    message_count = excluded.message_count
             """,
                 (
-                    conversation.conversation_id,
+                    conversation_id,
                     conversation.title,
                     conversation.created_at.isoformat(),
                     conversation.updated_at.isoformat(),
                     json.dumps(conversation.metadata),
+                    len(conversation.messages),
                 ),
             )
-
-            # Delete existing messages
-            conn.execute(
-                "DELETE FROM messages WHERE conversation_id = ?",
-                (conversation.conversation_id,),
-            )
-
-            # Insert messages
-            for msg in conversation.messages:
-                conn.execute(
+            if stored:
+                conn.executemany(
+                    "DELETE FROM messages WHERE message_id = ?",
+                    [(message_id,) for message_id in stored],
+                )
+            if updates:
+                conn.executemany(
+                    """
+                    UPDATE messages SET role = ?, content = ?, timestamp = ?,
+                        tokens = ?, metadata = ?, seq = ?
+                    WHERE message_id = ?
+                """,
+                    updates,
+                )
+            if inserts:
+                conn.executemany(
                     """
                     INSERT INTO messages
-                    (message_id, conversation_id, role, content, timestamp, tokens, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    (message_id, conversation_id, role, content, timestamp, tokens,
+                     metadata, seq)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                    (
-                        msg.message_id,
-                        conversation.conversation_id,
-                        msg.role.value,
-                        msg.content,
-                        msg.timestamp.isoformat(),
-                        msg.tokens,
-                        json.dumps(msg.metadata),
-                    ),
+                    inserts,
                 )
-
             conn.commit()
 
-    def load(self, conversation_id: str) -> Conversation | None:
-        """Load a conversation."""
-        with self._get_connection() as conn:
-            row = conn.execute(
-                "SELECT * FROM conversations WHERE conversation_id = ?",
-                (conversation_id,),
-            ).fetchone()
-
-            if not row:
-                return None
-
-            # Load messages
-            msg_rows = conn.execute(
-                "SELECT * FROM messages WHERE conversation_id = ? ORDER BY timestamp",
-                (conversation_id,),
-            ).fetchall()
-
-            messages = [
-                HistoryMessage(
-                    role=MessageRole(r[2]),
-                    content=r[3],
-                    timestamp=datetime.fromisoformat(r[4]),
-                    message_id=r[0],
-                    tokens=r[5],
-                    metadata=json.loads(r[6]) if r[6] else {},
+    def _fetch(
+        self, conn: sqlite3.Connection, conversation_ids: list[str]
+    ) -> list[Conversation]:
+        """Load conversations in the given order, a chunk of ids per query."""
+        headers: dict[str, tuple] = {}
+        messages: dict[str, list[HistoryMessage]] = {}
+        for i in range(0, len(conversation_ids), self._FETCH_CHUNK):
+            chunk = conversation_ids[i : i + self._FETCH_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                "SELECT conversation_id, title, created_at, updated_at, metadata "
+                f"FROM conversations WHERE conversation_id IN ({marks})",
+                chunk,
+            ):
+                headers[row[0]] = row
+                messages[row[0]] = []
+            for r in conn.execute(
+                f"SELECT {self._MESSAGE_COLUMNS}, conversation_id FROM messages "
+                f"WHERE conversation_id IN ({marks}) "
+                "ORDER BY conversation_id, seq, timestamp",
+                chunk,
+            ):
+                messages[r[7]].append(
+                    HistoryMessage(
+                        role=MessageRole(r[1]),
+                        content=r[2],
+                        timestamp=datetime.fromisoformat(r[3]),
+                        message_id=r[0],
+                        tokens=r[4],
+                        metadata=json.loads(r[5]) if r[5] else {},
+                    )
                 )
-                for r in msg_rows
-            ]
-
-            return Conversation(
+        return [
+            Conversation(
                 conversation_id=row[0],
                 title=row[1],
-                messages=messages,
+                messages=messages[row[0]],
                 created_at=datetime.fromisoformat(row[2]),
                 updated_at=datetime.fromisoformat(row[3]),
                 metadata=json.loads(row[4]) if row[4] else {},
             )
+            for row in (headers.get(cid) for cid in conversation_ids)
+            if row is not None
+        ]
+
+    def load(self, conversation_id: str) -> Conversation | None:
+        """Load a conversation."""
+        with self._get_connection() as conn:
+            found = self._fetch(conn, [conversation_id])
+        return found[0] if found else None
 
     def delete(self, conversation_id: str) -> bool:
         """Delete a conversation."""
         with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
             conn.execute(
                 "DELETE FROM messages WHERE conversation_id = ?", (conversation_id,)
             )
@@ -265,6 +575,29 @@ class SQLiteHistoryStore:
             conn.commit()
             return result.rowcount > 0
 
+    def list_summaries(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """list conversation summaries (no messages), most recent first."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT conversation_id, title, created_at, updated_at, message_count "
+                "FROM conversations ORDER BY updated_at DESC LIMIT ? OFFSET ?",
+                (limit, offset),
+            ).fetchall()
+        return [
+            {
+                "conversation_id": row[0],
+                "title": row[1],
+                "created_at": row[2],
+                "updated_at": row[3],
+                "message_count": row[4] or 0,
+            }
+            for row in rows
+        ]
+
     def list_conversations(
         self,
         limit: int = 100,
@@ -276,25 +609,36 @@ class SQLiteHistoryStore:
                 "SELECT conversation_id FROM conversations ORDER BY updated_at DESC LIMIT ? OFFSET ?",
                 (limit, offset),
             ).fetchall()
-
-            return [self.load(row[0]) for row in rows if row]  # type: ignore
-
-    def search(self, query: str) -> list[Conversation]:
-        """Search conversations."""
+            return self._fetch(conn, [row[0] for row in rows])
+
+    def search(self, query: str, limit: int | None = None) -> list[Conversation]:
+        """Search conversation titles and message content.
+
+        Matching is case-insensitive substring matching, most recently
+        updated conversations first.
+        """
+        # The trigram index cannot match terms shorter than three characters
+        if self.fts_enabled and len(query) >= 3:
+            phrase = '"' + query.replace('"', '""') + '"'
+            matches = """
+                SELECT conversation_id FROM conversations_fts
+                WHERE conversations_fts MATCH ?
+                UNION
+                SELECT conversation_id FROM messages_fts WHERE messages_fts MATCH ?
+            """
+            params: tuple[Any, ...] = (phrase, phrase)
+        else:
+            matches = """
+                SELECT conversation_id FROM conversations WHERE title LIKE ?
+                UNION
+                SELECT conversation_id FROM messages WHERE content LIKE ?
+            """
+            params = (f"%{query}%", f"%{query}%")
         with self._get_connection() as conn:
-            # Search in titles
-            conv_ids = set()
-            rows = conn.execute(
-                "SELECT conversation_id FROM conversations WHERE title LIKE ?",
-                (f"%{query}%",),
-            ).fetchall()
-            conv_ids.update(r[0] for r in rows)
-
-            # Search in messages
             rows = conn.execute(
-                "SELECT DISTINCT conversation_id FROM messages WHERE content LIKE ?",
-                (f"%{query}%",),
+                f"SELECT conversation_id FROM conversations "
+                f"WHERE conversation_id IN ({matches}) "
+                "ORDER BY updated_at DESC LIMIT ?",
+                (*params, -1 if limit is None else limit),
             ).fetchall()
-            conv_ids.update(r[0] for r in rows)
-
-            return [self.load(cid) for cid in conv_ids if cid]  # type: ignore
+            return self._fetch(conn, [row[0] for row in rows])
@@ -3,13 +3,18 @@
 import ast
 import importlib
 import os
+import sys
 import threading
 import time
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from codomyrmex.logging_monitoring import get_logger
 
+if TYPE_CHECKING:
+    from .manifest import ToolManifest
+
 logger = get_logger(__name__)
 
 
@@ -66,9 +71,25 @@ except ValueError:
 
 _DISCOVERY_ENGINE: Any | None = None
 
+_TOOL_MANIFEST: "ToolManifest | None" = None
+
+
+def _tool_manifest() -> "ToolManifest":
+    """The process-wide tool manifest, loaded from disk on first use."""
+    global _TOOL_MANIFEST
+    if _TOOL_MANIFEST is None:
+        from .manifest import ToolManifest, default_manifest_path
+
+        _TOOL_MANIFEST = ToolManifest(default_manifest_path())
+    return _TOOL_MANIFEST
+
 
 def invalidate_tool_cache() -> None:
-    """Clear the dynamic tool discovery cache and its TTL."""
+    """Clear the dynamic tool discovery cache and its TTL.
+
+    The tool manifest is kept: its entries are keyed by source file stats,
+    so the next scan still picks up every changed module.
+    """
     global _DYNAMIC_TOOLS_CACHE, _CACHE_EXPIRY
     with _DYNAMIC_TOOLS_CACHE_LOCK:
         _DYNAMIC_TOOLS_CACHE = None
@@ -151,14 +172,19 @@ def _decorates_mcp_tool(source_path: Path) -> bool:
 
 
 def _find_mcp_tool_modules() -> list[str]:
-    """Find exact decorated source modules without importing sibling packages."""
+    """Find exact decorated source modules without importing sibling packages.
+
+    Only files whose stat differs from the tool manifest are parsed.
+    """
     try:
         root = importlib.import_module("codomyrmex")
         root_paths = getattr(root, "__path__", None)
         if not root_paths:
             return [f"{target}.mcp_tools" for target in _FALLBACK_SCAN_TARGETS]
 
+        manifest = _tool_manifest()
         modules: set[str] = set()
+        seen: set[str] = set()
         ignored_parts = {"__pycache__", "test", "tests", "vendor", "vendors"}
         for root_path in root_paths:
             package_root = Path(root_path)
@@ -167,19 +193,18 @@ def _find_mcp_tool_modules() -> list[str]:
                 module_parts = list(relative.with_suffix("").parts)
                 if module_parts[-1] == "__init__":
                     module_parts.pop()
-                if (
-                    not module_parts
-                    or any(
-                        part.startswith(".")
-                        or part in ignored_parts
-                        or not part.isidentifier()
-                        for part in module_parts
-                    )
-                    or not _decorates_mcp_tool(source_path)
+                if not module_parts or any(
+                    part.startswith(".")
+                    or part in ignored_parts
+                    or not part.isidentifier()
+                    for part in module_parts
                 ):
                     continue
-                modules.add("codomyrmex." + ".".join(module_parts))
+                seen.add(str(source_path))
+                if manifest.decorated(source_path, _decorates_mcp_tool):
+                    modules.add("codomyrmex." + ".".join(module_parts))
 
+        manifest.prune(sources=seen)
         if modules:
             return sorted(modules)
     except (ImportError, AttributeError, OSError, RuntimeError) as exc:
@@ -190,7 +215,10 @@ def _find_mcp_tool_modules() -> list[str]:
 def discover_dynamic_tools() -> list[tuple[str, str, Any, dict[str, Any]]]:
     """Scan modules for @mcp_tool definitions using MCPDiscovery engine.
 
-    Uses a TTL-based cache.
+    Uses a TTL-based cache. Modules whose sources are unchanged since they
+    were recorded in the tool manifest are not imported: their tools get a
+    :class:`~.manifest.LazyToolHandler` that imports the module on the first
+    call. Other modules are imported, scanned and recorded.
     """
     global _DYNAMIC_TOOLS_CACHE, _CACHE_EXPIRY, _DISCOVERY_ENGINE
     now = time.monotonic()
@@ -213,11 +241,24 @@ def discover_dynamic_tools() -> list[tuple[str, str, Any, dict[str, Any]]]:
     t0 = time.monotonic()
 
     scan_targets = _find_mcp_tool_modules()
+    manifest = _tool_manifest()
+    # A module imported before this scan may predate its source file, so
+    # only modules first imported by the scan are recorded
+    preloaded = set(sys.modules)
 
     for target in scan_targets:
+        recorded = manifest.load_tools(target)
+        if recorded is not None:
+            for tool in recorded:
+                _DISCOVERY_ENGINE.register_tool(tool)
+            continue
         report = _DISCOVERY_ENGINE.scan_module(target)
         if report.failed_modules:
             logger.debug("Failed to scan module %s: %s", target, report.failed_modules)
+        elif target not in preloaded:
+            manifest.record(sys.modules[target], report.tools)
+    manifest.prune(modules=set(scan_targets))
+    manifest.save()
 
     tools: list[tuple[str, str, Any, dict[str, Any]]] = []
 
@@ -230,6 +271,7 @@ def discover_dynamic_tools() -> list[tuple[str, str, Any, dict[str, Any]]]:
     metrics.total_tools = len(_DISCOVERY_ENGINE.list_tools())
     metrics.modules_scanned = len(scan_targets)
     metrics.scan_duration_ms = elapsed_ms
+    metrics.last_scan_time = datetime.now(UTC)
     logger.info(
         "Dynamic tools discovered: %d in %.0fms",
         len(tools),
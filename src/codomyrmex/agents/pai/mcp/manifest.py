@@ -0,0 +1,268 @@
+"""Persistent manifest of ``@mcp_tool`` definitions.
+
+Dynamic discovery has to ``ast.parse`` every source file under
+``codomyrmex`` to find decorated modules, then import each of them to read
+the tools' names, descriptions and schemas. The manifest stores both
+results on disk, keyed by ``mtime_ns`` and ``size``:
+
+* ``sources`` — for every scanned file, whether it defines an ``@mcp_tool``;
+* ``modules`` — for every decorated module, the ``_mcp_tool_meta`` of its
+  tools and the attribute path that reaches each handler, keyed by the
+  module's file and the files its tools are defined in.
+
+Tools served from the manifest get a :class:`LazyToolHandler`, so a tool
+module is only imported by the first call to one of its tools.
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from codomyrmex.logging_monitoring import get_logger
+from codomyrmex.model_context_protocol.discovery import DiscoveredTool, MCPDiscovery
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+logger = get_logger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+def default_manifest_path() -> Path | None:
+    """``$CODOMYRMEX_MCP_MANIFEST``, else ``~/.codomyrmex/mcp_tool_manifest.json``.
+
+    Setting ``CODOMYRMEX_MCP_MANIFEST`` to an empty string keeps the
+    manifest in memory only.
+    """
+    raw = os.environ.get("CODOMYRMEX_MCP_MANIFEST")
+    if raw is None:
+        return Path.home() / ".codomyrmex" / "mcp_tool_manifest.json"
+    return Path(raw).expanduser() if raw.strip() else None
+
+
+def _stat_key(path: str | Path) -> list[int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _attr_path(module: ModuleType, name: str, handler: Any) -> list[str] | None:
+    """Attribute path from *module* to *handler*, found as member *name*.
+
+    Mirrors :meth:`MCPDiscovery._scan_module`: tools are module members or
+    members of classes defined in the module.
+    """
+    if getattr(module, name, None) is handler:
+        return [name]
+    for cls_name, cls in vars(module).items():
+        if (
+            inspect.isclass(cls)
+            and cls.__module__ == module.__name__
+            and getattr(cls, name, None) == handler
+        ):
+            return [cls_name, name]
+    return None
+
+
+class LazyToolHandler:
+    """Stand-in for a tool handler that imports its module on first call.
+
+    Carries the tool's ``_mcp_tool_meta`` so callers that read tool metadata
+    from handlers (e.g. the skill manifest) do not trigger the import.
+    """
+
+    def __init__(self, module: str, attr: list[str], meta: dict[str, Any]) -> None:
+        self.module = module
+        self.attr = tuple(attr)
+        self._mcp_tool_meta = meta
+        self._mcp_tool = meta
+        self.__name__ = self.attr[-1]
+        self.__qualname__ = ".".join(self.attr)
+        self.__doc__ = meta.get("description") or None
+        self._target: Callable[..., Any] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the real handler has been imported."""
+        return self._target is not None
+
+    def resolve(self) -> Callable[..., Any]:
+        """Import the tool's module and return the real handler."""
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    obj: Any = importlib.import_module(self.module)
+                    for part in self.attr:
+                        obj = getattr(obj, part)
+                    self._target = obj
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<LazyToolHandler {self.module}:{self.__qualname__}>"
+
+
+class ToolManifest:
+    """Decorated-source flags and tool metadata, persisted as JSON.
+
+    The manifest is only valid for the interpreter that wrote it, since the
+    tools a module defines can depend on which optional packages are
+    installed; another ``sys.executable`` starts from an empty manifest.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._sources: dict[str, list[Any]] = {}
+        self._modules: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != MANIFEST_VERSION
+            or data.get("python") != sys.executable
+            or not isinstance(data.get("sources"), dict)
+            or not isinstance(data.get("modules"), dict)
+        ):
+            return
+        self._sources = data["sources"]
+        self._modules = data["modules"]
+
+    # ── decorated sources ───────────────────────────────────────────
+
+    def decorated(self, source_path: Path, scan: Callable[[Path], bool]) -> bool:
+        """Cached ``scan(source_path)``, re-run when the file's stat changes."""
+        key = str(source_path)
+        stat = _stat_key(source_path)
+        entry = self._sources.get(key)
+        if stat is not None and entry is not None and entry[:2] == stat:
+            return bool(entry[2])
+        flag = scan(source_path)
+        if stat is not None:
+            with self._lock:
+                self._sources[key] = [*stat, flag]
+                self._dirty = True
+        return flag
+
+    # ── tool modules ────────────────────────────────────────────────
+
+    def load_tools(self, module_name: str) -> list[DiscoveredTool] | None:
+        """Tools recorded for *module_name* with lazy handlers.
+
+        Returns ``None`` when the module is not recorded or one of the files
+        it was recorded from has changed since.
+        """
+        entry = self._modules.get(module_name)
+        if entry is None:
+            return None
+        for path, stat in entry["files"].items():
+            if _stat_key(path) != stat:
+                return None
+        return [
+            MCPDiscovery.tool_from_meta(
+                tool["meta"],
+                module_path=module_name,
+                callable_name=tool["attr"][-1],
+                handler=LazyToolHandler(module_name, tool["attr"], tool["meta"]),
+                doc=tool["description"],
+            )
+            for tool in entry["tools"]
+        ]
+
+    def record(self, module: ModuleType, tools: list[DiscoveredTool]) -> bool:
+        """Record the tools found by scanning *module*.
+
+        Returns ``False`` (and records nothing) if a handler cannot be
+        reached by attribute access or its metadata is not JSON-serialisable;
+        such a module is scanned by importing it every time.
+        """
+        files: dict[str, list[int]] = {}
+        entries: list[dict[str, Any]] = []
+        origins = [module.__name__]
+        for tool in tools:
+            attr = _attr_path(module, tool.callable_name, tool.handler)
+            if attr is None:
+                return False
+            entries.append(
+                {
+                    "attr": attr,
+                    "description": tool.description,
+                    "meta": tool.handler._mcp_tool_meta,  # type: ignore[union-attr]
+                }
+            )
+            origins.append(getattr(tool.handler, "__module__", None) or "")
+        for origin in origins:
+            source = getattr(sys.modules.get(origin), "__file__", None)
+            if source is None:
+                continue
+            stat = _stat_key(source)
+            if stat is None:
+                return False
+            files[source] = stat
+        entry = {"files": files, "tools": entries}
+        try:
+            json.dumps(entry)
+        except (TypeError, ValueError):
+            return False
+        with self._lock:
+            self._modules[module.__name__] = entry
+            self._dirty = True
+        return True
+
+    def prune(
+        self, *, sources: set[str] | None = None, modules: set[str] | None = None
+    ) -> None:
+        """Drop source and module entries that are no longer present."""
+        with self._lock:
+            for table, keep in ((self._sources, sources), (self._modules, modules)):
+                if keep is None:
+                    continue
+                stale = table.keys() - keep
+                for key in stale:
+                    del table[key]
+                self._dirty |= bool(stale)
+
+    def save(self) -> None:
+        """Write the manifest to ``path`` if it changed."""
+        with self._lock:
+            if not (self.path and self._dirty):
+                return
+            payload = json.dumps(
+                {
+                    "version": MANIFEST_VERSION,
+                    "python": sys.executable,
+                    "sources": self._sources,
+                    "modules": self._modules,
+                }
+            )
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(payload, encoding="utf-8")
+                os.replace(tmp, self.path)
+            except OSError as exc:
+                logger.debug("Could not write MCP tool manifest %s: %s", self.path, exc)
+                return
+            self._dirty = False
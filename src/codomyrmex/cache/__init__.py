@@ -45,7 +45,8 @@ def cli_commands():
             "help": "list available cache backends",
             "handler": lambda **kwargs: print(
                 "Cache Backends:\n"
-                "  - in_memory   (default, dictionary-based)\n"
+                "  - in_memory   (default, LRU with TTL expiry)\n"
+                "  - sharded_in_memory (lock-striped in-memory LRU)\n"
                 "  - file_based  (disk-persistent cache)\n"
                 "  - redis       (distributed cache)"
             ),
@@ -100,7 +101,7 @@ def get_cache(name: str = "default", backend: str = "in_memory") -> Cache:
 
     Args:
         name: Cache name
-        backend: Cache backend (in_memory, file_based, redis)
+        backend: Cache backend (in_memory, sharded_in_memory, file_based, redis)
 
     Returns:
         Cache instance
@@ -1,8 +1,19 @@
 """
 In-memory cache backend.
+
+``InMemoryCache`` keeps entries in an ``OrderedDict`` in least-recently-used
+order, so hits, inserts and evictions are all O(1). Entries with a TTL are
+also pushed onto a min-heap keyed by expiry time, which lets expired entries
+be purged in expiry order instead of by scanning the whole cache.
+``ShardedInMemoryCache`` spreads keys over several independently locked
+caches to reduce lock contention in multi-threaded servers.
 """
 
+import fnmatch
+import heapq
+import threading
 import time
+from collections import OrderedDict
 from typing import Any
 
 from codomyrmex.cache.cache import Cache
@@ -13,7 +24,7 @@ logger = get_logger(__name__)
 
 
 class InMemoryCache(Cache):
-    """In-memory cache implementation."""
+    """Thread-safe in-memory LRU cache with per-entry TTL."""
 
     def __init__(self, max_size: int = 1000, default_ttl: int | None = None):
         """Initialize in-memory cache.
@@ -22,70 +33,120 @@ class InMemoryCache(Cache):
             max_size: Maximum number of items
             default_ttl: Default time-to-live in seconds
         """
-        self._cache: dict[str, tuple[Any, float, int | None]] = {}
+        # key -> (value, expires_at); expires_at is None for entries without TTL
+        self._cache: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        # (expires_at, key) min-heap; stale entries are skipped lazily
+        self._expiry_heap: list[tuple[float, str]] = []
         self.max_size = max_size
         self.default_ttl = default_ttl
         self._stats = CacheStats(max_size=max_size)
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Any | None:
         """Get a value from the cache."""
-        self._stats.total_requests += 1
-
-        if key not in self._cache:
-            self._stats.misses += 1
-            return None
-
-        value, timestamp, ttl = self._cache[key]
-
-        # Check expiration
-        if ttl is not None and time.time() - timestamp > ttl:
-            del self._cache[key]
-            self._stats.misses += 1
-            return None
-
-        self._stats.hits += 1
-        return value
+        with self._lock:
+            self._stats.total_requests += 1
+            entry = self._cache.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and time.time() > expires_at:
+                del self._cache[key]
+                self._stats.misses += 1
+                return None
+
+            self._cache.move_to_end(key)
+            self._stats.hits += 1
+            return value
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
         """set a value in the cache."""
-        # Evict if at max size
-        if len(self._cache) >= self.max_size and key not in self._cache:
-            # Remove oldest entry
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-            self._stats.size -= 1
-
         ttl = ttl or self.default_ttl
-        self._cache[key] = (value, time.time(), ttl)
-        self._stats.size = len(self._cache)
-        return True
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            elif len(self._cache) >= self.max_size:
+                self._purge_expired(now)
+                while self._cache and len(self._cache) >= self.max_size:
+                    self._cache.popitem(last=False)
+                    self._stats.evictions += 1
+            self._cache[key] = (value, expires_at)
+            if expires_at is not None:
+                heapq.heappush(self._expiry_heap, (expires_at, key))
+                if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+                    self._rebuild_expiry_heap()
+            self._stats.size = len(self._cache)
+            return True
+
+    def _purge_expired(self, now: float) -> int:
+        """Drop every entry whose TTL has passed, earliest expiry first."""
+        heap = self._expiry_heap
+        purged = 0
+        while heap and heap[0][0] < now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # The key may have been deleted or re-set since this was pushed.
+            if entry is not None and entry[1] == expires_at:
+                del self._cache[key]
+                purged += 1
+        return purged
+
+    def _rebuild_expiry_heap(self) -> None:
+        """Discard heap entries left behind by overwritten or deleted keys."""
+        self._expiry_heap = [
+            (expires_at, key)
+            for key, (_, expires_at) in self._cache.items()
+            if expires_at is not None
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    def purge_expired(self) -> int:
+        """Remove all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            purged = self._purge_expired(time.time())
+            self._stats.size = len(self._cache)
+            return purged
 
     def delete(self, key: str) -> bool:
         """Delete a key from the cache."""
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            if self._cache.pop(key, None) is None:
+                return False
             self._stats.size = len(self._cache)
             return True
-        return False
 
     def clear(self) -> bool:
         """Clear all entries from the cache."""
-        self._cache.clear()
-        self._stats.size = 0
-        return True
+        with self._lock:
+            self._cache.clear()
+            self._expiry_heap.clear()
+            self._stats.size = 0
+            return True
 
     def exists(self, key: str) -> bool:
-        """Check if a key exists in the cache."""
-        if key not in self._cache:
-            return False
+        """Check if a key exists in the cache.
 
-        # Check expiration
-        _, timestamp, ttl = self._cache[key]
-        if ttl is not None and time.time() - timestamp > ttl:
-            del self._cache[key]
-            return False
+        Unlike ``get``, this does not count as a use for LRU ordering.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return False
 
-        return True
+            expires_at = entry[1]
+            if expires_at is not None and time.time() > expires_at:
+                del self._cache[key]
+                return False
+
+            return True
 
     @property
     def stats(self) -> CacheStats:
@@ -93,11 +154,101 @@ class InMemoryCache(Cache):
         self._stats.size = len(self._cache)
         return self._stats
 
+    def __len__(self) -> int:
+        return len(self._cache)
+
     def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching a pattern."""
-        import fnmatch
+        with self._lock:
+            keys_to_delete = [k for k in self._cache if fnmatch.fnmatch(k, pattern)]
+            for key in keys_to_delete:
+                del self._cache[key]
+            self._stats.size = len(self._cache)
+            return len(keys_to_delete)
 
-        keys_to_delete = [k for k in self._cache if fnmatch.fnmatch(k, pattern)]
-        for key in keys_to_delete:
-            self.delete(key)
-        return len(keys_to_delete)
+
+class ShardedInMemoryCache(Cache):
+    """In-memory cache split into independently locked ``InMemoryCache`` shards.
+
+    Each key is routed to one shard by hash, so concurrent threads touching
+    different keys rarely wait on the same lock. LRU order and the size
+    limit are maintained per shard, i.e. eviction is approximately LRU
+    across the whole cache.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: int | None = None,
+        shards: int = 16,
+    ):
+        """Initialize sharded in-memory cache.
+
+        Args:
+            max_size: Maximum number of items across all shards
+            default_ttl: Default time-to-live in seconds
+            shards: Number of shards
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        per_shard = max(1, -(-max_size // shards))
+        self._shards = [
+            InMemoryCache(max_size=per_shard, default_ttl=default_ttl)
+            for _ in range(shards)
+        ]
+
+    def _shard(self, key: str) -> InMemoryCache:
+        return self._shards[hash(key) % len(self._shards)]
+
+    @property
+    def shard_count(self) -> int:
+        """Number of shards."""
+        return len(self._shards)
+
+    def get(self, key: str) -> Any | None:
+        """Get a value from the cache."""
+        return self._shard(key).get(key)
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """set a value in the cache."""
+        return self._shard(key).set(key, value, ttl)
+
+    def delete(self, key: str) -> bool:
+        """Delete a key from the cache."""
+        return self._shard(key).delete(key)
+
+    def clear(self) -> bool:
+        """Clear all entries from the cache."""
+        for shard in self._shards:
+            shard.clear()
+        return True
+
+    def exists(self, key: str) -> bool:
+        """Check if a key exists in the cache."""
+        return self._shard(key).exists(key)
+
+    def purge_expired(self) -> int:
+        """Remove all expired entries from every shard."""
+        return sum(shard.purge_expired() for shard in self._shards)
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching a pattern."""
+        return sum(shard.delete_pattern(pattern) for shard in self._shards)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get statistics aggregated over all shards."""
+        total = CacheStats(max_size=self.max_size)
+        for shard in self._shards:
+            s = shard.stats
+            total.hits += s.hits
+            total.misses += s.misses
+            total.total_requests += s.total_requests
+            total.size += s.size
+            total.evictions += s.evictions
+        return total
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
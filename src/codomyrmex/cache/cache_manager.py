@@ -16,7 +16,7 @@ from typing import TYPE_CHECKING, Any
 from codomyrmex.logging_monitoring import get_logger
 
 from .backends.file_based import FileBasedCache
-from .backends.in_memory import InMemoryCache
+from .backends.in_memory import InMemoryCache, ShardedInMemoryCache
 
 if TYPE_CHECKING:
     from .cache import Cache
@@ -70,6 +70,8 @@ class CacheManager:
         """Create a cache backend instance."""
         if backend == "in_memory":
             return InMemoryCache()
+        if backend == "sharded_in_memory":
+            return ShardedInMemoryCache()
         if backend == "file_based":
             return FileBasedCache()
         if backend == "redis":
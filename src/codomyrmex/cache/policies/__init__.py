@@ -341,6 +341,209 @@ class FIFOPolicy(EvictionPolicy[K, V]):
         return len(self._cache)
 
 
+class CountMinSketch:
+    """Count-min sketch of 4-bit saturating counters with periodic aging.
+
+    Estimates how often a key has been seen recently in constant memory.
+    After ``sample_size`` increments every counter is halved, so the
+    estimates track the recent popularity of a key instead of its
+    all-time count. ``sample_size=0`` disables automatic aging.
+    """
+
+    MAX_COUNT = 15
+    _HALVE = bytes(i >> 1 for i in range(256))
+    _MASK64 = (1 << 64) - 1
+
+    def __init__(self, width: int, depth: int = 4, sample_size: int | None = None):
+        self.width = max(16, width)
+        self.depth = depth
+        self.sample_size = 10 * self.width if sample_size is None else sample_size
+        self._rows = [bytearray(self.width) for _ in range(depth)]
+        self._additions = 0
+
+    def _indexes(self, key: Any) -> list[int]:
+        # hash(k) == k for small ints, so mix the bits (MurmurHash3 fmix64)
+        # before splitting them into the two double-hashing halves.
+        mask = self._MASK64
+        h = hash(key) & mask
+        h = ((h ^ (h >> 33)) * 0xFF51AFD7ED558CCD) & mask
+        h = ((h ^ (h >> 33)) * 0xC4CEB9FE1A85EC53) & mask
+        h ^= h >> 33
+        h2 = (h >> 32) | 1
+        h &= 0xFFFFFFFF
+        width = self.width
+        return [(h + i * h2) % width for i in range(self.depth)]
+
+    def increment(self, key: Any) -> None:
+        """Record one occurrence of ``key``."""
+        added = False
+        for row, index in zip(self._rows, self._indexes(key), strict=True):
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+                added = True
+        if added:
+            self._additions += 1
+            if self.sample_size and self._additions >= self.sample_size:
+                self.age()
+
+    def estimate(self, key: Any) -> int:
+        """Estimated recent frequency of ``key``."""
+        rows = self._rows
+        return min(rows[i][index] for i, index in enumerate(self._indexes(key)))
+
+    def age(self) -> None:
+        """Halve every counter."""
+        self._rows = [row.translate(self._HALVE) for row in self._rows]
+        self._additions //= 2
+
+    def clear(self) -> None:
+        """Reset all counters."""
+        self._rows = [bytearray(self.width) for _ in range(self.depth)]
+        self._additions = 0
+
+
+class WTinyLFUPolicy(EvictionPolicy[K, V]):
+    """Window TinyLFU eviction policy.
+
+    New entries go to a small LRU admission window. Entries leaving the
+    window compete with the least recently used entry of the main region
+    and are only admitted if a ``CountMinSketch`` estimates they are
+    accessed more often, which keeps one-off scans from flushing the
+    cache. The main region is a segmented LRU: entries start in
+    probation and move to the protected segment when accessed again.
+
+    A doorkeeper set absorbs the first access to each key so one-hit
+    wonders do not add noise to the sketch. The sketch is halved and the
+    doorkeeper cleared every ``10 * max_size`` accesses.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        window_ratio: float = 0.01,
+        protected_ratio: float = 0.8,
+    ):
+        super().__init__(max_size)
+        self._window_size = max(1, round(max_size * window_ratio))
+        main_size = max(0, max_size - self._window_size)
+        self._protected_size = int(main_size * protected_ratio)
+        self._main_size = main_size
+        self._window: OrderedDict[K, CacheEntry[V]] = OrderedDict()
+        self._probation: OrderedDict[K, CacheEntry[V]] = OrderedDict()
+        self._protected: OrderedDict[K, CacheEntry[V]] = OrderedDict()
+        self._sketch = CountMinSketch(width=4 * max(1, max_size), sample_size=0)
+        self._doorkeeper: set[int] = set()
+        self._sample_size = 10 * max(1, max_size)
+        self._accesses = 0
+
+    def _record(self, key: K) -> None:
+        """Count one access to ``key`` in the frequency estimator."""
+        h = hash(key)
+        if h in self._doorkeeper:
+            self._sketch.increment(key)
+        else:
+            self._doorkeeper.add(h)
+        self._accesses += 1
+        if self._accesses >= self._sample_size:
+            self._sketch.age()
+            self._doorkeeper.clear()
+            self._accesses = 0
+
+    def _frequency(self, key: K) -> int:
+        return self._sketch.estimate(key) + (hash(key) in self._doorkeeper)
+
+    def _find(self, key: K) -> OrderedDict[K, CacheEntry[V]] | None:
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                return segment
+        return None
+
+    def _on_hit(self, key: K, segment: OrderedDict[K, CacheEntry[V]]) -> None:
+        """Refresh recency, promoting probation entries to protected."""
+        if segment is not self._probation:
+            segment.move_to_end(key)
+            return
+        self._protected[key] = self._probation.pop(key)
+        if len(self._protected) > self._protected_size:
+            demoted, entry = self._protected.popitem(last=False)
+            self._probation[demoted] = entry
+
+    def get(self, key: K) -> V | None:
+        """Return the requested value."""
+        with self._lock:
+            self._record(key)
+            segment = self._find(key)
+            if segment is None:
+                return None
+
+            entry = segment[key]
+            if entry.is_expired():
+                del segment[key]
+                return None
+
+            self._on_hit(key, segment)
+            entry.touch()
+            return entry.value
+
+    def put(self, key: K, value: V, ttl: timedelta | None = None) -> None:
+        """Put."""
+        with self._lock:
+            if self.max_size <= 0:
+                return
+
+            self._record(key)
+            segment = self._find(key)
+            if segment is not None:
+                segment[key] = CacheEntry(value=value, ttl=ttl)
+                self._on_hit(key, segment)
+                return
+
+            self._window[key] = CacheEntry(value=value, ttl=ttl)
+            if len(self._window) > self._window_size:
+                self._admit(*self._window.popitem(last=False))
+
+    def _admit(self, candidate: K, entry: CacheEntry[V]) -> None:
+        """Move an entry evicted from the window into the main region."""
+        if len(self._probation) + len(self._protected) < self._main_size:
+            self._probation[candidate] = entry
+            return
+        victims = self._probation or self._protected
+        if not victims:
+            return
+        victim = next(iter(victims))
+        if self._frequency(candidate) > self._frequency(victim):
+            del victims[victim]
+            self._probation[candidate] = entry
+
+    def contains(self, key: K) -> bool:
+        """Check if key exists in cache without recording an access."""
+        with self._lock:
+            segment = self._find(key)
+            return segment is not None and not segment[key].is_expired()
+
+    def remove(self, key: K) -> V | None:
+        """Remove."""
+        with self._lock:
+            segment = self._find(key)
+            if segment is None:
+                return None
+            return segment.pop(key).value
+
+    def clear(self) -> None:
+        """Clear."""
+        with self._lock:
+            self._window.clear()
+            self._probation.clear()
+            self._protected.clear()
+            self._sketch.clear()
+            self._doorkeeper.clear()
+            self._accesses = 0
+
+    def size(self) -> int:
+        """Size."""
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+
 def create_policy(policy_name: str, max_size: int, **kwargs) -> EvictionPolicy:
     """Factory function to create eviction policies."""
     policies = {
@@ -348,6 +551,7 @@ def create_policy(policy_name: str, max_size: int, **kwargs) -> EvictionPolicy:
         "lfu": LFUPolicy,
         "ttl": TTLPolicy,
         "fifo": FIFOPolicy,
+        "wtinylfu": WTinyLFUPolicy,
     }
 
     policy_class = policies.get(policy_name.lower())
@@ -359,10 +563,12 @@ def create_policy(policy_name: str, max_size: int, **kwargs) -> EvictionPolicy:
 
 __all__ = [
     "CacheEntry",
+    "CountMinSketch",
     "EvictionPolicy",
     "FIFOPolicy",
     "LFUPolicy",
     "LRUPolicy",
     "TTLPolicy",
+    "WTinyLFUPolicy",
     "create_policy",
 ]
@@ -5,6 +5,7 @@ This subpackage contains the foundational components of the event system:
 event bus, event schemas/types, exception classes, and the EventMixin.
 """
 
+from .dispatch import AsyncDispatcher, LatencyHistogram
 from .event_bus import (
     EventBus,
     Subscription,
@@ -37,8 +38,11 @@ from .exceptions import (
     EventValidationError,
 )
 from .mixins import EventMixin
+from .routing import SubscriptionRouter
 
 __all__ = [
+    # dispatch
+    "AsyncDispatcher",
     # event_schema
     "Event",
     # event_bus
@@ -56,7 +60,9 @@ __all__ = [
     "EventTimeoutError",
     "EventType",
     "EventValidationError",
+    "LatencyHistogram",
     "Subscription",
+    "SubscriptionRouter",
     "create_alert_event",
     "create_analysis_complete_event",
     "create_analysis_start_event",
@@ -0,0 +1,294 @@
+"""
+Asynchronous handler dispatch for the Codomyrmex event bus.
+
+``AsyncDispatcher`` owns one long-lived asyncio event loop on a daemon
+thread. Publishers hand it batches of ``(subscription, events)`` pairs;
+the batches are queued and drained by a single loop callback, so a burst
+of publishes costs one cross-thread wake-up rather than one executor
+future (and event loop) per handler call. Events for the same subscriber
+are delivered in publish order by one worker task per subscriber, while
+different subscribers run concurrently.
+
+The number of queued and running handler calls is bounded by
+``max_pending``: ``submit`` blocks when the bound is reached, or raises
+``EventQueueError`` once its timeout expires.
+
+``LatencyHistogram`` records handler latencies in fixed log-spaced
+buckets, so memory use does not depend on the number of observations.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import EventQueueError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .event_bus import Subscription
+    from .event_schema import Event
+
+try:
+    from codomyrmex.logging_monitoring import get_logger
+
+    logger = get_logger(__name__)
+except ImportError:
+    import logging
+
+    logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """Latency distribution in fixed buckets (seconds)."""
+
+    BUCKETS = (
+        0.0001,
+        0.00025,
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    def __init__(self) -> None:
+        # one extra overflow bucket for values above the last bound
+        self._counts = [0] * (len(self.BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record one latency sample."""
+        index = bisect.bisect_left(self.BUCKETS, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += seconds
+            self.min = min(self.min, seconds)
+            self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q``-th percentile (0-100)."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = q / 100 * self.count
+            seen = 0
+            for bound, n in zip(self.BUCKETS, self._counts, strict=False):
+                seen += n
+                if seen >= rank:
+                    return bound
+            return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary with count, sum, min, max, avg, percentiles and buckets."""
+        with self._lock:
+            buckets = {
+                str(bound): n
+                for bound, n in zip(self.BUCKETS, self._counts, strict=False)
+            }
+            buckets["+Inf"] = self._counts[-1]
+            count, total = self.count, self.total
+            low = self.min if count else 0.0
+            high = self.max
+        return {
+            "count": count,
+            "sum": total,
+            "min": low,
+            "max": high,
+            "avg": total / count if count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": buckets,
+        }
+
+
+class AsyncDispatcher:
+    """Run coroutine handlers on a dedicated event loop thread."""
+
+    def __init__(
+        self,
+        max_pending: int = 10_000,
+        on_complete: Callable[[Subscription, float, BaseException | None], None]
+        | None = None,
+    ) -> None:
+        """
+        Args:
+            max_pending: Maximum number of queued or running handler calls.
+            on_complete: Called on the loop thread after every handler call
+                with the subscription, its latency in seconds and the
+                exception it raised, if any.
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.max_pending = max_pending
+        self._on_complete = on_complete
+        self._cond = threading.Condition()
+        self._pending = 0
+        self._batches: deque[list[tuple[Subscription, list[Event]]]] = deque()
+        self._drain_scheduled = False
+        self._inboxes: dict[str, deque[tuple[Subscription, Event]]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def pending(self) -> int:
+        """Handler calls queued or running."""
+        return self._pending
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+
+            self._thread = threading.Thread(
+                target=run, name="event_bus_dispatcher", daemon=True
+            )
+            self._thread.start()
+            started.wait()
+            self._loop = loop
+        return self._loop
+
+    def submit(
+        self,
+        batch: list[tuple[Subscription, list[Event]]],
+        timeout: float | None = None,
+    ) -> None:
+        """Queue handler calls, blocking while ``max_pending`` is reached.
+
+        Raises:
+            EventQueueError: If room does not free up within ``timeout``.
+        """
+        n = sum(len(events) for _, events in batch)
+        if not n:
+            return
+        with self._cond:
+            loop = self._ensure_started()
+            # Never block the loop thread itself: a handler publishing more
+            # events would otherwise wait on its own completion.
+            if threading.current_thread() is not self._thread and not (
+                self._cond.wait_for(
+                    lambda: self._pending == 0 or self._pending + n <= self.max_pending,
+                    timeout,
+                )
+            ):
+                raise EventQueueError(
+                    "Async dispatcher is full",
+                    queue_name="event_bus_dispatcher",
+                    queue_size=self._pending,
+                    max_size=self.max_pending,
+                )
+            self._pending += n
+            self._batches.append(batch)
+            schedule = not self._drain_scheduled
+            self._drain_scheduled = True
+        if schedule:
+            loop.call_soon_threadsafe(self._drain)
+
+    def _drain(self) -> None:
+        """Move queued batches into per-subscriber inboxes (loop thread)."""
+        with self._cond:
+            batches = list(self._batches)
+            self._batches.clear()
+            self._drain_scheduled = False
+        loop = asyncio.get_running_loop()
+        for batch in batches:
+            for subscription, events in batch:
+                inbox = self._inboxes.get(subscription.subscriber_id)
+                if inbox is None:
+                    inbox = self._inboxes[subscription.subscriber_id] = deque()
+                    loop.create_task(self._worker(subscription.subscriber_id))
+                inbox.extend((subscription, event) for event in events)
+
+    async def _worker(self, subscriber_id: str) -> None:
+        inbox = self._inboxes[subscriber_id]
+        try:
+            while inbox:
+                subscription, event = inbox.popleft()
+                error: BaseException | None = None
+                start = time.perf_counter()
+                try:
+                    await subscription.handler(event)
+                except Exception as e:
+                    error = e
+                elapsed = time.perf_counter() - start
+                if self._on_complete is not None:
+                    try:
+                        self._on_complete(subscription, elapsed, error)
+                    except Exception as e:
+                        logger.error("Error in dispatcher completion hook: %s", e)
+                with self._cond:
+                    self._pending -= 1
+                    self._cond.notify_all()
+        finally:
+            del self._inboxes[subscriber_id]
+            if inbox:  # cancelled: release the slots of undelivered events
+                with self._cond:
+                    self._pending -= len(inbox)
+                    self._cond.notify_all()
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait until every submitted handler call has finished."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending == 0, timeout)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Cancel outstanding handler calls and stop the loop thread."""
+        with self._cond:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+
+        async def cancel_all() -> None:
+            tasks = [
+                t for t in asyncio.all_tasks(loop) if t is not asyncio.current_task()
+            ]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if thread is not threading.current_thread():
+            try:
+                asyncio.run_coroutine_threadsafe(cancel_all(), loop).result(timeout)
+            except Exception as e:
+                logger.warning("Timed out cancelling async handlers: %s", e)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+        else:
+            loop.call_soon(loop.stop)
+        with self._cond:
+            self._batches.clear()
+            self._pending = 0
+            self._drain_scheduled = False
+            self._cond.notify_all()
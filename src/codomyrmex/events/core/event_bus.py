@@ -8,8 +8,10 @@ subscription handling, and asynchronous event processing.
 import asyncio
 import fnmatch
 import inspect
+import itertools
 import threading
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterable
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
@@ -26,8 +28,10 @@ except ImportError:
 
 from codomyrmex.logging_monitoring.core.correlation import get_correlation_id
 
+from .dispatch import AsyncDispatcher, LatencyHistogram
 from .event_schema import Event, EventSchema, EventType
 from .exceptions import EventPublishError, EventSubscriptionError
+from .routing import SubscriptionRouter
 
 
 @dataclass
@@ -61,7 +65,10 @@ class Subscription:
         if not match_found:
             return False
 
-        # Check filter function
+        return self.passes_filter(event)
+
+    def passes_filter(self, event: Event) -> bool:
+        """Check the subscription's filter function, if any."""
         if self.filter_func:
             try:
                 if not self.filter_func(event):
@@ -76,12 +83,38 @@ class Subscription:
 class EventBus:
     """
     Central event bus for managing event routing and subscriptions.
+
+    Subscription patterns are indexed by a ``SubscriptionRouter`` that is
+    updated on subscribe/unsubscribe, so publishing only visits matching
+    subscriptions instead of glob-matching every one of them. Once an event
+    type has been routed, publishing it takes no lock.
+
+    Synchronous handlers run inline in the publishing thread. Coroutine
+    handlers are batched per subscriber and run on the long-lived event
+    loop of an ``AsyncDispatcher``; at most ``max_pending`` such calls are
+    outstanding, beyond which publishers block (or, with
+    ``publish_timeout``, get an ``EventQueueError``). Every handler call is
+    timed into a per-subscriber ``LatencyHistogram``.
     """
 
-    def __init__(self, max_workers: int = 4, enable_async: bool = False):
+    def __init__(
+        self,
+        max_workers: int = 4,
+        enable_async: bool = False,
+        max_pending: int = 10_000,
+        publish_timeout: float | None = None,
+    ):
         """
         Initialize the event bus.
         Default to synchronous processing for deterministic local callers.
+
+        Args:
+            max_workers: Thread pool size for ``executor``.
+            enable_async: Queue published events on ``event_queue``.
+            max_pending: Maximum outstanding coroutine handler calls.
+            publish_timeout: Seconds a publisher waits for room in the
+                async dispatcher before ``EventQueueError``; None waits
+                indefinitely.
         """
         self.subscriptions: dict[str, Subscription] = {}
         self.event_schema = EventSchema()
@@ -106,6 +139,19 @@ class EventBus:
         self._lock = threading.RLock()
         self._subscriber_counter = 0
 
+        # Routing index; event type -> subscriber ids ordered for dispatch
+        self._router = SubscriptionRouter()
+        self._subscription_seq: dict[str, int] = {}
+        self._next_seq = itertools.count()
+        self._dispatch_order: dict[str, tuple[str, ...]] = {}
+
+        # Coroutine handler fan-out and per-subscriber latency
+        self.publish_timeout = publish_timeout
+        self._dispatcher = AsyncDispatcher(
+            max_pending=max_pending, on_complete=self._on_async_complete
+        )
+        self._handler_latency: dict[str, LatencyHistogram] = {}
+
         logger.info(
             "EventBus initialized with %d workers, async=%s", max_workers, enable_async
         )
@@ -148,6 +194,11 @@ class EventBus:
 
         with self._lock:
             self.subscriptions[subscriber_id] = subscription
+            if subscriber_id not in self._subscription_seq:
+                self._subscription_seq[subscriber_id] = next(self._next_seq)
+            self._handler_latency.setdefault(subscriber_id, LatencyHistogram())
+            self._router.add(subscriber_id, patterns)
+            self._dispatch_order.clear()
 
         logger.info(
             "Subscribed %s to %d event patterns", subscriber_id, len(event_patterns)
@@ -196,15 +247,18 @@ class EventBus:
     def unsubscribe(self, subscriber_id: str) -> bool:
         """Unsubscribe from events."""
         with self._lock:
+            self._router.remove(subscriber_id)
+            self._subscription_seq.pop(subscriber_id, None)
+            self._handler_latency.pop(subscriber_id, None)
+            self._dispatch_order.clear()
             if subscriber_id in self.subscriptions:
                 del self.subscriptions[subscriber_id]
                 logger.info("Unsubscribed %s", subscriber_id)
                 return True
         return False
 
-    def publish(self, event: Event) -> None:
-        """Publish an event."""
-        # Basic validation
+    def _prepare(self, event: Event) -> None:
+        """Validate an event and inject the current correlation ID."""
         if not hasattr(event, "event_type") or event.event_type is None:
             logger.error("Attempted to publish event without event_type")
             raise EventPublishError("Event must have an event_type")
@@ -215,6 +269,9 @@ class EventBus:
             if cid:
                 event.correlation_id = cid
 
+    def publish(self, event: Event) -> None:
+        """Publish an event."""
+        self._prepare(event)
         self.events_published += 1
 
         if self.enable_async:
@@ -225,6 +282,35 @@ class EventBus:
         else:
             self._process_event_sync(event)
 
+    def publish_many(self, events: Iterable[Event]) -> int:
+        """Publish a batch of events.
+
+        All events are validated before any is dispatched. Synchronous
+        handlers run inline in event order; coroutine handler calls for the
+        whole batch are handed to the async dispatcher in one submission,
+        grouped per subscriber.
+
+        Args:
+            events: Events to publish.
+
+        Returns:
+            Number of events published.
+        """
+        batch = list(events)
+        for event in batch:
+            self._prepare(event)
+        self.events_published += len(batch)
+
+        if self.enable_async:
+            for event in batch:
+                try:
+                    self.event_queue.put_nowait(event)
+                except (asyncio.QueueFull, AttributeError):
+                    self._process_event_sync(event)
+        else:
+            self._dispatch(batch)
+        return len(batch)
+
     async def publish_async(self, event: Event) -> None:
         """Publish an event asynchronously."""
         if not self.enable_async:
@@ -238,55 +324,117 @@ class EventBus:
         self.events_published += 1
         await self.event_queue.put(event)
 
-    def _process_event_sync(self, event: Event) -> None:
-        """Process an event synchronously."""
-        try:
-            matching_subs = []
-            with self._lock:
-                for sub in self.subscriptions.values():
-                    if sub.matches_event(event):
-                        matching_subs.append(sub)
+    def _route(self, event_type: str) -> tuple[str, ...]:
+        """Subscriber ids for ``event_type``, by priority then subscription order.
 
-            matching_subs.sort(key=lambda s: s.priority, reverse=True)
+        Must be called with ``self._lock`` held.
+        """
+        order = self._dispatch_order.get(event_type)
+        if order is None:
+            ids = [
+                sid
+                for sid in self._router.match(event_type)
+                if sid in self.subscriptions
+            ]
+            ids.sort(
+                key=lambda sid: (
+                    -self.subscriptions[sid].priority,
+                    self._subscription_seq.get(sid, 0),
+                )
+            )
+            order = tuple(ids)
+            if len(self._dispatch_order) >= 4096:
+                self._dispatch_order.clear()
+            self._dispatch_order[event_type] = order
+        return order
+
+    def _subscribers_for(self, event: Event) -> list[Subscription]:
+        """Subscriptions routed to ``event``, in dispatch order."""
+        event_type = (
+            event.event_type.value
+            if hasattr(event.event_type, "value")
+            else str(event.event_type)
+        )
+        order = self._dispatch_order.get(event_type)
+        if order is None:
+            with self._lock:
+                order = self._route(event_type)
+        subscriptions = self.subscriptions
+        return [sub for sid in order if (sub := subscriptions.get(sid)) is not None]
+
+    def _observe_latency(self, subscriber_id: str, elapsed: float) -> None:
+        """Record a handler run; dropped if the subscriber has since left."""
+        histogram = self._handler_latency.get(subscriber_id)
+        if histogram is not None:
+            histogram.observe(elapsed)
+
+    def _on_async_complete(
+        self, subscription: Subscription, elapsed: float, error: BaseException | None
+    ) -> None:
+        self._observe_latency(subscription.subscriber_id, elapsed)
+        if error is not None:
+            logger.error(
+                "Error in async event handler %s: %s", subscription.subscriber_id, error
+            )
+            self.events_failed += 1
 
-            for subscription in matching_subs:
-                try:
+    def _dispatch(self, events: list[Event]) -> None:
+        """Run sync handlers inline and hand coroutine handlers to the dispatcher."""
+        async_calls: dict[str, tuple[Subscription, list[Event]]] = {}
+        for event in events:
+            try:
+                for subscription in self._subscribers_for(event):
+                    if not subscription.passes_filter(event):
+                        continue
                     if subscription.is_async:
-                        self.executor.submit(
-                            self._run_async_handler, subscription.handler, event
-                        )
-                    else:
+                        async_calls.setdefault(
+                            subscription.subscriber_id, (subscription, [])
+                        )[1].append(event)
+                        continue
+                    start = time.perf_counter()
+                    try:
                         subscription.handler(event)
-                except Exception as e:
-                    logger.error(
-                        "Error in event handler %s: %s", subscription.subscriber_id, e
+                    except Exception as e:
+                        logger.error(
+                            "Error in event handler %s: %s",
+                            subscription.subscriber_id,
+                            e,
+                        )
+                        self.events_failed += 1
+                    self._observe_latency(
+                        subscription.subscriber_id, time.perf_counter() - start
                     )
-                    self.events_failed += 1
 
-            self.events_processed += 1
-        except Exception as e:
-            logger.error("Error processing event: %s", e)
-            self.dead_letter_queue.append(event)
-            self.events_failed += 1
+                self.events_processed += 1
+            except Exception as e:
+                logger.error("Error processing event: %s", e)
+                self.dead_letter_queue.append(event)
+                self.events_failed += 1
 
-    def _run_async_handler(self, handler, event):
-        try:
-            try:
-                loop = asyncio.get_running_loop()
-                # Use call_soon_threadsafe if we are in a different thread
-                # though usually _run_async_handler is called from executor
-                loop.call_soon_threadsafe(lambda: asyncio.create_task(handler(event)))
-            except RuntimeError:
-                # No running loop in this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(handler(event))
-                finally:
-                    loop.close()
-        except Exception as e:
-            logger.error("Error in async event handler: %s", e)
-            self.events_failed += 1
+        if async_calls:
+            self._dispatcher.submit(
+                list(async_calls.values()), timeout=self.publish_timeout
+            )
+
+    def _process_event_sync(self, event: Event) -> None:
+        """Process an event synchronously."""
+        self._dispatch([event])
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait for outstanding coroutine handler calls to finish.
+
+        Returns:
+            True if all finished within ``timeout``.
+        """
+        return self._dispatcher.join(timeout)
+
+    def get_handler_latency(self, subscriber_id: str) -> dict[str, Any]:
+        """Latency histogram summary (seconds) for one subscriber.
+
+        Unknown subscribers get an empty summary.
+        """
+        histogram = self._handler_latency.get(subscriber_id)
+        return (histogram or LatencyHistogram()).to_dict()
 
     def get_stats(self) -> dict[str, Any]:
         """Get stats."""
@@ -306,6 +454,12 @@ class EventBus:
                 "async_enabled": self.enable_async,
                 "subscribers_count": len(self.subscriptions),
                 "subscribers": subs,
+                "async_pending": self._dispatcher.pending,
+                "async_max_pending": self._dispatcher.max_pending,
+                "handler_latency": {
+                    sid: histogram.to_dict()
+                    for sid, histogram in self._handler_latency.items()
+                },
             }
 
     def reset_stats(self) -> None:
@@ -313,9 +467,13 @@ class EventBus:
 
     def shutdown(self) -> None:
         """Shutdown."""
+        self._dispatcher.stop()
         self.executor.shutdown(wait=True)
         with self._lock:
             self.subscriptions.clear()
+            self._router.clear()
+            self._subscription_seq.clear()
+            self._dispatch_order.clear()
 
     def list_event_types(self) -> list[str]:
         """list all event types that have active subscriptions."""
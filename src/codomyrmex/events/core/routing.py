@@ -0,0 +1,225 @@
+"""
+Subscription routing for the Codomyrmex event bus.
+
+``SubscriptionRouter`` indexes subscription patterns so that finding the
+subscribers of an event type does not require a glob match per
+subscription. Matching follows ``fnmatch.fnmatchcase`` semantics exactly:
+
+- Patterns without glob characters go into an exact-match hash map.
+- Dotted patterns whose segments are literals or a bare ``*`` go into a
+  segment trie. A bare ``*`` segment becomes a wildcard node consuming one
+  or more segments (``fnmatch``'s ``*`` also matches across dots), and a
+  final segment of the form ``literal*`` is a prefix test on the rest of
+  the event type.
+- Any other glob (``?``, ``[...]``, ``*`` inside a segment) falls back to a
+  compiled regular expression.
+
+Results are cached per event type until the next ``add``/``remove``.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from dataclasses import dataclass, field
+
+_GLOB_CHARS = frozenset("*?[")
+_MAX_CACHED_TYPES = 4096
+
+
+def _is_literal(text: str) -> bool:
+    return not _GLOB_CHARS.intersection(text)
+
+
+@dataclass
+class _TrieNode:
+    children: dict[str, _TrieNode] = field(default_factory=dict)
+    wildcard: _TrieNode | None = None
+    # subscriber ids whose pattern ends exactly at this node
+    terminal: set[str] = field(default_factory=set)
+    # literal prefix of a trailing ``literal*`` segment -> subscriber ids
+    prefixes: dict[str, set[str]] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return not (self.children or self.wildcard or self.terminal or self.prefixes)
+
+
+def _trie_segments(pattern: str) -> list[str] | None:
+    """Split ``pattern`` for the trie, or return None if it needs a regex."""
+    segments = pattern.split(".")
+    for i, segment in enumerate(segments):
+        if segment == "*" or _is_literal(segment):
+            continue
+        last = i == len(segments) - 1
+        if last and segment.endswith("*") and _is_literal(segment[:-1]):
+            continue
+        return None
+    return segments
+
+
+class SubscriptionRouter:
+    """Index from event-type patterns to subscriber ids."""
+
+    def __init__(self) -> None:
+        self._exact: dict[str, set[str]] = {}
+        self._root = _TrieNode()
+        self._regex: dict[str, tuple[re.Pattern[str], set[str]]] = {}
+        self._patterns: dict[str, set[str]] = {}
+        self._cache: dict[str, frozenset[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, subscriber_id: str, patterns: set[str]) -> None:
+        """Route ``patterns`` to ``subscriber_id``, replacing earlier patterns."""
+        self.remove(subscriber_id)
+        self._patterns[subscriber_id] = set(patterns)
+        for pattern in patterns:
+            self._insert(pattern, subscriber_id)
+        self._cache.clear()
+
+    def remove(self, subscriber_id: str) -> bool:
+        """Drop every pattern routed to ``subscriber_id``."""
+        patterns = self._patterns.pop(subscriber_id, None)
+        if patterns is None:
+            return False
+        for pattern in patterns:
+            self._delete(pattern, subscriber_id)
+        self._cache.clear()
+        return True
+
+    def clear(self) -> None:
+        """Remove all routes."""
+        self._exact.clear()
+        self._root = _TrieNode()
+        self._regex.clear()
+        self._patterns.clear()
+        self._cache.clear()
+
+    def match(self, event_type: str) -> frozenset[str]:
+        """Return the ids of subscribers with a pattern matching ``event_type``."""
+        cached = self._cache.get(event_type)
+        if cached is not None:
+            return cached
+
+        ids: set[str] = set()
+        exact = self._exact.get(event_type)
+        if exact:
+            ids.update(exact)
+        self._match_trie(self._root, event_type.split("."), 0, ids)
+        for regex, subscribers in self._regex.values():
+            if regex.match(event_type):
+                ids.update(subscribers)
+
+        result = frozenset(ids)
+        if len(self._cache) >= _MAX_CACHED_TYPES:
+            self._cache.clear()
+        self._cache[event_type] = result
+        return result
+
+    # ── Index maintenance ───────────────────────────────────────────
+
+    def _insert(self, pattern: str, subscriber_id: str) -> None:
+        if _is_literal(pattern):
+            self._exact.setdefault(pattern, set()).add(subscriber_id)
+            return
+        segments = _trie_segments(pattern)
+        if segments is None:
+            regex = re.compile(fnmatch.translate(pattern))
+            self._regex.setdefault(pattern, (regex, set()))[1].add(subscriber_id)
+            return
+
+        node = self._root
+        for segment in segments[:-1]:
+            node = self._child(node, segment)
+        last = segments[-1]
+        if last.endswith("*"):
+            # A trailing bare ``*`` is a prefix test with an empty literal.
+            node.prefixes.setdefault(last[:-1], set()).add(subscriber_id)
+        else:
+            self._child(node, last).terminal.add(subscriber_id)
+
+    @staticmethod
+    def _child(node: _TrieNode, segment: str) -> _TrieNode:
+        if segment == "*":
+            if node.wildcard is None:
+                node.wildcard = _TrieNode()
+            return node.wildcard
+        child = node.children.get(segment)
+        if child is None:
+            child = node.children[segment] = _TrieNode()
+        return child
+
+    def _delete(self, pattern: str, subscriber_id: str) -> None:
+        if _is_literal(pattern):
+            subscribers = self._exact.get(pattern)
+            if subscribers is not None:
+                subscribers.discard(subscriber_id)
+                if not subscribers:
+                    del self._exact[pattern]
+            return
+        segments = _trie_segments(pattern)
+        if segments is None:
+            entry = self._regex.get(pattern)
+            if entry is not None:
+                entry[1].discard(subscriber_id)
+                if not entry[1]:
+                    del self._regex[pattern]
+            return
+        self._delete_path(self._root, segments, subscriber_id)
+
+    def _delete_path(
+        self, node: _TrieNode, segments: list[str], subscriber_id: str
+    ) -> None:
+        """Remove ``subscriber_id`` at the end of ``segments``, pruning empty nodes."""
+        if len(segments) == 1 and segments[0].endswith("*"):
+            literal = segments[0][:-1]
+            subscribers = node.prefixes.get(literal)
+            if subscribers is not None:
+                subscribers.discard(subscriber_id)
+                if not subscribers:
+                    del node.prefixes[literal]
+            return
+
+        segment = segments[0]
+        child = node.wildcard if segment == "*" else node.children.get(segment)
+        if child is None:
+            return
+        if len(segments) == 1:
+            child.terminal.discard(subscriber_id)
+        else:
+            self._delete_path(child, segments[1:], subscriber_id)
+        if child.is_empty():
+            if segment == "*":
+                node.wildcard = None
+            else:
+                del node.children[segment]
+
+    # ── Matching ────────────────────────────────────────────────────
+
+    def _match_trie(
+        self, node: _TrieNode, segments: list[str], depth: int, ids: set[str]
+    ) -> None:
+        """Collect matches for ``segments[depth:]`` starting at ``node``.
+
+        Being at ``node`` with ``depth > 0`` means the text consumed so far
+        ends just before a dot (or at the end of the event type).
+        """
+        remaining = len(segments) - depth
+        if remaining == 0:
+            ids.update(node.terminal)
+            return
+
+        if node.prefixes:
+            rest = ".".join(segments[depth:])
+            for literal, subscribers in node.prefixes.items():
+                if rest.startswith(literal):
+                    ids.update(subscribers)
+
+        child = node.children.get(segments[depth])
+        if child is not None:
+            self._match_trie(child, segments, depth + 1, ids)
+        if node.wildcard is not None:
+            # ``*`` consumes one or more whole segments.
+            for end in range(depth + 1, len(segments) + 1):
+                self._match_trie(node.wildcard, segments, end, ids)
@@ -10,7 +10,10 @@ import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 @dataclass
@@ -109,6 +112,24 @@ class EventStore:
 
             return [e for e in self._events if from_seq <= e.sequence <= to_seq]
 
+    def iter_read(self, from_seq: int = 1, to_seq: int = 0) -> Iterator[StreamEvent]:
+        """Iterate over events in a sequence range.
+
+        Args:
+            from_seq: Start sequence (inclusive).
+            to_seq: End sequence (inclusive). 0 = latest.
+        """
+        yield from self.read(from_seq, to_seq)
+
+    def iter_by_time(self, from_time: float, to_time: float) -> Iterator[StreamEvent]:
+        """Iterate over events in a time range.
+
+        Args:
+            from_time: Start timestamp (inclusive).
+            to_time: End timestamp (inclusive).
+        """
+        yield from self.read_by_time(from_time, to_time)
+
     def read_by_topic(self, topic: str, limit: int = 0) -> list[StreamEvent]:
         """Read events by topic.
 
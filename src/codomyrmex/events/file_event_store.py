@@ -0,0 +1,559 @@
+"""Durable, segmented on-disk event store.
+
+``FileEventStore`` keeps the ``EventStore`` API but writes events to
+rolling append-only segment files instead of a Python list, so memory use
+does not grow with the number of stored events.
+
+Layout of the store directory, one set of files per segment, named after
+the first sequence number in the segment::
+
+    00000000000000000001.log   newline-delimited JSON events
+    00000000000000000001.idx   sparse index: (sequence, offset, timestamp)
+    00000000000000000001.meta  JSON summary, written when the segment rolls
+    store.json                 sequence floor kept across compaction
+
+Every ``index_interval``-th event of a segment gets an index entry, so a
+range read bisects the index and seeks straight to the nearest preceding
+entry. Sealed segments record their sequence range, min/max timestamps
+and topic counts in ``.meta``, which lets ``read_by_time`` and
+``read_by_topic`` skip segments without opening them; within a segment
+whose timestamps never decrease, time reads also seek via the index. Only the active
+(last) segment is rescanned when the store is reopened, and a torn final
+line left by a crash is truncated away.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import IO, TYPE_CHECKING, Any, Self
+
+from codomyrmex.events.event_store import EventStore, StreamEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_INDEX_ENTRY = struct.Struct("<QQd")
+_STATE_FILE = "store.json"
+
+
+@dataclass
+class _Segment:
+    """In-memory summary of one segment file."""
+
+    first_seq: int
+    directory: str
+    last_seq: int = 0
+    count: int = 0
+    size: int = 0
+    min_ts: float = float("inf")
+    max_ts: float = float("-inf")
+    topics: dict[str, int] = field(default_factory=dict)
+    # timestamps never decrease within the segment
+    ordered: bool = True
+    index_seqs: list[int] = field(default_factory=list)
+    index_offsets: list[int] = field(default_factory=list)
+    index_times: list[float] = field(default_factory=list)
+
+    def path(self, ext: str) -> str:
+        return os.path.join(self.directory, f"{self.first_seq:020d}.{ext}")
+
+    def record(self, event: StreamEvent, offset: int, size: int) -> None:
+        """Account for ``event`` written at ``offset`` with ``size`` bytes."""
+        if event.timestamp < self.max_ts:
+            self.ordered = False
+        self.last_seq = event.sequence
+        self.count += 1
+        self.size = offset + size
+        self.min_ts = min(self.min_ts, event.timestamp)
+        self.max_ts = max(self.max_ts, event.timestamp)
+        self.topics[event.topic] = self.topics.get(event.topic, 0) + 1
+
+    def add_index(self, event: StreamEvent, offset: int) -> bytes:
+        """Index ``event`` at ``offset``; returns the ``.idx`` record."""
+        self.index_seqs.append(event.sequence)
+        self.index_offsets.append(offset)
+        self.index_times.append(event.timestamp)
+        return _INDEX_ENTRY.pack(event.sequence, offset, event.timestamp)
+
+    def offset_for(self, sequence: int) -> int:
+        """Byte offset of the last indexed event at or before ``sequence``."""
+        i = bisect.bisect_right(self.index_seqs, sequence) - 1
+        return self.index_offsets[i] if i >= 0 else 0
+
+    def offset_for_time(self, timestamp: float) -> int:
+        """Byte offset of the last indexed event before ``timestamp``.
+
+        Only meaningful for ``ordered`` segments.
+        """
+        i = bisect.bisect_left(self.index_times, timestamp) - 1
+        return self.index_offsets[i] if i >= 0 else 0
+
+    def meta(self) -> dict[str, Any]:
+        return {
+            "first_seq": self.first_seq,
+            "last_seq": self.last_seq,
+            "count": self.count,
+            "size": self.size,
+            "min_ts": self.min_ts,
+            "max_ts": self.max_ts,
+            "ordered": self.ordered,
+            "topics": self.topics,
+        }
+
+
+def _encode(event: StreamEvent) -> bytes:
+    return (json.dumps(event.to_dict(), separators=(",", ":")) + "\n").encode()
+
+
+def _decode(line: bytes) -> StreamEvent:
+    return StreamEvent(**json.loads(line))
+
+
+def _write_json(path: str, payload: dict[str, Any]) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    os.replace(tmp, path)
+
+
+class FileEventStore(EventStore):
+    """Append-only event store persisted as rolling segment files.
+
+    Example::
+
+        with FileEventStore("/var/lib/codomyrmex/events") as store:
+            store.append(StreamEvent(topic="agent", event_type="started"))
+            for event in store.iter_read(from_seq=1_000_000):
+                ...
+    """
+
+    def __init__(
+        self,
+        path: str,
+        segment_size: int = 8 * 1024 * 1024,
+        index_interval: int = 64,
+        fsync: bool = False,
+    ) -> None:
+        """Open (or create) a store in directory ``path``.
+
+        Args:
+            path: Directory holding the segment files.
+            segment_size: Roll to a new segment once the active one
+                reaches this many bytes.
+            index_interval: Index every Nth event of a segment.
+            fsync: ``os.fsync`` after every append instead of only
+                flushing to the OS.
+        """
+        if segment_size <= 0 or index_interval <= 0:
+            raise ValueError("segment_size and index_interval must be positive")
+        self.path = path
+        self.segment_size = segment_size
+        self.index_interval = index_interval
+        self.fsync = fsync
+        self._lock = threading.RLock()
+        self._segments: list[_Segment] = []
+        self._log: IO[bytes] | None = None
+        self._idx: IO[bytes] | None = None
+        self._next_sequence = 1
+        self._closed = False
+        os.makedirs(path, exist_ok=True)
+        self._load()
+
+    # ── Opening and recovery ────────────────────────────────────────
+
+    def _load(self) -> None:
+        for name in os.listdir(self.path):
+            if name.endswith(".tmp"):
+                os.remove(os.path.join(self.path, name))
+        first_seqs = sorted(
+            int(name[:-4]) for name in os.listdir(self.path) if name.endswith(".log")
+        )
+        for i, first_seq in enumerate(first_seqs):
+            segment = _Segment(first_seq, self.path)
+            is_last = i == len(first_seqs) - 1
+            if is_last or not self._load_sealed(segment):
+                self._scan(segment)
+            if segment.count == 0 and not is_last:
+                self._delete_files(segment)
+                continue
+            # A segment superseded by a compaction that was interrupted
+            # before the old file was removed.
+            if self._segments and self._segments[-1].last_seq >= segment.first_seq:
+                self._delete_files(self._segments.pop())
+            self._segments.append(segment)
+
+        state_path = os.path.join(self.path, _STATE_FILE)
+        if os.path.exists(state_path):
+            with open(state_path, encoding="utf-8") as f:
+                self._next_sequence = json.load(f)["next_sequence"]
+        if self._segments and self._segments[-1].count:
+            self._next_sequence = max(
+                self._next_sequence, self._segments[-1].last_seq + 1
+            )
+        if self._segments:
+            self._open_active(self._segments[-1])
+
+    def _load_sealed(self, segment: _Segment) -> bool:
+        """Load a sealed segment's summary; False if it must be rescanned."""
+        try:
+            with open(segment.path("meta"), encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(segment.path("idx"), "rb") as f:
+                raw = f.read()
+        except (OSError, ValueError):
+            return False
+        segment.last_seq = meta["last_seq"]
+        segment.count = meta["count"]
+        segment.size = meta["size"]
+        segment.min_ts = meta["min_ts"]
+        segment.max_ts = meta["max_ts"]
+        segment.ordered = meta["ordered"]
+        segment.topics = meta["topics"]
+        for seq, offset, timestamp in _INDEX_ENTRY.iter_unpack(raw):
+            segment.index_seqs.append(seq)
+            segment.index_offsets.append(offset)
+            segment.index_times.append(timestamp)
+        return True
+
+    def _scan(self, segment: _Segment) -> None:
+        """Rebuild a segment summary from its log, truncating a torn tail."""
+        offset = 0
+        records: list[bytes] = []
+        with open(segment.path("log"), "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    event = _decode(line)
+                except (ValueError, TypeError):
+                    break
+                if segment.count % self.index_interval == 0:
+                    records.append(segment.add_index(event, offset))
+                segment.record(event, offset, len(line))
+                offset += len(line)
+        if os.path.getsize(segment.path("log")) != offset:
+            with open(segment.path("log"), "r+b") as f:
+                f.truncate(offset)
+        segment.size = offset
+        with open(segment.path("idx"), "wb") as f:
+            f.writelines(records)
+
+    def _open_active(self, segment: _Segment) -> None:
+        self._log = open(segment.path("log"), "ab")
+        self._idx = open(segment.path("idx"), "ab")
+
+    def _delete_files(self, segment: _Segment) -> None:
+        for ext in ("log", "idx", "meta"):
+            try:
+                os.remove(segment.path(ext))
+            except FileNotFoundError:
+                pass
+
+    # ── Writing ─────────────────────────────────────────────────────
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError("FileEventStore is closed")
+
+    def _roll(self, first_seq: int) -> _Segment:
+        """Seal the active segment and start a new one at ``first_seq``."""
+        if self._segments:
+            active = self._segments[-1]
+            self._close_active()
+            _write_json(active.path("meta"), active.meta())
+        segment = _Segment(first_seq, self.path)
+        self._segments.append(segment)
+        self._open_active(segment)
+        return segment
+
+    def _close_active(self) -> None:
+        for handle in (self._log, self._idx):
+            if handle is not None:
+                handle.close()
+        self._log = self._idx = None
+
+    def append(self, event: StreamEvent) -> int:
+        """Append an event and return its sequence number.
+
+        Args:
+            event: Event to store. Its ``data`` must be JSON-serializable.
+
+        Returns:
+            Assigned sequence number.
+        """
+        with self._lock:
+            self._check_open()
+            sequence = self._next_sequence
+            event.sequence = sequence
+            if not event.timestamp:
+                event.timestamp = time.time()
+            line = _encode(event)
+
+            segment = self._segments[-1] if self._segments else None
+            if segment is None or (
+                segment.count and segment.size + len(line) > self.segment_size
+            ):
+                segment = self._roll(sequence)
+            offset = segment.size
+            if segment.count % self.index_interval == 0:
+                self._idx.write(segment.add_index(event, offset))
+                self._idx.flush()
+            self._log.write(line)
+            self._log.flush()
+            if self.fsync:
+                os.fsync(self._log.fileno())
+            segment.record(event, offset, len(line))
+            self._next_sequence = sequence + 1
+            return sequence
+
+    # ── Reading ─────────────────────────────────────────────────────
+
+    @property
+    def count(self) -> int:
+        """Total number of events in the store."""
+        with self._lock:
+            return sum(s.count for s in self._segments)
+
+    @property
+    def latest_sequence(self) -> int:
+        """Latest sequence number."""
+        with self._lock:
+            return self._next_sequence - 1
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segment files."""
+        with self._lock:
+            return len(self._segments)
+
+    def _snapshot(self) -> list[_Segment]:
+        with self._lock:
+            self._check_open()
+            return [s for s in self._segments if s.count]
+
+    def _iter_segment(
+        self,
+        segment: _Segment,
+        from_seq: int,
+        to_seq: int,
+        offset: int | None = None,
+    ) -> Iterator[StreamEvent]:
+        try:
+            f = open(segment.path("log"), "rb")
+        except FileNotFoundError:
+            yield from self._iter_replaced(segment, from_seq, to_seq)
+            return
+        with f:
+            f.seek(segment.offset_for(from_seq) if offset is None else offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return
+                event = _decode(line)
+                if event.sequence > to_seq:
+                    return
+                if event.sequence >= from_seq:
+                    yield event
+
+    def _iter_replaced(
+        self, segment: _Segment, from_seq: int, to_seq: int
+    ) -> Iterator[StreamEvent]:
+        """Continue a read of ``segment`` after compaction removed its file.
+
+        Compaction either dropped the whole segment or rewrote its tail into
+        a replacement segment; re-resolve against the current segment list
+        and read whatever still holds this segment's sequence range.
+        """
+        to_seq = min(to_seq, segment.last_seq)
+        from_seq = max(from_seq, segment.first_seq)
+        with self._lock:
+            current = [
+                s
+                for s in self._segments
+                if s.count and s.first_seq <= to_seq and s.last_seq >= from_seq
+            ]
+        for replacement in current:
+            yield from self._iter_segment(replacement, from_seq, to_seq)
+
+    def iter_read(self, from_seq: int = 1, to_seq: int = 0) -> Iterator[StreamEvent]:
+        """Stream events in a sequence range without materializing them.
+
+        Args:
+            from_seq: Start sequence (inclusive).
+            to_seq: End sequence (inclusive). 0 = latest at call time.
+        """
+        segments = self._snapshot()
+        latest = self.latest_sequence
+        to_seq = latest if to_seq <= 0 else min(to_seq, latest)
+        start = bisect.bisect_right([s.first_seq for s in segments], from_seq) - 1
+        for segment in segments[max(start, 0) :]:
+            if segment.first_seq > to_seq:
+                return
+            if segment.last_seq < from_seq:
+                continue
+            yield from self._iter_segment(segment, from_seq, to_seq)
+
+    def read(self, from_seq: int = 1, to_seq: int = 0) -> list[StreamEvent]:
+        """Read events in a sequence range.
+
+        Args:
+            from_seq: Start sequence (inclusive).
+            to_seq: End sequence (inclusive). 0 = latest.
+
+        Returns:
+            list of events in the range.
+        """
+        return list(self.iter_read(from_seq, to_seq))
+
+    def iter_by_time(self, from_time: float, to_time: float) -> Iterator[StreamEvent]:
+        """Stream events in a time range.
+
+        Segments whose timestamp range does not overlap are skipped; in
+        segments with non-decreasing timestamps the read seeks via the
+        index and stops at the first event past ``to_time``.
+        """
+        latest = self.latest_sequence
+        for segment in self._snapshot():
+            if segment.max_ts < from_time or segment.min_ts > to_time:
+                continue
+            if not segment.ordered:
+                for event in self._iter_segment(segment, segment.first_seq, latest):
+                    if from_time <= event.timestamp <= to_time:
+                        yield event
+                continue
+            events = self._iter_segment(
+                segment, segment.first_seq, latest, segment.offset_for_time(from_time)
+            )
+            for event in events:
+                if event.timestamp > to_time:
+                    break
+                if event.timestamp >= from_time:
+                    yield event
+
+    def read_by_time(self, from_time: float, to_time: float) -> list[StreamEvent]:
+        """Read events in a time range.
+
+        Args:
+            from_time: Start timestamp (inclusive).
+            to_time: End timestamp (inclusive).
+
+        Returns:
+            Events within the time range.
+        """
+        return list(self.iter_by_time(from_time, to_time))
+
+    def read_by_topic(self, topic: str, limit: int = 0) -> list[StreamEvent]:
+        """Read events by topic.
+
+        Args:
+            topic: Topic to filter by.
+            limit: Maximum events to return (0 = all, otherwise the latest).
+
+        Returns:
+            Events matching the topic.
+        """
+        latest = self.latest_sequence
+        events: deque[StreamEvent] = deque(maxlen=limit if limit > 0 else None)
+        for segment in self._snapshot():
+            if topic not in segment.topics:
+                continue
+            for event in self._iter_segment(segment, segment.first_seq, latest):
+                if event.topic == topic:
+                    events.append(event)
+        return list(events)
+
+    def topics(self) -> list[str]:
+        """list all known topics."""
+        with self._lock:
+            return sorted({t for s in self._segments for t in s.topics})
+
+    # ── Maintenance ─────────────────────────────────────────────────
+
+    def _save_state(self) -> None:
+        _write_json(
+            os.path.join(self.path, _STATE_FILE),
+            {"next_sequence": self._next_sequence},
+        )
+
+    def compact(self, before_seq: int) -> int:
+        """Remove events before a sequence number.
+
+        Whole segments below ``before_seq`` are deleted; the segment
+        containing it is rewritten from that sequence onwards.
+
+        Args:
+            before_seq: Remove events with sequence < this.
+
+        Returns:
+            Number of events removed.
+        """
+        with self._lock:
+            self._check_open()
+            self._save_state()
+            removed = 0
+            while self._segments and self._segments[0].last_seq < before_seq:
+                segment = self._segments[0]
+                if segment is self._segments[-1]:
+                    self._close_active()
+                removed += segment.count
+                self._delete_files(segment)
+                self._segments.pop(0)
+            if self._segments and self._segments[0].first_seq < before_seq:
+                removed += self._rewrite_from(self._segments[0], before_seq)
+            if self._segments and self._log is None:
+                self._open_active(self._segments[-1])
+            return removed
+
+    def _rewrite_from(self, segment: _Segment, before_seq: int) -> int:
+        """Replace ``segment`` by a copy starting at ``before_seq``."""
+        is_active = segment is self._segments[-1]
+        if is_active:
+            self._close_active()
+        replacement = _Segment(before_seq, self.path)
+        tmp = replacement.path("log") + ".tmp"
+        with open(segment.path("log"), "rb") as src, open(tmp, "wb") as dst:
+            src.seek(segment.offset_for(before_seq))
+            for line in src:
+                if _decode(line).sequence >= before_seq:
+                    dst.write(line)
+        os.replace(tmp, replacement.path("log"))
+        self._scan(replacement)
+        if not is_active:
+            _write_json(replacement.path("meta"), replacement.meta())
+        self._delete_files(segment)
+        self._segments[0] = replacement
+        return segment.count - replacement.count
+
+    def clear(self) -> None:
+        """Clear all events and reset sequence."""
+        with self._lock:
+            self._check_open()
+            self._close_active()
+            for segment in self._segments:
+                self._delete_files(segment)
+            self._segments.clear()
+            self._next_sequence = 1
+            self._save_state()
+
+    def close(self) -> None:
+        """Flush and close the active segment."""
+        with self._lock:
+            if self._closed:
+                return
+            self._close_active()
+            self._closed = True
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+__all__ = ["FileEventStore"]
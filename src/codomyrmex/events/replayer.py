@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
 
     from codomyrmex.events.event_store import EventStore, StreamEvent
 
@@ -37,7 +37,10 @@ class EventReplayer:
     """Replay events from an EventStore for debugging.
 
     Re-emits events in sequence order and captures handler
-    outputs for determinism verification.
+    outputs for determinism verification. Events are streamed from the
+    store's ``iter_read``/``iter_by_time``, so replaying a file-backed
+    store never holds the whole range in memory; use :meth:`stream` to
+    avoid collecting handler outputs as well.
 
     Example::
 
@@ -67,22 +70,7 @@ class EventReplayer:
         Returns:
             ReplayResult with outputs and timing.
         """
-        start = time.monotonic()
-        events = self._store.read(from_seq, to_seq)
-        outputs: list[Any] = []
-
-        for event in events:
-            if handlers and event.topic in handlers:
-                output = handlers[event.topic](event)
-                outputs.append(output)
-
-        elapsed = (time.monotonic() - start) * 1000
-
-        return ReplayResult(
-            events_replayed=len(events),
-            handler_outputs=outputs,
-            duration_ms=elapsed,
-        )
+        return self._run(self._store.iter_read(from_seq, to_seq), handlers)
 
     def replay_by_time(
         self,
@@ -100,18 +88,46 @@ class EventReplayer:
         Returns:
             ReplayResult.
         """
+        return self._run(self._store.iter_by_time(from_time, to_time), handlers)
+
+    def stream(
+        self,
+        from_seq: int = 1,
+        to_seq: int = 0,
+        handlers: dict[str, Callable[[StreamEvent], Any]] | None = None,
+    ) -> Iterator[tuple[StreamEvent, Any]]:
+        """Lazily replay events, yielding each event with its handler output.
+
+        Events whose topic has no handler are yielded with ``None``.
+
+        Args:
+            from_seq: Start sequence.
+            to_seq: End sequence (0 = latest).
+            handlers: Topic → handler mapping.
+        """
+        handlers = handlers or {}
+        for event in self._store.iter_read(from_seq, to_seq):
+            handler = handlers.get(event.topic)
+            yield event, handler(event) if handler else None
+
+    def _run(
+        self,
+        events: Iterable[StreamEvent],
+        handlers: dict[str, Callable[[StreamEvent], Any]] | None,
+    ) -> ReplayResult:
         start = time.monotonic()
-        events = self._store.read_by_time(from_time, to_time)
         outputs: list[Any] = []
+        replayed = 0
 
         for event in events:
+            replayed += 1
             if handlers and event.topic in handlers:
                 outputs.append(handlers[event.topic](event))
 
         elapsed = (time.monotonic() - start) * 1000
 
         return ReplayResult(
-            events_replayed=len(events),
+            events_replayed=replayed,
             handler_outputs=outputs,
             duration_ms=elapsed,
         )
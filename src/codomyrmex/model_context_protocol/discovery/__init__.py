@@ -251,43 +251,15 @@ class MCPDiscovery:
 
         def _add_if_tool(name: str, obj: Any) -> None:
             if hasattr(obj, "_mcp_tool_meta"):
-                meta = obj._mcp_tool_meta
-
-                # Check requirements
-                available = True
-                unavailable_reason = None
-                if meta.get("requires"):
-                    missing = []
-                    for req in meta["requires"]:
-                        if not importlib.util.find_spec(req):
-                            missing.append(req)
-
-                    if missing:
-                        available = False
-                        unavailable_reason = (
-                            f"Missing dependencies: {', '.join(missing)}. "
-                            f"Install via 'uv add {' '.join(missing)}'"
-                        )
-
-                cat = str(meta.get("category", "general"))
-                tag_list = manifest_tags(
-                    category=cat,
-                    explicit=meta.get("tags"),
+                tools.append(
+                    self.tool_from_meta(
+                        obj._mcp_tool_meta,
+                        module_path=module.__name__,
+                        callable_name=name,
+                        handler=obj,
+                        doc=obj.__doc__,
+                    )
                 )
-                tool = DiscoveredTool(
-                    name=meta["name"] or name,
-                    description=meta["description"] or (obj.__doc__ or "").strip(),
-                    module_path=module.__name__,
-                    callable_name=name,
-                    parameters=meta.get("schema", meta.get("parameters", {})),
-                    tags=tag_list,
-                    version=meta.get("version", "1.0"),
-                    requires=meta.get("requires", []),
-                    available=available,
-                    unavailable_reason=unavailable_reason,
-                    handler=obj,
-                )
-                tools.append(tool)
 
         for name, obj in inspect.getmembers(module):
             _add_if_tool(name, obj)
@@ -300,6 +272,55 @@ class MCPDiscovery:
 
         return tools
 
+    @staticmethod
+    def tool_from_meta(
+        meta: dict[str, Any],
+        *,
+        module_path: str,
+        callable_name: str,
+        handler: Callable[..., Any] | None,
+        doc: str | None = None,
+    ) -> DiscoveredTool:
+        """Build a :class:`DiscoveredTool` from ``_mcp_tool_meta``.
+
+        ``doc`` is the handler's docstring, used when the metadata has no
+        description.
+        """
+        # Check requirements
+        available = True
+        unavailable_reason = None
+        if meta.get("requires"):
+            missing = []
+            for req in meta["requires"]:
+                if not importlib.util.find_spec(req):
+                    missing.append(req)
+
+            if missing:
+                available = False
+                unavailable_reason = (
+                    f"Missing dependencies: {', '.join(missing)}. "
+                    f"Install via 'uv add {' '.join(missing)}'"
+                )
+
+        cat = str(meta.get("category", "general"))
+        tag_list = manifest_tags(
+            category=cat,
+            explicit=meta.get("tags"),
+        )
+        return DiscoveredTool(
+            name=meta["name"] or callable_name,
+            description=meta["description"] or (doc or "").strip(),
+            module_path=module_path,
+            callable_name=callable_name,
+            parameters=meta.get("schema", meta.get("parameters", {})),
+            tags=tag_list,
+            version=meta.get("version", "1.0"),
+            requires=meta.get("requires", []),
+            available=available,
+            unavailable_reason=unavailable_reason,
+            handler=handler,
+        )
+
     def _update_metrics(self, report: DiscoveryReport) -> None:
         """Update internal metrics after a scan."""
         self._metrics.total_tools = len(self._registry)
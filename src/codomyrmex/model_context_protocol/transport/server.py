@@ -6,11 +6,13 @@ Supports both stdio and HTTP (Streamable HTTP + REST) transports.
 """
 
 import asyncio
+import functools
 import json
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from codomyrmex.logging_monitoring.core.correlation import with_correlation
 from codomyrmex.model_context_protocol.schemas.mcp_schemas import (
@@ -33,6 +35,8 @@ class MCPServerConfig:
         rate_limit_rate: Global rate limit (requests/second).
         rate_limit_burst: Global rate limit burst ceiling.
         warm_up: Eagerly populate discovery cache at server start.
+        max_in_flight: Maximum requests executing at once over stdio
+            (1 handles them one at a time).
     """
 
     name: str = "codomyrmex-mcp-server"
@@ -44,6 +48,7 @@ class MCPServerConfig:
     rate_limit_rate: float = 50.0
     rate_limit_burst: int = 100
     warm_up: bool = True
+    max_in_flight: int = 16
 
 
 class MCPServer:
@@ -68,6 +73,8 @@ class MCPServer:
         self._prompts: dict[str, dict[str, Any]] = {}
         self._initialized = False
         self._request_id = 0
+        # stdio requests being handled, by JSON-RPC id (for cancellation)
+        self._in_flight: dict[Any, asyncio.Task[None]] = {}
 
         # Allow injection of a custom call_tool handler for testing.
         # When provided, _call_tool dispatches to the injected function
@@ -312,6 +319,10 @@ class MCPServer:
         """Handle notifications."""
         if method == "notifications/initialized":
             self._initialized = True
+        elif method == "notifications/cancelled":
+            task = self._in_flight.get((params or {}).get("requestId"))
+            if task is not None:
+                task.cancel()
 
     async def _dispatch(self, method: str, params: dict[str, Any]) -> Any:
         """Dispatch method call."""
@@ -537,33 +548,104 @@ class MCPServer:
     # Server Running
     # =========================================================================
 
-    async def run_stdio(self) -> None:
-        """Run server over stdio transport."""
-        import sys
+    async def run_stdio(
+        self, stdin: TextIO | None = None, stdout: TextIO | None = None
+    ) -> None:
+        """Run server over stdio transport.
 
-        while True:
-            try:
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
-                if not line:
-                    break
+        Each request is handled in its own task, with at most
+        ``config.max_in_flight`` executing at once. The reader keeps
+        consuming input meanwhile, so a ``notifications/cancelled`` reaches
+        a queued or running request straight away; a cancelled request gets
+        no response. Notifications are handled inline, in input order.
+        Responses are written one JSON line each, in completion order, by a
+        single writer task.
 
-                message = json.loads(line.strip())
+        Args:
+            stdin: Stream to read requests from (default ``sys.stdin``).
+            stdout: Stream to write responses to (default ``sys.stdout``).
+        """
+        import sys
 
-                # stdio transport does not have HTTP headers, but we could parse top-level if we wanted
+        stdin = stdin or sys.stdin
+        stdout = stdout or sys.stdout
+        loop = asyncio.get_running_loop()
+        # Own threads, so blocking stdio never waits behind tool calls
+        # running on the default executor
+        reader_pool = ThreadPoolExecutor(1, thread_name_prefix="mcp-stdio-read")
+        writer_pool = ThreadPoolExecutor(1, thread_name_prefix="mcp-stdio-write")
+        limit = asyncio.Semaphore(max(1, self.config.max_in_flight))
+        outbox: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def handle(message: dict[str, Any]) -> None:
+            async with limit:
                 response = await self.handle_request(message)
-
-                if response:
-                    output = json.dumps(response)
-                    print(output, flush=True)
-
-            except json.JSONDecodeError:
-                continue
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                print(f"Error: {e}", file=sys.stderr)
+            if response:
+                outbox.put_nowait(response)
+
+        def done(request_id: Any, task: asyncio.Task[None]) -> None:
+            tasks.discard(task)
+            if self._in_flight.get(request_id) is task:
+                del self._in_flight[request_id]
+            if not task.cancelled() and task.exception() is not None:
+                print(f"Error: {task.exception()}", file=sys.stderr)
+
+        def write(lines: list[str]) -> None:
+            stdout.write("".join(lines))
+            stdout.flush()
+
+        async def writer() -> None:
+            closed = False
+            while not closed:
+                # Write everything queued so far with one flush
+                batch = [await outbox.get()]
+                while not outbox.empty():
+                    batch.append(outbox.get_nowait())
+                if None in batch:
+                    closed = True
+                lines = [json.dumps(r) + "\n" for r in batch if r is not None]
+                try:
+                    await loop.run_in_executor(writer_pool, write, lines)
+                except Exception as e:
+                    print(f"Error: {e}", file=sys.stderr)
+
+        writer_task = asyncio.create_task(writer())
+        try:
+            while True:
+                try:
+                    line = await loop.run_in_executor(reader_pool, stdin.readline)
+                    if not line:
+                        break
+
+                    message = json.loads(line.strip())
+                    request_id = message.get("id")
+                    if request_id is None:
+                        await self.handle_request(message)
+                        continue
+
+                    task = asyncio.create_task(handle(message))
+                    tasks.add(task)
+                    if isinstance(request_id, (str, int)):
+                        self._in_flight[request_id] = task
+                    task.add_done_callback(functools.partial(done, request_id))
+
+                except json.JSONDecodeError:
+                    continue
+                except KeyboardInterrupt:
+                    break
+                except Exception as e:
+                    print(f"Error: {e}", file=sys.stderr)
+
+            while tasks:
+                await asyncio.wait(set(tasks))
+            outbox.put_nowait(None)
+            await writer_task
+        finally:
+            for task in [*tasks, writer_task]:
+                task.cancel()
+            reader_pool.shutdown(wait=False)
+            writer_pool.shutdown(wait=False)
 
     def _create_http_app(
         self,
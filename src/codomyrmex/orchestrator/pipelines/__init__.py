@@ -1,5 +1,6 @@
 """Orchestrator pipeline types exposed from the canonical implementation."""
 
+from .executors import ProcessStageExecutor, StageExecutor, ThreadStageExecutor
 from .pipeline import (
     ConditionalStage,
     FunctionStage,
@@ -21,7 +22,10 @@ __all__ = [
     "PipelineBuilder",
     "PipelineResult",
     "PipelineStatus",
+    "ProcessStageExecutor",
     "Stage",
+    "StageExecutor",
     "StageResult",
     "StageStatus",
+    "ThreadStageExecutor",
 ]
@@ -0,0 +1,262 @@
+"""Pluggable executors for running pipeline stages concurrently.
+
+``ThreadStageExecutor`` runs stages on a thread pool (the behaviour
+``ParallelStage`` has always had) and suits I/O-bound stages.
+``ProcessStageExecutor`` runs them on a persistent process pool so
+CPU-bound stages scale across cores:
+
+- The pool is created once and reused across ``map`` calls; ``warm_up``
+  starts every worker (and runs the optional initializer) up front.
+- The context is pickled once per ``map`` call. Payloads of at least
+  ``shared_threshold`` bytes go into a ``multiprocessing.shared_memory``
+  block that workers attach to by name; smaller ones travel inline. Each
+  worker unpickles a given context once, however many stages it runs.
+- Stages are submitted in chunks, one pool task per chunk.
+
+Stages run by ``ProcessStageExecutor`` must be picklable (e.g. a
+``FunctionStage`` wrapping a module-level function). Changes a stage makes
+to the context in a worker are not seen by the caller.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import itertools
+import math
+import os
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.context import BaseContext
+
+    from .pipeline import Stage
+
+
+class StageExecutor(ABC):
+    """Runs a group of stages against a shared context."""
+
+    @abstractmethod
+    def map(self, stages: list[Stage], context: dict[str, Any]) -> dict[str, Any]:
+        """Execute ``stages`` and return their outputs keyed by stage id.
+
+        A stage that raises contributes ``{"error": str(exc)}``.
+        """
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Release pooled resources."""
+        return  # Optional hook — subclass may override
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.shutdown()
+
+
+class ThreadStageExecutor(StageExecutor):
+    """Run stages on a persistent thread pool, sharing the context object."""
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            return self._pool
+
+    def map(self, stages: list[Stage], context: dict[str, Any]) -> dict[str, Any]:
+        """Execute all stages concurrently on the thread pool."""
+        executor = self._executor()
+        futures = {
+            executor.submit(stage.execute, context): stage.stage_id for stage in stages
+        }
+        results: dict[str, Any] = {}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = {"error": str(e)}
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the thread pool; it is recreated on the next ``map``."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+
+@dataclass(frozen=True)
+class _ContextRef:
+    """Picklable handle to a published context."""
+
+    token: str
+    shm_name: str | None = None
+    size: int = 0
+    payload: bytes | None = None
+
+
+# Worker-side cache of unpickled contexts, most recent last.
+_WORKER_CONTEXTS: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_WORKER_CONTEXT_LIMIT = 4
+
+
+def _load_context(ref: _ContextRef) -> dict[str, Any]:
+    context = _WORKER_CONTEXTS.get(ref.token)
+    if context is not None:
+        _WORKER_CONTEXTS.move_to_end(ref.token)
+        return context
+    if ref.payload is not None:
+        context = pickle.loads(ref.payload)
+    else:
+        block = shared_memory.SharedMemory(name=ref.shm_name)
+        try:
+            context = pickle.loads(block.buf[: ref.size])
+        finally:
+            block.close()
+    _WORKER_CONTEXTS[ref.token] = context
+    while len(_WORKER_CONTEXTS) > _WORKER_CONTEXT_LIMIT:
+        _WORKER_CONTEXTS.popitem(last=False)
+    return context
+
+
+def _run_chunk(ref: _ContextRef, stages: list[Stage]) -> list[tuple[str, bool, Any]]:
+    """Execute a chunk of stages in a worker process."""
+    context = _load_context(ref)
+    results: list[tuple[str, bool, Any]] = []
+    for stage in stages:
+        try:
+            results.append((stage.stage_id, True, stage.execute(context)))
+        except Exception as e:
+            results.append((stage.stage_id, False, str(e)))
+    return results
+
+
+def _warm_worker(delay: float) -> int:
+    # Holding each worker briefly makes the pool start all of them.
+    time.sleep(delay)
+    return os.getpid()
+
+
+class ProcessStageExecutor(StageExecutor):
+    """Run stages on a persistent process pool with shared-memory context."""
+
+    _tokens = itertools.count()
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        chunksize: int | None = None,
+        shared_threshold: int = 1024 * 1024,
+        initializer: Callable[..., Any] | None = None,
+        initargs: tuple[Any, ...] = (),
+        mp_context: BaseContext | None = None,
+        warm_up: bool = False,
+    ):
+        """
+        Args:
+            max_workers: Worker processes (default ``os.cpu_count()``).
+            chunksize: Stages per pool task; by default stages are split
+                into about four chunks per worker.
+            shared_threshold: Pickled contexts of at least this many bytes
+                are passed through shared memory instead of the task queue.
+            initializer: Called once in every worker as it starts.
+            initargs: Arguments for ``initializer``.
+            mp_context: ``multiprocessing`` context for the pool.
+            warm_up: Start all workers immediately.
+        """
+        if chunksize is not None and chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self.shared_threshold = shared_threshold
+        self._initializer = initializer
+        self._initargs = initargs
+        self._mp_context = mp_context
+        self._pool: concurrent.futures.ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        if warm_up:
+            self.warm_up()
+
+    def _executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=self._mp_context,
+                    initializer=self._initializer,
+                    initargs=self._initargs,
+                )
+            return self._pool
+
+    def warm_up(self, delay: float = 0.05) -> int:
+        """Start every worker process; returns how many distinct workers ran."""
+        executor = self._executor()
+        futures = [
+            executor.submit(_warm_worker, delay) for _ in range(self.max_workers)
+        ]
+        return len({future.result() for future in futures})
+
+    def _publish(
+        self, context: dict[str, Any]
+    ) -> tuple[_ContextRef, shared_memory.SharedMemory | None]:
+        payload = pickle.dumps(context, protocol=pickle.HIGHEST_PROTOCOL)
+        token = f"{os.getpid()}-{next(self._tokens)}"
+        if len(payload) < self.shared_threshold:
+            return _ContextRef(token, payload=payload), None
+        block = shared_memory.SharedMemory(create=True, size=len(payload))
+        buf = block.buf
+        assert buf is not None  # only None after close()
+        buf[: len(payload)] = payload
+        return _ContextRef(token, shm_name=block.name, size=len(payload)), block
+
+    def _chunks(self, stages: list[Stage]) -> list[list[Stage]]:
+        size = self.chunksize or max(1, math.ceil(len(stages) / (self.max_workers * 4)))
+        return [stages[i : i + size] for i in range(0, len(stages), size)]
+
+    def map(self, stages: list[Stage], context: dict[str, Any]) -> dict[str, Any]:
+        """Execute all stages on the process pool."""
+        if not stages:
+            return {}
+        executor = self._executor()
+        ref, block = self._publish(context)
+        try:
+            futures = {
+                executor.submit(_run_chunk, ref, chunk): chunk
+                for chunk in self._chunks(stages)
+            }
+            results: dict[str, Any] = {}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    for stage_id, ok, value in future.result():
+                        results[stage_id] = value if ok else {"error": value}
+                except Exception as e:
+                    # The chunk never ran (unpicklable stage, dead worker, ...)
+                    for stage in futures[future]:
+                        results[stage.stage_id] = {"error": str(e)}
+            return results
+        finally:
+            if block is not None:
+                block.close()
+                block.unlink()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker processes; they restart on the next ``map``."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
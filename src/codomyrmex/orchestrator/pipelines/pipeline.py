@@ -1,6 +1,5 @@
 """Pipeline engine: stages, execution, and builder."""
 
-import concurrent.futures
 import time
 import uuid
 from abc import ABC, abstractmethod
@@ -12,6 +11,8 @@ from typing import Any
 
 from codomyrmex.validation.schemas.infra import PipelineStatus
 
+from .executors import StageExecutor, ThreadStageExecutor
+
 
 class StageStatus(Enum):
     """Status of a pipeline stage."""
@@ -145,36 +146,35 @@ class ConditionalStage(Stage):
 
 
 class ParallelStage(Stage):
-    """Stage that executes multiple child stages concurrently."""
+    """Stage that executes multiple child stages concurrently.
+
+    Child stages run on ``executor`` if given, otherwise on the executor of
+    the ``Pipeline`` running this stage, otherwise on a thread pool of
+    ``max_workers`` threads created for the call.
+    """
 
     def __init__(
         self,
         stage_id: str,
         stages: list[Stage],
         max_workers: int = 4,
+        executor: StageExecutor | None = None,
         **kwargs,
     ):
         super().__init__(stage_id, **kwargs)
         self.stages = stages
         self.max_workers = max_workers
+        self.executor = executor
 
-    def execute(self, context: dict[str, Any]) -> dict[str, Any]:
+    def execute(
+        self, context: dict[str, Any], executor: StageExecutor | None = None
+    ) -> dict[str, Any]:
         """Execute all child stages in parallel and return a per-stage result dict."""
-        results: dict[str, Any] = {}
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self.max_workers
-        ) as executor:
-            futures = {
-                executor.submit(stage.execute, context): stage.stage_id
-                for stage in self.stages
-            }
-            for future in concurrent.futures.as_completed(futures):
-                stage_id = futures[future]
-                try:
-                    results[stage_id] = future.result()
-                except Exception as e:
-                    results[stage_id] = {"error": str(e)}
-        return results
+        executor = self.executor or executor
+        if executor is not None:
+            return executor.map(self.stages, context)
+        with ThreadStageExecutor(max_workers=self.max_workers) as threads:
+            return threads.map(self.stages, context)
 
 
 class Pipeline:
@@ -193,6 +193,10 @@ class Pipeline:
         result = pipeline.run()
         if result.status == PipelineStatus.SUCCESS:
             print("Pipeline completed successfully")
+
+    ``executor`` (e.g. a ``ProcessStageExecutor`` for CPU-bound work) runs
+    the children of every ``ParallelStage`` that has no executor of its
+    own. The pipeline does not shut it down.
     """
 
     def __init__(
@@ -200,10 +204,12 @@ class Pipeline:
         pipeline_id: str | None = None,
         name: str | None = None,
         fail_fast: bool = True,
+        executor: StageExecutor | None = None,
     ):
         self.pipeline_id = pipeline_id or str(uuid.uuid4())[:8]
         self.name = name or self.pipeline_id
         self.fail_fast = fail_fast
+        self.executor = executor
         self._stages: dict[str, Stage] = {}
         self._context: dict[str, Any] = {}
 
@@ -242,7 +248,10 @@ class Pipeline:
         for attempt in range(stage.retry_count + 1):
             result.start_time = datetime.now()
             try:
-                result.output = stage.execute(context)
+                if isinstance(stage, ParallelStage):
+                    result.output = stage.execute(context, executor=self.executor)
+                else:
+                    result.output = stage.execute(context)
                 result.status = StageStatus.SUCCESS
                 result.end_time = datetime.now()
                 stage.on_success(result, context)
@@ -353,6 +362,7 @@ class PipelineBuilder:
         stage_id: str,
         stages: list[Stage],
         depends_on: list[str] | None = None,
+        executor: StageExecutor | None = None,
     ) -> "PipelineBuilder":
         """Add a parallel stage; returns self for chaining."""
         self._pipeline.add_stage(
@@ -360,10 +370,16 @@ class PipelineBuilder:
                 stage_id=stage_id,
                 stages=stages,
                 depends_on=depends_on,
+                executor=executor,
             )
         )
         return self
 
+    def executor(self, executor: StageExecutor) -> "PipelineBuilder":
+        """set the default executor for parallel stages; returns self for chaining."""
+        self._pipeline.executor = executor
+        return self
+
     def context(self, key: str, value: Any) -> "PipelineBuilder":
         """set an initial context value; returns self for chaining."""
         self._pipeline.set_context(key, value)
@@ -4,7 +4,8 @@ This module provides support for defining and executing Directed Acyclic Graphs
 of tasks. It allows for complex dependency management between tasks.
 
 Features:
-- Task dependencies and parallel execution
+- Task dependencies and parallel execution, each task starting as soon as
+  its dependencies finish (critical path first, optional concurrency cap)
 - Retry logic with exponential backoff
 - Conditional execution based on previous task results
 - Result passing between tasks
@@ -13,6 +14,9 @@ Features:
 """
 
 import asyncio
+import functools
+import heapq
+import importlib
 import inspect
 import time
 from collections.abc import Callable
@@ -48,11 +52,24 @@ __all__ = [
 ]
 
 
+@functools.cache
+def _observability_events() -> Any:
+    """Observability event factories, or None if unavailable (looked up once)."""
+    try:
+        return importlib.import_module(
+            ".observability.orchestrator_events", package=__package__
+        )
+    except ImportError as e:
+        logger.debug("Observability events not available: %s", e)
+        return None
+
+
 class Workflow:
     """Manages a collection of tasks and their dependencies.
 
     Supports:
     - Task dependencies with parallel execution
+    - Concurrency cap with critical-path-first scheduling
     - Retry logic with exponential backoff
     - Conditional task execution
     - Result passing between tasks
@@ -67,6 +84,8 @@ class Workflow:
         fail_fast: bool = True,
         progress_callback: ProgressCallback | None = None,
         event_bus: Any = None,
+        *,
+        max_concurrency: int | None = None,
     ):
         """Initialize workflow.
 
@@ -76,10 +95,15 @@ class Workflow:
             fail_fast: Stop on first failure if True
             progress_callback: Callback for progress updates (task_name, status, details)
             event_bus: Optional ``EventBus`` instance for typed event publishing
+            max_concurrency: Maximum number of tasks running at once (None
+                for no limit)
         """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise WorkflowError("max_concurrency must be at least 1")
         self.name = name
         self.timeout = timeout
         self.fail_fast = fail_fast
+        self.max_concurrency = max_concurrency
         self.progress_callback = progress_callback
         self._event_bus = event_bus
         self.tasks: dict[str, Task] = {}
@@ -173,142 +197,114 @@ class Workflow:
     def _try_emit_event(self, factory_path: str, *args: Any, **kwargs: Any) -> None:
         """Emit an observability event, silently skipping if unavailable."""
         try:
-            import importlib
-
-            mod = importlib.import_module(
-                ".observability.orchestrator_events",
-                package=__package__,
-            )
+            mod = _observability_events()
+            if mod is None:
+                return
             factory = getattr(mod, factory_path)
             self._publish_event(factory(*args, **kwargs))
         except (ImportError, AttributeError) as e:
             self.logger.debug("Observability events not available: %s", e)
 
-    def _find_runnable_tasks(
-        self,
-        completed_tasks: set[str],
-        skipped_tasks: set[str],
-    ) -> list["Task"]:
-        """Identify pending tasks whose dependencies are satisfied.
-
-        Tasks whose condition evaluates to False are marked SKIPPED.
-        """
-        runnable: list[Task] = []
-        for name, task in self.tasks.items():
-            if task.status != TaskStatus.PENDING:
-                continue
-            if not task.dependencies.issubset(completed_tasks):
-                continue
-            if task.should_run(self.task_results):
-                runnable.append(task)
-            else:
-                self.logger.info("Task '%s' skipped by condition", name)
-                task.status = TaskStatus.SKIPPED
-                skipped_tasks.add(name)
-                self.task_results[name] = task.get_result()
-                self._emit_progress(name, "skipped", {"reason": "condition"})
-        return runnable
-
-    def _skip_blocked_tasks(
-        self,
-        failed_tasks: set[str],
-        skipped_tasks: set[str],
-    ) -> bool:
-        """Mark pending tasks with failed dependencies as SKIPPED.
+    def critical_path_lengths(self) -> dict[str, float]:
+        """Longest remaining path from each task to the end of the workflow.
 
-        Returns True if at least one task was newly skipped (so the main
-        loop should re-evaluate), False if a deadlock is detected.
+        A task's weight is ``metadata["estimated_duration"]`` (default 1.0),
+        so without estimates this is the number of tasks on the longest
+        chain starting at the task. Assumes the workflow is acyclic.
         """
-        any_skipped = False
+        dependents: dict[str, list[str]] = {name: [] for name in self.tasks}
         for name, task in self.tasks.items():
-            if task.status == TaskStatus.PENDING:
-                if not task.dependencies.isdisjoint(failed_tasks):
-                    self.logger.warning(
-                        "Task '%s' skipped due to failed dependencies.", name
-                    )
-                    task.status = TaskStatus.SKIPPED
-                    task.error = Exception("Dependency failed")
-                    skipped_tasks.add(name)
-                    self.task_results[name] = task.get_result()
-                    self._emit_progress(
-                        name, "skipped", {"reason": "dependency_failed"}
-                    )
-                    any_skipped = True
-        return any_skipped
-
-    async def _launch_batch(self, runnable: list["Task"]) -> list[Any]:
-        """Start a batch of runnable tasks concurrently.
-
-        Returns the list of results (or exceptions) from ``asyncio.gather``.
-        """
-        self.logger.info("Running batch: %s", [t.name for t in runnable])
-        for task in runnable:
-            task.status = TaskStatus.RUNNING
-            self._emit_progress(task.name, "running", {})
-            self._try_emit_event("task_started", self.name, task.name)
-
-        coroutines = [self._execute_task_with_retry(t) for t in runnable]
-        return await asyncio.gather(*coroutines, return_exceptions=True)
-
-    def _process_batch_results(
-        self,
-        runnable: list["Task"],
-        results: list[Any],
-        completed_tasks: set[str],
-        failed_tasks: set[str],
-    ) -> None:
-        """Categorise batch results into completed / failed sets."""
-        for task, result in zip(runnable, results, strict=False):
-            if isinstance(result, Exception):
-                task.status = TaskStatus.FAILED
-                task.error = result
-                failed_tasks.add(task.name)
-                self.task_results[task.name] = task.get_result()
-                self.logger.error("Task '%s' failed: %s", task.name, result)
-                self._emit_progress(task.name, "failed", {"error": str(result)})
-                self._try_emit_event("task_failed", self.name, task.name, str(result))
-                if self.fail_fast:
-                    self.logger.info("Fail-fast: stopping workflow")
-                    self._cancelled = True
-            else:
-                if task.transform_result:
-                    try:
-                        result = task.transform_result(result)
-                    except Exception as e:
-                        self.logger.warning(
-                            "Result transform failed for %s: %s", task.name, e
-                        )
-                task.status = TaskStatus.COMPLETED
-                task.result = result
-                completed_tasks.add(task.name)
-                self.task_results[task.name] = task.get_result()
-                self.logger.info(
-                    "Task '%s' completed in %.2fs", task.name, task.execution_time
-                )
-                self._emit_progress(
-                    task.name,
-                    "completed",
-                    {
-                        "execution_time": task.execution_time,
-                        "attempts": task.attempts,
-                    },
-                )
-                self._try_emit_event(
-                    "task_completed",
-                    self.name,
-                    task.name,
-                    execution_time=task.execution_time,
-                    attempts=task.attempts,
-                )
+            for dep in task.dependencies:
+                dependents[dep].append(name)
+
+        # Kahn's algorithm from the sinks backwards
+        remaining = {name: len(children) for name, children in dependents.items()}
+        stack = [name for name, n in remaining.items() if n == 0]
+        lengths: dict[str, float] = {}
+        while stack:
+            name = stack.pop()
+            task = self.tasks[name]
+            lengths[name] = float(task.metadata.get("estimated_duration", 1.0)) + max(
+                (lengths[child] for child in dependents[name]), default=0.0
+            )
+            for dep in task.dependencies:
+                remaining[dep] -= 1
+                if remaining[dep] == 0:
+                    stack.append(dep)
+        return lengths
+
+    def _start_task(self, task: "Task") -> "asyncio.Task[Any]":
+        """Mark a task running and schedule it on the event loop."""
+        self.logger.info("Starting task '%s'", task.name)
+        task.status = TaskStatus.RUNNING
+        self._emit_progress(task.name, "running", {})
+        self._try_emit_event("task_started", self.name, task.name)
+        return asyncio.ensure_future(self._execute_task_with_retry(task))
+
+    def _skip_task(self, task: "Task", failed_dependency: bool) -> None:
+        """Mark a pending task SKIPPED because a dependency did not complete."""
+        reason = "dependency_failed" if failed_dependency else "dependency_skipped"
+        self.logger.warning("Task '%s' skipped (%s).", task.name, reason)
+        task.status = TaskStatus.SKIPPED
+        if failed_dependency:
+            task.error = Exception("Dependency failed")
+        self.task_results[task.name] = task.get_result()
+        self._emit_progress(task.name, "skipped", {"reason": reason})
+
+    def _record_result(self, task: "Task", result: Any) -> bool:
+        """Store the outcome of a finished task. Returns True on success."""
+        if isinstance(result, BaseException):
+            task.status = TaskStatus.FAILED
+            task.error = result
+            self.task_results[task.name] = task.get_result()
+            self.logger.error("Task '%s' failed: %s", task.name, result)
+            self._emit_progress(task.name, "failed", {"error": str(result)})
+            self._try_emit_event("task_failed", self.name, task.name, str(result))
+            if self.fail_fast:
+                self.logger.info("Fail-fast: stopping workflow")
+                self._cancelled = True
+            return False
+
+        if task.transform_result:
+            try:
+                result = task.transform_result(result)
+            except Exception as e:
+                self.logger.warning("Result transform failed for %s: %s", task.name, e)
+        task.status = TaskStatus.COMPLETED
+        task.result = result
+        self.task_results[task.name] = task.get_result()
+        self.logger.info("Task '%s' completed in %.2fs", task.name, task.execution_time)
+        self._emit_progress(
+            task.name,
+            "completed",
+            {
+                "execution_time": task.execution_time,
+                "attempts": task.attempts,
+            },
+        )
+        self._try_emit_event(
+            "task_completed",
+            self.name,
+            task.name,
+            execution_time=task.execution_time,
+            attempts=task.attempts,
+        )
+        return True
 
     async def run(self) -> dict[str, Any]:
         """Execute the workflow.
 
+        Tasks are started as soon as all of their dependencies have
+        completed, highest ``critical_path_lengths`` first, with at most
+        ``max_concurrency`` running at once. A task whose dependency failed
+        (or was skipped because of a failure) is skipped itself.
+
         Returns:
             Dictionary mapping task names to their results.
 
         Raises:
-            WorkflowError: If workflow execution fails.
+            WorkflowError: If workflow execution fails, or a task is left
+                waiting on a dependency skipped by its condition (deadlock).
             CycleError: If circular dependencies detected.
         """
         self.validate()
@@ -333,33 +329,108 @@ class Workflow:
         completed_tasks: set[str] = set()
         failed_tasks: set[str] = set()
         skipped_tasks: set[str] = set()
+        condition_skipped: set[str] = set()
 
-        while len(completed_tasks) + len(failed_tasks) + len(skipped_tasks) < len(
+        # Remaining unfinished dependencies per task, and reverse edges
+        in_degree = {name: len(task.dependencies) for name, task in self.tasks.items()}
+        dependents: dict[str, list[str]] = {name: [] for name in self.tasks}
+        for name, task in self.tasks.items():
+            for dep in task.dependencies:
+                dependents[dep].append(name)
+        priority = self.critical_path_lengths()
+        order = {name: i for i, name in enumerate(self.tasks)}
+        ready: list[tuple[float, int, str]] = []
+        running: dict[asyncio.Future[Any], Task] = {}
+        finished: asyncio.Queue[asyncio.Future[Any]] = asyncio.Queue()
+
+        def resolve(name: str) -> None:
+            """Propagate a finished task to its dependents."""
+            resolved = [name]
+            while resolved:
+                for child in dependents[resolved.pop()]:
+                    in_degree[child] -= 1
+                    if in_degree[child]:
+                        continue
+                    task = self.tasks[child]
+                    if task.dependencies <= completed_tasks:
+                        heapq.heappush(ready, (-priority[child], order[child], child))
+                    elif task.dependencies <= completed_tasks | condition_skipped:
+                        # Blocked by a condition skip: stays pending (deadlock)
+                        continue
+                    else:
+                        self._skip_task(
+                            task, not task.dependencies.isdisjoint(failed_tasks)
+                        )
+                        skipped_tasks.add(child)
+                        resolved.append(child)
+
+        for name, n in in_degree.items():
+            if n == 0:
+                heapq.heappush(ready, (-priority[name], order[name], name))
+
+        try:
+            while ready or running:
+                if self._cancelled:
+                    ready.clear()
+                while ready and (
+                    self.max_concurrency is None or len(running) < self.max_concurrency
+                ):
+                    name = heapq.heappop(ready)[2]
+                    task = self.tasks[name]
+                    if task.should_run(self.task_results):
+                        future = self._start_task(task)
+                        future.add_done_callback(finished.put_nowait)
+                        running[future] = task
+                        continue
+                    self.logger.info("Task '%s' skipped by condition", name)
+                    task.status = TaskStatus.SKIPPED
+                    skipped_tasks.add(name)
+                    condition_skipped.add(name)
+                    self.task_results[name] = task.get_result()
+                    self._emit_progress(name, "skipped", {"reason": "condition"})
+                    resolve(name)
+                if not running:
+                    continue
+
+                if self.timeout:
+                    remaining = self.timeout - (time.time() - self._start_time)
+                    try:
+                        done = [
+                            await asyncio.wait_for(finished.get(), max(remaining, 0.0))
+                        ]
+                    except TimeoutError:
+                        raise WorkflowError(
+                            f"Workflow timeout after {self.timeout}s"
+                        ) from None
+                else:
+                    done = [await finished.get()]
+                while not finished.empty():
+                    done.append(finished.get_nowait())
+                for future in done:
+                    task = running.pop(future)
+                    if future.cancelled():
+                        outcome: Any = asyncio.CancelledError(
+                            f"Task '{task.name}' was cancelled"
+                        )
+                    else:
+                        outcome = future.exception() or future.result()
+                    if self._record_result(task, outcome):
+                        completed_tasks.add(task.name)
+                    else:
+                        failed_tasks.add(task.name)
+                    resolve(task.name)
+        finally:
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        if self._cancelled:
+            self.logger.info("Workflow cancelled")
+        elif len(completed_tasks) + len(failed_tasks) + len(skipped_tasks) < len(
             self.tasks
         ):
-            if self._cancelled:
-                self.logger.info("Workflow cancelled")
-                break
-            if self.timeout and (time.time() - self._start_time) > self.timeout:
-                raise WorkflowError(f"Workflow timeout after {self.timeout}s")
-
-            runnable = self._find_runnable_tasks(completed_tasks, skipped_tasks)
-
-            if not runnable and (
-                len(completed_tasks) + len(failed_tasks) + len(skipped_tasks)
-                < len(self.tasks)
-            ):
-                if not self._skip_blocked_tasks(failed_tasks, skipped_tasks):
-                    raise WorkflowError("Deadlock detected during execution.")
-                continue
-
-            if not runnable:
-                break
-
-            results = await self._launch_batch(runnable)
-            self._process_batch_results(
-                runnable, results, completed_tasks, failed_tasks
-            )
+            raise WorkflowError("Deadlock detected during execution.")
 
         # Summary
         elapsed = time.time() - self._start_time
@@ -10,6 +10,7 @@ import contextlib
 with contextlib.suppress(ImportError):
     from codomyrmex.validation.schemas import Result, ResultStatus
 
+from .disk import DiskIndex
 from .engine import InMemoryIndex, SearchIndex, create_index, quick_search
 from .models import (
     Document,
@@ -29,6 +30,7 @@ def cli_commands():
             "handler": lambda **kwargs: print(
                 "Search Engines:\n"
                 "  - in_memory   (TF-IDF based, default)\n"
+                "  - disk        (persistent mmap segments, TF-IDF)\n"
                 "  - fuzzy       (fuzzy matching via FuzzyMatcher)"
             ),
         },
@@ -44,6 +46,7 @@ def cli_commands():
 
 
 __all__ = [
+    "DiskIndex",
     "Document",
     "FuzzyMatcher",
     "InMemoryIndex",
@@ -0,0 +1,660 @@
+"""
+Disk Search Index
+
+A persistent search index built from immutable on-disk segments, in the
+style of Lucene. New documents are buffered in an ``InMemoryIndex`` and
+written out as a segment on ``flush()``; segments are memory-mapped on
+open, so an index opens without re-tokenizing anything and can grow
+beyond RAM. Small segments are merged in a background thread.
+
+Layout of an index directory::
+
+    segments.json   manifest: live segments and their deleted doc numbers
+    seg-N.tim       term dictionary (sorted, fixed-width entries)
+    seg-N.pst       posting lists: varint (doc delta, tf) pairs per term
+    seg-N.ids       doc-id dictionary (sorted id -> local doc number)
+    seg-N.dat       doc store: one JSON record per document
+    seg-N.dix       doc-store offsets (n_docs + 1 little-endian u64)
+
+A segment is immutable once written; deletions are recorded in the
+manifest, which is replaced atomically on every commit.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any, Self
+
+from .engine import InMemoryIndex, SearchIndex, build_highlights, first_offsets
+from .models import Document, SearchResult, Tokenizer
+
+MANIFEST = "segments.json"
+_FORMAT_VERSION = 1
+_SEGMENT_EXTENSIONS = (".tim", ".pst", ".ids", ".dat", ".dix")
+_SEGMENT_FILE = re.compile(r"(seg-\d{6,})\.(?:tim|pst|ids|dat|dix)")
+
+_TABLE_HEADER = struct.Struct("<4sI")
+_TABLE_KEY = struct.Struct("<QI")  # key offset, key length
+_TERM_VALUE = struct.Struct("<IQI")  # df, postings offset, postings length
+_ID_VALUE = struct.Struct("<I")  # local doc number
+_OFFSET = struct.Struct("<Q")
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_postings(buf: bytes) -> Iterator[tuple[int, int]]:
+    """Decode varint ``(doc delta, tf)`` pairs into ``(doc, tf)``."""
+    values = []
+    value = shift = 0
+    for byte in buf:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    doc = 0
+    for i in range(0, len(values), 2):
+        doc += values[i]
+        yield doc, values[i + 1]
+
+
+def _encode_postings(postings: list[tuple[int, int]]) -> bytes:
+    out = bytearray()
+    prev = 0
+    for doc, tf in postings:
+        _write_varint(out, doc - prev)
+        _write_varint(out, tf)
+        prev = doc
+    return bytes(out)
+
+
+def _write_table(path: str, magic: bytes, rows: list[tuple[bytes, bytes]]) -> None:
+    """Write sorted ``(key, packed value)`` rows as a binary-searchable table."""
+    value_size = len(rows[0][1]) if rows else 0
+    entry_size = _TABLE_KEY.size + value_size
+    keys_start = _TABLE_HEADER.size + entry_size * len(rows)
+    entries = bytearray(_TABLE_HEADER.pack(magic, len(rows)))
+    offset = keys_start
+    for key, value in rows:
+        entries += _TABLE_KEY.pack(offset, len(key)) + value
+        offset += len(key)
+    with open(path, "wb") as f:
+        f.write(entries)
+        f.writelines(key for key, _ in rows)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class _Table:
+    """Read-only view of a table written by ``_write_table``."""
+
+    def __init__(self, buf: Any, magic: bytes, value: struct.Struct):
+        found, self.count = _TABLE_HEADER.unpack_from(buf, 0)
+        if found != magic:
+            raise ValueError(f"Corrupt segment table: bad magic {found!r}")
+        self._buf = buf
+        self._value = value
+        self._entry_size = _TABLE_KEY.size + value.size
+
+    def _entry(self, i: int) -> tuple[bytes, tuple[int, ...]]:
+        pos = _TABLE_HEADER.size + i * self._entry_size
+        key_offset, key_len = _TABLE_KEY.unpack_from(self._buf, pos)
+        key = self._buf[key_offset : key_offset + key_len]
+        return key, self._value.unpack_from(self._buf, pos + _TABLE_KEY.size)
+
+    def lookup(self, key: bytes) -> tuple[int, ...] | None:
+        """Binary-search for ``key``."""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            found, value = self._entry(mid)
+            if found == key:
+                return value
+            if found < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def __iter__(self) -> Iterator[tuple[bytes, tuple[int, ...]]]:
+        for i in range(self.count):
+            yield self._entry(i)
+
+
+def _document_record(document: Document) -> bytes:
+    return (
+        json.dumps(
+            {
+                "id": document.id,
+                "content": document.content,
+                "metadata": document.metadata,
+                "indexed_at": document.indexed_at.isoformat(),
+            },
+            separators=(",", ":"),
+        ).encode()
+        + b"\n"
+    )
+
+
+class _SegmentWriter:
+    """Stream documents and sorted posting lists into a new segment."""
+
+    def __init__(self, directory: str, name: str):
+        self._base = os.path.join(directory, name)
+        self._docs = open(self._base + ".dat", "wb")
+        self._postings = open(self._base + ".pst", "wb")
+        self._offsets = [0]
+        self._ids: list[tuple[bytes, bytes]] = []
+        self._terms: list[tuple[bytes, bytes]] = []
+        self._postings_offset = 0
+
+    def add_document(self, doc_id: str, record: bytes) -> int:
+        """Append a doc-store record and return its local doc number."""
+        doc = len(self._offsets) - 1
+        self._docs.write(record)
+        self._offsets.append(self._offsets[-1] + len(record))
+        self._ids.append((doc_id.encode(), _ID_VALUE.pack(doc)))
+        return doc
+
+    def add_term(self, term: bytes, postings: list[tuple[int, int]]) -> None:
+        """Append one term's postings. Terms must arrive in sorted order."""
+        data = _encode_postings(postings)
+        self._postings.write(data)
+        self._terms.append(
+            (term, _TERM_VALUE.pack(len(postings), self._postings_offset, len(data)))
+        )
+        self._postings_offset += len(data)
+
+    def finish(self) -> int:
+        """Write the dictionaries, sync every file and return the doc count."""
+        for f in (self._docs, self._postings):
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+        with open(self._base + ".dix", "wb") as f:
+            f.writelines(_OFFSET.pack(o) for o in self._offsets)
+            f.flush()
+            os.fsync(f.fileno())
+        self._ids.sort()
+        _write_table(self._base + ".ids", b"SIDS", self._ids)
+        _write_table(self._base + ".tim", b"STIM", self._terms)
+        return len(self._offsets) - 1
+
+    def abort(self) -> None:
+        self._docs.close()
+        self._postings.close()
+        _remove_segment_files(os.path.dirname(self._base), os.path.basename(self._base))
+
+
+def _remove_segment_files(directory: str, name: str) -> None:
+    for ext in _SEGMENT_EXTENSIONS:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(directory, name + ext))
+
+
+def _tagged_terms(segment: _Segment, tag: int) -> Iterator[tuple[bytes, int, int, int]]:
+    """Yield ``(term, tag, offset, length)`` so sorted streams can be merged."""
+    for term, offset, length in segment.iter_terms():
+        yield term, tag, offset, length
+
+
+def _map(path: str) -> mmap.mmap | bytes:
+    """Map a file read-only (empty files cannot be mapped, so return ``b""``)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class _Segment:
+    """A memory-mapped, immutable segment plus its deleted doc numbers."""
+
+    def __init__(self, directory: str, name: str, deleted: set[int] | None = None):
+        self.name = name
+        self.deleted = deleted or set()
+        base = os.path.join(directory, name)
+        self._maps = [_map(base + ext) for ext in _SEGMENT_EXTENSIONS]
+        tim, self._postings, ids, self._docs, self._offsets = self._maps
+        self.terms = _Table(tim, b"STIM", _TERM_VALUE)
+        self.ids = _Table(ids, b"SIDS", _ID_VALUE)
+        self.n_docs = len(self._offsets) // _OFFSET.size - 1
+
+    @property
+    def live_docs(self) -> int:
+        return self.n_docs - len(self.deleted)
+
+    def lookup_term(self, term: str) -> tuple[int, int, int] | None:
+        """Return ``(df, offset, length)`` for ``term`` or ``None``."""
+        found = self.terms.lookup(term.encode())
+        if found is None:
+            return None
+        df, offset, length = found
+        return df, offset, length
+
+    def postings(self, offset: int, length: int) -> Iterator[tuple[int, int]]:
+        return _decode_postings(self._postings[offset : offset + length])
+
+    def find(self, doc_id: str) -> int | None:
+        """Return the live local doc number for ``doc_id``."""
+        found = self.ids.lookup(doc_id.encode())
+        if found is None or found[0] in self.deleted:
+            return None
+        return found[0]
+
+    def record(self, doc: int) -> bytes:
+        start, end = struct.unpack_from("<QQ", self._offsets, doc * _OFFSET.size)
+        return self._docs[start:end]
+
+    def document(self, doc: int) -> Document:
+        data = json.loads(self.record(doc))
+        return Document(
+            id=data["id"],
+            content=data["content"],
+            metadata=data["metadata"],
+            indexed_at=datetime.fromisoformat(data["indexed_at"]),
+        )
+
+    def iter_terms(self) -> Iterator[tuple[bytes, int, int]]:
+        for term, (_, offset, length) in self.terms:
+            yield term, offset, length
+
+    def close(self) -> None:
+        for m in self._maps:
+            if isinstance(m, mmap.mmap):
+                m.close()
+
+
+class DiskIndex(SearchIndex):
+    """Persistent segment-based index with TF-IDF scoring.
+
+    Scoring matches ``InMemoryIndex``. Document frequencies count deleted
+    documents until their segment is merged, as in other segment-based
+    engines, so scores can drift slightly from an in-memory rebuild while
+    deletions are pending.
+
+    Writes become durable on ``flush()`` (or ``close()``); ``index`` flushes
+    automatically once ``flush_threshold`` documents are buffered. Whenever
+    there are more than ``merge_factor`` segments the smallest ones are
+    merged into one, in a background thread unless ``background_merge`` is
+    false. The tokenizer is not stored: reopen an index with the one it was
+    built with. Metadata must be JSON-serializable.
+
+    Example::
+
+        with DiskIndex("data/search-index") as index:
+            index.index(Document(id="1", content="rate limiting"))
+            index.flush()
+            results = index.search("rate", k=10)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        tokenizer: Tokenizer | None = None,
+        flush_threshold: int = 1000,
+        merge_factor: int = 10,
+        background_merge: bool = True,
+    ):
+        if merge_factor < 2:
+            raise ValueError("merge_factor must be at least 2")
+        self.path = path
+        self._buffer = InMemoryIndex(tokenizer)
+        self.tokenizer = self._buffer.tokenizer
+        self._flush_threshold = max(1, flush_threshold)
+        self._merge_factor = merge_factor
+        self._background_merge = background_merge
+        self._lock = threading.RLock()
+        self._merge_thread: threading.Thread | None = None
+        self._merge_error: BaseException | None = None
+        self._segments: list[_Segment] = []
+        self._next_segment = 1
+        self._closed = False
+        os.makedirs(path, exist_ok=True)
+        self._open()
+
+    # ── Manifest ─────────────────────────────────────────────────────
+
+    def _open(self) -> None:
+        manifest_path = os.path.join(self.path, MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            if manifest.get("version") != _FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported index format version: {manifest.get('version')}"
+                )
+            self._next_segment = manifest["next_segment"]
+            self._segments = [
+                _Segment(self.path, entry["name"], set(entry["deleted"]))
+                for entry in manifest["segments"]
+            ]
+        # Drop files left behind by flushes or merges that never committed.
+        # Only this index's own segment names are touched, so unrelated
+        # files sharing the directory survive.
+        live = {segment.name for segment in self._segments}
+        for filename in os.listdir(self.path):
+            match = _SEGMENT_FILE.fullmatch(filename)
+            if match and match.group(1) not in live:
+                os.remove(os.path.join(self.path, filename))
+
+    def _commit(self) -> None:
+        """Atomically replace the manifest. Caller holds the lock."""
+        manifest = {
+            "version": _FORMAT_VERSION,
+            "next_segment": self._next_segment,
+            "segments": [
+                {"name": s.name, "docs": s.n_docs, "deleted": sorted(s.deleted)}
+                for s in self._segments
+            ],
+        }
+        path = os.path.join(self.path, MANIFEST)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def _new_segment_name(self) -> str:
+        name = f"seg-{self._next_segment:06d}"
+        self._next_segment += 1
+        return name
+
+    # ── Writes ───────────────────────────────────────────────────────
+
+    def _delete_from_segments(self, doc_id: str) -> bool:
+        for segment in self._segments:
+            doc = segment.find(doc_id)
+            if doc is not None:
+                segment.deleted.add(doc)
+                return True
+        return False
+
+    def index(self, document: Document) -> None:
+        """Index a document, replacing any earlier version with its id."""
+        with self._lock:
+            self._check_open()
+            self._delete_from_segments(document.id)
+            self._buffer.index(document)
+            if self._buffer.count() >= self._flush_threshold:
+                self.flush()
+
+    def delete(self, doc_id: str) -> bool:
+        """Delete a document (durable after the next ``flush()``)."""
+        with self._lock:
+            self._check_open()
+            if self._buffer.delete(doc_id):
+                return True
+            return self._delete_from_segments(doc_id)
+
+    def flush(self) -> None:
+        """Write buffered documents as a new segment and commit deletions."""
+        with self._lock:
+            self._check_open()
+            buffer = self._buffer
+            if buffer.count():
+                name = self._new_segment_name()
+                writer = _SegmentWriter(self.path, name)
+                try:
+                    docs = {}
+                    for doc_id, document in buffer._documents.items():
+                        docs[doc_id] = writer.add_document(
+                            doc_id, _document_record(document)
+                        )
+                    for term in sorted(buffer._inverted_index):
+                        postings = sorted(
+                            (docs[d], buffer._doc_term_freq[d][term])
+                            for d in buffer._inverted_index[term]
+                        )
+                        if postings:
+                            writer.add_term(term.encode(), postings)
+                    writer.finish()
+                except BaseException:
+                    writer.abort()
+                    raise
+                self._segments.append(_Segment(self.path, name))
+                self._buffer = InMemoryIndex(self.tokenizer)
+            self._commit()
+            self._maybe_merge()
+
+    # ── Merging ──────────────────────────────────────────────────────
+
+    def _merge_candidates(self) -> list[_Segment] | None:
+        """Pick the smallest segments once there are too many of them."""
+        if len(self._segments) <= self._merge_factor:
+            return None
+        by_size = sorted(self._segments, key=lambda s: s.live_docs)
+        return by_size[: self._merge_factor]
+
+    def _maybe_merge(self) -> None:
+        if self._merge_thread is not None and self._merge_thread.is_alive():
+            return
+        if not self._background_merge:
+            while (sources := self._merge_candidates()) is not None:
+                self._merge(sources)
+            return
+        if self._merge_candidates() is None:
+            return
+        self._merge_thread = threading.Thread(
+            target=self._merge_in_background,
+            name="search-segment-merge",
+            daemon=True,
+        )
+        self._merge_thread.start()
+
+    def _merge_in_background(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    sources = None if self._closed else self._merge_candidates()
+                if sources is None:
+                    return
+                self._merge(sources)
+        except BaseException as exc:  # surfaced by wait_for_merges()
+            self._merge_error = exc
+
+    def _merge(self, sources: list[_Segment]) -> None:
+        """Merge ``sources`` into one segment without their deleted docs."""
+        with self._lock:
+            name = self._new_segment_name()
+            snapshot = [set(s.deleted) for s in sources]
+        writer = _SegmentWriter(self.path, name)
+        remap: list[dict[int, int]] = []
+        try:
+            for segment, deleted in zip(sources, snapshot, strict=True):
+                mapping = {}
+                for doc in range(segment.n_docs):
+                    if doc in deleted:
+                        continue
+                    record = segment.record(doc)
+                    doc_id = json.loads(record)["id"]
+                    mapping[doc] = writer.add_document(doc_id, record)
+                remap.append(mapping)
+            streams = [_tagged_terms(segment, i) for i, segment in enumerate(sources)]
+            current: bytes | None = None
+            merged: list[tuple[int, int]] = []
+            for term, i, offset, length in heapq.merge(*streams):
+                if term != current:
+                    if merged:
+                        writer.add_term(current, merged)  # type: ignore[arg-type]
+                    current, merged = term, []
+                mapping = remap[i]
+                merged.extend(
+                    (mapping[doc], tf)
+                    for doc, tf in sources[i].postings(offset, length)
+                    if doc in mapping
+                )
+            if merged:
+                writer.add_term(current, merged)  # type: ignore[arg-type]
+            n_docs = writer.finish()
+        except BaseException:
+            writer.abort()
+            raise
+
+        with self._lock:
+            if self._closed:
+                _remove_segment_files(self.path, name)
+                return
+            # Carry over deletions made while the merge was running.
+            deleted = {
+                remap[i][doc]
+                for i, segment in enumerate(sources)
+                for doc in segment.deleted - snapshot[i]
+                if doc in remap[i]
+            }
+            segments = []
+            for segment in self._segments:
+                if segment is sources[0] and n_docs:
+                    segments.append(_Segment(self.path, name, deleted))
+                if segment not in sources:
+                    segments.append(segment)
+            self._segments = segments
+            self._commit()
+            for segment in sources:
+                segment.close()
+                _remove_segment_files(self.path, segment.name)
+            if not n_docs:
+                _remove_segment_files(self.path, name)
+
+    def merge(self, max_segments: int = 1) -> None:
+        """Synchronously merge down to at most ``max_segments`` segments.
+
+        Buffered documents are flushed first. Merging to a single segment
+        also purges deleted documents from it.
+        """
+        self.flush()
+        self.wait_for_merges()
+        target = max(1, max_segments)
+        with self._lock:
+            if len(self._segments) > target:
+                count = len(self._segments) - target + 1
+                self._merge(sorted(self._segments, key=lambda s: s.live_docs)[:count])
+            if target == 1 and self._segments and self._segments[0].deleted:
+                self._merge(list(self._segments))
+
+    def wait_for_merges(self) -> None:
+        """Block until any background merge has finished."""
+        thread = self._merge_thread
+        if thread is not None:
+            thread.join()
+        if self._merge_error is not None:
+            error, self._merge_error = self._merge_error, None
+            raise error
+
+    # ── Reads ────────────────────────────────────────────────────────
+
+    def search(self, query: str, k: int = 10) -> list[SearchResult]:
+        """Search using TF-IDF scoring across all segments and the buffer."""
+        tokens = self.tokenizer.tokenize(query)
+        if not tokens or k <= 0:
+            return []
+        with self._lock:
+            self._check_open()
+            num_docs = self.count()
+            buffer = self._buffer
+            # (segment index or -1 for the buffer, doc) -> score
+            scores: dict[tuple[int, Any], float] = {}
+            for token in tokens:
+                found = [
+                    (i, hit)
+                    for i, segment in enumerate(self._segments)
+                    if (hit := segment.lookup_term(token)) is not None
+                ]
+                buffered = buffer._inverted_index.get(token, set())
+                df = sum(hit[0] for _, hit in found) + len(buffered)
+                if not df:
+                    continue
+                idf = math.log(num_docs / (df + 1)) + 1
+                for i, (_, offset, length) in found:
+                    deleted = self._segments[i].deleted
+                    for doc, tf in self._segments[i].postings(offset, length):
+                        if doc not in deleted:
+                            key = (i, doc)
+                            scores[key] = scores.get(key, 0.0) + tf * idf
+                for doc_id in buffered:
+                    tf = buffer._doc_term_freq[doc_id][token]
+                    key = (-1, doc_id)
+                    scores[key] = scores.get(key, 0.0) + tf * idf
+
+            top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+            results = []
+            for (i, doc), score in top:
+                document = (
+                    buffer._documents[doc] if i < 0 else self._segments[i].document(doc)
+                )
+                results.append(
+                    SearchResult(
+                        document=document,
+                        score=score,
+                        highlights=build_highlights(
+                            document.content,
+                            tokens,
+                            first_offsets(self.tokenizer, document.content),
+                        ),
+                    )
+                )
+            return results
+
+    def get(self, doc_id: str) -> Document | None:
+        """Get document by ID."""
+        with self._lock:
+            self._check_open()
+            document = self._buffer.get(doc_id)
+            if document is not None:
+                return document
+            for segment in self._segments:
+                doc = segment.find(doc_id)
+                if doc is not None:
+                    return segment.document(doc)
+            return None
+
+    def count(self) -> int:
+        """Get the number of live documents."""
+        with self._lock:
+            return self._buffer.count() + sum(s.live_docs for s in self._segments)
+
+    @property
+    def segment_count(self) -> int:
+        """Number of on-disk segments."""
+        with self._lock:
+            return len(self._segments)
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise ValueError(f"DiskIndex at {self.path} is closed")
+
+    def close(self) -> None:
+        """Flush, wait for merges and unmap every segment."""
+        if self._closed:
+            return
+        self.flush()
+        self.wait_for_merges()
+        with self._lock:
+            self._closed = True
+            for segment in self._segments:
+                segment.close()
+            self._segments = []
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -4,6 +4,7 @@ Search Engine
 Search index implementations with TF-IDF scoring.
 """
 
+import heapq
 import math
 import threading
 from abc import ABC, abstractmethod
@@ -32,14 +33,62 @@ class SearchIndex(ABC):
         """Get document count."""
 
 
+def build_highlights(
+    content: str, tokens: list[str], offsets: dict[str, int], limit: int = 3
+) -> list[str]:
+    """Build context snippets around the first occurrence of each query token.
+
+    Tokens without a recorded offset fall back to a case-insensitive
+    substring search of the content and are skipped if that fails too.
+
+    Args:
+        content: The document text.
+        tokens: Query tokens, in query order.
+        offsets: First character offset of each document token.
+        limit: Maximum number of snippets.
+    """
+    highlights = []
+    lowered = None
+    for token in tokens:
+        idx = offsets.get(token)
+        if idx is None:
+            if lowered is None:
+                lowered = content.lower()
+            idx = lowered.find(token.lower())
+            if idx == -1:
+                continue
+        start = max(0, idx - 30)
+        end = min(len(content), idx + len(token) + 30)
+        highlights.append("..." + content[start:end] + "...")
+        if len(highlights) == limit:
+            break
+    return highlights
+
+
+def first_offsets(tokenizer: Tokenizer, content: str) -> dict[str, int]:
+    """Map each located token of ``content`` to its first offset."""
+    offsets: dict[str, int] = {}
+    for token, idx in tokenizer.tokenize_with_offsets(content):
+        if idx >= 0:
+            offsets.setdefault(token, idx)
+    return offsets
+
+
 class InMemoryIndex(SearchIndex):
-    """In-memory inverted index with TF-IDF scoring."""
+    """In-memory inverted index with TF-IDF scoring.
+
+    Term frequencies and the first character offset of every term the
+    tokenizer can locate come from one ``tokenize_with_offsets`` pass at
+    index time, so highlights are sliced straight out of the content, and
+    only for the top-``k`` results that are returned.
+    """
 
     def __init__(self, tokenizer: Tokenizer | None = None):
         self.tokenizer = tokenizer or SimpleTokenizer()
         self._documents: dict[str, Document] = {}
         self._inverted_index: dict[str, set[str]] = defaultdict(set)
         self._doc_term_freq: dict[str, dict[str, int]] = {}
+        self._doc_offsets: dict[str, dict[str, int]] = {}
         self._lock = threading.Lock()
 
     def index(self, document: Document) -> None:
@@ -47,13 +96,16 @@ class InMemoryIndex(SearchIndex):
         with self._lock:
             if document.id in self._documents:
                 self._remove_from_index(document.id)
-            tokens = self.tokenizer.tokenize(document.content)
             term_freq: dict[str, int] = defaultdict(int)
-            for token in tokens:
+            offsets: dict[str, int] = {}
+            for token, idx in self.tokenizer.tokenize_with_offsets(document.content):
                 term_freq[token] += 1
+                if idx >= 0:
+                    offsets.setdefault(token, idx)
                 self._inverted_index[token].add(document.id)
             self._documents[document.id] = document
             self._doc_term_freq[document.id] = dict(term_freq)
+            self._doc_offsets[document.id] = offsets
 
     def _remove_from_index(self, doc_id: str) -> None:
         """Remove document from index."""
@@ -61,6 +113,7 @@ class InMemoryIndex(SearchIndex):
             for term in self._doc_term_freq[doc_id]:
                 self._inverted_index[term].discard(doc_id)
             del self._doc_term_freq[doc_id]
+        self._doc_offsets.pop(doc_id, None)
         if doc_id in self._documents:
             del self._documents[doc_id]
 
@@ -77,39 +130,32 @@ class InMemoryIndex(SearchIndex):
             return []
 
         num_docs = len(self._documents)
-        results = []
+        idf = {
+            token: math.log(num_docs / (len(self._inverted_index.get(token, ())) + 1))
+            + 1
+            for token in set(tokens)
+        }
 
+        scored = []
         for doc_id in candidates:
             score = 0.0
             doc_terms = self._doc_term_freq.get(doc_id, {})
             for token in tokens:
                 if token in doc_terms:
-                    tf = doc_terms[token]
-                    df = len(self._inverted_index.get(token, set()))
-                    idf = math.log(num_docs / (df + 1)) + 1
-                    score += tf * idf
-
-            doc = self._documents[doc_id]
-            highlights = []
-            content_lower = doc.content.lower()
-            for token in tokens:
-                idx = content_lower.find(token.lower())
-                if idx != -1:
-                    start = max(0, idx - 30)
-                    end = min(len(doc.content), idx + len(token) + 30)
-                    highlight = "..." + doc.content[start:end] + "..."
-                    highlights.append(highlight)
-
-            results.append(
-                SearchResult(
-                    document=doc,
-                    score=score,
-                    highlights=highlights[:3],
-                )
+                    score += doc_terms[token] * idf[token]
+            scored.append((score, doc_id))
+
+        top = heapq.nlargest(k, scored, key=lambda item: item[0])
+        return [
+            SearchResult(
+                document=self._documents[doc_id],
+                score=score,
+                highlights=build_highlights(
+                    self._documents[doc_id].content, tokens, self._doc_offsets[doc_id]
+                ),
             )
-
-        results.sort(reverse=True)
-        return results[:k]
+            for score, doc_id in top
+        ]
 
     def delete(self, doc_id: str) -> bool:
         """Delete a document."""
@@ -132,6 +178,10 @@ def create_index(backend: str = "memory", **kwargs) -> SearchIndex:
     """Create a search index."""
     if backend == "memory":
         return InMemoryIndex(**kwargs)
+    if backend == "disk":
+        from .disk import DiskIndex
+
+        return DiskIndex(**kwargs)
     raise ValueError(f"Unknown backend: {backend}")
 
 
@@ -6,6 +6,9 @@ for more robust search results.
 
 from __future__ import annotations
 
+import bisect
+import heapq
+import itertools
 import math
 import re
 from collections import Counter
@@ -25,57 +28,236 @@ class SearchResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class _Posting:
+    """Documents containing one term, in ascending internal doc order.
+
+    ``max_tf`` and ``min_dl`` only ever widen (removals leave them as is),
+    so the score upper bound derived from them stays valid.
+    """
+
+    docs: list[int] = field(default_factory=list)
+    tfs: list[int] = field(default_factory=list)
+    max_tf: int = 0
+    min_dl: int = 0
+
+
+class _Cursor:
+    """Iterator over one query term's posting list."""
+
+    __slots__ = ("bound", "docs", "pos", "tfs", "weight")
+
+    def __init__(self, posting: _Posting, weight: float, bound: float) -> None:
+        self.docs = posting.docs
+        self.tfs = posting.tfs
+        self.weight = weight
+        self.bound = bound
+        self.pos = 0
+
+    def doc(self) -> int | None:
+        return self.docs[self.pos] if self.pos < len(self.docs) else None
+
+    def seek(self, doc: int) -> int | None:
+        """Advance to the first posting at or after ``doc``."""
+        if self.pos < len(self.docs) and self.docs[self.pos] < doc:
+            self.pos = bisect.bisect_left(self.docs, doc, self.pos + 1)
+        return self.doc()
+
+
 class BM25Index:
-    """Simple BM25 keyword index for hybrid search."""
+    """Incremental BM25 keyword index for hybrid search.
+
+    Each term maps to a posting list of ``(doc, tf)`` pairs in insertion
+    order, and the total document length is tracked incrementally, so
+    adding a document costs O(its length). Queries run MaxScore top-k
+    retrieval: terms are ordered by their score upper bound and, once the
+    current k-th best score exceeds the combined bound of the weakest
+    terms, those terms are only probed for documents found via the others.
+    Query cost therefore depends on the posting lengths of the query
+    terms, not on the corpus size.
+
+    Re-adding a ``doc_id`` replaces the document. Removed documents are
+    skipped at query time and purged once they make up half the postings.
+    """
 
     def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
         self._k1 = k1
         self._b = b
-        self._docs: dict[str, list[str]] = {}
-        self._doc_lengths: dict[str, int] = {}
-        self._avg_dl: float = 0.0
+        self._postings: dict[str, _Posting] = {}
         self._df: Counter[str] = Counter()
-        self._n: int = 0
+        # Per internal doc number; ``None`` marks a removed document.
+        self._doc_ids: list[str | None] = []
+        self._doc_tfs: list[dict[str, int] | None] = []
+        self._doc_lengths: list[int] = []
+        self._doc_numbers: dict[str, int] = {}
+        self._total_length = 0
+
+    @property
+    def _n(self) -> int:
+        return len(self._doc_numbers)
+
+    @property
+    def _avg_dl(self) -> float:
+        return self._total_length / self._n if self._n else 0.0
+
+    def __len__(self) -> int:
+        return self._n
 
     def add_document(self, doc_id: str, text: str) -> None:
-        """Add a document to the index."""
+        """Add a document to the index, replacing any previous version."""
+        if doc_id in self._doc_numbers:
+            self.remove_document(doc_id)
         tokens = self._tokenize(text)
-        self._docs[doc_id] = tokens
-        self._doc_lengths[doc_id] = len(tokens)
-        self._df.update(set(tokens))
-        self._n += 1
-        self._avg_dl = sum(self._doc_lengths.values()) / max(self._n, 1)
+        tfs = Counter(tokens)
+        doc = len(self._doc_ids)
+        dl = len(tokens)
+        self._doc_ids.append(doc_id)
+        self._doc_tfs.append(dict(tfs))
+        self._doc_lengths.append(dl)
+        self._doc_numbers[doc_id] = doc
+        self._total_length += dl
+        self._df.update(tfs.keys())
+        for term, tf in tfs.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = _Posting(min_dl=dl)
+            posting.docs.append(doc)
+            posting.tfs.append(tf)
+            posting.max_tf = max(posting.max_tf, tf)
+            posting.min_dl = min(posting.min_dl, dl)
 
-    def search(self, query: str, top_k: int = 10) -> list[tuple[str, float]]:
-        """Search using BM25 scoring."""
-        query_tokens = self._tokenize(query)
-        scores: dict[str, float] = {}
-        for doc_id, doc_tokens in self._docs.items():
-            score = self._bm25_score(query_tokens, doc_tokens, doc_id)
-            if score > 0:
-                scores[doc_id] = score
-        sorted_results = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        return sorted_results[:top_k]
-
-    def _bm25_score(
-        self, query_tokens: list[str], doc_tokens: list[str], doc_id: str
-    ) -> float:
-        """bm25 Score ."""
-        tf_map = Counter(doc_tokens)
-        dl = self._doc_lengths[doc_id]
-        score = 0.0
-        for term in query_tokens:
-            if term not in tf_map:
-                continue
-            tf = tf_map[term]
+    def remove_document(self, doc_id: str) -> bool:
+        """Remove a document. Returns ``False`` if it was not indexed."""
+        doc = self._doc_numbers.pop(doc_id, None)
+        if doc is None:
+            return False
+        tfs = self._doc_tfs[doc] or {}
+        self._df.subtract(tfs.keys())
+        for term in tfs:
+            if self._df[term] <= 0:
+                del self._df[term]
+        self._total_length -= self._doc_lengths[doc]
+        self._doc_ids[doc] = None
+        self._doc_tfs[doc] = None
+        if len(self._doc_ids) - self._n > max(self._n, 1024):
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        """Renumber live documents and rebuild postings without removed ones."""
+        live = [
+            (doc_id, tfs, dl)
+            for doc_id, tfs, dl in zip(
+                self._doc_ids, self._doc_tfs, self._doc_lengths, strict=True
+            )
+            if doc_id is not None
+        ]
+        self._postings.clear()
+        self._doc_ids, self._doc_tfs, self._doc_lengths = [], [], []
+        self._doc_numbers.clear()
+        self._df.clear()
+        self._total_length = 0
+        for doc_id, tfs, dl in live:
+            doc = len(self._doc_ids)
+            self._doc_ids.append(doc_id)
+            self._doc_tfs.append(tfs)
+            self._doc_lengths.append(dl)
+            self._doc_numbers[doc_id] = doc
+            self._total_length += dl
+            self._df.update(tfs.keys())
+            for term, tf in tfs.items():
+                posting = self._postings.get(term)
+                if posting is None:
+                    posting = self._postings[term] = _Posting(min_dl=dl)
+                posting.docs.append(doc)
+                posting.tfs.append(tf)
+                posting.max_tf = max(posting.max_tf, tf)
+                posting.min_dl = min(posting.min_dl, dl)
+
+    def _cursors(self, query_tokens: list[str]) -> list[_Cursor]:
+        """Build one cursor per distinct query term, ordered by score bound."""
+        k1, b = self._k1, self._b
+        avg_dl = max(self._avg_dl, 1)
+        cursors = []
+        for term, qtf in Counter(query_tokens).items():
             df = self._df.get(term, 0)
-            idf = math.log((self._n - df + 0.5) / (df + 0.5) + 1)
-            numerator = tf * (self._k1 + 1)
-            denominator = tf + self._k1 * (
-                1 - self._b + self._b * dl / max(self._avg_dl, 1)
+            if df <= 0:
+                continue
+            posting = self._postings[term]
+            weight = qtf * math.log((self._n - df + 0.5) / (df + 0.5) + 1)
+            tf = posting.max_tf
+            bound = (
+                weight
+                * tf
+                * (k1 + 1)
+                / (tf + k1 * (1 - b + b * posting.min_dl / avg_dl))
             )
-            score += idf * numerator / denominator
-        return score
+            cursors.append(_Cursor(posting, weight, bound))
+        cursors.sort(key=lambda c: c.bound)
+        return cursors
+
+    def search(self, query: str, top_k: int = 10) -> list[tuple[str, float]]:
+        """Search using BM25 scoring with MaxScore top-k pruning."""
+        if top_k <= 0 or not self._n:
+            return []
+        cursors = self._cursors(self._tokenize(query))
+        if not cursors:
+            return []
+
+        k1, b = self._k1, self._b
+        avg_dl = max(self._avg_dl, 1)
+        lengths = self._doc_lengths
+        doc_ids = self._doc_ids
+        # prefix[i]: combined upper bound of cursors[0..i].
+        prefix = list(itertools.accumulate(c.bound for c in cursors))
+        heap: list[tuple[float, int, str]] = []  # (score, -doc, id); min-heap
+        threshold = 0.0
+        first_essential = 0
+
+        while True:
+            essential = cursors[first_essential:]
+            doc = min(
+                (c.docs[c.pos] for c in essential if c.pos < len(c.docs)),
+                default=None,
+            )
+            if doc is None:
+                break
+            norm = k1 * (1 - b + b * lengths[doc] / avg_dl)
+            score = 0.0
+            for c in essential:
+                if c.pos < len(c.docs) and c.docs[c.pos] == doc:
+                    tf = c.tfs[c.pos]
+                    score += c.weight * tf * (k1 + 1) / (tf + norm)
+                    c.pos += 1
+            doc_id = doc_ids[doc]
+            if doc_id is None:
+                continue
+            for i in range(first_essential - 1, -1, -1):
+                if score + prefix[i] <= threshold:
+                    break
+                c = cursors[i]
+                if c.seek(doc) == doc:
+                    tf = c.tfs[c.pos]
+                    score += c.weight * tf * (k1 + 1) / (tf + norm)
+            else:
+                if score <= threshold:
+                    continue
+                if len(heap) < top_k:
+                    heapq.heappush(heap, (score, -doc, doc_id))
+                else:
+                    heapq.heapreplace(heap, (score, -doc, doc_id))
+                if len(heap) == top_k:
+                    threshold = heap[0][0]
+                    while (
+                        first_essential < len(cursors)
+                        and prefix[first_essential] <= threshold
+                    ):
+                        first_essential += 1
+                    if first_essential == len(cursors):
+                        break
+
+        ranked = sorted(heap, key=lambda item: (-item[0], -item[1]))
+        return [(doc_id, score) for score, _, doc_id in ranked]
 
     @staticmethod
     def _tokenize(text: str) -> list[str]:
@@ -41,6 +41,25 @@ class Tokenizer(ABC):
     def tokenize(self, text: str) -> list[str]:
         """Tokenize."""
 
+    def tokenize_with_offsets(self, text: str) -> list[tuple[str, int]]:
+        """Tokenize, pairing each token with its character offset in ``text``.
+
+        Returns exactly the tokens of ``tokenize``, in order, so indexes take
+        term frequencies and offsets from a single pass. The default locates
+        each token in the lowercased text, scanning forward, and pairs tokens
+        that are not substrings of it (synonyms, stems) with ``-1``;
+        tokenizers that know their match positions should override it.
+        """
+        lowered = text.lower()
+        out = []
+        cursor = 0
+        for token in self.tokenize(text):
+            idx = lowered.find(token.lower(), cursor)
+            if idx != -1:
+                cursor = idx + 1
+            out.append((token, idx))
+        return out
+
 
 class SimpleTokenizer(Tokenizer):
     """Simple whitespace and punctuation tokenizer."""
@@ -56,6 +75,16 @@ class SimpleTokenizer(Tokenizer):
         tokens = re.findall(r"\b\w+\b", text)
         return [t for t in tokens if len(t) >= self.min_length]
 
+    def tokenize_with_offsets(self, text: str) -> list[tuple[str, int]]:
+        """Tokenize, pairing each token with its character offset in ``text``."""
+        if self.lowercase:
+            text = text.lower()
+        return [
+            (m.group(), m.start())
+            for m in re.finditer(r"\b\w+\b", text)
+            if len(m.group()) >= self.min_length
+        ]
+
 
 class FuzzyMatcher:
     """Fuzzy string matching utilities."""
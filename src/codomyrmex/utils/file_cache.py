@@ -0,0 +1,180 @@
+"""Per-file parse cache validated by stat and content hash.
+
+Shared by ``agents.context.RepoIndexer`` and ``agentic_memory.obsidian``'s
+``ObsidianVault``. A cache entry is a JSON-serialisable dict holding the
+file's ``mtime_ns``, ``size`` and BLAKE2b ``digest`` next to whatever the
+owner's parse function returned. An entry is reused while mtime and size
+match; otherwise the file is hashed and only re-parsed if its content
+changed. Entries for files modified within ``RACY_NS`` of the check are
+flagged ``racy`` and always re-hashed, so a same-size rewrite inside the
+filesystem's timestamp granularity is not missed.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import functools
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from codomyrmex.logging_monitoring import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    ParseFn = Callable[[str, bytes], dict[str, Any]]
+
+logger = get_logger(__name__)
+
+# Files modified this recently may change again within the filesystem's
+# timestamp granularity, so they are re-hashed on the next check.
+RACY_NS = 2_000_000_000
+
+
+def scan_file(
+    parse: ParseFn, path: str, known_digest: str | None = None
+) -> dict[str, Any] | None:
+    """Read, hash and parse one file; runs in worker processes.
+
+    Returns ``None`` if the file cannot be read, ``{"digest", "unchanged":
+    True}`` if its content hash equals ``known_digest``, and otherwise the
+    digest merged with ``parse(path, data)``.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if digest == known_digest:
+        return {"digest": digest, "unchanged": True}
+    return {"digest": digest, **parse(path, data)}
+
+
+class FileParseCache:
+    """Cache entries keyed by caller-chosen strings, one per file.
+
+    Args:
+        parse: Module-level function ``(path, data) -> dict`` returning the
+            JSON-serialisable fields to store; it runs in worker processes.
+        version: Format version of the persisted file; a mismatch discards it.
+        cache_path: JSON file to persist the entries in; without it they
+            only live as long as this object.
+        max_workers: Parser processes (default ``os.cpu_count()``).
+        parallel_threshold: Minimum number of files to parse before a
+            process pool is used.
+    """
+
+    def __init__(
+        self,
+        parse: ParseFn,
+        *,
+        version: int,
+        cache_path: str | Path | None = None,
+        max_workers: int | None = None,
+        parallel_threshold: int = 32,
+    ) -> None:
+        self.parse = parse
+        self.version = version
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
+        self.dirty = False
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    @property
+    def entries(self) -> dict[str, dict[str, Any]]:
+        """All entries, loaded from ``cache_path`` on first access."""
+        if self._entries is None:
+            self._entries = {}
+            if self.cache_path and self.cache_path.exists():
+                try:
+                    data = json.loads(self.cache_path.read_text())
+                    if data.get("version") == self.version:
+                        self._entries = data["files"]
+                except (OSError, ValueError, KeyError, AttributeError):
+                    logger.warning("Ignoring unreadable cache %s", self.cache_path)
+        return self._entries
+
+    def pop(self, key: str) -> dict[str, Any] | None:
+        """Remove and return the entry for ``key``, if any."""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.dirty = True
+        return entry
+
+    def save(self) -> None:
+        """Write the entries to ``cache_path`` if they changed."""
+        if not (self.cache_path and self.dirty):
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": self.version, "files": self._entries}))
+        os.replace(tmp, self.cache_path)
+        self.dirty = False
+
+    def _scan(
+        self, pending: list[tuple[str, str | None]]
+    ) -> list[dict[str, Any] | None]:
+        scan = functools.partial(scan_file, self.parse)
+        workers = self.max_workers or os.cpu_count() or 1
+        if workers < 2 or len(pending) < self.parallel_threshold:
+            return [scan(path, digest) for path, digest in pending]
+        paths, digests = zip(*pending, strict=True)
+        chunksize = max(1, len(pending) // (workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(scan, paths, digests, chunksize=chunksize))
+
+    def resolve(
+        self, files: Iterable[tuple[str, str]]
+    ) -> dict[str, tuple[dict[str, Any] | None, bool]]:
+        """Bring the entries for ``(key, path)`` pairs up to date.
+
+        Returns:
+            ``key -> (entry, parsed)``. ``entry`` is ``None`` (and dropped
+            from the cache) when the file cannot be read; ``parsed`` is
+            ``True`` when the entry's parsed fields are new in this call.
+        """
+        entries = self.entries
+        started = time.time_ns()
+        resolved: dict[str, tuple[dict[str, Any] | None, bool]] = {}
+        pending: list[tuple[str, str, os.stat_result, str | None]] = []
+        for key, path in files:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                self.pop(key)
+                resolved[key] = (None, False)
+                continue
+            entry = entries.get(key)
+            if (
+                entry is not None
+                and not entry["racy"]
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+            ):
+                resolved[key] = (entry, False)
+            else:
+                pending.append((key, path, stat, entry["digest"] if entry else None))
+
+        scanned = self._scan([(path, digest) for _, path, _, digest in pending])
+        for (key, _, stat, _), result in zip(pending, scanned, strict=True):
+            if result is None:
+                self.pop(key)
+                resolved[key] = (None, False)
+                continue
+            unchanged = result.pop("unchanged", False)
+            entry = entries[key] if unchanged else result
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            entry["racy"] = stat.st_mtime_ns > started - RACY_NS
+            entries[key] = entry
+            self.dirty = True
+            resolved[key] = (entry, not unchanged)
+        return resolved
+
+
+__all__ = ["RACY_NS", "FileParseCache", "scan_file"]
@@ -6,12 +6,16 @@ Vector similarity search with in-memory and namespaced backends.
 
 import contextlib
 
+from .evaluation import quantization_report, recall_at_k
+from .ivf import IVFVectorStore
+from .matrix import MatrixVectorStore
 from .models import (
     DistanceMetric,
     SearchResult,
     VectorEntry,
     normalize_embedding,
 )
+from .quantized import QuantizedVectorStore
 from .store import (
     InMemoryVectorStore,
     NamespacedVectorStore,
@@ -37,6 +41,9 @@ def cli_commands():
         print("Vector Store Backends")
         print("  InMemoryVectorStore - In-process memory store")
         print("  NamespacedVectorStore - Namespace-partitioned store")
+        print("  MatrixVectorStore - NumPy float32 matrix store with batch search")
+        print("  IVFVectorStore - Approximate IVF-flat index (k-means lists, nprobe)")
+        print("  QuantizedVectorStore - int8 / product-quantized codes with re-ranking")
         print(f"  Distance Metrics: {[dm.value for dm in DistanceMetric]}")  # type: ignore
 
     def _stats():
@@ -57,12 +64,17 @@ def cli_commands():
 __all__ = [
     "ChromaVectorStore",
     "DistanceMetric",
+    "IVFVectorStore",
     "InMemoryVectorStore",
+    "MatrixVectorStore",
     "NamespacedVectorStore",
+    "QuantizedVectorStore",
     "SearchResult",
     "VectorEntry",
     "VectorStore",
     "cli_commands",
     "create_vector_store",
     "normalize_embedding",
+    "quantization_report",
+    "recall_at_k",
 ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -17,9 +18,11 @@ class _SearchMixin:
         _vectors (dict[str, VectorEntry])
         _distance_fn (Callable[[list[float], list[float]], float])
         _higher_is_better (bool)
+        _metadata_index (MetadataIndex)
     """
 
     _vectors: dict[str, Any]
+    _metadata_index: Any
     _lock: Any
     _distance_fn: Any
     _higher_is_better: bool
@@ -29,17 +32,23 @@ class _SearchMixin:
         query: list[float],
         k: int = 10,
         filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
-        """Search for similar vectors using linear scan."""
+        """Search for similar vectors using linear scan.
+
+        A ``where`` filter is resolved against the metadata index first, so
+        only matching entries are scored.
+        """
         from .models import SearchResult as SR
 
         results = []
         lock = self._lock
-        if lock is None:
-            entries = list(self._vectors.values())
-        else:
-            with lock:
+        with lock if lock is not None else contextlib.nullcontext():
+            if where is None:
                 entries = list(self._vectors.values())
+            else:
+                ids = self._metadata_index.candidates(where)
+                entries = [self._vectors[i] for i in ids]
         for entry in entries:
             if filter_fn and not filter_fn(entry.metadata):
                 continue
@@ -92,9 +92,13 @@ class ChromaVectorStore(VectorStore):
         query: list[float],
         k: int = 10,
         filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
         """Search for similar vectors.
 
+        ``where`` uses the Chroma filter dialect and is passed through to
+        Chroma unchanged, so it is evaluated natively before ranking.
+
         Note: `filter_fn` requires pulling all metadata and discarding results
         if evaluated purely in Python. Chroma accepts a `where` dict for meta filtering,
         but the VectorStore contract requires over-fetching and filtering in memory,
@@ -110,10 +114,14 @@ class ChromaVectorStore(VectorStore):
 
         fetch_k = min(fetch_k, item_count)
 
+        query_kwargs: dict[str, Any] = {}
+        if where is not None:
+            query_kwargs["where"] = where
         results = self._collection.query(
             query_embeddings=[query],
             n_results=fetch_k,
             include=["embeddings", "metadatas", "distances"],
+            **query_kwargs,
         )
 
         if not results["ids"] or not results["ids"][0]:
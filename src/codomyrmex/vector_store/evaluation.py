@@ -0,0 +1,97 @@
+"""
+Vector Store Evaluation
+
+Helpers for measuring the quality of approximate vector stores against
+an exact reference store.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from .store import VectorStore
+
+if TYPE_CHECKING:
+    from .models import SearchResult
+    from .quantized import QuantizedVectorStore
+
+
+def _mean_recall(
+    expected: list[list["SearchResult"]], actual: list[list["SearchResult"]]
+) -> float:
+    """Average, over queries, of the share of expected ids found in actual."""
+    if not expected:
+        return 0.0
+    total = 0.0
+    for want, got in zip(expected, actual, strict=True):
+        if not want:
+            total += 1.0
+            continue
+        want_ids = {r.id for r in want}
+        total += len(want_ids & {r.id for r in got}) / len(want_ids)
+    return total / len(expected)
+
+
+def recall_at_k(
+    candidate: VectorStore,
+    reference: VectorStore,
+    queries: list[list[float]],
+    k: int = 10,
+) -> float:
+    """Mean recall@k of ``candidate`` against the exact ``reference`` store.
+
+    For each query, recall is the fraction of the reference top-k ids that
+    also appear in the candidate top-k.
+
+    Args:
+        candidate: The approximate store under test.
+        reference: An exact store holding the same vectors.
+        queries: Query embeddings.
+        k: Number of neighbours compared per query.
+
+    Returns:
+        Recall averaged over all queries, in ``[0, 1]``.
+    """
+    if not queries:
+        return 0.0
+    return _mean_recall(
+        reference.search_batch(queries, k), candidate.search_batch(queries, k)
+    )
+
+
+def quantization_report(
+    store: "QuantizedVectorStore",
+    reference: VectorStore,
+    queries: list[list[float]],
+    k: int = 10,
+) -> dict[str, Any]:
+    """Measure recall and compression of a ``QuantizedVectorStore``.
+
+    Args:
+        store: The quantized store under test.
+        reference: An exact store holding the same vectors.
+        queries: Query embeddings.
+        k: Number of neighbours compared per query.
+
+    Returns:
+        Dict with ``recall`` (with the store's re-ranking),
+        ``recall_without_rerank`` (codes only), ``bytes_per_vector`` and
+        ``compression_ratio`` versus float32 rows.
+    """
+    if not queries:
+        return {
+            "recall": 0.0,
+            "recall_without_rerank": 0.0,
+            "bytes_per_vector": store.code_size,
+            "compression_ratio": None,
+        }
+    expected = reference.search_batch(queries, k)
+    code_size = store.code_size
+    return {
+        "recall": _mean_recall(expected, store.search_batch(queries, k)),
+        "recall_without_rerank": _mean_recall(
+            expected, store.search_batch(queries, k, rerank=0)
+        ),
+        "bytes_per_vector": code_size,
+        "compression_ratio": (store.dimension or 0) * 4 / code_size
+        if code_size
+        else None,
+    }
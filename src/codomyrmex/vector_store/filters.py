@@ -0,0 +1,288 @@
+"""
+Vector Store Metadata Filters
+
+A declarative ``where`` filter language for vector search, backed by an
+inverted index over metadata fields so filtered searches only score the
+matching subset of vectors.
+
+The syntax follows the Chroma ``where`` dialect::
+
+    {"source": "paper"}  # equality
+    {"source": {"$ne": "web"}}
+    {"lang": {"$in": ["en", "de"]}}  # membership
+    {"lang": {"$nin": ["fr"]}}
+    {"year": {"$gte": 2020, "$lt": 2024}}  # range
+    {"$and": [{"source": "paper"}, {"year": {"$gt": 2019}}]}
+    {"$or": [{"lang": "en"}, {"stars": {"$gte": 4.5}}]}
+
+Several fields in one dict are combined with ``$and``. Comparisons only
+match values of a compatible kind (numbers with numbers, strings with
+strings, booleans with booleans); ``$ne`` and ``$nin`` only match entries
+that have the field.
+"""
+
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass, field
+from typing import Any
+
+_COMPARISONS = frozenset({"$eq", "$ne", "$in", "$nin", "$gt", "$gte", "$lt", "$lte"})
+_RANGE_OPS = frozenset({"$gt", "$gte", "$lt", "$lte"})
+
+
+def _kind(value: Any) -> str | None:
+    """Classify a metadata value for indexing, or ``None`` if not indexable."""
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "num"
+    if isinstance(value, str):
+        return "str"
+    return None
+
+
+@dataclass(frozen=True)
+class _Condition:
+    """A single ``field <op> value`` comparison."""
+
+    field: str
+    op: str
+    value: Any
+
+
+@dataclass(frozen=True)
+class _Group:
+    """A ``$and`` / ``$or`` combination of sub-filters."""
+
+    op: str
+    children: tuple[Any, ...]
+
+
+def _parse(where: dict[str, Any]) -> _Condition | _Group:
+    if not isinstance(where, dict) or not where:
+        raise ValueError(f"Filter must be a non-empty dict, got {where!r}")
+
+    nodes: list[_Condition | _Group] = []
+    for key, spec in where.items():
+        if key in ("$and", "$or"):
+            if not isinstance(spec, list) or not spec:
+                raise ValueError(f"{key} expects a non-empty list of filters")
+            nodes.append(_Group(key, tuple(_parse(child) for child in spec)))
+        elif key.startswith("$"):
+            raise ValueError(f"Unknown filter operator: {key}")
+        elif isinstance(spec, dict):
+            if not spec:
+                raise ValueError(f"Empty condition for field {key!r}")
+            for op, value in spec.items():
+                nodes.append(_parse_condition(key, op, value))
+        else:
+            nodes.append(_parse_condition(key, "$eq", spec))
+    return nodes[0] if len(nodes) == 1 else _Group("$and", tuple(nodes))
+
+
+def _parse_condition(name: str, op: str, value: Any) -> _Condition:
+    if op not in _COMPARISONS:
+        raise ValueError(f"Unknown filter operator: {op}")
+    if op in ("$in", "$nin"):
+        if not isinstance(value, (list, tuple, set, frozenset)):
+            raise ValueError(f"{op} expects a list of values")
+        value = tuple(value)
+        if any(_kind(v) is None for v in value):
+            raise ValueError(f"{op} values must be str, int, float or bool")
+    elif _kind(value) is None:
+        raise ValueError(f"{op} value must be str, int, float or bool, got {value!r}")
+    elif op in _RANGE_OPS and _kind(value) == "bool":
+        raise ValueError(f"{op} does not accept boolean values")
+    return _Condition(name, op, value)
+
+
+def _compare(actual: Any, op: str, expected: Any) -> bool:
+    """Evaluate one comparison against a present metadata value."""
+    kind = _kind(actual)
+    if op in ("$in", "$nin"):
+        hit = kind is not None and any(
+            _kind(v) == kind and v == actual for v in expected
+        )
+        return hit if op == "$in" else not hit
+    same_kind = kind is not None and kind == _kind(expected)
+    if op == "$eq":
+        return same_kind and actual == expected
+    if op == "$ne":
+        return not (same_kind and actual == expected)
+    if not same_kind:
+        return False
+    if op == "$gt":
+        return actual > expected
+    if op == "$gte":
+        return actual >= expected
+    if op == "$lt":
+        return actual < expected
+    return actual <= expected
+
+
+class MetadataFilter:
+    """A compiled ``where`` filter.
+
+    Example::
+
+        f = MetadataFilter({"source": "paper", "year": {"$gte": 2020}})
+        f.matches({"source": "paper", "year": 2021})  # True
+    """
+
+    def __init__(self, where: dict[str, Any]):
+        self.where = where
+        self._root = _parse(where)
+
+    def matches(self, metadata: dict[str, Any]) -> bool:
+        """Evaluate the filter against one metadata dict."""
+        return self._matches(self._root, metadata)
+
+    def _matches(self, node: _Condition | _Group, metadata: dict[str, Any]) -> bool:
+        if isinstance(node, _Group):
+            results = (self._matches(child, metadata) for child in node.children)
+            return all(results) if node.op == "$and" else any(results)
+        if node.field not in metadata:
+            return False
+        return _compare(metadata[node.field], node.op, node.value)
+
+    def __repr__(self) -> str:
+        return f"MetadataFilter({self.where!r})"
+
+
+@dataclass
+class _FieldIndex:
+    """Postings for one metadata field."""
+
+    postings: dict[tuple[str, Any], set[str]] = field(default_factory=dict)
+    sorted_keys: dict[str, list[Any]] = field(default_factory=dict)
+    ids: set[str] = field(default_factory=set)
+
+
+class MetadataIndex:
+    """Inverted index from metadata ``(field, value)`` pairs to entry ids.
+
+    Scalar values (str, int, float, bool) get a posting set per distinct
+    value, and each field keeps its distinct numeric and string values
+    sorted so range conditions resolve with ``bisect``. Entries whose value
+    for a field is not a scalar only match ``$ne`` / ``$nin`` on it.
+
+    The index keeps a shallow copy of each entry's metadata, so later
+    mutation of the caller's dict cannot desynchronise it.
+    """
+
+    def __init__(self) -> None:
+        self._fields: dict[str, _FieldIndex] = {}
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entry_id: str, metadata: dict[str, Any]) -> None:
+        """Index an entry, replacing any metadata previously indexed for it."""
+        if entry_id in self._entries:
+            self.remove(entry_id)
+        self._entries[entry_id] = dict(metadata)
+        for name, value in metadata.items():
+            index = self._fields.get(name)
+            if index is None:
+                index = self._fields[name] = _FieldIndex()
+            index.ids.add(entry_id)
+            kind = _kind(value)
+            if kind is None:
+                continue
+            key = (kind, value)
+            posting = index.postings.get(key)
+            if posting is None:
+                posting = index.postings[key] = set()
+                if kind != "bool":
+                    bisect.insort(index.sorted_keys.setdefault(kind, []), value)
+            posting.add(entry_id)
+
+    def remove(self, entry_id: str) -> None:
+        """Drop an entry from the index (no-op if it is not indexed)."""
+        metadata = self._entries.pop(entry_id, None)
+        if metadata is None:
+            return
+        for name, value in metadata.items():
+            index = self._fields[name]
+            index.ids.discard(entry_id)
+            kind = _kind(value)
+            posting = index.postings.get((kind, value)) if kind else None
+            if posting is not None:
+                posting.discard(entry_id)
+                if not posting:
+                    del index.postings[(kind, value)]
+                    if kind != "bool":
+                        keys = index.sorted_keys[kind]
+                        del keys[bisect.bisect_left(keys, value)]
+            if not index.ids:
+                del self._fields[name]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._fields.clear()
+        self._entries.clear()
+
+    def candidates(self, where: MetadataFilter | dict[str, Any]) -> set[str]:
+        """Return the ids of all entries matching ``where``."""
+        if not isinstance(where, MetadataFilter):
+            where = MetadataFilter(where)
+        return self._resolve(where._root)
+
+    def _resolve(self, node: _Condition | _Group) -> set[str]:
+        if isinstance(node, _Group):
+            if node.op == "$or":
+                out: set[str] = set()
+                for child in node.children:
+                    out |= self._resolve(child)
+                return out
+            sets = sorted((self._resolve(c) for c in node.children), key=len)
+            out = set(sets[0])
+            for other in sets[1:]:
+                if not out:
+                    break
+                out &= other
+            return out
+        return self._resolve_condition(node)
+
+    def _resolve_condition(self, cond: _Condition) -> set[str]:
+        index = self._fields.get(cond.field)
+        if index is None:
+            return set()
+        op, value = cond.op, cond.value
+        if op == "$eq":
+            return set(index.postings.get((_kind(value), value), ()))
+        if op == "$in":
+            out: set[str] = set()
+            for v in value:
+                out |= index.postings.get((_kind(v), v), set())
+            return out
+        if op in ("$ne", "$nin"):
+            excluded = value if op == "$nin" else (value,)
+            out = set(index.ids)
+            for v in excluded:
+                out -= index.postings.get((_kind(v), v), set())
+            return out
+
+        kind = _kind(value)
+        keys = index.sorted_keys.get(kind, [])
+        if op == "$gt":
+            selected = keys[bisect.bisect_right(keys, value) :]
+        elif op == "$gte":
+            selected = keys[bisect.bisect_left(keys, value) :]
+        elif op == "$lt":
+            selected = keys[: bisect.bisect_left(keys, value)]
+        else:
+            selected = keys[: bisect.bisect_right(keys, value)]
+        out = set()
+        for v in selected:
+            out |= index.postings[(kind, v)]
+        return out
+
+
+def as_filter(where: MetadataFilter | dict[str, Any] | None) -> MetadataFilter | None:
+    """Compile ``where`` once, passing through ``None`` and compiled filters."""
+    if where is None or isinstance(where, MetadataFilter):
+        return where
+    return MetadataFilter(where)
@@ -0,0 +1,336 @@
+"""
+IVF Vector Store
+
+Approximate nearest-neighbour search with an inverted-file (IVF-flat)
+index: a k-means coarse quantizer partitions the vectors into lists and
+each query only scores the ``nprobe`` lists closest to it.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+from .matrix import MatrixVectorStore, np
+from .models import SearchResult
+
+_KMEANS_CHUNK = 16_384
+
+
+def _nearest_centroids(rows: Any, centroids: Any, n: int, spherical: bool) -> Any:
+    """Return the ``n`` closest centroid ids for each row, closest first.
+
+    Spherical centroids are ranked by inner product; otherwise by squared
+    L2 distance, expanded so only one matrix product is needed.
+    """
+    if spherical:
+        scores = rows @ centroids.T
+    else:
+        c_sq = np.einsum("ij,ij->i", centroids, centroids)
+        scores = 2.0 * (rows @ centroids.T) - c_sq[None, :]
+    if n == 1:
+        return np.argmax(scores, axis=1)[:, None]
+    if n >= scores.shape[1]:
+        return np.argsort(-scores, axis=1)
+    part = np.argpartition(-scores, n - 1, axis=1)[:, :n]
+    order = np.argsort(-np.take_along_axis(scores, part, axis=1), axis=1)
+    return np.take_along_axis(part, order, axis=1)
+
+
+def _kmeans(
+    data: Any, n_clusters: int, iterations: int, seed: int, spherical: bool
+) -> Any:
+    """Run Lloyd's k-means on ``data`` and return float32 centroids.
+
+    At most ``len(data)`` centroids are returned. Empty clusters are
+    re-seeded from random rows; spherical centroids are re-normalized
+    after every update.
+    """
+    rng = np.random.default_rng(seed)
+    n_clusters = min(n_clusters, data.shape[0])
+    centroids = data[rng.choice(data.shape[0], n_clusters, replace=False)].copy()
+    for _ in range(iterations):
+        labels = np.concatenate(
+            [
+                _nearest_centroids(
+                    data[i : i + _KMEANS_CHUNK], centroids, 1, spherical
+                )[:, 0]
+                for i in range(0, data.shape[0], _KMEANS_CHUNK)
+            ]
+        )
+        counts = np.bincount(labels, minlength=n_clusters)
+        order = np.argsort(labels, kind="stable")
+        present = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[present]
+        sums = np.zeros_like(centroids)
+        sums[present] = np.add.reduceat(data[order], starts, axis=0)
+        empty = counts == 0
+        counts[empty] = 1
+        centroids = sums / counts[:, None]
+        if empty.any():
+            centroids[empty] = data[rng.choice(data.shape[0], int(empty.sum()))]
+        if spherical:
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            centroids = centroids / np.where(norms == 0, 1.0, norms)
+    return centroids.astype(np.float32)
+
+
+class IVFVectorStore(MatrixVectorStore):
+    """Approximate vector store using an IVF-flat index.
+
+    Vectors live in the same contiguous float32 matrix as
+    ``MatrixVectorStore``; the index adds a set of k-means centroids and
+    one inverted list of row slots per centroid. Until enough vectors have
+    been added to train the quantizer (``train_size``), searches fall back
+    to an exact scan. After training, inserts are assigned to their
+    nearest centroid and deletes are removed from their list, so the index
+    is maintained incrementally.
+
+    ``nprobe`` trades recall for latency: probing more lists scores more
+    candidates. ``nprobe >= n_lists`` is equivalent to exact search.
+
+    Example::
+
+        store = IVFVectorStore(n_lists=256, nprobe=16)
+        store.add_batch(entries)  # trains once train_size is reached
+        results = store.search(query, k=10)
+        results = store.search(query, k=10, nprobe=64)  # higher recall
+    """
+
+    def __init__(
+        self,
+        distance_metric: str = "cosine",
+        dimension: int | None = None,
+        *,
+        n_lists: int = 100,
+        nprobe: int = 8,
+        train_size: int | None = None,
+        kmeans_iterations: int = 20,
+        seed: int = 0,
+        initial_capacity: int = 1024,
+    ):
+        if n_lists < 1:
+            raise ValueError("n_lists must be at least 1")
+        self._n_lists = n_lists
+        self.nprobe = nprobe
+        self._train_size = train_size if train_size is not None else n_lists * 39
+        self._kmeans_iterations = kmeans_iterations
+        self._seed = seed
+        super().__init__(
+            distance_metric=distance_metric,
+            dimension=dimension,
+            initial_capacity=initial_capacity,
+        )
+
+    # ── Index state ──────────────────────────────────────────────────
+
+    def _reset(self) -> None:
+        """Drop all rows and the trained quantizer."""
+        super()._reset()
+        self._centroids: Any = None
+        self._assign: list[int] = []
+        self._lists: list[list[int]] = []
+        self._list_cache: dict[int, Any] = {}
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the coarse quantizer has been trained."""
+        return self._centroids is not None
+
+    @property
+    def n_lists(self) -> int:
+        """Number of inverted lists (k-means centroids)."""
+        return self._n_lists
+
+    def _nearest_lists(self, rows: Any, n: int, centroids: Any = None) -> Any:
+        """Return the ``n`` closest centroid ids for each row, closest first."""
+        if centroids is None:
+            centroids = self._centroids
+        return _nearest_centroids(
+            rows, centroids, n, spherical=self._distance_metric == "cosine"
+        )
+
+    def _kmeans(self, data: Any) -> Any:
+        """Run Lloyd's k-means on ``data`` and return the centroids."""
+        return _kmeans(
+            data,
+            self._n_lists,
+            self._kmeans_iterations,
+            self._seed,
+            spherical=self._distance_metric == "cosine",
+        )
+
+    def train(self, sample_size: int | None = None) -> None:
+        """Train the coarse quantizer on the stored vectors and rebuild lists.
+
+        Args:
+            sample_size: Optional cap on the number of rows used for
+                k-means; all rows are still assigned to lists afterwards.
+        """
+        with self._lock:
+            if self._size == 0:
+                raise ValueError("Cannot train an IVF index on an empty store")
+            data = self._matrix[: self._size]
+            if sample_size is not None and sample_size < self._size:
+                rng = np.random.default_rng(self._seed)
+                data = data[rng.choice(self._size, sample_size, replace=False)]
+            self._centroids = self._kmeans(data)
+            self._rebuild_lists()
+
+    def _rebuild_lists(self) -> None:
+        """Assign every stored row to its nearest centroid."""
+        self._lists = [[] for _ in range(self._centroids.shape[0])]
+        self._list_cache.clear()
+        self._assign = []
+        for start in range(0, self._size, _KMEANS_CHUNK):
+            block = self._matrix[start : min(start + _KMEANS_CHUNK, self._size)]
+            labels = self._nearest_lists(block, 1)[:, 0].tolist()
+            for offset, label in enumerate(labels):
+                self._lists[label].append(start + offset)
+            self._assign.extend(labels)
+
+    def _list_slots(self, list_id: int) -> Any:
+        """Return the slots of one inverted list as a cached array."""
+        cached = self._list_cache.get(list_id)
+        if cached is None:
+            cached = np.asarray(self._lists[list_id], dtype=np.intp)
+            self._list_cache[list_id] = cached
+        return cached
+
+    # ── Incremental maintenance ──────────────────────────────────────
+
+    def _write_rows(
+        self,
+        ids: list[str],
+        rows: Any,
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Insert rows, then place new or changed rows into their lists."""
+        first_new = self._size
+        existing = [self._index[i] for i in ids if i in self._index]
+        super()._write_rows(ids, rows, metadatas)
+
+        if not self.is_trained:
+            if self._size >= self._train_size:
+                self.train()
+            return
+
+        self._assign.extend([-1] * (self._size - first_new))
+        slots = sorted(set(existing)) + list(range(first_new, self._size))
+        labels = self._nearest_lists(self._matrix[slots], 1)[:, 0].tolist()
+        for slot, label in zip(slots, labels, strict=True):
+            old = self._assign[slot]
+            if old == label:
+                continue
+            if old >= 0:
+                self._lists[old].remove(slot)
+                self._list_cache.pop(old, None)
+            self._lists[label].append(slot)
+            self._list_cache.pop(label, None)
+            self._assign[slot] = label
+
+    def delete(self, id: str) -> bool:
+        """Delete a vector and remove it from its inverted list."""
+        with self._lock:
+            slot = self._index.get(id)
+            if slot is None:
+                return False
+            last = self._size - 1
+            if self.is_trained:
+                label = self._assign[slot]
+                self._lists[label].remove(slot)
+                self._list_cache.pop(label, None)
+                if slot != last:
+                    moved_label = self._assign[last]
+                    members = self._lists[moved_label]
+                    members[members.index(last)] = slot
+                    self._list_cache.pop(moved_label, None)
+                    self._assign[slot] = moved_label
+                self._assign.pop()
+            return super().delete(id)
+
+    # ── Search ───────────────────────────────────────────────────────
+
+    def search(
+        self,
+        query: list[float],
+        k: int = 10,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
+        nprobe: int | None = None,
+    ) -> list[SearchResult]:
+        """Approximate search over the ``nprobe`` nearest inverted lists."""
+        return self.search_batch([query], k, filter_fn, where, nprobe)[0]
+
+    def search_batch(
+        self,
+        queries: list[list[float]],
+        k: int = 10,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
+        nprobe: int | None = None,
+    ) -> list[list[SearchResult]]:
+        """Approximate search for many queries.
+
+        A ``where`` filter selective enough that its matches number fewer
+        than the rows the probed lists would hold is answered by scoring
+        exactly those matches; otherwise the probed lists are masked by it.
+
+        Args:
+            queries: Query embeddings, one per row.
+            k: Number of results per query.
+            filter_fn: Optional metadata predicate applied to candidates.
+            where: Optional declarative metadata filter.
+            nprobe: Lists to probe per query (defaults to ``self.nprobe``).
+
+        Returns:
+            One ranked result list per query, in query order.
+        """
+        with self._lock:
+            if not self.is_trained:
+                return super().search_batch(queries, k, filter_fn, where)
+            if len(queries) == 0:
+                return []
+            block = self._as_matrix(queries)
+            if k <= 0:
+                return [[] for _ in range(block.shape[0])]
+            if block.shape[1] != self._dimension:
+                raise ValueError(
+                    f"Query dimension {block.shape[1]} does not match store "
+                    f"dimension {self._dimension}"
+                )
+            probe = max(1, min(nprobe or self.nprobe, self._centroids.shape[0]))
+            allowed = None
+            if where is not None:
+                matches = self._candidate_slots(None, where)
+                if matches.size * self._centroids.shape[0] <= self._size * probe:
+                    return super().search_batch(queries, k, filter_fn, where)
+                allowed = np.zeros(self._size, dtype=bool)
+                allowed[matches] = True
+            coarse = block
+            if self._distance_metric == "cosine":
+                norms = np.linalg.norm(block, axis=1, keepdims=True)
+                coarse = block / np.where(norms == 0, 1.0, norms)
+            probed = self._nearest_lists(coarse, probe)
+
+            batches = []
+            for query, lists in zip(block, probed, strict=True):
+                slots = np.concatenate([self._list_slots(i) for i in lists.tolist()])
+                if allowed is not None:
+                    slots = slots[allowed[slots]]
+                if filter_fn is not None:
+                    keep = np.fromiter(
+                        (filter_fn(self._metadata[s]) for s in slots.tolist()),
+                        dtype=bool,
+                        count=slots.size,
+                    )
+                    slots = slots[keep]
+                if slots.size == 0:
+                    batches.append([])
+                    continue
+                scores = self._score(query[None, :], slots)[0]
+                batches.append(self._results_for(scores, slots, k))
+            return batches
+
+    def list_sizes(self) -> list[int]:
+        """Return the number of vectors in each inverted list."""
+        with self._lock:
+            return [len(members) for members in self._lists]
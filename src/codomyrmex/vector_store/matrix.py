@@ -0,0 +1,376 @@
+"""
+Matrix Vector Store
+
+NumPy-backed vector storage that keeps every embedding as a row of one
+contiguous float32 matrix, so search is a single matrix-vector product
+followed by an ``argpartition`` top-k instead of a per-entry Python loop.
+"""
+
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from .filters import MetadataIndex
+from .models import SearchResult, VectorEntry
+from .store import VectorStore
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_METRICS = ("cosine", "euclidean", "dot_product")
+
+
+def _top_k_indices(scores: Any, k: int, higher_is_better: bool) -> Any:
+    """Return the indices of the best ``k`` scores, best first.
+
+    Uses ``argpartition`` so only the selected ``k`` candidates are
+    fully sorted, giving O(n + k log k) instead of O(n log n).
+    """
+    keys = -scores if higher_is_better else scores
+    n = keys.shape[0]
+    if k >= n:
+        return np.argsort(keys, kind="stable")
+    part = np.argpartition(keys, k - 1)[:k]
+    return part[np.argsort(keys[part], kind="stable")]
+
+
+def _prepare_rows(metric: str, rows: Any) -> tuple[Any, Any]:
+    """Convert raw float32 rows into stored form plus per-row norm data.
+
+    Cosine rows are unit-normalized and paired with their original L2
+    norm; euclidean rows are kept raw with their squared norm; dot-product
+    rows are kept raw with zero norms.
+    """
+    if metric == "cosine":
+        norms = np.linalg.norm(rows, axis=1)
+        safe = np.where(norms == 0, 1.0, norms)
+        return rows / safe[:, None], norms
+    if metric == "euclidean":
+        return rows, np.einsum("ij,ij->i", rows, rows)
+    return rows, np.zeros(rows.shape[0], dtype=np.float32)
+
+
+def _score_rows(metric: str, queries: Any, matrix: Any, norms: Any) -> Any:
+    """Score a ``(m, d)`` query block against rows in stored form."""
+    if metric == "cosine":
+        q_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(q_norms == 0, 1.0, q_norms)
+        return queries @ matrix.T
+    if metric == "euclidean":
+        q_sq = np.einsum("ij,ij->i", queries, queries)[:, None]
+        sq = norms[None, :] - 2.0 * (queries @ matrix.T) + q_sq
+        return np.sqrt(np.maximum(sq, 0.0))
+    return queries @ matrix.T
+
+
+class MatrixVectorStore(VectorStore):
+    """Vector store backed by a contiguous float32 matrix.
+
+    Rows are stored pre-normalized for the cosine metric, so a query is
+    scored against the whole store with one ``matrix @ query`` product.
+    Deletion moves the last row into the freed slot, keeping the live
+    rows contiguous. ``search_batch`` scores many queries at once with a
+    single matrix-matrix product.
+
+    Example::
+
+        store = MatrixVectorStore(distance_metric="cosine")
+        store.add("doc-1", [0.1, 0.2, 0.3])
+        results = store.search([0.1, 0.2, 0.3], k=5)
+        batches = store.search_batch([[0.1, 0.2, 0.3], [0.3, 0.2, 0.1]], k=5)
+    """
+
+    def __init__(
+        self,
+        distance_metric: str = "cosine",
+        dimension: int | None = None,
+        initial_capacity: int = 1024,
+    ):
+        if np is None:
+            raise ImportError(
+                "numpy is not installed. Install it with `uv sync --extra scientific` "
+                "to use MatrixVectorStore."
+            )
+        if distance_metric not in _METRICS:
+            raise ValueError(f"Unknown distance metric: {distance_metric}")
+
+        self._distance_metric = distance_metric
+        self._higher_is_better = distance_metric != "euclidean"
+        self._fixed_dimension = dimension
+        self._initial_capacity = max(1, initial_capacity)
+        self._lock = threading.RLock()
+        self._reset()
+
+    # ── Internal storage ─────────────────────────────────────────────
+
+    def _reset(self) -> None:
+        """Drop all rows and reallocate empty storage."""
+        self._dimension: int | None = self._fixed_dimension
+        self._size = 0
+        self._ids: list[str] = []
+        self._index: dict[str, int] = {}
+        self._metadata: list[dict[str, Any]] = []
+        self._metadata_index = MetadataIndex()
+        self._created_at: list[datetime] = []
+        self._matrix = self._allocate(self._initial_capacity, self._dimension or 0)
+        # Cosine: original L2 norm of each row. Euclidean: squared norm.
+        self._norms = np.zeros(self._initial_capacity, dtype=np.float32)
+
+    def _allocate(self, capacity: int, dim: int) -> Any:
+        """Allocate zeroed row storage for ``capacity`` rows of ``dim``."""
+        return np.zeros((capacity, dim), dtype=np.float32)
+
+    def _ensure_dimension(self, dim: int) -> None:
+        """Fix the store dimension on first insert and validate afterwards."""
+        if self._dimension is None:
+            self._dimension = dim
+            self._matrix = self._allocate(self._matrix.shape[0], dim)
+        elif dim != self._dimension:
+            raise ValueError(
+                f"Embedding dimension {dim} does not match store dimension "
+                f"{self._dimension}"
+            )
+
+    def _ensure_capacity(self, needed: int) -> None:
+        """Grow the backing arrays geometrically to hold ``needed`` rows."""
+        capacity = self._matrix.shape[0]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        matrix = self._allocate(capacity, self._matrix.shape[1])
+        matrix[: self._size] = self._matrix[: self._size]
+        norms = np.zeros(capacity, dtype=np.float32)
+        norms[: self._size] = self._norms[: self._size]
+        self._matrix = matrix
+        self._norms = norms
+
+    def _prepare_rows(self, rows: Any) -> tuple[Any, Any]:
+        """Convert raw rows into stored form and their per-row norm data."""
+        return _prepare_rows(self._distance_metric, rows)
+
+    def _write_rows(
+        self,
+        ids: list[str],
+        rows: Any,
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Insert or overwrite ``rows`` under ``ids``. Caller holds the lock."""
+        self._ensure_dimension(rows.shape[1])
+        stored, norms = self._prepare_rows(rows)
+        self._ensure_capacity(self._size + len(ids))
+        now = datetime.now()
+        for row_id, vec, norm, meta in zip(ids, stored, norms, metadatas, strict=True):
+            slot = self._index.get(row_id)
+            if slot is None:
+                slot = self._size
+                self._size += 1
+                self._index[row_id] = slot
+                self._ids.append(row_id)
+                self._metadata.append(meta)
+                self._created_at.append(now)
+            else:
+                self._metadata[slot] = meta
+            self._metadata_index.add(row_id, meta)
+            self._matrix[slot] = vec
+            self._norms[slot] = norm
+
+    def _row_embedding(self, slot: int) -> list[float]:
+        """Reconstruct the caller-visible embedding for a row."""
+        row = self._matrix[slot]
+        if self._distance_metric == "cosine":
+            row = row * self._norms[slot]
+        return row.tolist()
+
+    def _as_matrix(self, vectors: Any) -> Any:
+        """Coerce a sequence of vectors to a 2-D float32 array."""
+        arr = np.asarray(vectors, dtype=np.float32)
+        if arr.ndim == 1:
+            arr = arr.reshape(1, -1)
+        return arr
+
+    def _candidate_slots(
+        self,
+        filter_fn: Callable[[dict[str, Any]], bool] | None,
+        where: dict[str, Any] | None = None,
+    ) -> Any:
+        """Return sorted row indices passing both filters (``None`` = all).
+
+        ``where`` is resolved through the metadata index, so ``filter_fn``
+        is only evaluated for the rows it selects.
+        """
+        if where is not None:
+            ids = self._metadata_index.candidates(where)
+            slots = np.sort(
+                np.fromiter(
+                    (self._index[i] for i in ids), dtype=np.intp, count=len(ids)
+                )
+            )
+        elif filter_fn is None:
+            return None
+        else:
+            slots = np.arange(self._size, dtype=np.intp)
+        if filter_fn is not None and slots.size:
+            keep = np.fromiter(
+                (filter_fn(self._metadata[i]) for i in slots.tolist()),
+                dtype=bool,
+                count=slots.size,
+            )
+            slots = slots[keep]
+        return slots
+
+    def _score(self, queries: Any, slots: Any) -> Any:
+        """Score a ``(m, d)`` query block against the selected rows."""
+        if slots is None:
+            matrix = self._matrix[: self._size]
+            norms = self._norms[: self._size]
+        else:
+            matrix = self._matrix[slots]
+            norms = self._norms[slots]
+        return _score_rows(self._distance_metric, queries, matrix, norms)
+
+    def _results_for(self, scores: Any, slots: Any, k: int) -> list[SearchResult]:
+        """Build ranked ``SearchResult`` objects for one query row."""
+        order = _top_k_indices(scores, k, self._higher_is_better)
+        results = []
+        for pos in order.tolist():
+            slot = pos if slots is None else int(slots[pos])
+            results.append(
+                SearchResult(
+                    id=self._ids[slot],
+                    score=float(scores[pos]),
+                    embedding=self._row_embedding(slot),
+                    metadata=self._metadata[slot],
+                )
+            )
+        return results
+
+    # ── VectorStore interface ────────────────────────────────────────
+
+    def add(
+        self, id: str, embedding: list[float], metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Add a vector to the store."""
+        rows = self._as_matrix(embedding)
+        with self._lock:
+            self._write_rows([id], rows, [metadata or {}])
+
+    def add_batch(
+        self, entries: list[tuple[str, list[float], dict[str, Any] | None]]
+    ) -> int:
+        """Add multiple vectors at once, converting them in one array op."""
+        if not entries:
+            return 0
+        ids = [item[0] for item in entries]
+        rows = self._as_matrix([item[1] for item in entries])
+        metadatas = [(item[2] if len(item) > 2 else None) or {} for item in entries]
+        with self._lock:
+            self._write_rows(ids, rows, metadatas)
+        return len(entries)
+
+    def get(self, id: str) -> VectorEntry | None:
+        """Get a vector by ID."""
+        with self._lock:
+            slot = self._index.get(id)
+            if slot is None:
+                return None
+            return VectorEntry(
+                id=id,
+                embedding=self._row_embedding(slot),
+                metadata=self._metadata[slot],
+                created_at=self._created_at[slot],
+            )
+
+    def delete(self, id: str) -> bool:
+        """Delete a vector by ID, back-filling its row with the last row."""
+        with self._lock:
+            slot = self._index.pop(id, None)
+            if slot is None:
+                return False
+            self._metadata_index.remove(id)
+            last = self._size - 1
+            if slot != last:
+                moved_id = self._ids[last]
+                self._matrix[slot] = self._matrix[last]
+                self._norms[slot] = self._norms[last]
+                self._ids[slot] = moved_id
+                self._metadata[slot] = self._metadata[last]
+                self._created_at[slot] = self._created_at[last]
+                self._index[moved_id] = slot
+            self._ids.pop()
+            self._metadata.pop()
+            self._created_at.pop()
+            self._size = last
+            return True
+
+    def search(
+        self,
+        query: list[float],
+        k: int = 10,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
+    ) -> list[SearchResult]:
+        """Search for similar vectors with one matrix-vector product."""
+        return self.search_batch([query], k, filter_fn, where)[0]
+
+    def search_batch(
+        self,
+        queries: list[list[float]],
+        k: int = 10,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for many queries with a single matrix-matrix product.
+
+        Args:
+            queries: Query embeddings, one per row.
+            k: Number of results per query.
+            filter_fn: Optional metadata predicate applied before scoring.
+            where: Optional declarative metadata filter; only rows it
+                selects through the metadata index are scored.
+
+        Returns:
+            One ranked result list per query, in query order.
+        """
+        if len(queries) == 0:
+            return []
+        block = self._as_matrix(queries)
+        with self._lock:
+            if self._size == 0 or k <= 0:
+                return [[] for _ in range(block.shape[0])]
+            if block.shape[1] != self._dimension:
+                raise ValueError(
+                    f"Query dimension {block.shape[1]} does not match store "
+                    f"dimension {self._dimension}"
+                )
+            slots = self._candidate_slots(filter_fn, where)
+            if slots is not None and slots.size == 0:
+                return [[] for _ in range(block.shape[0])]
+            scores = self._score(block, slots)
+            return [self._results_for(row, slots, k) for row in scores]
+
+    def count(self) -> int:
+        """Get total number of vectors."""
+        with self._lock:
+            return self._size
+
+    def clear(self) -> None:
+        """Clear all vectors."""
+        with self._lock:
+            self._reset()
+
+    def list_ids(self) -> list[str]:
+        """List all vector IDs."""
+        with self._lock:
+            return list(self._ids)
+
+    @property
+    def dimension(self) -> int | None:
+        """Embedding dimension, fixed by the first insert if not given."""
+        return self._dimension
+
+    def __len__(self) -> int:
+        return self.count()
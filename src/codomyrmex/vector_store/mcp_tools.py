@@ -54,24 +54,29 @@ def vector_add(
     category="vector_store",
     description=(
         "Search the in-process vector store for the k most similar vectors to a query embedding. "
+        "Optionally restrict results with a metadata filter such as "
+        '{"source": "paper", "year": {"$gte": 2020}}. '
         "Returns a list of results with id, score, and metadata."
     ),
 )
 def vector_search(
     query_embedding: list[float],
     k: int = 5,
+    where: dict | None = None,
 ) -> list[dict]:
     """Find the *k* most similar vectors to *query_embedding*.
 
     Args:
         query_embedding: Float query vector to search with.
         k: Maximum number of results to return (default 5).
+        where: Optional metadata filter (equality, ``$in``/``$nin``,
+            ``$gt``/``$gte``/``$lt``/``$lte``, ``$and``/``$or``).
 
     Returns:
         list of dicts with ``id``, ``score``, and ``metadata`` keys,
         sorted best-match first.
     """
-    results = _get_store().search(query_embedding, k=k)
+    results = _get_store().search(query_embedding, k=k, where=where)
     return [{"id": r.id, "score": r.score, "metadata": r.metadata} for r in results]
 
 
@@ -0,0 +1,624 @@
+"""
+Memory-Mapped Vector Store
+
+Binary persistent vector storage. A directory holds a compacted snapshot
+(a float32 ``.npy`` vector block opened with ``mmap``, a norms block, an
+id/metadata JSON-lines sidecar and two binary indexes over it) plus an
+append-only write-ahead log of the puts and deletes made since the
+snapshot. Opening the store maps the snapshot without reading it and
+replays only the log; ids and metadata are decoded per row on demand.
+Each write appends one log record. ``compact`` folds the log into a new
+snapshot.
+
+Layout::
+
+    <path>/manifest.json          format version, metric, dimension, generation
+    <path>/vectors-<gen>.npy      float32 rows (unit-normalized for cosine)
+    <path>/norms-<gen>.npy        per-row norm data for the metric
+    <path>/entries-<gen>.jsonl    {"id": ..., "metadata": ...} per row
+    <path>/offsets-<gen>.npy      int64 byte offset of each sidecar line
+    <path>/lookup-<gen>.npy       uint64 id hashes, sorted, and their rows
+    <path>/wal.log                append-only records since the snapshot
+
+Every snapshot file is fsynced before the manifest is replaced, and the
+manifest is replaced atomically and is the commit point of a compaction,
+so a crash mid-compaction leaves the previous snapshot in place;
+replaying a log over a newer snapshot is idempotent.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from codomyrmex.logging_monitoring import get_logger
+
+from .filters import MetadataIndex
+from .matrix import (
+    _METRICS,
+    MatrixVectorStore,
+    _score_rows,
+    _top_k_indices,
+    np,
+)
+from .models import SearchResult, VectorEntry
+from .store import VectorStore
+
+logger = get_logger(__name__)
+
+_FORMAT_VERSION = 1
+_MANIFEST_FILE = "manifest.json"
+_WAL_FILE = "wal.log"
+_OP_PUT = 1
+_OP_DELETE = 2
+_CRC = struct.Struct("<I")
+# op, id length, metadata length, dimension
+_RECORD = struct.Struct("<BIII")
+_COPY_CHUNK = 65_536
+
+
+def _id_hash(row_id: str) -> int:
+    """Stable 64-bit hash of an id for the snapshot lookup table."""
+    digest = hashlib.blake2b(row_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file, or a directory entry on POSIX, to stable storage."""
+    if path.is_dir() and os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _lookup_table(hashes: Any) -> Any:
+    """Stack id hashes sorted ascending over the rows they belong to."""
+    order = np.argsort(hashes, kind="stable")
+    return np.stack([hashes[order], order.astype(np.uint64)])
+
+
+def _save_array(path: Path, array: Any) -> None:
+    """Write an ``.npy`` file and fsync it."""
+    with open(path, "wb") as f:
+        np.save(f, array)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class MmapVectorStore(VectorStore):
+    """Persistent vector store with a memory-mapped snapshot and a WAL.
+
+    Writes go to an in-memory ``MatrixVectorStore`` overlay and are
+    appended to the write-ahead log; deletes of snapshot rows only flip a
+    liveness bit. Searches score the mapped snapshot and the overlay and
+    merge the two top-k lists. Every ``compact_interval`` log records the
+    store is compacted automatically.
+
+    Example::
+
+        store = MmapVectorStore("data/embeddings", distance_metric="cosine")
+        store.add("doc-1", embedding, {"source": "paper"})
+        results = store.search(query, k=10)
+        store.compact()
+        store.close()
+    """
+
+    def __init__(
+        self,
+        path: str,
+        distance_metric: str = "cosine",
+        compact_interval: int | None = 10_000,
+        sync_writes: bool = False,
+    ):
+        if np is None:
+            raise ImportError(
+                "numpy is not installed. Install it with `uv sync --extra scientific` "
+                "to use MmapVectorStore."
+            )
+        if distance_metric not in _METRICS:
+            raise ValueError(f"Unknown distance metric: {distance_metric}")
+
+        self._path = Path(path)
+        self._distance_metric = distance_metric
+        self._higher_is_better = distance_metric != "euclidean"
+        self._compact_interval = compact_interval
+        self._sync_writes = sync_writes
+        self._lock = threading.RLock()
+        self._generation = 0
+        self._dimension: int | None = None
+        self._wal_records = 0
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._load_snapshot()
+        self._overlay = MatrixVectorStore(distance_metric, dimension=self._dimension)
+        self._replay_wal()
+        self._wal = open(self._wal_path, "ab")
+
+    # ── Files ────────────────────────────────────────────────────────
+
+    @property
+    def _wal_path(self) -> Path:
+        return self._path / _WAL_FILE
+
+    def _snapshot_paths(self, generation: int) -> tuple[Path, ...]:
+        return (
+            self._path / f"vectors-{generation}.npy",
+            self._path / f"norms-{generation}.npy",
+            self._path / f"entries-{generation}.jsonl",
+            self._path / f"offsets-{generation}.npy",
+            self._path / f"lookup-{generation}.npy",
+        )
+
+    def _clear_base(self) -> None:
+        """Forget the mapped snapshot."""
+        entries = getattr(self, "_base_entries", None)
+        if entries is not None:
+            entries.close()
+            self._base_entries_file.close()
+        self._base: Any = None
+        self._base_norms: Any = None
+        self._base_entries: mmap.mmap | None = None
+        self._base_offsets: Any = None
+        self._base_hashes: Any = None
+        self._base_slots: Any = None
+        self._base_size = 0
+        self._base_rows: dict[int, tuple[str, dict[str, Any]]] = {}
+        self._base_metadata_index: MetadataIndex | None = None
+        self._base_live: Any = None
+        self._base_live_count = 0
+
+    def _load_snapshot(self) -> None:
+        """Map the current snapshot, if any, without decoding its rows."""
+        self._clear_base()
+        manifest_path = self._path / _MANIFEST_FILE
+        if not manifest_path.exists():
+            return
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get("distance_metric") != self._distance_metric:
+            raise ValueError(
+                f"Store at {self._path} uses distance metric "
+                f"{manifest.get('distance_metric')!r}, not {self._distance_metric!r}"
+            )
+        self._generation = manifest["generation"]
+        self._dimension = manifest["dimension"]
+        if manifest["count"] == 0:
+            return
+
+        paths = self._snapshot_paths(self._generation)
+        vectors_path, norms_path, entries_path, offsets_path, lookup_path = paths
+        self._base = np.load(vectors_path, mmap_mode="r")
+        self._base_norms = np.load(norms_path, mmap_mode="r")
+        self._base_offsets = np.load(offsets_path, mmap_mode="r")
+        lookup = np.load(lookup_path, mmap_mode="r")
+        self._base_hashes, self._base_slots = lookup[0], lookup[1]
+        self._base_entries_file = open(entries_path, "rb")
+        self._base_entries = mmap.mmap(
+            self._base_entries_file.fileno(), 0, access=mmap.ACCESS_READ
+        )
+        self._base_size = manifest["count"]
+        self._base_live = np.ones(self._base_size, dtype=bool)
+        self._base_live_count = self._base_size
+
+    # ── Write-ahead log ──────────────────────────────────────────────
+
+    def _replay_wal(self) -> None:
+        """Apply log records written since the snapshot, dropping a torn tail."""
+        if not self._wal_path.exists():
+            return
+        data = self._wal_path.read_bytes()
+        offset = 0
+        head = _CRC.size + _RECORD.size
+        while offset + head <= len(data):
+            (crc,) = _CRC.unpack_from(data, offset)
+            op, id_len, meta_len, dim = _RECORD.unpack_from(data, offset + _CRC.size)
+            end = offset + head + id_len + meta_len + dim * 4
+            if end > len(data) or zlib.crc32(data[offset + _CRC.size : end]) != crc:
+                break
+            pos = offset + head
+            row_id = data[pos : pos + id_len].decode("utf-8")
+            pos += id_len
+            if op == _OP_PUT:
+                metadata = json.loads(data[pos : pos + meta_len])
+                pos += meta_len
+                row = np.frombuffer(data, dtype=np.float32, count=dim, offset=pos)
+                self._apply_put(row_id, row, metadata)
+            elif op == _OP_DELETE:
+                self._apply_delete(row_id)
+            self._wal_records += 1
+            offset = end
+
+        if offset < len(data):
+            logger.warning(
+                "Truncating %d trailing bytes of incomplete WAL record in %s",
+                len(data) - offset,
+                self._wal_path,
+            )
+            with open(self._wal_path, "r+b") as f:
+                f.truncate(offset)
+
+    def _append(
+        self,
+        op: int,
+        row_id: str,
+        row: Any = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Append one record to the log. Caller holds the lock."""
+        id_bytes = row_id.encode("utf-8")
+        meta_bytes = json.dumps(metadata).encode("utf-8") if op == _OP_PUT else b""
+        vec_bytes = row.tobytes() if row is not None else b""
+        body = (
+            _RECORD.pack(op, len(id_bytes), len(meta_bytes), len(vec_bytes) // 4)
+            + id_bytes
+            + meta_bytes
+            + vec_bytes
+        )
+        self._wal.write(_CRC.pack(zlib.crc32(body)) + body)
+        self._wal.flush()
+        if self._sync_writes:
+            os.fsync(self._wal.fileno())
+        self._wal_records += 1
+
+    def _maybe_compact(self) -> None:
+        if self._compact_interval and self._wal_records >= self._compact_interval:
+            self.compact()
+
+    def _kill_base_row(self, row_id: str) -> bool:
+        """Mark a snapshot row dead; return whether it was live."""
+        slot = self._base_slot(row_id)
+        if slot is None or not self._base_live[slot]:
+            return False
+        self._base_live[slot] = False
+        self._base_live_count -= 1
+        if self._base_metadata_index is not None:
+            self._base_metadata_index.remove(slot)
+        return True
+
+    def _apply_put(self, row_id: str, row: Any, metadata: dict[str, Any]) -> None:
+        self._kill_base_row(row_id)
+        self._overlay.add(row_id, row, metadata)
+        self._dimension = self._overlay.dimension
+
+    def _apply_delete(self, row_id: str) -> bool:
+        return self._overlay.delete(row_id) or self._kill_base_row(row_id)
+
+    # ── Snapshot rows ────────────────────────────────────────────────
+
+    def _base_row(self, slot: int) -> tuple[str, dict[str, Any]]:
+        """Decode (and cache) the id and metadata of a snapshot row."""
+        row = self._base_rows.get(slot)
+        if row is None:
+            start = int(self._base_offsets[slot])
+            end = int(self._base_offsets[slot + 1])
+            item = json.loads(self._base_entries[start:end])
+            row = self._base_rows[slot] = (item["id"], item.get("metadata", {}))
+        return row
+
+    def _base_slot(self, row_id: str) -> int | None:
+        """Find the snapshot row holding ``row_id`` via the hash lookup table."""
+        if not self._base_size:
+            return None
+        key = np.uint64(_id_hash(row_id))
+        pos = int(np.searchsorted(self._base_hashes, key))
+        while pos < self._base_size and self._base_hashes[pos] == key:
+            slot = int(self._base_slots[pos])
+            if self._base_row(slot)[0] == row_id:
+                return slot
+            pos += 1
+        return None
+
+    def _base_where_index(self) -> MetadataIndex:
+        """Metadata index over live snapshot rows keyed by slot, built on first use."""
+        if self._base_metadata_index is None:
+            index = MetadataIndex()
+            for slot in np.flatnonzero(self._base_live).tolist():
+                index.add(slot, self._base_row(slot)[1])
+            self._base_metadata_index = index
+        return self._base_metadata_index
+
+    def _base_embedding(self, slot: int) -> list[float]:
+        row = np.array(self._base[slot], dtype=np.float32)
+        if self._distance_metric == "cosine":
+            row = row * self._base_norms[slot]
+        return row.tolist()
+
+    def _base_search(
+        self,
+        block: Any,
+        k: int,
+        filter_fn: Callable[[dict[str, Any]], bool] | None,
+        where: dict[str, Any] | None,
+    ) -> list[list[SearchResult]]:
+        """Top-k over live snapshot rows for each query in ``block``."""
+        if self._base_live_count == 0:
+            return [[] for _ in range(block.shape[0])]
+        if where is not None:
+            found = self._base_where_index().candidates(where)
+            slots = np.sort(np.fromiter(found, dtype=np.intp, count=len(found)))
+        else:
+            slots = np.flatnonzero(self._base_live)
+        if filter_fn is not None and slots.size:
+            keep = np.fromiter(
+                (filter_fn(self._base_row(i)[1]) for i in slots.tolist()),
+                dtype=bool,
+                count=slots.size,
+            )
+            slots = slots[keep]
+        if slots.size == 0:
+            return [[] for _ in range(block.shape[0])]
+        if slots.size == self._base_size:
+            scores = _score_rows(
+                self._distance_metric, block, self._base, self._base_norms
+            )
+        else:
+            scores = _score_rows(
+                self._distance_metric,
+                block,
+                self._base[slots],
+                self._base_norms[slots],
+            )
+
+        batches = []
+        for row_scores in scores:
+            order = _top_k_indices(row_scores, k, self._higher_is_better)
+            batch = []
+            for pos in order.tolist():
+                slot = int(slots[pos])
+                row_id, metadata = self._base_row(slot)
+                batch.append(
+                    SearchResult(
+                        id=row_id,
+                        score=float(row_scores[pos]),
+                        embedding=self._base_embedding(slot),
+                        metadata=metadata,
+                    )
+                )
+            batches.append(batch)
+        return batches
+
+    # ── VectorStore interface ────────────────────────────────────────
+
+    def add(
+        self, id: str, embedding: list[float], metadata: dict[str, Any] | None = None
+    ) -> None:
+        """Add a vector; appends one WAL record."""
+        row = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        with self._lock:
+            if self._dimension is not None and row.shape[0] != self._dimension:
+                raise ValueError(
+                    f"Embedding dimension {row.shape[0]} does not match store "
+                    f"dimension {self._dimension}"
+                )
+            meta = metadata or {}
+            self._append(_OP_PUT, id, row, meta)
+            self._apply_put(id, row, meta)
+            self._maybe_compact()
+
+    def get(self, id: str) -> VectorEntry | None:
+        """Get a vector by ID."""
+        with self._lock:
+            entry = self._overlay.get(id)
+            if entry is not None:
+                return entry
+            slot = self._base_slot(id)
+            if slot is None or not self._base_live[slot]:
+                return None
+            return VectorEntry(
+                id=id,
+                embedding=self._base_embedding(slot),
+                metadata=self._base_row(slot)[1],
+            )
+
+    def delete(self, id: str) -> bool:
+        """Delete a vector; appends one WAL record if it existed."""
+        with self._lock:
+            if not self._apply_delete(id):
+                return False
+            self._append(_OP_DELETE, id)
+            self._maybe_compact()
+            return True
+
+    def search(
+        self,
+        query: list[float],
+        k: int = 10,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
+    ) -> list[SearchResult]:
+        """Search the mapped snapshot and the in-memory overlay."""
+        return self.search_batch([query], k, filter_fn, where)[0]
+
+    def search_batch(
+        self,
+        queries: list[list[float]],
+        k: int = 10,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for many queries, merging snapshot and overlay top-k."""
+        if len(queries) == 0:
+            return []
+        block = np.asarray(queries, dtype=np.float32)
+        if block.ndim == 1:
+            block = block.reshape(1, -1)
+        with self._lock:
+            if k <= 0 or self.count() == 0:
+                return [[] for _ in range(block.shape[0])]
+            if block.shape[1] != self._dimension:
+                raise ValueError(
+                    f"Query dimension {block.shape[1]} does not match store "
+                    f"dimension {self._dimension}"
+                )
+            base = self._base_search(block, k, filter_fn, where)
+            overlay = self._overlay.search_batch(block, k, filter_fn, where)
+        merged = []
+        for a, b in zip(base, overlay, strict=True):
+            combined = a + b
+            combined.sort(key=lambda r: r.score, reverse=self._higher_is_better)
+            merged.append(combined[:k])
+        return merged
+
+    def count(self) -> int:
+        """Get total number of live vectors."""
+        with self._lock:
+            return self._base_live_count + self._overlay.count()
+
+    def list_ids(self) -> list[str]:
+        """List all live vector IDs."""
+        with self._lock:
+            ids = []
+            if self._base_live_count:
+                ids = [
+                    self._base_row(i)[0]
+                    for i in np.flatnonzero(self._base_live).tolist()
+                ]
+            return ids + self._overlay.list_ids()
+
+    def clear(self) -> None:
+        """Remove all vectors and their files."""
+        with self._lock:
+            old_generation = self._generation
+            self._clear_base()
+            self._dimension = None
+            self._overlay = MatrixVectorStore(self._distance_metric)
+            self._generation += 1
+            self._write_manifest(0)
+            self._remove_snapshot(old_generation)
+            self._truncate_wal()
+
+    def flush(self) -> None:
+        """Force the write-ahead log to stable storage."""
+        with self._lock:
+            self._wal.flush()
+            os.fsync(self._wal.fileno())
+
+    def compact(self) -> None:
+        """Fold the write-ahead log into a new memory-mapped snapshot."""
+        with self._lock:
+            live = (
+                np.flatnonzero(self._base_live)
+                if self._base_live_count
+                else np.zeros(0, dtype=np.intp)
+            )
+            overlay = self._overlay
+            overlay_size = overlay.count()
+            total = live.size + overlay_size
+            generation = self._generation + 1
+            paths = self._snapshot_paths(generation)
+            vectors_path, norms_path = paths[0], paths[1]
+
+            if total:
+                dim = self._dimension
+                vectors = np.lib.format.open_memmap(
+                    vectors_path, mode="w+", dtype=np.float32, shape=(total, dim)
+                )
+                norms = np.lib.format.open_memmap(
+                    norms_path, mode="w+", dtype=np.float32, shape=(total,)
+                )
+                for start in range(0, live.size, _COPY_CHUNK):
+                    chunk = live[start : start + _COPY_CHUNK]
+                    vectors[start : start + chunk.size] = self._base[chunk]
+                    norms[start : start + chunk.size] = self._base_norms[chunk]
+                vectors[live.size :] = overlay._matrix[:overlay_size]
+                norms[live.size :] = overlay._norms[:overlay_size]
+                vectors.flush()
+                norms.flush()
+                del vectors, norms
+                _fsync_path(vectors_path)
+                _fsync_path(norms_path)
+                self._write_entries(paths, live, overlay)
+
+            old_generation = self._generation
+            self._generation = generation
+            self._write_manifest(total)
+            self._clear_base()
+            self._remove_snapshot(old_generation)
+            self._truncate_wal()
+            self._load_snapshot()
+            self._overlay = MatrixVectorStore(
+                self._distance_metric, dimension=self._dimension
+            )
+
+    def close(self) -> None:
+        """Flush and close the write-ahead log and unmap the snapshot."""
+        with self._lock:
+            if not self._wal.closed:
+                self._wal.flush()
+                self._wal.close()
+            self._clear_base()
+
+    # ── Helpers ──────────────────────────────────────────────────────
+
+    def _write_entries(
+        self, paths: tuple[Path, ...], live: Any, overlay: MatrixVectorStore
+    ) -> None:
+        """Write the sidecar and its offset and lookup indexes for a snapshot.
+
+        Surviving snapshot rows are copied as raw sidecar bytes and keep
+        their id hashes, so compaction never decodes them.
+        """
+        _, _, entries_path, offsets_path, lookup_path = paths
+        total = live.size + overlay.count()
+        offsets = np.empty(total + 1, dtype=np.int64)
+        hashes = np.empty(total, dtype=np.uint64)
+        pos = 0
+        with open(entries_path, "wb") as f:
+            if live.size:
+                slot_hashes = np.empty(self._base_size, dtype=np.uint64)
+                slot_hashes[self._base_slots.astype(np.intp)] = self._base_hashes
+                hashes[: live.size] = slot_hashes[live]
+                starts = self._base_offsets[live].tolist()
+                ends = self._base_offsets[live + 1].tolist()
+                for i, (start, end) in enumerate(zip(starts, ends, strict=True)):
+                    offsets[i] = pos
+                    f.write(self._base_entries[start:end])
+                    pos += end - start
+            rows = zip(overlay._ids, overlay._metadata, strict=True)
+            for i, (row_id, meta) in enumerate(rows, start=live.size):
+                line = (json.dumps({"id": row_id, "metadata": meta}) + "\n").encode(
+                    "utf-8"
+                )
+                offsets[i] = pos
+                hashes[i] = _id_hash(row_id)
+                f.write(line)
+                pos += len(line)
+            offsets[total] = pos
+            f.flush()
+            os.fsync(f.fileno())
+        _save_array(offsets_path, offsets)
+        _save_array(lookup_path, _lookup_table(hashes))
+
+    def _write_manifest(self, count: int) -> None:
+        """Atomically replace the manifest; this commits a snapshot."""
+        manifest = {
+            "version": _FORMAT_VERSION,
+            "distance_metric": self._distance_metric,
+            "dimension": self._dimension,
+            "count": count,
+            "generation": self._generation,
+        }
+        tmp = self._path / (_MANIFEST_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(manifest))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._path / _MANIFEST_FILE)
+        _fsync_path(self._path)
+
+    def _remove_snapshot(self, generation: int) -> None:
+        for file in self._snapshot_paths(generation):
+            file.unlink(missing_ok=True)
+
+    def _truncate_wal(self) -> None:
+        self._wal.close()
+        self._wal = open(self._wal_path, "wb")
+        self._wal_records = 0
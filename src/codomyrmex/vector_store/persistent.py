@@ -2,6 +2,9 @@
 Persistent Vector Store
 
 File-backed vector storage for persistence across restarts.
+
+``PersistentVectorStore`` rewrites one JSON document per save; for large
+stores use ``mmap_store.MmapVectorStore`` (mmap snapshot + write-ahead log).
 """
 
 import json
@@ -19,6 +22,7 @@ from . import (
     VectorStore,
 )
 from ._search_mixin import _SearchMixin
+from .filters import MetadataIndex
 
 logger = get_logger(__name__)
 
@@ -54,6 +58,7 @@ class PersistentVectorStore(_SearchMixin, VectorStore):
 
         self._distance_metric = distance_metric
         self._vectors: dict[str, VectorEntry] = {}
+        self._metadata_index = MetadataIndex()
 
         # Load existing data
         self._load()
@@ -72,6 +77,7 @@ class PersistentVectorStore(_SearchMixin, VectorStore):
                         metadata=item.get("metadata", {}),
                     )
                     self._vectors[entry.id] = entry
+                    self._metadata_index.add(entry.id, entry.metadata)
             except (json.JSONDecodeError, KeyError) as e:
                 logger.warning("Failed to load vector store from %s: %s", self._path, e)
 
@@ -115,6 +121,7 @@ class PersistentVectorStore(_SearchMixin, VectorStore):
                 embedding=embedding,
                 metadata=metadata or {},
             )
+            self._metadata_index.add(id, metadata or {})
             self._maybe_save()
 
     def get(self, id: str) -> VectorEntry | None:
@@ -127,6 +134,7 @@ class PersistentVectorStore(_SearchMixin, VectorStore):
         with self._lock:
             if id in self._vectors:
                 del self._vectors[id]
+                self._metadata_index.remove(id)
                 self._maybe_save()
                 return True
         return False
@@ -140,6 +148,7 @@ class PersistentVectorStore(_SearchMixin, VectorStore):
         """Clear all vectors."""
         with self._lock:
             self._vectors.clear()
+            self._metadata_index.clear()
             if self._auto_save:
                 self._save()
 
@@ -217,9 +226,10 @@ class CachedVectorStore(VectorStore):
         query: list[float],
         k: int = 10,
         filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
         """Search (not cached)."""
-        return self._backend.search(query, k, filter_fn)
+        return self._backend.search(query, k, filter_fn, where=where)
 
     def count(self) -> int:
         """Count."""
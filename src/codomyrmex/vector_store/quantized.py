@@ -0,0 +1,436 @@
+"""
+Quantized Vector Store
+
+Compressed vector storage for memory-bound workloads. Rows are encoded
+with int8 scalar quantization (one byte per dimension) or product
+quantization (one byte per subspace), scanned with asymmetric distance
+computation against the full-precision query, and the best candidates
+are re-ranked exactly against the original rows.
+"""
+
+import tempfile
+from collections.abc import Callable
+from typing import Any
+
+from .ivf import _kmeans, _nearest_centroids
+from .matrix import MatrixVectorStore, _score_rows, _top_k_indices, np
+from .models import SearchResult
+
+_METHODS = ("int8", "pq")
+_ORIGINALS = ("disk", "memory")
+_ADC_CHUNK = 16_384
+
+
+class ScalarQuantizer:
+    """Per-dimension int8 scalar quantizer.
+
+    Each dimension's training range ``[min, max]`` is mapped linearly onto
+    the 256 int8 levels; values outside the range are clipped.
+    """
+
+    def __init__(self) -> None:
+        self._low: Any = None
+        self._step: Any = None
+
+    @property
+    def code_size(self) -> int:
+        """Bytes per encoded vector."""
+        return int(self._low.shape[0])
+
+    @property
+    def code_dtype(self) -> Any:
+        return np.int8
+
+    def fit(self, data: Any) -> None:
+        """Learn the per-dimension ranges from ``data``."""
+        low = data.min(axis=0)
+        span = data.max(axis=0) - low
+        self._low = low.astype(np.float32)
+        self._step = (np.where(span < 1e-12, 1.0, span) / 255.0).astype(np.float32)
+
+    def encode(self, rows: Any) -> Any:
+        """Encode float rows as int8 codes."""
+        levels = np.rint((rows - self._low) / self._step) - 128.0
+        return np.clip(levels, -128, 127).astype(np.int8)
+
+    def decode(self, codes: Any) -> Any:
+        """Reconstruct approximate float rows from int8 codes."""
+        return (codes.astype(np.float32) + 128.0) * self._step + self._low
+
+    def scores(self, metric: str, queries: Any, codes: Any) -> Any:
+        """Score float queries against encoded rows.
+
+        Inner products are folded into the code domain,
+        ``q . x ~= codes @ (q * step) + q . (low + 128 * step)``, so the
+        codes are never decoded for cosine and dot-product scoring.
+        """
+        if metric == "euclidean":
+            rows = self.decode(codes)
+            return _score_rows(metric, queries, rows, np.einsum("ij,ij->i", rows, rows))
+        if metric == "cosine":
+            q_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.where(q_norms == 0, 1.0, q_norms)
+        offset = queries @ (self._low + 128.0 * self._step)
+        return (queries * self._step) @ codes.T.astype(np.float32) + offset[:, None]
+
+
+class ProductQuantizer:
+    """Product quantizer with 256 centroids per subspace.
+
+    Vectors are split into ``n_subspaces`` equal slices and each slice is
+    replaced by the id of its nearest k-means centroid, so a vector costs
+    one byte per subspace. Queries are scored with per-subspace lookup
+    tables (asymmetric distance computation): the query itself is never
+    quantized.
+    """
+
+    def __init__(self, n_subspaces: int, iterations: int = 20, seed: int = 0):
+        self._n_subspaces = n_subspaces
+        self._iterations = iterations
+        self._seed = seed
+        self._codebooks: list[Any] = []
+
+    @property
+    def code_size(self) -> int:
+        """Bytes per encoded vector."""
+        return self._n_subspaces
+
+    @property
+    def code_dtype(self) -> Any:
+        return np.uint8
+
+    def _slices(self, rows: Any) -> Any:
+        """View ``(n, d)`` rows as ``(n, n_subspaces, d / n_subspaces)``."""
+        return rows.reshape(rows.shape[0], self._n_subspaces, -1)
+
+    def fit(self, data: Any) -> None:
+        """Train one 256-centroid codebook per subspace on ``data``."""
+        parts = self._slices(data)
+        self._codebooks = [
+            _kmeans(
+                np.ascontiguousarray(parts[:, j]),
+                256,
+                self._iterations,
+                self._seed + j,
+                spherical=False,
+            )
+            for j in range(self._n_subspaces)
+        ]
+
+    def encode(self, rows: Any) -> Any:
+        """Encode float rows as one centroid id per subspace."""
+        parts = self._slices(rows)
+        codes = np.empty((rows.shape[0], self._n_subspaces), dtype=np.uint8)
+        for j, book in enumerate(self._codebooks):
+            codes[:, j] = _nearest_centroids(parts[:, j], book, 1, False)[:, 0]
+        return codes
+
+    def decode(self, codes: Any) -> Any:
+        """Reconstruct approximate float rows from centroid ids."""
+        return np.concatenate(
+            [book[codes[:, j]] for j, book in enumerate(self._codebooks)], axis=1
+        )
+
+    def scores(self, metric: str, queries: Any, codes: Any) -> Any:
+        """Score float queries against encoded rows via lookup tables."""
+        if metric == "cosine":
+            q_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.where(q_norms == 0, 1.0, q_norms)
+        parts = self._slices(queries)
+        out = np.zeros((queries.shape[0], codes.shape[0]), dtype=np.float32)
+        for j, book in enumerate(self._codebooks):
+            table = parts[:, j] @ book.T
+            if metric == "euclidean":
+                q_sq = np.einsum("ij,ij->i", parts[:, j], parts[:, j])[:, None]
+                c_sq = np.einsum("ij,ij->i", book, book)[None, :]
+                table = q_sq - 2.0 * table + c_sq
+            out += table[:, codes[:, j]]
+        if metric == "euclidean":
+            return np.sqrt(np.maximum(out, 0.0))
+        return out
+
+
+class QuantizedVectorStore(MatrixVectorStore):
+    """Vector store that scans compressed codes and re-ranks exactly.
+
+    ``method="int8"`` stores one signed byte per dimension (4x smaller
+    than float32); ``method="pq"`` stores one byte per subspace, e.g. 16
+    bytes for a 384-dimensional vector with ``pq_subspaces=16``. Search
+    scores every candidate against its code, keeps the best
+    ``k * rerank`` and re-scores those against the full-precision rows,
+    so returned scores are exact. ``rerank=0`` returns the approximate
+    scores directly.
+
+    The full-precision rows are still needed for re-ranking and ``get``.
+    By default (``originals="disk"``) they are kept in an unlinked
+    temporary file in ``originals_dir`` (the system temp directory if
+    unset) mapped into memory, so only the codes stay resident and
+    re-ranking pages in just the shortlisted rows; the operating system
+    may keep hot pages cached but can reclaim them under pressure. The
+    file is scratch space, not persistence; use ``MmapVectorStore`` for
+    durable storage. ``originals="memory"`` keeps the rows in RAM next to
+    the codes, which makes re-ranking faster but costs more memory than
+    an unquantized ``MatrixVectorStore``.
+
+    Until ``train_size`` vectors have been added the quantizer is
+    untrained and searches are exact.
+
+    Example::
+
+        store = QuantizedVectorStore(method="pq", pq_subspaces=16)
+        store.add_batch(entries)  # trains once train_size is reached
+        results = store.search(query, k=10)
+        approx = store.search(query, k=10, rerank=0)  # codes only
+    """
+
+    def __init__(
+        self,
+        distance_metric: str = "cosine",
+        method: str = "int8",
+        dimension: int | None = None,
+        *,
+        pq_subspaces: int = 8,
+        rerank: int = 4,
+        train_size: int = 1024,
+        originals: str = "disk",
+        originals_dir: str | None = None,
+        kmeans_iterations: int = 20,
+        seed: int = 0,
+        initial_capacity: int = 1024,
+    ):
+        if method not in _METHODS:
+            raise ValueError(f"Unknown quantization method: {method}")
+        if pq_subspaces < 1:
+            raise ValueError("pq_subspaces must be at least 1")
+        if rerank < 0:
+            raise ValueError("rerank must be non-negative")
+        if originals not in _ORIGINALS:
+            raise ValueError(f"Unknown originals storage: {originals}")
+        self._method = method
+        self._pq_subspaces = pq_subspaces
+        self.rerank = rerank
+        self._train_size = max(1, train_size)
+        self._originals = originals
+        self._originals_dir = originals_dir
+        self._kmeans_iterations = kmeans_iterations
+        self._seed = seed
+        if dimension is not None:
+            self._check_dimension(dimension)
+        super().__init__(
+            distance_metric=distance_metric,
+            dimension=dimension,
+            initial_capacity=initial_capacity,
+        )
+
+    # ── Storage ──────────────────────────────────────────────────────
+
+    def _reset(self) -> None:
+        """Drop all rows, codes and the trained quantizer."""
+        super()._reset()
+        self._quantizer: Any = None
+        self._codes: Any = None
+
+    def _check_dimension(self, dim: int) -> None:
+        if self._method == "pq" and dim % self._pq_subspaces:
+            raise ValueError(
+                f"Embedding dimension {dim} is not divisible by "
+                f"pq_subspaces={self._pq_subspaces}"
+            )
+
+    def _allocate(self, capacity: int, dim: int) -> Any:
+        """Allocate original-row storage, file-backed unless kept in memory."""
+        if self._originals == "memory" or dim == 0:
+            return super()._allocate(capacity, dim)
+        handle = tempfile.TemporaryFile(dir=self._originals_dir)
+        with handle:
+            return np.memmap(handle, dtype=np.float32, mode="w+", shape=(capacity, dim))
+
+    def _ensure_dimension(self, dim: int) -> None:
+        if self._dimension is None:
+            self._check_dimension(dim)
+        super()._ensure_dimension(dim)
+
+    def _ensure_capacity(self, needed: int) -> None:
+        super()._ensure_capacity(needed)
+        if self._codes is not None and self._codes.shape[0] < self._matrix.shape[0]:
+            codes = np.zeros(
+                (self._matrix.shape[0], self._codes.shape[1]), dtype=self._codes.dtype
+            )
+            codes[: self._size] = self._codes[: self._size]
+            self._codes = codes
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the quantizer has been trained."""
+        return self._quantizer is not None
+
+    @property
+    def method(self) -> str:
+        """Quantization method, ``"int8"`` or ``"pq"``."""
+        return self._method
+
+    @property
+    def code_size(self) -> int | None:
+        """Bytes per encoded vector, or ``None`` before the dimension is known."""
+        if self._dimension is None:
+            return None
+        if self._method == "pq":
+            return self._pq_subspaces
+        return self._dimension
+
+    def memory_usage(self) -> dict[str, Any]:
+        """Report the bytes held by codes and by full-precision rows.
+
+        Returns:
+            Dict with ``code_bytes``, ``original_bytes``,
+            ``originals_on_disk`` and ``resident_bytes`` (codes plus any
+            originals held in RAM).
+        """
+        with self._lock:
+            dim = self._dimension or 0
+            code_bytes = self._size * (self.code_size or 0) if self.is_trained else 0
+            original_bytes = self._size * dim * 4
+            on_disk = isinstance(self._matrix, np.memmap)
+            return {
+                "code_bytes": code_bytes,
+                "original_bytes": original_bytes,
+                "originals_on_disk": on_disk,
+                "resident_bytes": code_bytes + (0 if on_disk else original_bytes),
+            }
+
+    # ── Training and encoding ────────────────────────────────────────
+
+    def train(self, sample_size: int | None = None) -> None:
+        """Fit the quantizer on the stored vectors and encode every row.
+
+        Args:
+            sample_size: Optional cap on the number of rows used for
+                fitting; all rows are still encoded afterwards.
+        """
+        with self._lock:
+            if self._size == 0:
+                raise ValueError("Cannot train a quantizer on an empty store")
+            data = np.asarray(self._matrix[: self._size])
+            if sample_size is not None and sample_size < self._size:
+                rng = np.random.default_rng(self._seed)
+                data = data[np.sort(rng.choice(self._size, sample_size, replace=False))]
+            if self._method == "pq":
+                quantizer: Any = ProductQuantizer(
+                    self._pq_subspaces, self._kmeans_iterations, self._seed
+                )
+            else:
+                quantizer = ScalarQuantizer()
+            quantizer.fit(data)
+            self._quantizer = quantizer
+            self._codes = np.zeros(
+                (self._matrix.shape[0], quantizer.code_size),
+                dtype=quantizer.code_dtype,
+            )
+            for start in range(0, self._size, _ADC_CHUNK):
+                stop = min(start + _ADC_CHUNK, self._size)
+                self._codes[start:stop] = quantizer.encode(self._matrix[start:stop])
+
+    def _write_rows(
+        self,
+        ids: list[str],
+        rows: Any,
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Insert rows, then encode new or changed rows."""
+        first_new = self._size
+        existing = [self._index[i] for i in ids if i in self._index]
+        super()._write_rows(ids, rows, metadatas)
+
+        if not self.is_trained:
+            if self._size >= self._train_size:
+                self.train()
+            return
+
+        slots = sorted(set(existing)) + list(range(first_new, self._size))
+        self._codes[slots] = self._quantizer.encode(self._matrix[slots])
+
+    def delete(self, id: str) -> bool:
+        """Delete a vector, back-filling its code with the last row's."""
+        with self._lock:
+            slot = self._index.get(id)
+            if slot is None:
+                return False
+            if self.is_trained:
+                self._codes[slot] = self._codes[self._size - 1]
+            return super().delete(id)
+
+    # ── Search ───────────────────────────────────────────────────────
+
+    def _approx_scores(self, queries: Any, slots: Any) -> Any:
+        """Score a query block against the codes of the selected rows."""
+        codes = self._codes[: self._size] if slots is None else self._codes[slots]
+        return np.concatenate(
+            [
+                self._quantizer.scores(
+                    self._distance_metric, queries, codes[i : i + _ADC_CHUNK]
+                )
+                for i in range(0, codes.shape[0], _ADC_CHUNK)
+            ],
+            axis=1,
+        )
+
+    def search(
+        self,
+        query: list[float],
+        k: int = 10,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
+        rerank: int | None = None,
+    ) -> list[SearchResult]:
+        """Search the codes, then re-rank the shortlist exactly."""
+        return self.search_batch([query], k, filter_fn, where, rerank)[0]
+
+    def search_batch(
+        self,
+        queries: list[list[float]],
+        k: int = 10,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
+        rerank: int | None = None,
+    ) -> list[list[SearchResult]]:
+        """Approximate search for many queries with exact re-ranking.
+
+        Args:
+            queries: Query embeddings, one per row.
+            k: Number of results per query.
+            filter_fn: Optional metadata predicate applied before scoring.
+            where: Optional declarative metadata filter.
+            rerank: Shortlist size as a multiple of ``k`` (defaults to
+                ``self.rerank``); ``0`` skips re-ranking.
+
+        Returns:
+            One ranked result list per query, in query order.
+        """
+        with self._lock:
+            if not self.is_trained:
+                return super().search_batch(queries, k, filter_fn, where)
+            if len(queries) == 0:
+                return []
+            block = self._as_matrix(queries)
+            if k <= 0:
+                return [[] for _ in range(block.shape[0])]
+            if block.shape[1] != self._dimension:
+                raise ValueError(
+                    f"Query dimension {block.shape[1]} does not match store "
+                    f"dimension {self._dimension}"
+                )
+            slots = self._candidate_slots(filter_fn, where)
+            if slots is not None and slots.size == 0:
+                return [[] for _ in range(block.shape[0])]
+            approx = self._approx_scores(block, slots)
+            factor = self.rerank if rerank is None else rerank
+            if factor <= 0:
+                return [self._results_for(row, slots, k) for row in approx]
+
+            batches = []
+            for query, row in zip(block, approx, strict=True):
+                top = _top_k_indices(row, k * factor, self._higher_is_better)
+                shortlist = top if slots is None else slots[top]
+                exact = self._score(query[None, :], shortlist)[0]
+                batches.append(self._results_for(exact, shortlist, k))
+            return batches
@@ -10,6 +10,7 @@ from collections.abc import Callable
 from typing import Any
 
 from ._search_mixin import _SearchMixin
+from .filters import MetadataIndex
 from .models import DistanceMetric, SearchResult, VectorEntry
 
 
@@ -36,8 +37,31 @@ class VectorStore(ABC):
         query: list[float],
         k: int = 10,
         filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
-        """Search for similar vectors."""
+        """Search for similar vectors.
+
+        Args:
+            query: Query embedding.
+            k: Number of results.
+            filter_fn: Optional metadata predicate.
+            where: Optional declarative metadata filter (see ``filters``);
+                indexed backends only score entries that match it.
+        """
+
+    def search_batch(
+        self,
+        queries: list[list[float]],
+        k: int = 10,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """Search for several queries, returning one result list per query.
+
+        Backends with a vectorized scoring path override this; the default
+        simply calls ``search`` once per query.
+        """
+        return [self.search(query, k, filter_fn, where=where) for query in queries]
 
     @abstractmethod
     def count(self) -> int:
@@ -53,6 +77,7 @@ class InMemoryVectorStore(_SearchMixin, VectorStore):
 
     def __init__(self, distance_metric: str = "cosine"):
         self._vectors: dict[str, VectorEntry] = {}
+        self._metadata_index = MetadataIndex()
         self._lock = threading.RLock()
 
         if distance_metric == "cosine":
@@ -74,6 +99,7 @@ class InMemoryVectorStore(_SearchMixin, VectorStore):
         entry = VectorEntry(id=id, embedding=embedding, metadata=metadata or {})
         with self._lock:
             self._vectors[id] = entry
+            self._metadata_index.add(id, entry.metadata)
 
     def add_batch(
         self, entries: list[tuple[str, list[float], dict[str, Any] | None]]
@@ -90,6 +116,7 @@ class InMemoryVectorStore(_SearchMixin, VectorStore):
                     embedding=embedding,
                     metadata=metadata or {},
                 )
+                self._metadata_index.add(id_val, metadata or {})
                 count += 1
         return count
 
@@ -103,6 +130,7 @@ class InMemoryVectorStore(_SearchMixin, VectorStore):
         with self._lock:
             if id in self._vectors:
                 del self._vectors[id]
+                self._metadata_index.remove(id)
                 return True
         return False
 
@@ -115,6 +143,7 @@ class InMemoryVectorStore(_SearchMixin, VectorStore):
         """Clear all vectors."""
         with self._lock:
             self._vectors.clear()
+            self._metadata_index.clear()
 
     def list_ids(self) -> list[str]:
         """List all vector IDs."""
@@ -164,9 +193,10 @@ class NamespacedVectorStore(VectorStore):
         query: list[float],
         k: int = 10,
         filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        where: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
         """Search in current namespace."""
-        return self._get_store().search(query, k, filter_fn)
+        return self._get_store().search(query, k, filter_fn, where=where)
 
     def count(self) -> int:
         """Count in current namespace."""
@@ -197,6 +227,30 @@ def create_vector_store(backend: str = "memory", **kwargs) -> VectorStore:
         return InMemoryVectorStore(**kwargs)
     if backend == "namespaced":
         return NamespacedVectorStore(**kwargs)
+    if backend == "matrix":
+        from .matrix import MatrixVectorStore, np
+
+        if np is None:
+            raise ValueError("Matrix backend requires numpy package")
+        return MatrixVectorStore(**kwargs)
+    if backend == "ivf":
+        from .ivf import IVFVectorStore, np
+
+        if np is None:
+            raise ValueError("IVF backend requires numpy package")
+        return IVFVectorStore(**kwargs)
+    if backend == "mmap":
+        from .mmap_store import MmapVectorStore, np
+
+        if np is None:
+            raise ValueError("Mmap backend requires numpy package")
+        return MmapVectorStore(**kwargs)
+    if backend == "quantized":
+        from .quantized import QuantizedVectorStore, np
+
+        if np is None:
+            raise ValueError("Quantized backend requires numpy package")
+        return QuantizedVectorStore(**kwargs)
     if backend == "chroma":
         try:
             from .chroma import ChromaVectorStore
@@ -0,0 +1,374 @@
+"""AgentMemory recall and KnowledgeMemory deduplication benchmarks.
+
+Compares ``AgentMemory.recall`` through the stores' token indexes (posting
+lists / ``memory_tokens`` table, filters applied in the store, partial
+top-k) with the previous implementation, which loaded every memory,
+filtered in Python and fully sorted the scored list; and
+``KnowledgeMemory.deduplicate`` with MinHash/LSH candidates and batched
+writes against the all-pairs comparison with a save per merge; and
+``KnowledgeMemory.recall`` re-ranking with one cached, batched
+``/api/embed`` request against one request per candidate; and stigmergy
+``tick``/``top_k`` with lazy evaporation against per-trace decay.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+import urllib.request
+
+import pytest
+
+from codomyrmex.agentic_memory import (
+    AgentMemory,
+    InMemoryStore,
+    JSONFileStore,
+    KnowledgeMemory,
+)
+from codomyrmex.agentic_memory.core.embeddings import cosine
+from codomyrmex.agentic_memory.core.memory import _recency_score, _relevance
+from codomyrmex.agentic_memory.core.models import (
+    Memory,
+    MemoryImportance,
+    MemoryType,
+    RetrievalResult,
+)
+from codomyrmex.agentic_memory.sqlite_store import SQLiteStore
+from codomyrmex.agentic_memory.stigmergy import (
+    SqliteTraceLedger,
+    StigmergyConfig,
+    TraceField,
+)
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+from tests.utils.fake_embed_server import FakeEmbedServer
+
+pytestmark = pytest.mark.performance
+
+VOCABULARY = [f"word{i}" for i in range(2000)]
+
+
+def _legacy_recall(store, query, k, memory_type=None, min_importance=None):
+    candidates = store.list_all()
+    if memory_type is not None:
+        candidates = [m for m in candidates if m.memory_type == memory_type]
+    if min_importance is not None:
+        candidates = [
+            m for m in candidates if m.importance.value >= min_importance.value
+        ]
+    results = [
+        RetrievalResult(
+            memory=m,
+            relevance_score=_relevance(query, m.content),
+            recency_score=_recency_score(m.created_at),
+            importance_score=m.importance.value / 4.0,
+        )
+        for m in candidates
+    ]
+    results.sort(key=lambda r: r.combined_score, reverse=True)
+    return results[:k]
+
+
+def _populate(store, n: int) -> None:
+    rng = random.Random(3)
+    now = time.time()
+    for i in range(n):
+        store.save(
+            Memory(
+                id=f"m{i}",
+                content=" ".join(rng.choices(VOCABULARY, k=12)),
+                memory_type=rng.choice(list(MemoryType)),
+                importance=rng.choice(list(MemoryImportance)),
+                created_at=now - rng.uniform(0, 86400),
+            )
+        )
+
+
+class TestAgentMemoryRecallBenchmarks:
+    @pytest.mark.parametrize("backend", ["in_memory", "sqlite"])
+    def test_indexed_vs_full_scan(self, tmp_path, backend):
+        n = 20000 if backend == "in_memory" else 5000
+        store = (
+            InMemoryStore()
+            if backend == "in_memory"
+            else SQLiteStore(db_path=str(tmp_path / "mem.db"))
+        )
+        _populate(store, n)
+        memory = AgentMemory(store=store)
+        query = "word7 word42 word1999"
+        filters = {"memory_type": MemoryType.SEMANTIC}
+
+        expected = _legacy_recall(store, query, 10, **filters)
+        got = memory.recall(query, k=10, **filters)
+        assert [r.combined_score for r in got] == pytest.approx(
+            [r.combined_score for r in expected], abs=1e-4
+        )
+
+        runner = BenchmarkRunner(f"AgentMemory.recall, {backend}, {n} memories")
+        runner.add(
+            "full_scan_sort",
+            lambda: _legacy_recall(store, query, 10, **filters),
+            iterations=5,
+        )
+        runner.add(
+            "token_index_topk",
+            lambda: memory.recall(query, k=10, **filters),
+            iterations=5,
+        )
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        scan_ms, indexed_ms = (r.mean_ms for r in suite.results)
+        print(f"{backend}: {scan_ms:.2f} -> {indexed_ms:.2f} ms")
+        assert indexed_ms < scan_ms
+
+
+def _legacy_merge(store, threshold: float) -> int:
+    import datetime as dt
+
+    semantic = [m for m in store.list_all() if m.memory_type == MemoryType.SEMANTIC]
+    semantic.sort(key=lambda m: m.created_at)
+    merged = 0
+    deleted_ids: set[str] = set()
+    for i, base in enumerate(semantic):
+        if base.id in deleted_ids:
+            continue
+        for candidate in semantic[i + 1 :]:
+            if candidate.id in deleted_ids:
+                continue
+            if _relevance(base.content, candidate.content) >= threshold:
+                now_str = dt.datetime.fromtimestamp(candidate.created_at).strftime(
+                    "%Y-%m-%d"
+                )
+                base.content += f"\n\n## Update ({now_str})\n\n{candidate.content}"
+                store.save(base)
+                store.delete(candidate.id)
+                deleted_ids.add(candidate.id)
+                merged += 1
+    return merged
+
+
+def _knowledge_base(path, topics: int, now: float) -> KnowledgeMemory:
+    rng = random.Random(5)
+    km = KnowledgeMemory(store=JSONFileStore(str(path)))
+    items = []
+    for t in range(topics):
+        words = rng.sample(VOCABULARY, 25)
+        items.append(f"Topic {t}\n\n" + " ".join(words))
+        if t % 4 == 0:
+            words[0] = rng.choice(VOCABULARY)
+            items.append(f"Topic {t}\n\n" + " ".join(words))
+    km._agent.store.save_many(
+        Memory(
+            id=f"k{i}",
+            content=content,
+            memory_type=MemoryType.SEMANTIC,
+            created_at=now + i,
+        )
+        for i, content in enumerate(items)
+    )
+    return km
+
+
+class TestKnowledgeDedupBenchmarks:
+    def test_lsh_vs_all_pairs(self, tmp_path):
+        topics = 1000
+        # One creation time for both bases: merges write the candidate's date
+        now = time.time()
+        legacy = _knowledge_base(tmp_path / "legacy.json", topics, now)
+        start = time.perf_counter()
+        legacy_merged = _legacy_merge(legacy._agent.store, 0.85)
+        legacy_s = time.perf_counter() - start
+
+        km = _knowledge_base(tmp_path / "lsh.json", topics, now)
+        start = time.perf_counter()
+        report = km.deduplicate(threshold=0.85)
+        lsh_s = time.perf_counter() - start
+
+        print(
+            f"\n{report.scanned} KIs: all pairs {legacy_s * 1000:.0f} ms "
+            f"({report.total_pairs} pairs), LSH {lsh_s * 1000:.0f} ms "
+            f"({report.pairs_compared} pairs), merged {report.merged}"
+        )
+        assert report.merged == legacy_merged == topics // 4
+        assert sorted(m.content for m in km._agent.store.list_all()) == sorted(
+            m.content for m in legacy._agent.store.list_all()
+        )
+        assert report.pairs_compared < report.total_pairs / 100
+        assert lsh_s < legacy_s
+
+
+def _legacy_rerank(km: KnowledgeMemory, query: str, base_url: str, k: int = 10):
+    base_results = km._agent.recall(
+        query, k=min(k * 3, 30), memory_type=MemoryType.SEMANTIC
+    )
+
+    def embed(text: str) -> list[float]:
+        request = urllib.request.Request(
+            f"{base_url}/api/embed",
+            data=json.dumps({"model": "nomic-embed-text", "input": text}).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=2.0) as resp:
+            return json.loads(resp.read())["embeddings"][0]
+
+    q_vec = embed(query)
+    scored = [
+        (
+            0.7 * cosine(q_vec, embed(rr.memory.content[:512]))
+            + 0.3 * rr.relevance_score,
+            rr,
+        )
+        for rr in base_results
+    ]
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [rr for _, rr in scored[:k]]
+
+
+class TestKnowledgeRecallBenchmarks:
+    def test_batched_cached_rerank(self, monkeypatch):
+        # Simulated model cost: 2 ms per request plus 0.5 ms per input text
+        with FakeEmbedServer(request_latency=0.002, per_input_latency=0.0005) as srv:
+            monkeypatch.setenv("OLLAMA_BASE_URL", srv.url)
+            km = KnowledgeMemory(store=InMemoryStore())
+            rng = random.Random(9)
+            for i in range(500):
+                km.store(
+                    title=f"KI {i}", body=" ".join(rng.sample(VOCABULARY[:300], 30))
+                )
+            query = " ".join(VOCABULARY[:6])
+
+            expected = [r.memory.id for r in _legacy_rerank(km, query, srv.url)]
+            assert [r.memory.id for r in km.recall(query)] == expected
+            assert [r.memory.id for r in asyncio.run(km.arecall(query))] == expected
+
+            def cold_batched():
+                km.embedding_cache._vectors.clear()
+                return km.recall(query)
+
+            runner = BenchmarkRunner(
+                "KnowledgeMemory.recall with re-rank, 30 candidates"
+            )
+            runner.add(
+                "request_per_candidate",
+                lambda: _legacy_rerank(km, query, srv.url),
+                iterations=5,
+            )
+            runner.add("batched_cold_cache", cold_batched, iterations=5)
+            runner.add("batched_warm_cache", lambda: km.recall(query), iterations=5)
+            runner.add(
+                "async_warm_cache",
+                lambda: asyncio.run(km.arecall(query)),
+                iterations=5,
+            )
+            suite = runner.run()
+            print("\n" + runner.to_markdown(suite))
+
+        legacy_ms, cold_ms, warm_ms, async_ms = (r.mean_ms for r in suite.results)
+        print(
+            f"per-candidate {legacy_ms:.1f} ms, batched {cold_ms:.1f} ms, "
+            f"cached {warm_ms:.1f} ms, async cached {async_ms:.1f} ms"
+        )
+        assert cold_ms < legacy_ms
+        assert warm_ms < cold_ms
+
+
+def _legacy_ledger_tick(ledger: SqliteTraceLedger) -> int:
+    """Previous ``SqliteTraceLedger.tick``: one statement per row."""
+    removed = 0
+    cfg = ledger.config
+    with ledger._lock, ledger._conn() as conn:
+        rows = conn.execute("SELECT key, strength FROM stigmergy_traces").fetchall()
+        for row in rows:
+            new_s = float(row["strength"]) - cfg.evaporation_per_tick
+            if new_s <= cfg.min_strength:
+                conn.execute(
+                    "DELETE FROM stigmergy_traces WHERE key = ?", (row["key"],)
+                )
+                removed += 1
+            else:
+                conn.execute(
+                    "UPDATE stigmergy_traces SET strength = ?, updated_at = ? "
+                    "WHERE key = ?",
+                    (new_s, time.time(), row["key"]),
+                )
+    return removed
+
+
+def _traces(n: int, seed: int = 3) -> list[tuple[str, float]]:
+    rng = random.Random(seed)
+    return [(f"trace-{i}", rng.uniform(0.5, 10.0)) for i in range(n)]
+
+
+def _run_field(lazy: bool, traces, ticks: int) -> list[str]:
+    field = TraceField(StigmergyConfig(evaporation_per_tick=0.1, lazy_evaporation=lazy))
+    for key, strength in traces:
+        field.deposit(key, strength)
+    top: list[str] = []
+    for _ in range(ticks):
+        field.tick()
+        top = [m.key for m in field.top_k(10)]
+    return top
+
+
+@pytest.mark.performance
+class TestStigmergyBenchmarks:
+    def test_trace_field_lazy_vs_eager(self):
+        traces = _traces(20_000)
+        assert _run_field(True, traces, 8) == _run_field(False, traces, 8)
+
+        runner = BenchmarkRunner("TraceField, 20k traces, 32 x (tick + top_k)")
+        runner.add("eager", lambda: _run_field(False, traces, 32), iterations=3)
+        runner.add("lazy", lambda: _run_field(True, traces, 32), iterations=3)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        eager_ms, lazy_ms = (r.mean_ms for r in suite.results)
+        assert lazy_ms < eager_ms
+
+    def test_sqlite_ledger_tick(self, tmp_path):
+        traces = _traces(5_000)
+        ledgers = {}
+        for name, lazy in (("legacy", False), ("bulk", False), ("lazy", True)):
+            ledger = SqliteTraceLedger(
+                str(tmp_path / f"{name}.db"),
+                StigmergyConfig(evaporation_per_tick=0.01, lazy_evaporation=lazy),
+            )
+            with ledger._conn() as conn:
+                conn.executemany(
+                    "INSERT INTO stigmergy_traces "
+                    "(key, strength, updated_at, level) VALUES (?, ?, 0, ?)",
+                    [(k, s, s if lazy else None) for k, s in traces],
+                )
+            ledgers[name] = ledger
+
+        def ticks(fn):
+            return lambda: [fn() for _ in range(8)]
+
+        runner = BenchmarkRunner("SqliteTraceLedger, 5k traces, 8 ticks + top_k")
+        runner.add(
+            "per_row_tick",
+            ticks(lambda: _legacy_ledger_tick(ledgers["legacy"])),
+            iterations=3,
+        )
+        runner.add("bulk_eager_tick", ticks(ledgers["bulk"].tick), iterations=3)
+        runner.add("lazy_tick", ticks(ledgers["lazy"].tick), iterations=3)
+        runner.add("eager_top_k", lambda: ledgers["bulk"].top_k(10), iterations=20)
+        runner.add("lazy_top_k", lambda: ledgers["lazy"].top_k(10), iterations=20)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        legacy_ms, bulk_ms, lazy_ms, eager_top_ms, lazy_top_ms = (
+            r.mean_ms for r in suite.results
+        )
+        print(
+            f"tick: per-row {legacy_ms:.1f} ms, bulk {bulk_ms:.1f} ms, "
+            f"lazy {lazy_ms:.1f} ms; top_k: eager {eager_top_ms:.2f} ms, "
+            f"lazy {lazy_top_ms:.2f} ms"
+        )
+        assert [m.key for m in ledgers["lazy"].top_k(10)] == [
+            m.key for m in ledgers["bulk"].top_k(10)
+        ]
+        assert bulk_ms < legacy_ms
+        assert lazy_ms < bulk_ms
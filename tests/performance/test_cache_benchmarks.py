@@ -0,0 +1,193 @@
+"""Cache benchmarks.
+
+Compares ops/sec of the ``OrderedDict`` LRU ``InMemoryCache`` and the
+sharded variant with the previous dict-based implementation, whose
+eviction scanned every entry for the oldest timestamp, and the hit rates
+of the ``cache.policies`` eviction policies on Zipf and scan traces.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from codomyrmex.cache.backends.in_memory import InMemoryCache, ShardedInMemoryCache
+from codomyrmex.cache.policies import create_policy
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+
+pytestmark = pytest.mark.performance
+
+CAPACITY = 2_000
+N_OPS = 20_000
+
+
+class _LegacyInMemoryCache:
+    """The previous implementation: O(n) eviction via ``min`` over timestamps."""
+
+    def __init__(self, max_size: int = 1000, default_ttl: int | None = None):
+        self._cache: dict[str, tuple[Any, float, int | None]] = {}
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+
+    def get(self, key: str) -> Any | None:
+        if key not in self._cache:
+            return None
+        value, timestamp, ttl = self._cache[key]
+        if ttl is not None and time.time() - timestamp > ttl:
+            del self._cache[key]
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        if len(self._cache) >= self.max_size and key not in self._cache:
+            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
+            del self._cache[oldest_key]
+        self._cache[key] = (value, time.time(), ttl or self.default_ttl)
+        return True
+
+
+@pytest.fixture(scope="module")
+def workload():
+    rng = random.Random(0)
+    # Key space 5x the capacity so most writes evict.
+    keys = [f"key{rng.randrange(CAPACITY * 5)}" for _ in range(N_OPS)]
+    reads = [rng.random() < 0.5 for _ in range(N_OPS)]
+    return list(zip(keys, reads, strict=True))
+
+
+def _replay(cache, workload) -> None:
+    for key, is_read in workload:
+        if is_read:
+            cache.get(key)
+        else:
+            cache.set(key, key)
+
+
+def _ops_per_sec(result) -> float:
+    return N_OPS * 1000 / result.mean_ms
+
+
+class TestInMemoryCacheBenchmarks:
+    def test_lru_vs_legacy_ops_per_sec(self, workload):
+        runner = BenchmarkRunner("in-memory cache, 50% reads, full cache")
+        factories = {
+            "legacy_dict_scan": lambda: _LegacyInMemoryCache(CAPACITY, 60),
+            "ordered_dict_lru": lambda: InMemoryCache(CAPACITY, 60),
+            "sharded_lru_16": lambda: ShardedInMemoryCache(CAPACITY, 60, shards=16),
+        }
+        for name, factory in factories.items():
+            cache = factory()
+            _replay(cache, workload)  # warm up to capacity
+            runner.add(name, lambda c=cache: _replay(c, workload), iterations=3)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        for r in suite.results:
+            print(f"{r.name}: {_ops_per_sec(r):,.0f} ops/sec")
+
+        legacy, lru, sharded = (_ops_per_sec(r) for r in suite.results)
+        assert lru > legacy * 10
+        assert sharded > legacy * 10
+
+    def test_multithreaded_ops_per_sec(self, workload):
+        threads = 8
+
+        def hammer(cache) -> None:
+            workers = [
+                threading.Thread(target=_replay, args=(cache, workload[i::threads]))
+                for i in range(threads)
+            ]
+            for w in workers:
+                w.start()
+            for w in workers:
+                w.join()
+
+        runner = BenchmarkRunner("in-memory cache, 8 threads")
+        single = InMemoryCache(CAPACITY, 60)
+        sharded = ShardedInMemoryCache(CAPACITY, 60, shards=16)
+        runner.add("ordered_dict_lru", lambda: hammer(single), iterations=3)
+        runner.add("sharded_lru_16", lambda: hammer(sharded), iterations=3)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        for r in suite.results:
+            print(f"{r.name}: {_ops_per_sec(r):,.0f} ops/sec")
+        assert len(single) <= CAPACITY
+        assert len(sharded) <= CAPACITY
+
+
+POLICIES = ("lru", "lfu", "fifo", "wtinylfu")
+POLICY_SIZE = 500
+
+
+def _zipf_trace(n: int, universe: int, skew: float, seed: int) -> list[int]:
+    rng = random.Random(seed)
+    cum_weights = list(
+        itertools.accumulate(1.0 / (rank + 1) ** skew for rank in range(universe))
+    )
+    return rng.choices(range(universe), cum_weights=cum_weights, k=n)
+
+
+def _scan_trace(n: int, seed: int) -> list[int]:
+    """Zipf traffic interrupted every 5k requests by a 2k-key one-off scan."""
+    hot = _zipf_trace(n, 5_000, 0.9, seed)
+    trace: list[int] = []
+    next_scan_key = 1_000_000
+    for start in range(0, n, 5_000):
+        trace.extend(hot[start : start + 5_000])
+        trace.extend(range(next_scan_key, next_scan_key + 2_000))
+        next_scan_key += 2_000
+    return trace
+
+
+def _hit_rate(policy_name: str, trace: list[int]) -> float:
+    policy = create_policy(policy_name, POLICY_SIZE)
+    hits = 0
+    for key in trace:
+        if policy.get(key) is None:
+            policy.put(key, key)
+        else:
+            hits += 1
+    return hits / len(trace)
+
+
+class TestPolicyHitRates:
+    def test_zipf_and_scan_hit_rates(self):
+        traces = {
+            "zipf_0.8": _zipf_trace(100_000, 20_000, 0.8, seed=0),
+            "zipf_1.0": _zipf_trace(100_000, 20_000, 1.0, seed=1),
+            "zipf_0.9_with_scans": _scan_trace(100_000, seed=2),
+        }
+        rates = {
+            (trace_name, policy): _hit_rate(policy, trace)
+            for trace_name, trace in traces.items()
+            for policy in POLICIES
+        }
+        lines = [
+            f"# Hit rate, {POLICY_SIZE} entries",
+            "| Trace | " + " | ".join(POLICIES) + " |",
+            "|-------|" + "|".join("------" for _ in POLICIES) + "|",
+        ]
+        for trace_name in traces:
+            row = " | ".join(f"{rates[trace_name, p]:.3f}" for p in POLICIES)
+            lines.append(f"| {trace_name} | {row} |")
+        print("\n" + "\n".join(lines))
+
+        for trace_name in traces:
+            assert rates[trace_name, "wtinylfu"] > rates[trace_name, "lru"]
+            assert rates[trace_name, "wtinylfu"] > rates[trace_name, "fifo"]
+        assert (
+            rates["zipf_0.9_with_scans", "wtinylfu"]
+            > rates["zipf_0.9_with_scans", "lfu"]
+        )
+
+    def test_policy_throughput(self):
+        trace = _zipf_trace(20_000, 20_000, 0.9, seed=3)
+        runner = BenchmarkRunner("eviction policy get/put, Zipf 0.9")
+        for policy in POLICIES:
+            runner.add(policy, lambda p=policy: _hit_rate(p, trace), iterations=3)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
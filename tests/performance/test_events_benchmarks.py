@@ -0,0 +1,213 @@
+"""Event bus and event store benchmarks.
+
+Compares ``EventBus.publish`` dispatch through the ``SubscriptionRouter``
+with the previous linear scan that glob-matched every subscription on
+every publish, coroutine handler fan-out through the long-lived
+``AsyncDispatcher`` with the previous one-executor-job-and-event-loop per
+handler call, and ``FileEventStore`` range reads and streaming replay with
+the list-backed ``EventStore``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import tracemalloc
+from concurrent.futures import wait
+
+import pytest
+
+from codomyrmex.events.core import Event, EventBus, EventType
+from codomyrmex.events.event_store import EventStore, StreamEvent
+from codomyrmex.events.file_event_store import FileEventStore
+from codomyrmex.events.replayer import EventReplayer
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+
+pytestmark = pytest.mark.performance
+
+N_EVENTS = 2_000
+
+
+def _legacy_publish(bus: EventBus, event: Event) -> None:
+    """The previous dispatch: ``matches_event`` on every subscription."""
+    with bus._lock:
+        matching = [s for s in bus.subscriptions.values() if s.matches_event(event)]
+    matching.sort(key=lambda s: s.priority, reverse=True)
+    for subscription in matching:
+        subscription.handler(event)
+
+
+def _agent_bus(n_subscribers: int) -> EventBus:
+    """Subscriptions like a fleet of agents: mostly exact, some globs."""
+    rng = random.Random(0)
+    types = [t.value for t in EventType]
+    bus = EventBus()
+    for i in range(n_subscribers):
+        kind = rng.random()
+        if kind < 0.7:
+            patterns = rng.sample(types, 2)
+        elif kind < 0.95:
+            patterns = [rng.choice(types).split(".")[0] + ".*"]
+        else:
+            patterns = ["*.error"]
+        bus.subscribe(patterns, lambda e: None, f"agent_{i}")
+    return bus
+
+
+@pytest.fixture(scope="module")
+def events():
+    rng = random.Random(1)
+    types = list(EventType)
+    return [
+        Event(event_type=rng.choice(types), source="bench") for _ in range(N_EVENTS)
+    ]
+
+
+class TestEventBusDispatchBenchmarks:
+    @pytest.mark.parametrize("n_subscribers", [50, 500])
+    def test_routed_vs_linear_dispatch(self, events, n_subscribers):
+        bus = _agent_bus(n_subscribers)
+
+        def routed():
+            for event in events:
+                bus.publish(event)
+
+        def linear():
+            for event in events:
+                _legacy_publish(bus, event)
+
+        runner = BenchmarkRunner(f"EventBus dispatch, {n_subscribers} subscribers")
+        runner.add("linear_fnmatch", linear, iterations=3)
+        runner.add("routing_trie", routed, iterations=3)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        for r in suite.results:
+            print(f"{r.name}: {N_EVENTS * 1000 / r.mean_ms:,.0f} dispatches/sec")
+
+        linear_ms, routed_ms = (r.mean_ms for r in suite.results)
+        assert routed_ms < linear_ms
+        bus.shutdown()
+
+
+def _legacy_run_async_handler(handler, event: Event) -> None:
+    """The previous per-call handler runner: a fresh event loop each time."""
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(handler(event))
+    finally:
+        loop.close()
+
+
+def _legacy_async_publish(bus: EventBus, events: list[Event]) -> None:
+    """The previous coroutine dispatch: one executor job per handler call."""
+    futures = []
+    for event in events:
+        for subscription in bus._subscribers_for(event):
+            if subscription.passes_filter(event):
+                futures.append(
+                    bus.executor.submit(
+                        _legacy_run_async_handler, subscription.handler, event
+                    )
+                )
+    wait(futures)
+
+
+class TestAsyncDispatchBenchmarks:
+    def test_dispatcher_vs_executor_loops(self, events):
+        bus = EventBus()
+        calls = 0
+
+        async def handler(event):
+            nonlocal calls
+            calls += 1
+
+        for i in range(10):
+            bus.subscribe(["*"], handler, f"async_{i}")
+        batch = events[:500]
+
+        def publish_each():
+            for event in batch:
+                bus.publish(event)
+            bus.flush()
+
+        def publish_many():
+            bus.publish_many(batch)
+            bus.flush()
+
+        runner = BenchmarkRunner("EventBus coroutine handlers, 10 subscribers")
+        runner.add(
+            "executor_event_loops",
+            lambda: _legacy_async_publish(bus, batch),
+            iterations=5,
+        )
+        runner.add("dispatcher_publish", publish_each, iterations=5)
+        runner.add("dispatcher_publish_many", publish_many, iterations=5)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        for r in suite.results:
+            print(f"{r.name}: {len(batch) * 10 * 1000 / r.mean_ms:,.0f} calls/sec")
+        latency = bus.get_handler_latency("async_0")
+        print(f"async_0 latency p50={latency['p50']}s p99={latency['p99']}s")
+
+        legacy_ms, each_ms, many_ms = (r.mean_ms for r in suite.results)
+        assert each_ms < legacy_ms
+        assert many_ms < legacy_ms
+        assert calls > 0
+        bus.shutdown()
+
+
+N_STORED = 200_000
+
+
+class TestEventStoreBenchmarks:
+    def test_range_read_and_streaming_replay(self, tmp_path):
+        memory = EventStore()
+        disk = FileEventStore(str(tmp_path), segment_size=4 * 1024 * 1024)
+        for i in range(N_STORED):
+            for store in (memory, disk):
+                store.append(
+                    StreamEvent(
+                        topic=f"agent{i % 8}",
+                        event_type="step",
+                        data={"i": i},
+                        timestamp=1_000.0 + i,
+                    )
+                )
+        tail = N_STORED - 100
+
+        runner = BenchmarkRunner(f"EventStore range read, {N_STORED:,} events")
+        runner.add("list_scan_last_100", lambda: memory.read(tail), iterations=5)
+        runner.add("segment_seek_last_100", lambda: disk.read(tail), iterations=5)
+        runner.add(
+            "list_scan_time_100",
+            lambda: memory.read_by_time(1_000.0 + tail, 1_000.0 + N_STORED),
+            iterations=5,
+        )
+        runner.add(
+            "segment_skip_time_100",
+            lambda: disk.read_by_time(1_000.0 + tail, 1_000.0 + N_STORED),
+            iterations=5,
+        )
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        scan_ms, seek_ms, time_scan_ms, time_skip_ms = (
+            r.mean_ms for r in suite.results
+        )
+        assert seek_ms < scan_ms
+        assert time_skip_ms < time_scan_ms
+
+        memory.clear()
+        tracemalloc.start()
+        materialized = len(disk.read())
+        _, list_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = EventReplayer(disk).replay()
+        _, stream_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"replay of {N_STORED:,} events: materialized peak "
+            f"{list_peak / 2**20:.1f} MiB, streaming peak {stream_peak / 2**20:.1f} MiB"
+        )
+        assert materialized == result.events_replayed == N_STORED
+        assert stream_peak < list_peak / 10
+        disk.close()
@@ -0,0 +1,101 @@
+"""Hermes session store benchmarks.
+
+Compares appending one turn to a long conversation with
+``SQLiteSessionStore.save`` (inserts only the new message row) against
+the previous layout, which re-serialised the whole message list into a
+JSON column with ``INSERT OR REPLACE`` on every save.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from codomyrmex.agents.hermes.session import HermesSession, SQLiteSessionStore
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.performance
+
+
+def _legacy_store(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE hermes_sessions (session_id TEXT PRIMARY KEY, name TEXT, "
+        "parent_session_id TEXT, messages TEXT NOT NULL, "
+        "metadata TEXT NOT NULL DEFAULT '{}', created_at REAL NOT NULL, "
+        "updated_at REAL NOT NULL)"
+    )
+    return conn
+
+
+def _legacy_save(conn: sqlite3.Connection, session: HermesSession) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO hermes_sessions VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            session.session_id,
+            session.name,
+            session.parent_session_id,
+            json.dumps(session.messages),
+            json.dumps(session.metadata),
+            session.created_at,
+            session.updated_at,
+        ),
+    )
+    conn.commit()
+
+
+def _long_session(turns: int) -> HermesSession:
+    session = HermesSession(session_id="long")
+    for i in range(turns):
+        session.add_message(
+            "user" if i % 2 == 0 else "assistant", f"message {i} " + "lorem " * 80
+        )
+    return session
+
+
+class TestSessionStoreBenchmarks:
+    def test_append_vs_full_rewrite(self, tmp_path):
+        turns = 2000
+        legacy_session = _long_session(turns)
+        legacy = _legacy_store(tmp_path / "legacy.db")
+        _legacy_save(legacy, legacy_session)
+
+        store = SQLiteSessionStore(tmp_path / "rows.db")
+        eager = _long_session(turns)
+        store.save(eager)
+        lazy = store.load("long", lazy=True)
+
+        def legacy_turn():
+            legacy_session.add_message("user", "one more turn")
+            _legacy_save(legacy, legacy_session)
+
+        def eager_turn():
+            eager.add_message("user", "one more turn")
+            store.save(eager)
+
+        def lazy_turn():
+            lazy.add_message("user", "one more turn")
+            store.save(lazy)
+
+        runner = BenchmarkRunner(f"Hermes save of one new turn, {turns} messages")
+        runner.add("json_insert_or_replace", legacy_turn, iterations=50)
+        runner.add("append_rows", eager_turn, iterations=50)
+        runner.add("append_rows_lazy", lazy_turn, iterations=50)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        legacy_ms, eager_ms, lazy_ms = (r.mean_ms for r in suite.results)
+        print(
+            f"json {legacy_ms:.2f} ms, append {eager_ms:.2f} ms, "
+            f"lazy append {lazy_ms:.2f} ms"
+        )
+        assert store.load("long").messages == lazy.messages
+        assert lazy_ms < legacy_ms
+        assert eager_ms < legacy_ms
@@ -0,0 +1,191 @@
+"""Agent history store benchmarks.
+
+Compares ``SQLiteHistoryStore`` (pooled WAL connections, diff-based
+``executemany`` saves, FTS5 search) with the previous implementation,
+which opened a connection per call, deleted and re-inserted every message
+on save and searched with ``LIKE``; and ``FileHistoryStore`` listing from
+its summary index with parsing every JSON file.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from codomyrmex.agents.history import (
+    Conversation,
+    FileHistoryStore,
+    MessageRole,
+    SQLiteHistoryStore,
+)
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+
+pytestmark = pytest.mark.performance
+
+
+def _legacy_save(db_path: str, conversation: Conversation) -> None:
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO conversations "
+            "(conversation_id, title, created_at, updated_at, metadata) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                conversation.conversation_id,
+                conversation.title,
+                conversation.created_at.isoformat(),
+                conversation.updated_at.isoformat(),
+                json.dumps(conversation.metadata),
+            ),
+        )
+        conn.execute(
+            "DELETE FROM messages WHERE conversation_id = ?",
+            (conversation.conversation_id,),
+        )
+        for msg in conversation.messages:
+            conn.execute(
+                "INSERT INTO messages (message_id, conversation_id, role, content, "
+                "timestamp, tokens, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    msg.message_id,
+                    conversation.conversation_id,
+                    msg.role.value,
+                    msg.content,
+                    msg.timestamp.isoformat(),
+                    msg.tokens,
+                    json.dumps(msg.metadata),
+                ),
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _legacy_search(db_path: str, query: str) -> set[str]:
+    conn = sqlite3.connect(db_path)
+    try:
+        ids = {
+            r[0]
+            for r in conn.execute(
+                "SELECT conversation_id FROM conversations WHERE title LIKE ?",
+                (f"%{query}%",),
+            )
+        }
+        ids.update(
+            r[0]
+            for r in conn.execute(
+                "SELECT DISTINCT conversation_id FROM messages WHERE content LIKE ?",
+                (f"%{query}%",),
+            )
+        )
+        return ids
+    finally:
+        conn.close()
+
+
+def _conversation(cid: str, turns: int, start: datetime) -> Conversation:
+    conv = Conversation(conversation_id=cid, title=f"Conversation {cid}")
+    for i in range(turns):
+        conv.add_message(
+            MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT,
+            f"{cid} turn {i} " + "lorem ipsum dolor " * 10,
+            timestamp=start + timedelta(seconds=i),
+        )
+    return conv
+
+
+class TestHistoryStoreBenchmarks:
+    def test_sqlite_append_and_search(self, tmp_path):
+        start = datetime(2026, 1, 1)
+        legacy_db = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(legacy_db)
+        conn.execute(
+            "CREATE TABLE conversations (conversation_id TEXT PRIMARY KEY, "
+            "title TEXT, created_at TEXT, updated_at TEXT, metadata TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE messages (message_id TEXT PRIMARY KEY, "
+            "conversation_id TEXT, role TEXT, content TEXT, timestamp TEXT, "
+            "tokens INTEGER DEFAULT 0, metadata TEXT)"
+        )
+        conn.execute("CREATE INDEX idx_messages_conv ON messages(conversation_id)")
+        conn.close()
+        store = SQLiteHistoryStore(str(tmp_path / "pooled.db"))
+        for i in range(200):
+            conv = _conversation(f"c{i}", 20, start)
+            _legacy_save(legacy_db, conv)
+            store.save(conv)
+        legacy_conv = _conversation("long", 1000, start)
+        conv = _conversation("long", 1000, start)
+        _legacy_save(legacy_db, legacy_conv)
+        store.save(conv)
+
+        counter = iter(range(10**6))
+
+        def legacy_append():
+            legacy_conv.add_user_message(f"more {next(counter)}")
+            _legacy_save(legacy_db, legacy_conv)
+
+        def pooled_append():
+            conv.add_user_message(f"more {next(counter)}")
+            store.save(conv)
+
+        runner = BenchmarkRunner("History save of one new turn, 1000 messages")
+        runner.add("connect_delete_reinsert", legacy_append, iterations=20)
+        runner.add("pooled_diff_executemany", pooled_append, iterations=20)
+        save_suite = runner.run()
+        print("\n" + runner.to_markdown(save_suite))
+
+        assert _legacy_search(legacy_db, "c17 turn 3") == {
+            c.conversation_id for c in store.search("c17 turn 3")
+        }
+        runner = BenchmarkRunner("History search over 5000 messages")
+        runner.add(
+            "like_scan", lambda: _legacy_search(legacy_db, "c17 turn 3"), iterations=20
+        )
+        runner.add("fts5_trigram", lambda: store.search("c17 turn 3"), iterations=20)
+        search_suite = runner.run()
+        print("\n" + runner.to_markdown(search_suite))
+
+        legacy_save_ms, save_ms = (r.mean_ms for r in save_suite.results)
+        like_ms, fts_ms = (r.mean_ms for r in search_suite.results)
+        print(
+            f"save {legacy_save_ms:.2f} -> {save_ms:.2f} ms, "
+            f"search {like_ms:.2f} -> {fts_ms:.2f} ms"
+        )
+        assert save_ms < legacy_save_ms
+        assert fts_ms < like_ms
+
+    def test_file_listing_from_index(self, tmp_path):
+        start = datetime(2026, 1, 1)
+        store = FileHistoryStore(str(tmp_path))
+        for i in range(300):
+            conv = _conversation(f"f{i}", 30, start)
+            conv.updated_at = start + timedelta(minutes=i)
+            store.save(conv)
+
+        def parse_all():
+            conversations = [
+                store.load(path.stem) for path in store.directory.glob("*.json")
+            ]
+            conversations.sort(key=lambda c: c.updated_at, reverse=True)
+            return conversations[:20]
+
+        fresh = FileHistoryStore(str(tmp_path))
+        assert [c.conversation_id for c in parse_all()] == [
+            c.conversation_id for c in fresh.list_conversations(limit=20)
+        ]
+        runner = BenchmarkRunner("File history, first page of 300 conversations")
+        runner.add("parse_every_file", parse_all, iterations=5)
+        runner.add(
+            "summary_index",
+            lambda: FileHistoryStore(str(tmp_path)).list_conversations(limit=20),
+            iterations=5,
+        )
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        parse_ms, index_ms = (r.mean_ms for r in suite.results)
+        assert index_ms < parse_ms
@@ -0,0 +1,60 @@
+"""RepoIndexer benchmarks on the codomyrmex source tree.
+
+Compares a cold, serial ``index_directory`` (what every call used to cost)
+with a new session loading the persisted per-file cache, an incremental
+``update`` of one file, and a cold parse on a process pool.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from codomyrmex.agents.context.indexer import RepoIndexer
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+
+pytestmark = pytest.mark.performance
+
+SRC = Path(__file__).resolve().parents[2] / "src" / "codomyrmex"
+
+
+class TestRepoIndexerBenchmarks:
+    def test_cached_and_incremental_indexing(self, tmp_path):
+        cache = tmp_path / "index-cache.json"
+        expected = RepoIndexer(parallel_threshold=10**9).index_directory(SRC)
+        RepoIndexer(cache_path=cache).index_directory(SRC)
+
+        warm = RepoIndexer(cache_path=cache)
+        warm.index_directory(SRC)
+        target = next(iter(warm._files.values()))[0]
+
+        runner = BenchmarkRunner(f"RepoIndexer, {expected.files_indexed} files")
+        runner.add(
+            "cold_serial",
+            lambda: RepoIndexer(parallel_threshold=10**9).index_directory(SRC),
+            iterations=2,
+        )
+        runner.add(
+            "cold_process_pool",
+            lambda: RepoIndexer(parallel_threshold=1).index_directory(SRC),
+            iterations=2,
+        )
+        runner.add(
+            "new_session_cached",
+            lambda: RepoIndexer(cache_path=cache).index_directory(SRC),
+            iterations=3,
+        )
+        runner.add("update_one_file", lambda: warm.update([target]), iterations=5)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        cold_ms, pool_ms, cached_ms, update_ms = (r.mean_ms for r in suite.results)
+        print(f"cpus={os.cpu_count()}")
+        cached = RepoIndexer(cache_path=cache).index_directory(SRC)
+        assert cached.to_dict() == expected.to_dict()
+        assert cached_ms < cold_ms
+        assert update_ms < cached_ms
+        if (os.cpu_count() or 1) >= 4:
+            assert pool_ms < cold_ms
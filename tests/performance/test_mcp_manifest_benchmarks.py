@@ -0,0 +1,84 @@
+"""Dynamic MCP tool discovery benchmarks, with and without the tool manifest.
+
+Each run is a fresh interpreter, since discovery imports tool modules and
+``sys.modules`` would otherwise carry them over. ``no_manifest`` is what
+every server start used to cost: parse every source file and import every
+decorated module. ``warm_manifest`` reads a manifest written by an earlier
+process and imports no tool modules.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+from tests.support.repo_paths import REPO_ROOT
+
+pytestmark = pytest.mark.performance
+
+SCRIPT = """
+import json, sys, time
+from codomyrmex.agents.pai.mcp.discovery import discover_dynamic_tools
+started = time.perf_counter()
+tools = discover_dynamic_tools()
+print(json.dumps({
+    "elapsed_ms": (time.perf_counter() - started) * 1000,
+    "tools": len(tools),
+    "modules": len(sys.modules),
+}))
+"""
+
+
+def _discover(manifest: str) -> dict:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        part for part in (str(REPO_ROOT / "src"), env.get("PYTHONPATH", "")) if part
+    )
+    env["CODOMYRMEX_MCP_MANIFEST"] = manifest
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestMCPManifestBenchmarks:
+    def test_discovery_from_manifest(self, tmp_path):
+        manifest = str(tmp_path / "manifest.json")
+        _discover(manifest)
+        runs: dict[str, list[dict]] = {"no_manifest": [], "warm_manifest": []}
+
+        runner = BenchmarkRunner("discover_dynamic_tools, fresh interpreter")
+        runner.add(
+            "no_manifest",
+            lambda: runs["no_manifest"].append(_discover("")),
+            iterations=2,
+        )
+        runner.add(
+            "warm_manifest",
+            lambda: runs["warm_manifest"].append(_discover(manifest)),
+            iterations=3,
+        )
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        for name, samples in runs.items():
+            print(
+                f"{name}: discovery {min(s['elapsed_ms'] for s in samples):.0f}ms, "
+                f"{samples[-1]['tools']} tools, {samples[-1]['modules']} modules"
+            )
+
+        cold, warm = runs["no_manifest"][-1], runs["warm_manifest"][-1]
+        assert warm["tools"] == cold["tools"]
+        assert warm["modules"] < cold["modules"]
+        no_manifest_ms, warm_ms = (r.mean_ms for r in suite.results)
+        assert warm_ms < no_manifest_ms
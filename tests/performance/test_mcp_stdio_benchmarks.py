@@ -0,0 +1,124 @@
+"""MCPServer stdio throughput with a local fake client.
+
+The client writes a burst of ``tools/call`` requests into a pipe from one
+thread and reads the responses from another. ``serial`` runs with
+``max_in_flight=1``, which is how ``run_stdio`` used to behave (read one
+request, answer it, read the next); ``concurrent`` uses the default limit.
+The I/O-bound tool sleeps, so concurrency pays off up to the size of the
+default executor; the echo tool measures per-request overhead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from codomyrmex.model_context_protocol.transport.server import (
+    MCPServer,
+    MCPServerConfig,
+)
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+
+pytestmark = pytest.mark.performance
+
+REQUESTS = 200
+
+
+def _server(max_in_flight: int) -> MCPServer:
+    srv = MCPServer(
+        MCPServerConfig(
+            name="bench",
+            max_in_flight=max_in_flight,
+            rate_limit_rate=1e9,
+            rate_limit_burst=10**9,
+        )
+    )
+
+    @srv.tool(name="io_bound")
+    def io_bound(n: int) -> int:
+        time.sleep(0.005)
+        return n
+
+    @srv.tool(name="echo")
+    def echo(n: int) -> int:
+        return n
+
+    return srv
+
+
+def _fake_client_session(srv: MCPServer, tool: str, n: int = REQUESTS) -> list:
+    """Send *n* calls to *tool* through pipes; return the responses."""
+    in_read, in_write = os.pipe()
+    out_read, out_write = os.pipe()
+    responses: list = []
+
+    def send() -> None:
+        with os.fdopen(in_write, "w") as client:
+            for i in range(n):
+                request = {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "tools/call",
+                    "params": {"name": tool, "arguments": {"n": i}},
+                }
+                client.write(json.dumps(request) + "\n")
+
+    def receive() -> None:
+        with os.fdopen(out_read) as server_out:
+            responses.extend(json.loads(line) for line in server_out)
+
+    threads = [threading.Thread(target=send), threading.Thread(target=receive)]
+    for t in threads:
+        t.start()
+    with os.fdopen(in_read) as stdin, os.fdopen(out_write, "w") as stdout:
+        asyncio.run(srv.run_stdio(stdin, stdout))
+    for t in threads:
+        t.join()
+    return responses
+
+
+class TestMCPStdioBenchmarks:
+    def test_concurrent_stdio_throughput(self):
+        default = MCPServerConfig().max_in_flight
+        sessions: dict[str, list] = {}
+
+        def session(name: str, max_in_flight: int, tool: str):
+            def run() -> None:
+                sessions[name] = _fake_client_session(_server(max_in_flight), tool)
+
+            return run
+
+        runner = BenchmarkRunner(f"MCPServer.run_stdio, {REQUESTS} tools/call")
+        runner.add("io_bound_serial", session("io_serial", 1, "io_bound"), iterations=2)
+        runner.add(
+            "io_bound_concurrent",
+            session("io_concurrent", default, "io_bound"),
+            iterations=2,
+        )
+        runner.add("echo_serial", session("echo_serial", 1, "echo"), iterations=3)
+        runner.add(
+            "echo_concurrent", session("echo_concurrent", default, "echo"), iterations=3
+        )
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        io_serial_ms, io_concurrent_ms, echo_serial_ms, echo_concurrent_ms = (
+            r.mean_ms for r in suite.results
+        )
+        for name, ms in (
+            ("io_bound", (io_serial_ms, io_concurrent_ms)),
+            ("echo", (echo_serial_ms, echo_concurrent_ms)),
+        ):
+            print(
+                f"{name}: serial {REQUESTS / ms[0] * 1000:.0f} req/s, "
+                f"concurrent {REQUESTS / ms[1] * 1000:.0f} req/s"
+            )
+
+        for responses in sessions.values():
+            assert sorted(r["id"] for r in responses) == list(range(REQUESTS))
+            assert all("result" in r for r in responses)
+        assert io_concurrent_ms < io_serial_ms / 2
@@ -0,0 +1,88 @@
+"""ObsidianVault scan benchmarks on a generated vault.
+
+Compares a cold, serial scan (what every ``refresh`` used to cost) with a
+cold scan on a process pool, a new session loading the persisted parse
+cache, a ``refresh`` after editing one note, and an ``update`` of that note.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+
+import pytest
+
+from codomyrmex.agentic_memory.obsidian.graph import find_orphans, get_link_stats
+from codomyrmex.agentic_memory.obsidian.vault import ObsidianVault
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+
+pytestmark = pytest.mark.performance
+
+NOTES = 3000
+
+
+def _write_vault(root, n: int = NOTES) -> None:
+    rng = random.Random(7)
+    for i in range(n):
+        folder = root / f"area-{i % 20}"
+        folder.mkdir(exist_ok=True)
+        links = " ".join(f"[[Note {rng.randrange(n)}]]" for _ in range(5))
+        (folder / f"Note {i}.md").write_text(
+            f"---\ncreated: 2024-01-{i % 28 + 1:02d}\ntags: [t{i % 50}]\n---\n"
+            f"# Note {i}\n\nSee {links} and #topic/{i % 30}.\n\n"
+            "> [!note] Summary\n> Body text.\n\n"
+            "```python\nprint('x')\n```\n\nStatus:: open\n" + "word " * 150
+        )
+
+
+class TestObsidianVaultBenchmarks:
+    def test_cached_and_incremental_scan(self, tmp_path):
+        root = tmp_path / "vault"
+        root.mkdir()
+        _write_vault(root)
+        cache = tmp_path / "vault-cache.json"
+        _ = ObsidianVault(root, cache_path=cache).notes
+
+        warm = ObsidianVault(root, cache_path=cache)
+        _ = warm.notes
+        target = root / "area-3" / "Note 3.md"
+        original = target.read_text()
+        edits = iter(range(10**6))
+
+        def edit() -> None:
+            target.write_text(f"{original}\n#edit-{next(edits)}\n")
+
+        def cold_serial():
+            return ObsidianVault(root, parallel_threshold=10**9).notes
+
+        runner = BenchmarkRunner(f"ObsidianVault, {NOTES} notes")
+        runner.add("cold_serial", cold_serial, iterations=2)
+        runner.add(
+            "cold_process_pool",
+            lambda: ObsidianVault(root, parallel_threshold=1).notes,
+            iterations=2,
+        )
+        runner.add(
+            "new_session_cached",
+            lambda: ObsidianVault(root, cache_path=cache).notes,
+            iterations=3,
+        )
+        runner.add("refresh_one_edit", lambda: (edit(), warm.refresh()), iterations=5)
+        runner.add(
+            "update_one_edit", lambda: (edit(), warm.update([target])), iterations=5
+        )
+        runner.add("find_orphans", lambda: find_orphans(warm), iterations=5)
+        runner.add("get_link_stats", lambda: get_link_stats(warm), iterations=5)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        cold_ms, pool_ms, cached_ms, refresh_ms, update_ms, _, _ = (
+            r.mean_ms for r in suite.results
+        )
+        print(f"cpus={os.cpu_count()}")
+        assert ObsidianVault(root, cache_path=cache).notes == cold_serial()
+        assert cached_ms < cold_ms
+        assert refresh_ms < cold_ms
+        assert update_ms < refresh_ms
+        if (os.cpu_count() or 1) >= 4:
+            assert pool_ms < cold_ms
@@ -0,0 +1,166 @@
+"""Orchestrator workflow scheduling and pipeline executor benchmarks.
+
+Compares dependency-driven ``Workflow.run`` with the previous wave
+scheduler, which gathered every runnable task, waited for the whole wave
+and then rescanned all tasks for newly unblocked work; and
+``ProcessStageExecutor`` (warm pool, context published once) with a fresh
+process pool that pickles the whole context for every stage.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import os
+import random
+
+import pytest
+
+from codomyrmex.orchestrator.pipelines import (
+    FunctionStage,
+    ProcessStageExecutor,
+    ThreadStageExecutor,
+)
+from codomyrmex.orchestrator.workflows.workflow import TaskStatus, Workflow
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+
+pytestmark = pytest.mark.performance
+
+
+async def _wave_run(wf: Workflow) -> None:
+    """The previous scheduler: gather runnable waves, rescan after each.
+
+    Uses the same per-task bookkeeping as ``Workflow.run`` so only the
+    scheduling differs.
+    """
+    wf.validate()
+    wf.task_results.clear()
+    for task in wf.tasks.values():
+        task.status = TaskStatus.PENDING
+    completed: set[str] = set()
+    while len(completed) < len(wf.tasks):
+        runnable = [
+            t
+            for t in wf.tasks.values()
+            if t.status == TaskStatus.PENDING
+            and t.dependencies <= completed
+            and t.should_run(wf.task_results)
+        ]
+        futures = [wf._start_task(t) for t in runnable]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for task, result in zip(runnable, results, strict=True):
+            if wf._record_result(task, result):
+                completed.add(task.name)
+
+
+def _sleeper(seconds: float):
+    async def action(_task_results=None):
+        await asyncio.sleep(seconds)
+
+    return action
+
+
+def _wide_workflow(chains: int = 20, depth: int = 5) -> Workflow:
+    """Independent chains whose steps take 1-20 ms each."""
+    rng = random.Random(0)
+    wf = Workflow("wide")
+    for c in range(chains):
+        for d in range(depth):
+            deps = [f"c{c}_{d - 1}"] if d else []
+            wf.add_task(
+                f"c{c}_{d}", _sleeper(rng.uniform(0.001, 0.02)), dependencies=deps
+            )
+    return wf
+
+
+def _deep_workflow(layers: int = 400, width: int = 4) -> Workflow:
+    """Layered DAG of instant tasks, each depending on two tasks above."""
+    rng = random.Random(1)
+    wf = Workflow("deep")
+    for layer in range(layers):
+        for i in range(width):
+            deps = (
+                [f"l{layer - 1}_{j}" for j in rng.sample(range(width), 2)]
+                if layer
+                else []
+            )
+            wf.add_task(f"l{layer}_{i}", _sleeper(0), dependencies=deps)
+    return wf
+
+
+class TestWorkflowSchedulingBenchmarks:
+    @pytest.mark.parametrize(
+        ("label", "factory"),
+        [
+            ("wide: 20 chains x 5", _wide_workflow),
+            ("deep: 400 layers x 4", _deep_workflow),
+        ],
+    )
+    def test_eager_vs_wave_scheduling(self, label, factory):
+        wf = factory()
+
+        runner = BenchmarkRunner(f"Workflow scheduling, {label}")
+        runner.add("wave_gather", lambda: asyncio.run(_wave_run(wf)), iterations=3)
+        runner.add("eager_in_degree", lambda: asyncio.run(wf.run()), iterations=3)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        wave_ms, eager_ms = (r.mean_ms for r in suite.results)
+        print(f"{label}: wave {wave_ms:.1f} ms, eager {eager_ms:.1f} ms")
+        assert all(t.status == TaskStatus.COMPLETED for t in wf.tasks.values())
+        assert eager_ms < wave_ms
+
+
+def _checksum(ctx):
+    """CPU-bound stage reading a slice of a large shared payload."""
+    data = ctx["payload"]
+    total = 0
+    for i in range(0, len(data), 64):
+        total = (total * 31 + data[i]) % 1_000_003
+    return total
+
+
+def _per_stage_pickling(stages, context) -> dict:
+    """Fresh pool, full context pickled into every stage submission."""
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as pool:
+        futures = {pool.submit(s.execute, context): s.stage_id for s in stages}
+        return {
+            futures[f]: f.result() for f in concurrent.futures.as_completed(futures)
+        }
+
+
+class TestPipelineExecutorBenchmarks:
+    def test_process_executor_vs_per_stage_pickling(self):
+        context = {"payload": os.urandom(16 * 1024 * 1024)}
+        stages = [FunctionStage(f"check_{i}", _checksum) for i in range(16)]
+
+        processes = ProcessStageExecutor(max_workers=2, warm_up=True)
+        threads = ThreadStageExecutor(max_workers=2)
+        expected = threads.map(stages, context)
+        assert processes.map(stages, context) == expected
+
+        runner = BenchmarkRunner("ParallelStage, 16 stages, 16 MiB context")
+        runner.add(
+            "fresh_pool_pickle_per_stage",
+            lambda: _per_stage_pickling(stages, context),
+            iterations=3,
+        )
+        runner.add(
+            "process_executor_shared",
+            lambda: processes.map(stages, context),
+            iterations=3,
+        )
+        runner.add(
+            "thread_executor", lambda: threads.map(stages, context), iterations=3
+        )
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        naive_ms, shared_ms, thread_ms = (r.mean_ms for r in suite.results)
+        print(f"cpus={os.cpu_count()}")
+        processes.shutdown()
+        threads.shutdown()
+
+        assert shared_ms < naive_ms
+        if (os.cpu_count() or 1) >= 4:
+            # Only measurable with real cores to spread the GIL-bound work over
+            assert shared_ms < thread_ms
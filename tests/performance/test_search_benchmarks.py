@@ -0,0 +1,161 @@
+"""Search index benchmarks.
+
+Compares ``BM25Index`` MaxScore retrieval over posting lists with a
+per-document linear scan of the same corpus, ``DiskIndex`` cold open
+with re-indexing an ``InMemoryIndex``, and top-k-only highlighting on long
+documents.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+from codomyrmex.search import DiskIndex, Document, InMemoryIndex
+from codomyrmex.search.hybrid import BM25Index
+
+pytestmark = pytest.mark.performance
+
+N_DOCS = 20_000
+VOCAB = [f"term{i}" for i in range(5_000)]
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = random.Random(0)
+    # Zipf-like term frequencies: low term ids are common, high ones rare.
+    weights = [1.0 / (rank + 1) for rank in range(len(VOCAB))]
+    return {
+        f"d{i}": " ".join(rng.choices(VOCAB, weights, k=rng.randint(20, 80)))
+        for i in range(N_DOCS)
+    }
+
+
+def _linear_scan(docs: dict[str, list[str]], query: str, k: int = 10):
+    """Score every document, rebuilding its term counts per query."""
+    n = len(docs)
+    avg_dl = sum(len(t) for t in docs.values()) / n
+    terms = BM25Index._tokenize(query)
+    df = {t: sum(1 for tokens in docs.values() if t in tokens) for t in terms}
+    scores = {}
+    for doc_id, tokens in docs.items():
+        tf_map = Counter(tokens)
+        score = 0.0
+        for term in terms:
+            tf = tf_map.get(term, 0)
+            if tf:
+                idf = math.log((n - df[term] + 0.5) / (df[term] + 0.5) + 1)
+                score += (
+                    idf * tf * 2.5 / (tf + 1.5 * (0.25 + 0.75 * len(tokens) / avg_dl))
+                )
+        if score > 0:
+            scores[doc_id] = score
+    return sorted(scores.items(), key=lambda x: x[1], reverse=True)[:k]
+
+
+class TestBM25Benchmarks:
+    def test_maxscore_vs_linear_scan(self, corpus):
+        index = BM25Index()
+        for doc_id, text in corpus.items():
+            index.add_document(doc_id, text)
+        tokenized = {d: BM25Index._tokenize(t) for d, t in corpus.items()}
+        queries = {
+            "rare": "term3000 term4100 term2500",
+            "mixed": "term1 term40 term900",
+            "common": "term0 term1 term2",
+        }
+
+        runner = BenchmarkRunner("BM25 top-10 retrieval")
+        runner.add(
+            "linear_scan",
+            lambda: _linear_scan(tokenized, queries["mixed"]),
+            iterations=1,
+        )
+        for name, query in queries.items():
+            runner.add(
+                f"maxscore_{name}",
+                lambda q=query: index.search(q, top_k=10),
+                iterations=20,
+            )
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        linear_ms, rare_ms, mixed_ms, _ = (r.mean_ms for r in suite.results)
+        assert rare_ms < mixed_ms
+        assert mixed_ms < linear_ms / 10
+        assert [d for d, _ in index.search(queries["mixed"], top_k=10)] == [
+            d for d, _ in _linear_scan(tokenized, queries["mixed"])
+        ]
+
+
+class TestDiskIndexBenchmarks:
+    def test_cold_open_vs_reindex(self, corpus, tmp_path):
+        docs = [Document(id=d, content=text) for d, text in corpus.items()]
+        path = str(tmp_path / "index")
+        with DiskIndex(path, flush_threshold=5_000) as index:
+            for doc in docs:
+                index.index(doc)
+            index.merge()
+
+        def reindex():
+            memory = InMemoryIndex()
+            for doc in docs:
+                memory.index(doc)
+            return memory
+
+        def open_and_query():
+            with DiskIndex(path) as index:
+                return index.search("term40 term900", k=10)
+
+        runner = BenchmarkRunner("search index cold start")
+        runner.add("in_memory_reindex", reindex, iterations=1)
+        runner.add("disk_open_and_query", open_and_query, iterations=5)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        reindex_ms, disk_ms = (r.mean_ms for r in suite.results)
+        assert disk_ms < reindex_ms
+
+
+def _eager_highlight_search(index: InMemoryIndex, query: str, k: int):
+    """Score every candidate and scan its full content for highlights first."""
+    tokens = index.tokenizer.tokenize(query)
+    candidates = set().union(*(index._inverted_index.get(t, set()) for t in tokens))
+    results = []
+    for doc_id in candidates:
+        content_lower = index._documents[doc_id].content.lower()
+        highlights = [content_lower.find(t) for t in tokens]
+        score = sum(index._doc_term_freq[doc_id].get(t, 0) for t in tokens)
+        results.append((score, doc_id, highlights))
+    results.sort(reverse=True)
+    return results[:k]
+
+
+class TestHighlightBenchmarks:
+    def test_long_document_query_latency(self):
+        rng = random.Random(2)
+        filler = [f"filler{i}" for i in range(2_000)]
+        index = InMemoryIndex()
+        for i in range(2_000):
+            words = rng.choices(filler, k=5_000)  # ~50 KB per document
+            words.append("needle")
+            index.index(Document(id=f"d{i}", content=" ".join(words)))
+
+        runner = BenchmarkRunner("InMemoryIndex search on long documents")
+        runner.add(
+            "eager_highlights",
+            lambda: _eager_highlight_search(index, "needle", 10),
+            iterations=3,
+        )
+        runner.add(
+            "top_k_highlights", lambda: index.search("needle", k=10), iterations=3
+        )
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        eager_ms, lazy_ms = (r.mean_ms for r in suite.results)
+        assert lazy_ms < eager_ms
@@ -0,0 +1,217 @@
+"""Vector store search benchmarks.
+
+Compares the linear-scan ``InMemoryVectorStore`` with the NumPy-backed
+``MatrixVectorStore`` for single and batched top-k queries, and measures
+the approximate, quantized, memory-mapped and filtered variants.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+pytestmark = pytest.mark.performance
+
+np = pytest.importorskip("numpy")
+
+from codomyrmex.performance.benchmarking import BenchmarkRunner
+from codomyrmex.vector_store import InMemoryVectorStore, MatrixVectorStore
+
+N_VECTORS = 20_000
+DIM = 128
+K = 10
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((N_VECTORS, DIM)).astype(np.float32)
+    queries = rng.standard_normal((32, DIM)).astype(np.float32)
+    return data, queries
+
+
+@pytest.fixture(scope="module")
+def matrix_store(dataset):
+    data, _ = dataset
+    store = MatrixVectorStore(distance_metric="cosine")
+    store.add_batch([(f"v{i}", row, None) for i, row in enumerate(data)])
+    return store
+
+
+class TestMatrixStoreBenchmarks:
+    def test_single_query_faster_than_linear_scan(self, dataset, matrix_store):
+        data, queries = dataset
+        linear = InMemoryVectorStore(distance_metric="cosine")
+        linear.add_batch([(f"v{i}", row.tolist(), None) for i, row in enumerate(data)])
+        query = queries[0].tolist()
+
+        runner = BenchmarkRunner("vector_store single query")
+        runner.add("linear_scan", lambda: linear.search(query, k=K), iterations=3)
+        runner.add("matrix", lambda: matrix_store.search(query, k=K), iterations=20)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        linear_ms, matrix_ms = (r.mean_ms for r in suite.results)
+        assert matrix_ms < linear_ms
+
+    def test_batch_query_throughput(self, dataset, matrix_store):
+        _, queries = dataset
+        batch = queries.tolist()
+
+        runner = BenchmarkRunner("vector_store batch query")
+        runner.add(
+            "matrix_looped",
+            lambda: [matrix_store.search(q, k=K) for q in batch],
+            iterations=5,
+        )
+        runner.add(
+            "matrix_search_batch",
+            lambda: matrix_store.search_batch(batch, k=K),
+            iterations=5,
+        )
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        looped_ms, batched_ms = (r.mean_ms for r in suite.results)
+        assert batched_ms < looped_ms * 1.5
+
+
+class TestIVFBenchmarks:
+    def test_recall_latency_tradeoff(self):
+        from codomyrmex.vector_store import IVFVectorStore, recall_at_k
+
+        rng = np.random.default_rng(1)
+        centres = rng.standard_normal((256, DIM)) * 0.6
+        labels = rng.integers(0, 256, N_VECTORS + 32)
+        points = (centres[labels] + rng.standard_normal((len(labels), DIM))).astype(
+            np.float32
+        )
+        data, queries = points[:N_VECTORS], points[N_VECTORS:].tolist()
+        entries = [(f"v{i}", row, None) for i, row in enumerate(data)]
+        exact = MatrixVectorStore(distance_metric="cosine")
+        exact.add_batch(entries)
+        ivf = IVFVectorStore(distance_metric="cosine", n_lists=128)
+        ivf.add_batch(entries)
+        assert ivf.is_trained
+
+        runner = BenchmarkRunner("vector_store IVF vs exact")
+        runner.add("exact", lambda: exact.search(queries[0], k=K), iterations=20)
+        recalls = {}
+        for nprobe in (1, 4, 16):
+            ivf.nprobe = nprobe
+            recalls[nprobe] = recall_at_k(ivf, exact, queries, k=K)
+            runner.add(
+                f"ivf_nprobe_{nprobe}",
+                lambda n=nprobe: ivf.search(queries[0], k=K, nprobe=n),
+                iterations=20,
+            )
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        print(
+            "recall@10: "
+            + ", ".join(f"nprobe={n}: {r:.3f}" for n, r in recalls.items())
+        )
+
+        assert recalls[1] <= recalls[4] <= recalls[16]
+        assert recalls[16] > 0.8
+
+
+class TestQuantizedBenchmarks:
+    def test_memory_and_recall(self, dataset, matrix_store, tmp_path):
+        from codomyrmex.vector_store import QuantizedVectorStore, quantization_report
+
+        data, queries = dataset
+        entries = [(f"v{i}", row, None) for i, row in enumerate(data)]
+        batch = queries.tolist()
+        runner = BenchmarkRunner("vector_store quantized search")
+        runner.add("float32", lambda: matrix_store.search(batch[0], k=K), iterations=20)
+        reports = {}
+        for method, subspaces in (("int8", 8), ("pq", 32)):
+            store = QuantizedVectorStore(
+                distance_metric="cosine",
+                method=method,
+                pq_subspaces=subspaces,
+                train_size=4096,
+                originals_dir=str(tmp_path),
+            )
+            store.add_batch(entries)
+            reports[method] = quantization_report(store, matrix_store, batch, k=K)
+            runner.add(method, lambda s=store: s.search(batch[0], k=K), iterations=20)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        for method, report in reports.items():
+            print(
+                f"{method}: recall@{K}={report['recall']:.3f} "
+                f"(codes only {report['recall_without_rerank']:.3f}), "
+                f"{report['bytes_per_vector']} B/vector, "
+                f"{report['compression_ratio']:.0f}x vs float32"
+            )
+
+        assert reports["int8"]["compression_ratio"] == 4
+        assert reports["pq"]["compression_ratio"] == 16
+        assert reports["int8"]["recall"] > 0.95
+        assert reports["pq"]["recall"] > 0.5
+
+
+class TestMmapStoreBenchmarks:
+    def test_cold_start_vs_json(self, dataset, tmp_path):
+        import time
+
+        from codomyrmex.vector_store.mmap_store import MmapVectorStore
+        from codomyrmex.vector_store.persistent import PersistentVectorStore
+
+        data, _ = dataset
+        n = 5_000
+        json_path = str(tmp_path / "vectors.json")
+        json_store = PersistentVectorStore(json_path, save_interval=10**9)
+        for i in range(n):
+            json_store.add(f"v{i}", data[i].tolist())
+        json_store.flush()
+
+        mmap_path = str(tmp_path / "vectors.db")
+        mmap_store = MmapVectorStore(mmap_path, compact_interval=None)
+        start = time.perf_counter()
+        for i in range(n):
+            mmap_store.add(f"v{i}", data[i])
+        write_ms = (time.perf_counter() - start) * 1000
+        mmap_store.compact()
+        mmap_store.close()
+
+        runner = BenchmarkRunner("vector_store cold start")
+        runner.add("json_load", lambda: PersistentVectorStore(json_path), iterations=3)
+        runner.add(
+            "mmap_open", lambda: MmapVectorStore(mmap_path).close(), iterations=3
+        )
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+        print(f"mmap WAL writes: {write_ms / n * 1000:.1f}us/record")
+
+        json_ms, mmap_ms = (r.mean_ms for r in suite.results)
+        assert mmap_ms < json_ms
+
+
+class TestMetadataFilterBenchmarks:
+    def test_selective_where_is_faster_than_filter_fn(self, dataset):
+        data, queries = dataset
+        store = MatrixVectorStore(distance_metric="cosine")
+        store.add_batch(
+            [(f"v{i}", row, {"tenant": i % 100}) for i, row in enumerate(data)]
+        )
+        query = queries[0].tolist()
+
+        runner = BenchmarkRunner("vector_store filtered search (1% selectivity)")
+        runner.add(
+            "filter_fn",
+            lambda: store.search(query, k=K, filter_fn=lambda m: m["tenant"] == 7),
+            iterations=20,
+        )
+        runner.add(
+            "where",
+            lambda: store.search(query, k=K, where={"tenant": 7}),
+            iterations=20,
+        )
+        runner.add("unfiltered", lambda: store.search(query, k=K), iterations=20)
+        suite = runner.run()
+        print("\n" + runner.to_markdown(suite))
+
+        filter_fn_ms, where_ms, _ = (r.mean_ms for r in suite.results)
+        assert where_ms < filter_fn_ms
@@ -0,0 +1,128 @@
+"""Tests for the vault parse cache and the incrementally maintained indexes."""
+
+import os
+from types import SimpleNamespace
+
+from codomyrmex.agentic_memory.obsidian.crud import create_note, delete_note
+from codomyrmex.agentic_memory.obsidian.graph import _graph_of, get_backlinks
+from codomyrmex.agentic_memory.obsidian.parser import parse_note
+from codomyrmex.agentic_memory.obsidian.vault import ObsidianVault
+
+
+def _edges(graph):
+    return {(u, v) for u in graph.nodes() for v in graph.successors(u)}
+
+
+def _assert_indexes_match_rebuild(vault):
+    fresh = ObsidianVault(vault.path)
+    assert list(vault.notes) == list(fresh.notes)
+    assert vault.get_all_tags() == fresh.get_all_tags()
+    for tag in fresh.get_all_tags():
+        assert [n.title for n in vault.get_notes_by_tag(tag)] == [
+            n.title for n in fresh.get_notes_by_tag(tag)
+        ]
+    # A vault without a link_index: the graph is built from its notes
+    rebuilt = _graph_of(SimpleNamespace(notes=fresh.notes))
+    graph = vault.link_index.graph
+    assert set(graph.nodes()) == set(rebuilt.nodes())
+    assert _edges(graph) == _edges(rebuilt)
+    for node in rebuilt.nodes():
+        assert sorted(graph.predecessors(node)) == sorted(rebuilt.predecessors(node))
+
+
+class TestParseCache:
+    def test_cached_notes_equal_fresh_parse(self, tmp_vault, tmp_path):
+        cache = tmp_path / "cache" / "vault.json"
+        (tmp_vault / "Keys.md").write_text(
+            "---\n1: one\nwhen: 2024-01-15 10:30:00\n---\nx\n"
+        )
+        first = ObsidianVault(tmp_vault, cache_path=cache)
+        assert not cache.exists()
+        _ = first.notes
+        assert cache.exists()
+        second = ObsidianVault(tmp_vault, cache_path=cache)
+        for rel, note in second.notes.items():
+            assert note == parse_note(tmp_vault / rel)
+            assert note == first.notes[rel]
+        fm = second.notes["My Test Note.md"].frontmatter
+        assert fm["created"].isoformat() == "2024-01-15"
+        assert second.notes["Keys.md"].frontmatter[1] == "one"
+
+    def test_refresh_reparses_only_changed_notes(self, tmp_vault):
+        vault = ObsidianVault(tmp_vault)
+        before = dict(vault.notes)
+        path = tmp_vault / "Simple Note.md"
+        path.write_text(path.read_text() + "\nMore text with #fresh-tag\n")
+        vault.refresh()
+        assert vault.notes["Simple Note.md"] is not before["Simple Note.md"]
+        for rel, note in before.items():
+            if rel != "Simple Note.md":
+                assert vault.notes[rel] is note
+        assert [n.title for n in vault.get_notes_by_tag("fresh-tag")] == ["Simple Note"]
+
+    def test_same_size_rewrite_with_same_mtime_is_detected(self, tmp_vault):
+        path = tmp_vault / "Racy.md"
+        path.write_text("links to [[Alpha]]")
+        vault = ObsidianVault(tmp_vault)
+        _ = vault.notes
+        stat = path.stat()
+        path.write_text("links to [[Gamma]]")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert vault.update([path]) == ["Racy.md"]
+        assert [link.target for link in vault.notes["Racy.md"].links] == ["Gamma"]
+
+    def test_unreadable_cache_is_ignored(self, tmp_vault, tmp_path):
+        cache = tmp_path / "vault.json"
+        cache.write_text("{not json")
+        vault = ObsidianVault(tmp_vault, cache_path=cache)
+        assert len(vault) == 7
+
+    def test_parallel_parse_matches_serial(self, tmp_vault):
+        serial = ObsidianVault(tmp_vault)
+        parallel = ObsidianVault(tmp_vault, max_workers=2, parallel_threshold=1)
+        assert parallel.notes == serial.notes
+
+
+class TestIncrementalIndexes:
+    def test_update_add_change_delete(self, tmp_vault):
+        vault = ObsidianVault(tmp_vault)
+        _ = vault.notes
+        (tmp_vault / "Hub.md").write_text("[[Simple Note]] [[Hub]] #hubtopic\n")
+        (tmp_vault / "Other Hub.md").write_text("[[Simple Note]] #hubtopic/child\n")
+        assert vault.update(["Hub.md", tmp_vault / "Other Hub.md"]) == [
+            "Hub.md",
+            "Other Hub.md",
+        ]
+        _assert_indexes_match_rebuild(vault)
+        assert {n.title for n in vault.get_notes_by_tag("hubtopic")} == {
+            "Hub",
+            "Other Hub",
+        }
+
+        (tmp_vault / "Hub.md").write_text("no links any more\n")
+        (tmp_vault / "Other Hub.md").unlink()
+        assert vault.update(["Hub.md", "Other Hub.md", ".obsidian/x.md"]) == [
+            "Hub.md",
+            "Other Hub.md",
+        ]
+        _assert_indexes_match_rebuild(vault)
+        assert "hubtopic" not in vault.get_all_tags()
+
+    def test_duplicate_titles_share_graph_nodes(self, tmp_vault):
+        (tmp_vault / "dup").mkdir()
+        (tmp_vault / "dup" / "Simple Note.md").write_text("[[Target X]]\n")
+        vault = ObsidianVault(tmp_vault)
+        assert vault.link_index.graph.has_edge("Simple Note", "Target X")
+        (tmp_vault / "dup" / "Simple Note.md").unlink()
+        vault.refresh()
+        assert vault.link_index.graph.has_node("Simple Note")
+        assert not vault.link_index.graph.has_node("Target X")
+        _assert_indexes_match_rebuild(vault)
+
+    def test_crud_keeps_backlinks_current(self, tmp_vault):
+        vault = ObsidianVault(tmp_vault)
+        create_note(vault, "Linker", content="see [[Simple Note]]")
+        assert "Linker" in [n.title for n in get_backlinks(vault, "Simple Note")]
+        delete_note(vault, "Linker")
+        assert "Linker" not in [n.title for n in get_backlinks(vault, "Simple Note")]
+        _assert_indexes_match_rebuild(vault)
@@ -0,0 +1,133 @@
+"""KnowledgeMemory embedding re-rank: batching, caching and async recall.
+
+Zero-mock: a real local HTTP server stands in for Ollama's ``/api/embed``.
+"""
+
+from __future__ import annotations
+
+import socket
+
+import pytest
+from tests.utils.fake_embed_server import FakeEmbedServer, fake_embedding
+
+from codomyrmex.agentic_memory.core.embeddings import (
+    EmbeddingCache,
+    OllamaEmbedder,
+    content_hash,
+)
+from codomyrmex.agentic_memory.core.memory import KnowledgeMemory
+from codomyrmex.agentic_memory.sqlite_store import SQLiteStore
+from codomyrmex.agentic_memory.stores import InMemoryStore
+
+
+@pytest.fixture
+def server(monkeypatch):
+    with FakeEmbedServer() as srv:
+        monkeypatch.setenv("OLLAMA_BASE_URL", srv.url)
+        yield srv
+
+
+def _fill(km: KnowledgeMemory) -> None:
+    km.store(title="BM25 ranking", body="bm25 ranking scores documents for search")
+    km.store(title="Ollama models", body="ollama runs local language models")
+    km.store(title="Search engines", body="search engines rank documents")
+
+
+@pytest.mark.unit
+class TestBatchedRerank:
+    def test_one_request_then_only_the_query(self, server) -> None:
+        km = KnowledgeMemory(store=InMemoryStore())
+        _fill(km)
+
+        first = km.recall("search ranking documents", k=3)
+        assert len(server.requests) == 1
+        assert server.requests[0][0] == "search ranking documents"
+        assert len(server.requests[0]) == 1 + len(first)
+
+        second = km.recall("search ranking documents", k=3)
+        assert server.requests[1] == ["search ranking documents"]
+        assert [r.memory.id for r in second] == [r.memory.id for r in first]
+        assert len(km.embedding_cache) == len(first)
+
+    def test_changed_content_is_re_embedded(self, server) -> None:
+        km = KnowledgeMemory(store=InMemoryStore())
+        mem = km.store(title="Topic", body="alpha beta")
+        km.recall("alpha", k=1)
+        mem.content = "Topic\n\nalpha gamma"
+        km._agent.store.save(mem)
+        km.recall("alpha", k=1)
+        assert server.requests[1] == ["alpha", "Topic\n\nalpha gamma"]
+
+    def test_default_cache_stays_in_memory(self, server, tmp_path) -> None:
+        km = KnowledgeMemory(store=SQLiteStore(db_path=str(tmp_path / "ki.db")))
+        assert km.embedding_cache.db_path is None
+
+    def test_cache_persists_when_given_a_path(self, server, tmp_path) -> None:
+        db = str(tmp_path / "ki.db")
+        cache = EmbeddingCache(db)
+        km = KnowledgeMemory(store=SQLiteStore(db_path=db), embedding_cache=cache)
+        _fill(km)
+        km.recall("local language models", k=2)
+        assert len(server.requests[0]) > 1
+        cache.close()
+
+        reopened_cache = EmbeddingCache(db)
+        reopened = KnowledgeMemory(
+            store=SQLiteStore(db_path=db), embedding_cache=reopened_cache
+        )
+        reopened.recall("local language models", k=2)
+        assert server.requests[1] == ["local language models"]
+        reopened_cache.close()
+
+    def test_rerank_orders_by_blended_similarity(self, server) -> None:
+        km = KnowledgeMemory(store=InMemoryStore())
+        _fill(km)
+        results = km.recall("ollama local models", k=3)
+        assert results[0].memory.metadata["title"] == "Ollama models"
+
+    async def test_arecall_matches_recall(self, server) -> None:
+        km = KnowledgeMemory(store=InMemoryStore())
+        _fill(km)
+        expected = [r.memory.id for r in km.recall("search documents", k=3)]
+        got = await km.arecall("search documents", k=3)
+        assert [r.memory.id for r in got] == expected
+        assert server.requests[-1] == ["search documents"]
+
+    async def test_unreachable_server_falls_back(self, monkeypatch) -> None:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        monkeypatch.setenv("OLLAMA_BASE_URL", f"http://127.0.0.1:{port}")
+        km = KnowledgeMemory(store=InMemoryStore())
+        _fill(km)
+        token_only = km.recall("search documents", k=2, use_ollama=False)
+        ids = [r.memory.id for r in token_only]
+        assert [r.memory.id for r in km.recall("search documents", k=2)] == ids
+        assert [r.memory.id for r in await km.arecall("search documents", k=2)] == ids
+
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    def test_roundtrip_on_disk(self, tmp_path) -> None:
+        path = tmp_path / "vectors.db"
+        cache = EmbeddingCache(path)
+        cache.put_many("m", {"h1": [0.5, 1.25], "h2": [3.0, -1.0]})
+        cache.close()
+
+        reopened = EmbeddingCache(path)
+        assert reopened.get_many("m", ["h1", "h2", "h3"]) == {
+            "h1": [0.5, 1.25],
+            "h2": [3.0, -1.0],
+        }
+        assert reopened.get_many("other-model", ["h1"]) == {}
+        assert len(reopened) == 2
+
+    def test_embedder_deduplicates_documents(self, server) -> None:
+        embedder = OllamaEmbedder("m", base_url=server.url)
+        q_vec, vectors = embedder.embed_with_query("q", ["same", "same", "other"])
+        assert server.requests == [["q", "same", "other"]]
+        assert q_vec == fake_embedding("q")
+        assert vectors == [fake_embedding(t) for t in ("same", "same", "other")]
+        assert set(embedder.cache.get_many("m", [content_hash("same")])) == {
+            content_hash("same")
+        }
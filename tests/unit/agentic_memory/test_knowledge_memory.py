@@ -5,12 +5,14 @@ Zero-mock: uses InMemoryStore (the real in-memory backend) directly.
 
 from __future__ import annotations
 
+import random
 import time
 
 import pytest
 
 from codomyrmex.agentic_memory.core.memory import KnowledgeMemory
-from codomyrmex.agentic_memory.stores import InMemoryStore
+from codomyrmex.agentic_memory.core.minhash import candidate_pairs, lsh_params
+from codomyrmex.agentic_memory.stores import InMemoryStore, JSONFileStore
 
 # ── fixture ────────────────────────────────────────────────────────────────
 
@@ -110,3 +112,102 @@ def test_merge_duplicates_threshold_zero_merges_all(km: KnowledgeMemory) -> None
     merged = km.merge_duplicates(threshold=0.0)
     # At least one merge (word1 overlaps)
     assert merged >= 1
+
+
+# ── deduplicate (MinHash/LSH) ──────────────────────────────────────────────
+
+
+def _corpus(km: KnowledgeMemory, topics: int = 60, copies: int = 3) -> None:
+    rng = random.Random(11)
+    vocab = [f"term{i}" for i in range(3000)]
+    for t in range(topics):
+        words = rng.sample(vocab, 20)
+        for c in range(copies):
+            body = list(words)
+            if c:
+                body[rng.randrange(len(body))] = rng.choice(vocab)
+            km.store(title=f"Topic {t}", body=" ".join(body))
+
+
+def test_deduplicate_lsh_matches_exhaustive() -> None:
+    lsh_km = KnowledgeMemory(store=InMemoryStore())
+    full_km = KnowledgeMemory(store=InMemoryStore())
+    _corpus(lsh_km)
+    _corpus(full_km)
+
+    lsh = lsh_km.deduplicate(threshold=0.85)
+    full = full_km.deduplicate(threshold=0.85, exhaustive=True)
+
+    assert lsh.used_lsh
+    assert not full.used_lsh
+    # The first near-copy of each topic merges; the grown base then
+    # falls below the threshold for the second one.
+    assert lsh.merged == full.merged == 60
+    assert lsh.pairs_compared < full.pairs_compared / 20
+    assert sorted(m.content for m in lsh_km._agent.store.list_all()) == sorted(
+        m.content for m in full_km._agent.store.list_all()
+    )
+
+
+def test_deduplicate_low_threshold_compares_all_pairs(km: KnowledgeMemory) -> None:
+    for i in range(4):
+        km.store(title=f"T{i}", body=f"unique{i}")
+    report = km.deduplicate(threshold=0.2)
+    assert not report.used_lsh
+    assert report.scanned == 4
+    assert report.pairs_compared == report.total_pairs == 6
+    assert report.merged == 0
+
+
+def test_deduplicate_batches_json_writes(tmp_path) -> None:
+    store = JSONFileStore(str(tmp_path / "ki.json"))
+    km = KnowledgeMemory(store=store)
+    for topic in ("first", "second"):
+        for _ in range(2):
+            km.store(title=topic, body="identical knowledge item body text")
+    report = km.deduplicate(threshold=0.85)
+    assert report.merged == 2
+    reloaded = JSONFileStore(str(tmp_path / "ki.json")).list_all()
+    assert len(reloaded) == 2
+    assert all(m.content.count("## Update") == 1 for m in reloaded)
+
+
+def test_candidate_pairs_skip_empty_and_low_thresholds() -> None:
+    sets = [frozenset({"a", "b", "c"}), frozenset(), frozenset({"a", "b", "c"})]
+    assert candidate_pairs(sets, 0.9) == {(0, 2)}
+    assert candidate_pairs(sets, 0.1) is None
+    assert lsh_params(0.85, 64) == (21, 3)
+
+
+def test_deduplicate_contained_in_longer_item(km: KnowledgeMemory) -> None:
+    km.store(title="python", body="type hints")
+    time.sleep(0.01)
+    extra = " ".join(f"extra{i}" for i in range(20))
+    km.store(title="python", body=f"type hints {extra}")
+    report = km.deduplicate(threshold=0.85)
+    assert report.used_lsh
+    assert report.pairs_compared == 1
+    assert report.merged == 1
+
+
+def test_candidate_pairs_cover_containment_across_sizes() -> None:
+    rng = random.Random(5)
+    vocab = [f"w{i}" for i in range(400)]
+    sets = []
+    for _ in range(40):
+        base = rng.sample(vocab, rng.randrange(2, 30))
+        sets.append(frozenset(base))
+        grown = base[: int(len(base) * 0.9) or 1] + rng.sample(vocab, rng.randrange(60))
+        sets.append(frozenset(grown))
+
+    def contained(a: frozenset, b: frozenset) -> bool:
+        return len(a & b) / len(a) >= 0.85
+
+    expected = {
+        (i, j)
+        for i in range(len(sets))
+        for j in range(i + 1, len(sets))
+        if contained(sets[i], sets[j]) or contained(sets[j], sets[i])
+    }
+    assert expected
+    assert expected <= candidate_pairs(sets, 0.85)
@@ -0,0 +1,213 @@
+"""Tests for indexed AgentMemory retrieval — strictly zero-mock."""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import time
+
+import pytest
+
+from codomyrmex.agentic_memory import AgentMemory, InMemoryStore, JSONFileStore
+from codomyrmex.agentic_memory.core.memory import _recency_score, _relevance
+from codomyrmex.agentic_memory.core.models import (
+    Memory,
+    MemoryImportance,
+    MemoryType,
+    RetrievalResult,
+)
+from codomyrmex.agentic_memory.core.token_index import TokenIndex
+from codomyrmex.agentic_memory.sqlite_store import SQLiteStore
+
+WORDS = [
+    "alpha",
+    "beta",
+    "gamma",
+    "delta",
+    "epsilon",
+    "zeta",
+    "eta",
+    "theta",
+    "iota",
+    "kappa",
+]
+
+
+def _populate(store, n: int = 300, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    now = time.time()
+    for i in range(n):
+        store.save(
+            Memory(
+                id=f"m{i}",
+                content=" ".join(rng.choices(WORDS, k=rng.randint(1, 5))),
+                memory_type=rng.choice(list(MemoryType)),
+                importance=rng.choice(list(MemoryImportance)),
+                created_at=now - rng.uniform(0, 20000),
+            )
+        )
+
+
+def _full_scan(store, query, k, memory_type=None, min_importance=None):
+    results = [
+        RetrievalResult(
+            memory=m,
+            relevance_score=_relevance(query, m.content),
+            recency_score=_recency_score(m.created_at),
+            importance_score=m.importance.value / 4.0,
+        )
+        for m in store.list_all()
+        if (memory_type is None or m.memory_type == memory_type)
+        and (min_importance is None or m.importance.value >= min_importance.value)
+    ]
+    results.sort(key=lambda r: r.combined_score, reverse=True)
+    return results[:k]
+
+
+def _scores(results) -> list[float]:
+    return [r.combined_score for r in results]
+
+
+@pytest.fixture(params=["memory", "json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryStore()
+    elif request.param == "json":
+        yield JSONFileStore(tmp_path / "mem.json")
+    else:
+        yield SQLiteStore(db_path=str(tmp_path / "mem.db"))
+
+
+@pytest.mark.unit
+class TestIndexedRecall:
+    @pytest.mark.parametrize(
+        ("query", "k", "memory_type", "min_importance"),
+        [
+            ("alpha beta", 10, None, None),
+            ("gamma", 5, MemoryType.SEMANTIC, None),
+            ("delta zeta unknown", 7, None, MemoryImportance.HIGH),
+            ("nothing matches", 4, MemoryType.PROCEDURAL, MemoryImportance.MEDIUM),
+            ("ALPHA", 50, None, None),
+        ],
+    )
+    def test_matches_full_scan(self, store, query, k, memory_type, min_importance):
+        _populate(store)
+        mem = AgentMemory(store=store)
+        got = mem.recall(
+            query, k=k, memory_type=memory_type, min_importance=min_importance
+        )
+        expected = _full_scan(store, query, k, memory_type, min_importance)
+        # Recency keeps decaying between the two calls; compare with a tolerance.
+        assert _scores(got) == pytest.approx(_scores(expected), abs=1e-4)
+        for r in got:
+            assert r.relevance_score == _relevance(query, r.memory.content)
+            if memory_type is not None:
+                assert r.memory.memory_type == memory_type
+            if min_importance is not None:
+                assert r.memory.importance.value >= min_importance.value
+
+    def test_recall_does_not_touch_access_counts(self, store):
+        mem = AgentMemory(store=store)
+        saved = mem.remember("alpha beta")
+        mem.recall("alpha", k=3)
+        assert store.list_all()[0].access_count == saved.access_count == 0
+
+    def test_direct_store_writes_stay_indexed(self, store):
+        mem = AgentMemory(store=store)
+        store.save(Memory(id="x", content="unique needle"))
+        assert [r.memory.id for r in mem.recall("needle", k=1)] == ["x"]
+
+        store.save(Memory(id="x", content="something else"))
+        assert [r.memory.content for r in mem.recall("needle", k=1)] == [
+            "something else"
+        ]
+        assert mem.recall("needle", k=1)[0].relevance_score == 0.0
+
+        assert mem.forget("x")
+        assert mem.recall("needle", k=5) == []
+
+    def test_empty_query_keeps_store_order(self, store):
+        _populate(store, n=40)
+        mem = AgentMemory(store=store)
+        got = mem.recall("", k=6, min_importance=MemoryImportance.HIGH)
+        expected = [
+            m.id
+            for m in store.list_all()
+            if m.importance.value >= MemoryImportance.HIGH.value
+        ][:6]
+        assert [r.memory.id for r in got] == expected
+        assert all(r.relevance_score == 0.0 for r in got)
+
+    def test_custom_store_falls_back_to_scan(self):
+        class ListStore:
+            def __init__(self) -> None:
+                self.items: dict[str, Memory] = {}
+
+            def save(self, memory: Memory) -> None:
+                self.items[memory.id] = memory
+
+            def list_all(self) -> list[Memory]:
+                return list(self.items.values())
+
+        store = ListStore()
+        _populate(store, n=50)
+        got = AgentMemory(store=store).recall("beta", k=5)
+        assert _scores(got) == pytest.approx(
+            _scores(_full_scan(store, "beta", 5)), abs=1e-4
+        )
+
+
+@pytest.mark.unit
+class TestStoreIndexes:
+    def test_token_index_add_remove(self):
+        index = TokenIndex()
+        index.add(Memory(id="a", content="Foo bar", created_at=1.0))
+        index.add(Memory(id="b", content="bar baz", created_at=2.0))
+        assert sorted(index.token_matches({"bar", "foo"})) == [
+            ("a", 2, 1.0, MemoryImportance.MEDIUM.value),
+            ("b", 1, 2.0, MemoryImportance.MEDIUM.value),
+        ]
+        index.remove("a")
+        index.remove("missing")
+        assert len(index) == 1
+        assert index.token_matches({"foo"}) == []
+        assert index.token_matches(set(), recent_per_importance=5) == [
+            ("b", 0, 2.0, MemoryImportance.MEDIUM.value)
+        ]
+
+    def test_json_store_rebuilds_index_on_load(self, tmp_path):
+        path = tmp_path / "mem.json"
+        JSONFileStore(path).save(Memory(id="a", content="persisted words"))
+        reloaded = JSONFileStore(path)
+        assert [row[0] for row in reloaded.token_matches({"words"})] == ["a"]
+
+    def test_sqlite_backfills_tokens_for_existing_db(self, tmp_path):
+        db = tmp_path / "old.db"
+        SQLiteStore(db_path=str(db)).save(Memory(id="a", content="legacy row"))
+        conn = sqlite3.connect(db)
+        conn.execute("DROP TABLE memory_tokens")
+        conn.commit()
+        conn.close()
+
+        store = SQLiteStore(db_path=str(db))
+        assert [row[:2] for row in store.token_matches({"legacy", "row"})] == [("a", 2)]
+
+    def test_sqlite_get_many_and_list_filtered(self, tmp_path):
+        store = SQLiteStore(db_path=str(tmp_path / "mem.db"))
+        for i, importance in enumerate(MemoryImportance):
+            store.save(
+                Memory(
+                    id=f"m{i}",
+                    content="x",
+                    importance=importance,
+                    created_at=float(i),
+                )
+            )
+        assert [m.id for m in store.get_many(["m3", "zz", "m0"])] == ["m3", "m0"]
+        assert [
+            m.id
+            for m in store.list_filtered(
+                min_importance=MemoryImportance.MEDIUM, limit=2
+            )
+        ] == ["m1", "m2"]
+        assert store.get_many([]) == []
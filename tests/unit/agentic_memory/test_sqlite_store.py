@@ -146,3 +146,14 @@ class TestSQLiteStoreCorruptedData:
         # Find the corrupted one — should have empty metadata fallback
         bad = next(m for m in memories if m.id == "bad-meta")
         assert bad.metadata == {}  # Graceful fallback
+
+    def test_save_many_and_delete_many(self, sqlite_store):
+        sqlite_store.save_many(
+            [Memory(id=str(i), content=f"batch item {i}") for i in range(5)]
+        )
+        assert len(sqlite_store.list_all()) == 5
+        assert [r[0] for r in sqlite_store.token_matches({"3"})] == ["3"]
+
+        assert sqlite_store.delete_many(["1", "3", "missing"]) == 2
+        assert sorted(m.id for m in sqlite_store.list_all()) == ["0", "2", "4"]
+        assert sqlite_store.token_matches({"3"}) == []
@@ -64,3 +64,61 @@ def test_consolidation_trace_field_boost() -> None:
     cases = cons.consolidate([mem])
     assert len(cases) == 1
     assert cases[0].case_id == "memory-mem-1"
+
+
+def _replay(field: TraceField, ticks: int = 12) -> list[tuple[str, float]]:
+    field.deposit("a", 4.0, metadata={"n": 1})
+    field.deposit("b", 2.25)
+    field.deposit("c", 0.75)
+    for step in range(ticks):
+        if step == 2:
+            field.reinforce("b")
+        if step == 5:
+            field.deposit("a", 1.5)
+            field.deposit("d", 3.0)
+        field.tick()
+    return [(m.key, round(m.strength, 9)) for m in field.top_k(10)]
+
+
+def test_lazy_evaporation_matches_eager() -> None:
+    eager = TraceField(StigmergyConfig(evaporation_per_tick=0.25))
+    lazy = TraceField(StigmergyConfig(evaporation_per_tick=0.25, lazy_evaporation=True))
+    assert _replay(lazy) == _replay(eager)
+    assert len(lazy) == len(eager)
+    for key in ("a", "b", "c", "d"):
+        e, z = eager.sense(key), lazy.sense(key)
+        assert (e is None) == (z is None)
+        if e is not None and z is not None:
+            assert z.strength == pytest.approx(e.strength)
+
+
+def test_lazy_tick_defers_removal_to_collect() -> None:
+    cfg = StigmergyConfig(
+        evaporation_per_tick=0.5, lazy_evaporation=True, gc_interval_ticks=4
+    )
+    field = TraceField(cfg)
+    field.deposit("fleeting", initial=0.4)
+    field.deposit("stays", initial=10.0)
+    assert field.tick() == 0
+    assert field.sense("fleeting") is None
+    field.deposit("gone", initial=0.6)
+    assert [field.tick() for _ in range(3)] == [0, 0, 1]
+    assert len(field) == 1
+    assert field.ticks == 4
+    assert [m.key for m in field.top_k(5)] == ["stays"]
+
+
+def test_lazy_deposit_on_expired_key_starts_fresh() -> None:
+    cfg = StigmergyConfig(evaporation_per_tick=1.0, lazy_evaporation=True)
+    field = TraceField(cfg)
+    field.deposit("k", 0.5, metadata={"old": True})
+    field.tick()
+    m = field.deposit("k", 2.0)
+    assert m.strength == 2.0
+    assert m.metadata == {}
+    assert field.collect() == 0
+
+
+def test_gc_interval_validation() -> None:
+    with pytest.raises(ValueError, match="gc_interval_ticks"):
+        StigmergyConfig(gc_interval_ticks=0)
@@ -42,3 +42,67 @@ def test_sqlite_len(tmp_path: Path) -> None:
     assert len(ledger) == 0
     ledger.deposit("z", 1.0)
     assert len(ledger) == 1
+
+
+def _lazy(**kwargs: float) -> StigmergyConfig:
+    return StigmergyConfig(lazy_evaporation=True, **kwargs)
+
+
+def test_sqlite_lazy_matches_eager(tmp_path: Path) -> None:
+    results = []
+    for name, cfg in (
+        ("eager", StigmergyConfig(evaporation_per_tick=0.25)),
+        ("lazy", _lazy(evaporation_per_tick=0.25, gc_interval_ticks=3)),
+    ):
+        ledger = SqliteTraceLedger(str(tmp_path / f"{name}.db"), config=cfg)
+        ledger.deposit("a", 4.0)
+        ledger.deposit("b", 2.25)
+        ledger.deposit("c", 0.75)
+        for step in range(10):
+            if step == 2:
+                ledger.reinforce("b")
+            if step == 5:
+                ledger.deposit("a", 1.5)
+            ledger.tick()
+        results.append(
+            ([(m.key, round(m.strength, 9)) for m in ledger.top_k(5)], len(ledger))
+        )
+    assert results[0] == results[1]
+
+
+def test_sqlite_lazy_gc_is_periodic(tmp_path: Path) -> None:
+    cfg = _lazy(evaporation_per_tick=1.0, gc_interval_ticks=2)
+    ledger = SqliteTraceLedger(str(tmp_path / "gc.db"), config=cfg)
+    ledger.deposit("weak", 0.5)
+    ledger.deposit("strong", 5.0)
+    assert ledger.tick() == 0
+    assert ledger.sense("weak") is None
+    assert len(ledger) == 1
+    assert ledger.tick() == 1
+    assert ledger.collect() == 0
+
+
+def test_sqlite_lazy_survives_reopen_and_mode_switch(tmp_path: Path) -> None:
+    db = str(tmp_path / "switch.db")
+    lazy = SqliteTraceLedger(db, config=_lazy(evaporation_per_tick=1.0))
+    lazy.deposit("k", 5.0, metadata={"src": "lazy"})
+    lazy.deposit("weak", 0.5)
+    lazy.tick()
+    lazy.tick()
+
+    again = SqliteTraceLedger(db, config=_lazy(evaporation_per_tick=1.0))
+    m = again.sense("k")
+    assert m is not None
+    assert m.strength == 3.0
+    assert m.metadata == {"src": "lazy"}
+
+    slower = SqliteTraceLedger(db, config=_lazy(evaporation_per_tick=0.5))
+    assert slower.sense("k").strength == 3.0
+    slower.tick()
+    assert slower.sense("k").strength == 2.5
+
+    eager = SqliteTraceLedger(db, config=StigmergyConfig(evaporation_per_tick=0.5))
+    assert len(eager) == 1
+    assert eager.sense("k").strength == 2.5
+    eager.tick()
+    assert eager.sense("k").strength == 2.0
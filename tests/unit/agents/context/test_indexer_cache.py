@@ -0,0 +1,179 @@
+"""Tests for RepoIndexer caching, parallel parsing and incremental refresh."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from codomyrmex.agents.context.indexer import IndexWatcher, RepoIndexer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _tree(root: Path, files: int = 4) -> None:
+    (root / "pkg").mkdir()
+    for i in range(files):
+        (root / "pkg" / f"mod{i}.py").write_text(
+            f'import os\nfrom json import dumps\n\n\ndef func{i}():\n    """Doc {i}."""\n\n\n'
+            f"class Cls{i}:\n    pass\n"
+        )
+    (root / "broken.py").write_text("def broken(:\n")
+    # Old enough that the cache trusts mtime and size
+    for path in root.rglob("*.py"):
+        os.utime(path, ns=(10**18, 10**18))
+
+
+def _names(index) -> set[str]:
+    return {s.name for s in index.symbols}
+
+
+def _rewrite_keeping_stat(path: Path, text: str) -> None:
+    """Replace the content without changing size or mtime."""
+    stat = path.stat()
+    path.write_text(text.ljust(stat.st_size)[: stat.st_size])
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+@pytest.mark.unit
+class TestIndexCache:
+    def test_unchanged_files_come_from_cache(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        indexer = RepoIndexer()
+        first = indexer.index_directory(tmp_path)
+        assert first.files_indexed == 4
+        assert first.symbol_count == 8
+
+        # Same size and mtime: the cached symbols are served
+        _rewrite_keeping_stat(tmp_path / "pkg" / "mod0.py", "def zzzzz(): pass\n" * 3)
+        assert "func0" in _names(indexer.index_directory(tmp_path))
+
+    def test_changed_and_removed_files(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        indexer = RepoIndexer()
+        indexer.index_directory(tmp_path)
+        (tmp_path / "pkg" / "mod0.py").write_text("def renamed():\n    pass\n")
+        (tmp_path / "pkg" / "mod1.py").unlink()
+        names = _names(indexer.index_directory(tmp_path))
+        assert "renamed" in names
+        assert not {"func0", "func1", "Cls1"} & names
+
+    def test_touched_file_matches_by_hash(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        indexer = RepoIndexer()
+        indexer.index_directory(tmp_path)
+        path = tmp_path / "pkg" / "mod2.py"
+        digest = indexer._cache.entries[str(path)]["digest"]
+        os.utime(path, ns=(0, 10**9))
+        indexer.index_directory(tmp_path)
+        entry = indexer._cache.entries[str(path)]
+        assert entry["digest"] == digest
+        assert entry["mtime_ns"] == 10**9
+
+    def test_cache_persists_across_instances(self, tmp_path: Path) -> None:
+        root = tmp_path / "repo"
+        root.mkdir()
+        _tree(root)
+        cache = tmp_path / "cache" / "index.json"
+        expected = RepoIndexer(cache_path=cache).index_directory(root)
+        assert json.loads(cache.read_text())["version"] == 2
+
+        _rewrite_keeping_stat(root / "pkg" / "mod3.py", "x = 1\n" * 20)
+        reloaded = RepoIndexer(cache_path=cache).index_directory(root)
+        assert [s.to_dict() for s in reloaded.symbols] == [
+            s.to_dict() for s in expected.symbols
+        ]
+
+    def test_corrupt_cache_is_ignored(self, tmp_path: Path) -> None:
+        (tmp_path / "repo").mkdir()
+        _tree(tmp_path / "repo")
+        cache = tmp_path / "index.json"
+        cache.write_text("{not json")
+        index = RepoIndexer(cache_path=cache).index_directory(tmp_path / "repo")
+        assert index.files_indexed == 4
+
+    def test_parallel_matches_serial(self, tmp_path: Path) -> None:
+        _tree(tmp_path, files=12)
+        serial = RepoIndexer().index_directory(tmp_path)
+        parallel = RepoIndexer(max_workers=2, parallel_threshold=1).index_directory(
+            tmp_path
+        )
+        assert [s.to_dict() for s in parallel.symbols] == [
+            s.to_dict() for s in serial.symbols
+        ]
+        assert len(parallel.imports) == len(serial.imports) == 24
+
+    def test_index_file_uses_cache(self, tmp_path: Path) -> None:
+        path = tmp_path / "one.py"
+        path.write_text("def one():\n    pass\n")
+        os.utime(path, ns=(10**18, 10**18))
+        indexer = RepoIndexer()
+        assert indexer.index_file(path).symbol_count == 1
+        _rewrite_keeping_stat(path, "x = 111111111111111\n")
+        assert _names(indexer.index_file(path)) == {"one"}
+
+    def test_same_size_rewrite_with_same_recent_mtime_is_detected(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "racy.py"
+        path.write_text("def alpha(): pass\n")
+        indexer = RepoIndexer()
+        assert _names(indexer.index_file(path)) == {"alpha"}
+        # Rewritten within the timestamp granularity: stat alone cannot tell
+        _rewrite_keeping_stat(path, "def gamma(): pass\n")
+        assert _names(indexer.index_file(path)) == {"gamma"}
+        assert _names(indexer.index_directory(tmp_path)) == {"gamma"}
+
+
+@pytest.mark.unit
+class TestIncrementalRefresh:
+    def test_update_paths(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        indexer = RepoIndexer()
+        indexer.index_directory(tmp_path)
+        new = tmp_path / "pkg" / "extra.py"
+        new.write_text("class Extra:\n    pass\n")
+        (tmp_path / "pkg" / "mod0.py").unlink()
+
+        index = indexer.update([new, tmp_path / "pkg" / "mod0.py"])
+        assert "Extra" in _names(index)
+        assert "func0" not in _names(index)
+        assert index is indexer.index
+        assert index.files_indexed == 4
+
+    def test_changed_files(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        indexer = RepoIndexer()
+        assert indexer.changed_files() == []
+        indexer.index_directory(tmp_path)
+        assert indexer.changed_files() == []
+        (tmp_path / "pkg" / "mod1.py").write_text("def changed(): pass\n")
+        (tmp_path / "pkg" / "mod2.py").unlink()
+        (tmp_path / "new.py").write_text("")
+        changed = {os.path.basename(p) for p in indexer.changed_files()}
+        assert changed == {"mod1.py", "mod2.py", "new.py"}
+
+    def test_watcher_poll_and_thread(self, tmp_path: Path) -> None:
+        _tree(tmp_path)
+        seen: list[list[str]] = []
+        refreshed = threading.Event()
+
+        def callback(index, changed):
+            seen.append(changed)
+            refreshed.set()
+
+        indexer = RepoIndexer()
+        watcher = indexer.watch(tmp_path, callback=callback, interval=0.05)
+        assert isinstance(watcher, IndexWatcher)
+        assert watcher.is_alive
+        (tmp_path / "pkg" / "late.py").write_text("def late(): pass\n")
+        assert refreshed.wait(timeout=5)
+        watcher.stop()
+        assert not watcher.is_alive
+        assert "late" in _names(indexer.index)
+        assert any(p.endswith("late.py") for p in seen[0])
+        assert watcher.poll() == []
@@ -355,3 +355,199 @@ class TestSQLiteHistoryStore:
         loaded = store.load("sc-meta")
         assert loaded.messages[0].tokens == 55
         assert loaded.messages[0].metadata == {"source": "cli"}
+
+
+@pytest.mark.unit
+class TestFileHistoryStoreIndex:
+    """Tests for the FileHistoryStore summary index."""
+
+    def test_list_summaries_from_index(self, tmp_path):
+        """Summaries come from the index without reparsing files."""
+        store = FileHistoryStore(str(tmp_path))
+        now = datetime.now()
+        for i in range(3):
+            conv = _make_conversation(f"fc{i}", messages=[(MessageRole.USER, "hi")] * i)
+            conv.updated_at = now - timedelta(hours=i)
+            store.save(conv)
+        summaries = store.list_summaries(limit=2, offset=1)
+        assert [s["conversation_id"] for s in summaries] == ["fc1", "fc2"]
+        assert summaries[1]["message_count"] == 2
+        assert (tmp_path / FileHistoryStore.INDEX_NAME).exists()
+
+        reopened = FileHistoryStore(str(tmp_path))
+        reopened.load = None  # the index is valid, so no file may be parsed
+        assert [s["conversation_id"] for s in reopened.list_summaries()] == [
+            "fc0",
+            "fc1",
+            "fc2",
+        ]
+
+    def test_external_changes_are_picked_up(self, tmp_path):
+        """Files added, rewritten or removed behind the store's back."""
+        store = FileHistoryStore(str(tmp_path))
+        store.save(_make_conversation("a", title="Old"))
+        store.save(_make_conversation("b"))
+        assert len(store.list_summaries()) == 2
+
+        other = FileHistoryStore(str(tmp_path))
+        other.save(_make_conversation("a", title="Renamed title"))
+        other.save(_make_conversation("c"))
+        (tmp_path / "b.json").unlink()
+
+        summaries = {s["conversation_id"]: s for s in store.list_summaries()}
+        assert set(summaries) == {"a", "c"}
+        assert summaries["a"]["title"] == "Renamed title"
+
+    def test_delete_drops_index_entry(self, tmp_path):
+        """Deleted conversations disappear from listings."""
+        store = FileHistoryStore(str(tmp_path))
+        store.save(_make_conversation("gone"))
+        store.delete("gone")
+        assert store.list_conversations() == []
+
+
+@pytest.mark.unit
+class TestSQLiteHistoryStoreIncremental:
+    """Tests for pooled connections, diff-based saves and FTS search."""
+
+    @staticmethod
+    def _message_rows(db_path):
+        import sqlite3
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute(
+            "SELECT rowid, message_id, seq, content FROM messages ORDER BY seq"
+        ).fetchall()
+        conn.close()
+        return rows
+
+    def test_wal_mode(self, tmp_path):
+        """Pooled connections use WAL journaling."""
+        store = SQLiteHistoryStore(str(tmp_path / "test.db"))
+        with store._get_connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_append_only_inserts_new_rows(self, tmp_path):
+        """Re-saving after an append keeps the existing rows untouched."""
+        db_path = str(tmp_path / "test.db")
+        store = SQLiteHistoryStore(db_path)
+        conv = _make_conversation(
+            "inc", messages=[(MessageRole.USER, f"m{i}") for i in range(5)]
+        )
+        store.save(conv)
+        before = self._message_rows(db_path)
+        conv.add_assistant_message("m5")
+        store.save(conv)
+        after = self._message_rows(db_path)
+        assert after[:5] == before
+        assert after[5][2:] == (5, "m5")
+
+    def test_edit_remove_and_reorder(self, tmp_path):
+        """Edited, removed and reordered messages round-trip."""
+        store = SQLiteHistoryStore(str(tmp_path / "test.db"))
+        conv = _make_conversation(
+            "edit", messages=[(MessageRole.USER, f"m{i}") for i in range(4)]
+        )
+        store.save(conv)
+        conv.messages[1].content = "edited"
+        del conv.messages[2]
+        conv.messages.reverse()
+        store.save(conv)
+        loaded = store.load("edit")
+        assert [m.content for m in loaded.messages] == ["m3", "edited", "m0"]
+        assert store.list_summaries()[0]["message_count"] == 3
+
+    def test_search_substring_and_short_queries(self, tmp_path):
+        """FTS search keeps case-insensitive substring semantics."""
+        store = SQLiteHistoryStore(str(tmp_path / "test.db"))
+        store.save(
+            _make_conversation(
+                "s1",
+                title="Planning",
+                messages=[(MessageRole.USER, "Fix the Authentication bug")],
+            )
+        )
+        store.save(_make_conversation("s2", title="OAuth rollout"))
+        assert store.fts_enabled
+        assert [c.conversation_id for c in store.search("AUTHENT")] == ["s1"]
+        assert {c.conversation_id for c in store.search("auth")} == {"s1", "s2"}
+        assert {c.conversation_id for c in store.search("au")} == {"s1", "s2"}
+        assert store.search('"quoted"') == []
+
+    def test_search_index_follows_updates(self, tmp_path):
+        """Edited and deleted content leaves the search index."""
+        store = SQLiteHistoryStore(str(tmp_path / "test.db"))
+        conv = _make_conversation("s", messages=[(MessageRole.USER, "platypus")])
+        store.save(conv)
+        conv.messages[0].content = "wombat"
+        store.save(conv)
+        assert store.search("platypus") == []
+        assert len(store.search("wombat")) == 1
+        store.delete("s")
+        assert store.search("wombat") == []
+
+    def test_migrates_legacy_schema(self, tmp_path):
+        """Databases from the previous schema gain seq, counts and FTS."""
+        import sqlite3
+
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE conversations (conversation_id TEXT PRIMARY KEY, "
+            "title TEXT, created_at TEXT, updated_at TEXT, metadata TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE messages (message_id TEXT PRIMARY KEY, "
+            "conversation_id TEXT, role TEXT, content TEXT, timestamp TEXT, "
+            "tokens INTEGER DEFAULT 0, metadata TEXT)"
+        )
+        now = datetime.now()
+        conn.execute(
+            "INSERT INTO conversations VALUES ('old', 'Legacy', ?, ?, '{}')",
+            (now.isoformat(), now.isoformat()),
+        )
+        conn.executemany(
+            "INSERT INTO messages VALUES (?, 'old', 'user', ?, ?, 0, '{}')",
+            [
+                ("m2", "second", (now + timedelta(seconds=1)).isoformat()),
+                ("m1", "first legacy", now.isoformat()),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        store = SQLiteHistoryStore(db_path)
+        assert [m.content for m in store.load("old").messages] == [
+            "first legacy",
+            "second",
+        ]
+        assert store.list_summaries()[0]["message_count"] == 2
+        assert [c.conversation_id for c in store.search("legacy")] == ["old"]
+
+    def test_concurrent_saves(self, tmp_path):
+        """Threads share the pool without locking errors."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        store = SQLiteHistoryStore(str(tmp_path / "test.db"), pool_size=3)
+
+        def work(i):
+            conv = _make_conversation(f"t{i}")
+            for j in range(5):
+                conv.add_user_message(f"message {j}")
+                store.save(conv)
+            return store.load(f"t{i}").message_count
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            counts = list(pool.map(work, range(12)))
+        assert counts == [5] * 12
+        assert store._created <= 3
+        store.close()
+        assert store._created == 0
+
+    def test_memory_database_uses_single_connection(self):
+        """A ':memory:' store keeps its data on one shared connection."""
+        store = SQLiteHistoryStore(":memory:", pool_size=8)
+        store.save(_make_conversation("mem"))
+        assert store.pool_size == 1
+        assert store.load("mem") is not None
@@ -0,0 +1,181 @@
+"""Zero-mock tests for the persistent MCP tool manifest.
+
+Covers: ToolManifest source flags, recording and reloading tools keyed by
+source stats, LazyToolHandler import-on-first-call, and end-to-end
+discovery served from a manifest written by an earlier process.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from tests.support.repo_paths import REPO_ROOT
+
+from codomyrmex.agents.pai.mcp.manifest import (
+    LazyToolHandler,
+    ToolManifest,
+    default_manifest_path,
+)
+from codomyrmex.model_context_protocol.discovery import MCPDiscovery
+
+TOOLS_SOURCE = textwrap.dedent(
+    '''
+    from codomyrmex.model_context_protocol.decorators import mcp_tool
+
+
+    @mcp_tool(category="demo", tags=["lazy"])
+    def add_numbers(a: int, b: int = 2) -> dict:
+        """Add two numbers."""
+        return {"sum": a + b}
+
+
+    class Greeter:
+        @staticmethod
+        @mcp_tool(name="greet")
+        def greet(name: str) -> dict:
+            """Greet someone."""
+            return {"greeting": f"hello {name}"}
+    '''
+)
+
+
+@pytest.fixture
+def tool_package(tmp_path):
+    """An importable package ``manifest_demo_pkg`` with one tool module."""
+    pkg = tmp_path / "manifest_demo_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "tools.py").write_text(TOOLS_SOURCE)
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield pkg
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in [m for m in sys.modules if m.startswith("manifest_demo_pkg")]:
+            del sys.modules[name]
+
+
+def _record(manifest, module_name):
+    engine = MCPDiscovery()
+    report = engine.scan_module(module_name)
+    assert not report.failed_modules
+    assert manifest.record(sys.modules[module_name], report.tools)
+    return report.tools
+
+
+@pytest.mark.unit
+class TestToolManifest:
+    def test_decorated_flag_is_cached_by_stat(self, tmp_path):
+        source = tmp_path / "mod.py"
+        source.write_text("x = 1\n")
+        calls = []
+
+        def scan(path):
+            calls.append(path)
+            return "mcp_tool" in path.read_text()
+
+        manifest = ToolManifest(tmp_path / "manifest.json")
+        assert manifest.decorated(source, scan) is False
+        assert manifest.decorated(source, scan) is False
+        assert len(calls) == 1
+        source.write_text("@mcp_tool\ndef f(): ...\n")
+        assert manifest.decorated(source, scan) is True
+        assert len(calls) == 2
+        manifest.save()
+        assert ToolManifest(tmp_path / "manifest.json").decorated(source, scan)
+        assert len(calls) == 2
+
+    def test_reloaded_tools_match_scan_without_import(self, tool_package, tmp_path):
+        path = tmp_path / "manifest.json"
+        manifest = ToolManifest(path)
+        scanned = _record(manifest, "manifest_demo_pkg.tools")
+        manifest.save()
+        del sys.modules["manifest_demo_pkg.tools"]
+
+        tools = ToolManifest(path).load_tools("manifest_demo_pkg.tools")
+        assert tools is not None
+        assert "manifest_demo_pkg.tools" not in sys.modules
+        assert [(t.name, t.description, t.parameters, t.tags) for t in tools] == [
+            (t.name, t.description, t.parameters, t.tags) for t in scanned
+        ]
+        by_name = {t.name: t.handler for t in tools}
+        assert isinstance(by_name["codomyrmex.greet"], LazyToolHandler)
+        assert by_name["codomyrmex.greet"]._mcp_tool_meta["category"] == "general"
+        assert by_name["codomyrmex.add_numbers"]._mcp_tool_meta["tags"] == ["lazy"]
+        assert not by_name["codomyrmex.add_numbers"].loaded
+
+        assert by_name["codomyrmex.add_numbers"](a=1) == {"sum": 3}
+        assert "manifest_demo_pkg.tools" in sys.modules
+        assert by_name["codomyrmex.greet"](name="ant") == {"greeting": "hello ant"}
+
+    def test_changed_source_invalidates_module_entry(self, tool_package, tmp_path):
+        manifest = ToolManifest(tmp_path / "manifest.json")
+        _record(manifest, "manifest_demo_pkg.tools")
+        assert manifest.load_tools("manifest_demo_pkg.tools") is not None
+        (tool_package / "tools.py").write_text(TOOLS_SOURCE + "\n# edited\n")
+        assert manifest.load_tools("manifest_demo_pkg.tools") is None
+
+    def test_unreadable_or_foreign_manifest_is_ignored(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text("{not json")
+        assert ToolManifest(path).load_tools("anything") is None
+        path.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "python": "/other/python",
+                    "sources": {},
+                    "modules": {"m": {"files": {}, "tools": []}},
+                }
+            )
+        )
+        assert ToolManifest(path).load_tools("m") is None
+
+    def test_empty_env_var_disables_persistence(self, monkeypatch):
+        monkeypatch.setenv("CODOMYRMEX_MCP_MANIFEST", "")
+        assert default_manifest_path() is None
+
+
+@pytest.mark.unit
+class TestDiscoveryFromManifest:
+    def test_second_process_serves_tools_without_importing_modules(self, tmp_path):
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(
+            part for part in (str(REPO_ROOT / "src"), env.get("PYTHONPATH", "")) if part
+        )
+        env["CODOMYRMEX_MCP_MANIFEST"] = str(tmp_path / "manifest.json")
+        script = """
+import json, sys
+from codomyrmex.agents.pai.mcp.discovery import discover_dynamic_tools
+tools = discover_dynamic_tools()
+lazy = {name for name, _, handler, _ in tools if type(handler).__name__ == "LazyToolHandler"}
+print(json.dumps({
+    "tools": sorted([name, params] for name, _, _, params in tools),
+    "lazy": sorted(lazy),
+    "search_loaded": "codomyrmex.search.mcp_tools" in sys.modules,
+}))
+"""
+
+        def run():
+            result = subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=REPO_ROOT,
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=300,
+                check=False,
+            )
+            assert result.returncode == 0, result.stderr
+            return json.loads(result.stdout.strip().splitlines()[-1])
+
+        cold, warm = run(), run()
+        assert (tmp_path / "manifest.json").exists()
+        assert warm["tools"] == cold["tools"]
+        assert not cold["lazy"]
+        assert "codomyrmex.search_documents" in warm["lazy"]
+        assert cold["search_loaded"]
+        assert not warm["search_loaded"]
@@ -0,0 +1,154 @@
+"""Tests for the LRU / TTL-heap InMemoryCache and ShardedInMemoryCache.
+
+Zero-Mock Policy: no unittest.mock, MagicMock, monkeypatch, or pytest-mock.
+"""
+
+import threading
+import time
+
+import pytest
+
+from codomyrmex.cache import CacheManager
+from codomyrmex.cache.backends.in_memory import InMemoryCache, ShardedInMemoryCache
+
+
+@pytest.mark.unit
+class TestInMemoryCacheLRU:
+    def test_get_refreshes_recency(self):
+        cache = InMemoryCache(max_size=3)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        cache.set("d", 4)  # evicts b, the least recently used
+        assert cache.exists("b") is False
+        assert [k for k in "acd" if cache.exists(k)] == ["a", "c", "d"]
+        assert cache.stats.evictions == 1
+
+    def test_overwrite_refreshes_recency(self):
+        cache = InMemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+        cache.set("c", 3)
+        assert cache.get("a") == 10
+        assert cache.get("b") is None
+
+    def test_exists_does_not_refresh_recency(self):
+        cache = InMemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.exists("a") is True
+        cache.set("c", 3)
+        assert cache.exists("a") is False
+
+    def test_expired_entries_are_purged_before_evicting_live_ones(self):
+        cache = InMemoryCache(max_size=3)
+        cache.set("live1", 1)
+        cache.set("short", 2, ttl=0.01)
+        cache.set("live2", 3)
+        time.sleep(0.02)
+        cache.set("new", 4)
+        assert cache.get("live1") == 1
+        assert cache.get("live2") == 3
+        assert cache.get("new") == 4
+        assert cache.stats.evictions == 0
+
+    def test_purge_expired(self):
+        cache = InMemoryCache(default_ttl=0.01)
+        for i in range(10):
+            cache.set(f"k{i}", i)
+        cache.set("forever", 0, ttl=3600)
+        time.sleep(0.02)
+        assert cache.purge_expired() == 10
+        assert len(cache) == 1
+        assert cache.stats.size == 1
+
+    def test_reset_ttl_is_not_purged_by_stale_heap_entry(self):
+        cache = InMemoryCache()
+        cache.set("k", 1, ttl=0.01)
+        cache.set("k", 2, ttl=3600)
+        time.sleep(0.02)
+        assert cache.purge_expired() == 0
+        assert cache.get("k") == 2
+
+    def test_expiry_heap_stays_bounded_under_overwrites(self):
+        cache = InMemoryCache(default_ttl=3600)
+        for i in range(5_000):
+            cache.set("same", i)
+        assert len(cache._expiry_heap) <= 2 * len(cache) + 64
+        assert cache.get("same") == 4_999
+
+    def test_concurrent_access_respects_max_size(self):
+        cache = InMemoryCache(max_size=50)
+
+        def worker(offset: int) -> None:
+            for i in range(2_000):
+                cache.set(f"{offset}-{i}", i)
+                cache.get(f"{offset}-{i // 2}")
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(cache) == 50
+        assert cache.stats.total_requests == 16_000
+
+
+@pytest.mark.unit
+class TestShardedInMemoryCache:
+    def test_basic_operations(self):
+        cache = ShardedInMemoryCache(max_size=100, shards=4)
+        assert cache.shard_count == 4
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.exists("b") is True
+        assert cache.delete("b") is True
+        assert cache.delete("b") is False
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.size, stats.max_size) == (1, 1, 1, 100)
+        assert cache.clear() is True
+        assert len(cache) == 0
+
+    def test_size_is_bounded(self):
+        cache = ShardedInMemoryCache(max_size=64, shards=8)
+        for i in range(1_000):
+            cache.set(f"key{i}", i)
+        assert len(cache) <= 64
+        assert cache.stats.evictions == 1_000 - len(cache)
+
+    def test_ttl_and_patterns(self):
+        cache = ShardedInMemoryCache(default_ttl=0.01, shards=4)
+        for i in range(20):
+            cache.set(f"user:{i}", i)
+        cache.set("keep", 1, ttl=3600)
+        assert cache.delete_pattern("user:1*") == 11
+        time.sleep(0.02)
+        assert cache.purge_expired() == 9
+        assert cache.get("keep") == 1
+
+    def test_threads(self):
+        cache = ShardedInMemoryCache(max_size=10_000, shards=8)
+
+        def worker(offset: int) -> None:
+            for i in range(1_000):
+                cache.set(f"{offset}-{i}", i)
+                assert cache.get(f"{offset}-{i}") == i
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(cache) == 8_000
+
+    def test_invalid_shard_count(self):
+        with pytest.raises(ValueError, match="shards"):
+            ShardedInMemoryCache(shards=0)
+
+    def test_cache_manager_backend(self):
+        cache = CacheManager().get_cache("sharded", backend="sharded_in_memory")
+        assert isinstance(cache, ShardedInMemoryCache)
@@ -0,0 +1,117 @@
+"""
+Unit tests for cache.policies CountMinSketch and WTinyLFUPolicy — Zero-Mock compliant.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from codomyrmex.cache.policies import CountMinSketch, WTinyLFUPolicy, create_policy
+
+
+@pytest.mark.unit
+class TestCountMinSketch:
+    def test_estimates_never_undercount(self):
+        sketch = CountMinSketch(width=256, sample_size=10_000)
+        for i in range(50):
+            for _ in range(i % 10):
+                sketch.increment(f"k{i}")
+        for i in range(50):
+            assert sketch.estimate(f"k{i}") >= i % 10
+
+    def test_counters_saturate(self):
+        sketch = CountMinSketch(width=64, sample_size=10_000)
+        for _ in range(100):
+            sketch.increment("hot")
+        assert sketch.estimate("hot") == CountMinSketch.MAX_COUNT
+
+    def test_aging_halves_counts(self):
+        sketch = CountMinSketch(width=64, sample_size=20)
+        for _ in range(8):
+            sketch.increment("a")
+        assert sketch.estimate("a") == 8
+        for i in range(12):
+            sketch.increment(f"other{i}")
+        assert sketch.estimate("a") == 4
+
+    def test_int_keys_collide_independently_per_row(self):
+        sketch = CountMinSketch(width=1024, sample_size=10_000)
+        for key in range(200):
+            sketch.increment(key)
+        assert all(sketch.estimate(key) >= 1 for key in range(200))
+        aliased = sum(sketch.estimate(key + 1024) > 0 for key in range(200))
+        assert aliased <= 2
+
+    def test_clear(self):
+        sketch = CountMinSketch(width=64)
+        sketch.increment("a")
+        sketch.clear()
+        assert sketch.estimate("a") == 0
+
+
+@pytest.mark.unit
+class TestWTinyLFUPolicy:
+    def test_basic_operations(self):
+        policy = WTinyLFUPolicy(max_size=10)
+        policy.put("a", 1)
+        assert policy.get("a") == 1
+        assert policy.get("missing") is None
+        assert policy.contains("a") is True
+        policy.put("a", 2)
+        assert policy.get("a") == 2
+        assert policy.remove("a") == 2
+        assert policy.remove("a") is None
+        assert policy.size() == 0
+
+    def test_size_is_bounded(self):
+        policy = WTinyLFUPolicy(max_size=50)
+        for i in range(1_000):
+            policy.put(i, i)
+        assert policy.size() <= 50
+
+    def test_frequent_keys_survive_a_scan(self):
+        policy = WTinyLFUPolicy(max_size=100)
+        hot = [f"hot{i}" for i in range(50)]
+        for _ in range(5):
+            for key in hot:
+                if policy.get(key) is None:
+                    policy.put(key, key)
+        for i in range(1_000):
+            policy.put(f"scan{i}", i)
+        # Admission is probabilistic (sketch collisions), so allow a few losses.
+        assert sum(policy.contains(key) for key in hot) >= 45
+
+    def test_lru_loses_hot_keys_on_same_scan(self):
+        policy = create_policy("lru", 100)
+        for key in (f"hot{i}" for i in range(50)):
+            policy.put(key, key)
+        for i in range(1_000):
+            policy.put(f"scan{i}", i)
+        assert not any(policy.contains(f"hot{i}") for i in range(50))
+
+    def test_probation_hit_promotes_to_protected(self):
+        policy = WTinyLFUPolicy(max_size=100)
+        for i in range(3):
+            policy.put(i, i)
+        assert 0 in policy._probation
+        policy.get(0)
+        assert 0 in policy._protected
+
+    def test_expired_entry(self):
+        policy = WTinyLFUPolicy(max_size=10)
+        policy.put("k", "v", ttl=timedelta(seconds=-1))
+        assert policy.contains("k") is False
+        assert policy.get("k") is None
+        assert policy.size() == 0
+
+    def test_clear_and_zero_size(self):
+        policy = WTinyLFUPolicy(max_size=10)
+        policy.put("k", "v")
+        policy.clear()
+        assert policy.size() == 0
+        empty = WTinyLFUPolicy(max_size=0)
+        empty.put("k", "v")
+        assert empty.size() == 0
+
+    def test_factory(self):
+        assert isinstance(create_policy("wtinylfu", 10), WTinyLFUPolicy)
@@ -0,0 +1,202 @@
+"""Tests for events.core.dispatch and EventBus.publish_many."""
+
+import asyncio
+import threading
+
+import pytest
+
+from codomyrmex.events.core import (
+    AsyncDispatcher,
+    Event,
+    EventBus,
+    EventQueueError,
+    EventType,
+    LatencyHistogram,
+)
+from codomyrmex.events.core.event_bus import Subscription
+
+
+def _event(i: int = 0, event_type: EventType = EventType.SYSTEM_STARTUP) -> Event:
+    return Event(event_type=event_type, source="test", data={"i": i})
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    def test_summary(self):
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.observe(0.0002)
+        for _ in range(10):
+            histogram.observe(0.2)
+        summary = histogram.to_dict()
+        assert summary["count"] == 100
+        assert summary["min"] == pytest.approx(0.0002)
+        assert summary["max"] == pytest.approx(0.2)
+        assert summary["p50"] == 0.00025
+        assert summary["p95"] == 0.25
+        assert summary["buckets"]["0.00025"] == 90
+        assert summary["buckets"]["0.25"] == 10
+
+    def test_overflow_and_empty(self):
+        histogram = LatencyHistogram()
+        assert histogram.to_dict()["p99"] == 0.0
+        histogram.observe(60.0)
+        assert histogram.to_dict()["buckets"]["+Inf"] == 1
+        assert histogram.percentile(99) == 60.0
+
+
+@pytest.mark.unit
+class TestAsyncDispatcher:
+    def test_per_subscriber_order_and_join(self):
+        seen: dict[str, list[int]] = {"a": [], "b": []}
+
+        def make(name):
+            async def handler(event):
+                await asyncio.sleep(0)
+                seen[name].append(event.data["i"])
+
+            return Subscription(name, {"*"}, handler, is_async=True)
+
+        a, b = make("a"), make("b")
+        dispatcher = AsyncDispatcher()
+        for start in range(0, 50, 10):
+            batch = [_event(i) for i in range(start, start + 10)]
+            dispatcher.submit([(a, batch), (b, batch)])
+        assert dispatcher.join(timeout=5)
+        assert seen["a"] == seen["b"] == list(range(50))
+        assert dispatcher.pending == 0
+        dispatcher.stop()
+        assert not dispatcher.running
+
+    def test_back_pressure_times_out(self):
+        release = threading.Event()
+
+        async def blocked(event):
+            await asyncio.to_thread(release.wait)
+
+        sub = Subscription("slow", {"*"}, blocked, is_async=True)
+        dispatcher = AsyncDispatcher(max_pending=3)
+        dispatcher.submit([(sub, [_event(i) for i in range(3)])])
+        with pytest.raises(EventQueueError):
+            dispatcher.submit([(sub, [_event(3)])], timeout=0.05)
+        release.set()
+        assert dispatcher.join(timeout=5)
+        dispatcher.submit([(sub, [_event(4)])], timeout=1)
+        assert dispatcher.join(timeout=5)
+        dispatcher.stop()
+
+    def test_stop_cancels_outstanding(self):
+        async def forever(event):
+            await asyncio.sleep(3600)
+
+        sub = Subscription("forever", {"*"}, forever, is_async=True)
+        dispatcher = AsyncDispatcher()
+        dispatcher.submit([(sub, [_event(i) for i in range(5)])])
+        dispatcher.stop(timeout=2)
+        assert dispatcher.pending == 0
+
+    def test_invalid_max_pending(self):
+        with pytest.raises(ValueError):
+            AsyncDispatcher(max_pending=0)
+
+
+@pytest.mark.unit
+class TestPublishMany:
+    def test_sync_and_async_handlers(self):
+        bus = EventBus()
+        sync_seen: list[int] = []
+        async_seen: list[int] = []
+
+        async def async_handler(event):
+            async_seen.append(event.data["i"])
+
+        bus.subscribe(["system.*"], lambda e: sync_seen.append(e.data["i"]), "sync")
+        bus.subscribe(["system.startup"], async_handler, "async")
+        events = [_event(i) for i in range(20)]
+        events.append(_event(99, EventType.SYSTEM_SHUTDOWN))
+
+        assert bus.publish_many(events) == 21
+        assert sync_seen == [*range(20), 99]
+        assert bus.flush(timeout=5)
+        assert async_seen == list(range(20))
+
+        stats = bus.get_stats()
+        assert stats["events_published"] == 21
+        assert stats["events_processed"] == 21
+        assert stats["async_pending"] == 0
+        assert stats["handler_latency"]["sync"]["count"] == 21
+        assert bus.get_handler_latency("async")["count"] == 20
+        bus.shutdown()
+
+    def test_validates_before_dispatch(self):
+        bus = EventBus()
+        seen = []
+        bus.subscribe(["*"], seen.append, "sub")
+        bad = _event()
+        bad.event_type = None
+        with pytest.raises(Exception, match="event_type"):
+            bus.publish_many([_event(), bad])
+        assert seen == []
+        bus.shutdown()
+
+    def test_handler_errors_are_counted(self):
+        bus = EventBus()
+
+        def boom(event):
+            raise RuntimeError("boom")
+
+        async def async_boom(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(["*"], boom, "sync")
+        bus.subscribe(["*"], async_boom, "async")
+        bus.publish_many([_event(i) for i in range(3)])
+        assert bus.flush(timeout=5)
+        assert bus.events_failed == 6
+        assert bus.events_processed == 3
+        bus.shutdown()
+
+    def test_publish_timeout_raises_when_full(self):
+        release = threading.Event()
+
+        async def blocked(event):
+            await asyncio.to_thread(release.wait)
+
+        bus = EventBus(max_pending=2, publish_timeout=0.05)
+        bus.subscribe(["*"], blocked, "slow")
+        bus.publish_many([_event(0), _event(1)])
+        with pytest.raises(EventQueueError):
+            bus.publish(_event(2))
+        release.set()
+        assert bus.flush(timeout=5)
+        bus.shutdown()
+
+    def test_unsubscribe_drops_latency(self):
+        bus = EventBus()
+        bus.subscribe(["*"], lambda e: None, "sub")
+        bus.publish(_event())
+        assert "sub" in bus.get_stats()["handler_latency"]
+        bus.unsubscribe("sub")
+        assert "sub" not in bus.get_stats()["handler_latency"]
+        bus.shutdown()
+
+    def test_latency_reads_do_not_create_entries(self):
+        bus = EventBus()
+        assert bus.get_handler_latency("nobody")["count"] == 0
+        assert bus.get_stats()["handler_latency"] == {}
+        bus.shutdown()
+
+    def test_late_async_completion_after_unsubscribe(self):
+        release = threading.Event()
+
+        async def slow(event):
+            await asyncio.to_thread(release.wait)
+
+        bus = EventBus()
+        bus.subscribe(["*"], slow, "slow")
+        bus.publish(_event())
+        bus.unsubscribe("slow")
+        release.set()
+        assert bus.flush(timeout=5)
+        assert "slow" not in bus.get_stats()["handler_latency"]
+        bus.shutdown()
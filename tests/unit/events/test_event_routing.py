@@ -0,0 +1,172 @@
+"""Tests for events.core.routing.SubscriptionRouter and its use in EventBus."""
+
+import fnmatch
+import random
+
+import pytest
+
+from codomyrmex.events.core import Event, EventBus, EventType, SubscriptionRouter
+
+PATTERNS = [
+    "*",
+    "a",
+    "a.b",
+    "a.*",
+    "a.b*",
+    "*.c",
+    "a.*.c",
+    "*.b.*",
+    "a.*.*",
+    "x*",
+    "a?b",
+    "a.[bc].d",
+    "a.b*c",
+    "*b*",
+    "a..c",
+    "",
+]
+
+EVENT_TYPES = [
+    "",
+    "a",
+    "b",
+    "a.",
+    "a.b",
+    "a.bb",
+    "a.b.c",
+    "a.x.y.c",
+    "a..c",
+    ".c",
+    "x.b.y",
+    "xyz",
+    "axb",
+    "a.c.d",
+    "a.bzc",
+    "q.a.b.c",
+]
+
+
+def _brute_force(patterns: dict[str, set[str]], event_type: str) -> set[str]:
+    return {
+        sid
+        for sid, pats in patterns.items()
+        if any(fnmatch.fnmatchcase(event_type, p) for p in pats)
+    }
+
+
+@pytest.mark.unit
+class TestSubscriptionRouter:
+    def test_matches_fnmatch_for_each_pattern(self):
+        router = SubscriptionRouter()
+        patterns = {f"s{i}": {p} for i, p in enumerate(PATTERNS)}
+        for sid, pats in patterns.items():
+            router.add(sid, pats)
+        for event_type in EVENT_TYPES:
+            assert router.match(event_type) == _brute_force(patterns, event_type), (
+                event_type
+            )
+
+    def test_random_patterns_and_removals(self):
+        rng = random.Random(0)
+        segments = ["a", "b", "c", "*", "b*", "?"]
+        router = SubscriptionRouter()
+        patterns: dict[str, set[str]] = {}
+        for i in range(300):
+            sid = f"s{rng.randrange(80)}"
+            if sid in patterns and rng.random() < 0.3:
+                assert router.remove(sid) is True
+                del patterns[sid]
+            else:
+                pats = {
+                    ".".join(rng.choices(segments, k=rng.randint(1, 4)))
+                    for _ in range(rng.randint(1, 3))
+                }
+                router.add(sid, pats)
+                patterns[sid] = pats
+            if i % 10 == 0:
+                for _ in range(20):
+                    event_type = ".".join(rng.choices("abcd", k=rng.randint(1, 5)))
+                    assert router.match(event_type) == _brute_force(
+                        patterns, event_type
+                    )
+        assert len(router) == len(patterns)
+
+    def test_removal_prunes_trie(self):
+        router = SubscriptionRouter()
+        router.add("s1", {"a.*.c.d", "a.b*", "x", "a?"})
+        assert router.remove("s1") is True
+        assert router.remove("s1") is False
+        assert router._root.is_empty()
+        assert not router._exact
+        assert not router._regex
+
+    def test_cache_is_invalidated(self):
+        router = SubscriptionRouter()
+        router.add("s1", {"a.*"})
+        assert router.match("a.b") == {"s1"}
+        router.add("s2", {"a.b"})
+        assert router.match("a.b") == {"s1", "s2"}
+        router.add("s1", {"z"})
+        assert router.match("a.b") == {"s2"}
+
+
+@pytest.mark.unit
+class TestEventBusRouting:
+    def test_dispatch_order_and_filters(self):
+        bus = EventBus()
+        calls = []
+        bus.subscribe(["system.*"], lambda e: calls.append("low"), "low")
+        bus.subscribe(
+            ["system.startup"], lambda e: calls.append("high"), "high", priority=5
+        )
+        bus.subscribe(["*"], lambda e: calls.append("all"), "all")
+        bus.subscribe(
+            ["system.*"],
+            lambda e: calls.append("filtered"),
+            "filtered",
+            filter_func=lambda e: e.source == "wanted",
+        )
+        bus.publish(Event(event_type=EventType.SYSTEM_STARTUP, source="other"))
+        assert calls == ["high", "low", "all"]
+
+        calls.clear()
+        bus.publish(Event(event_type=EventType.SYSTEM_STARTUP, source="wanted"))
+        assert calls == ["high", "low", "all", "filtered"]
+
+        calls.clear()
+        bus.unsubscribe("low")
+        bus.publish(Event(event_type=EventType.SYSTEM_STARTUP, source="x"))
+        assert calls == ["high", "all"]
+        bus.shutdown()
+
+    def test_order_survives_unsubscribe(self):
+        bus = EventBus()
+        calls = []
+        for name in "ABCDEFG":
+            bus.subscribe(["*"], lambda e, n=name: calls.append(n), name)
+        bus.unsubscribe("A")
+        bus.unsubscribe("C")
+        for name in "HIJ":
+            bus.subscribe(["*"], lambda e, n=name: calls.append(n), name)
+        bus.publish(Event(event_type=EventType.SYSTEM_STARTUP, source="t"))
+        assert "".join(calls) == "BDEFGHIJ"
+        bus.shutdown()
+
+    def test_resubscribe_replaces_patterns(self):
+        bus = EventBus()
+        calls = []
+        bus.subscribe(["system.startup"], lambda e: calls.append(1), "sub")
+        bus.subscribe(["system.shutdown"], lambda e: calls.append(2), "sub")
+        bus.publish(Event(event_type=EventType.SYSTEM_STARTUP, source="t"))
+        bus.publish(Event(event_type=EventType.SYSTEM_SHUTDOWN, source="t"))
+        assert calls == [2]
+        bus.shutdown()
+
+    def test_subscriptions_cleared_directly(self):
+        bus = EventBus()
+        calls = []
+        bus.subscribe(["*"], lambda e: calls.append(1), "sub")
+        bus.subscriptions.clear()
+        bus.publish(Event(event_type=EventType.SYSTEM_STARTUP, source="t"))
+        assert calls == []
+        bus.shutdown()
@@ -0,0 +1,177 @@
+"""Tests for events.file_event_store — segmented on-disk FileEventStore."""
+
+import os
+
+import pytest
+
+from codomyrmex.events.event_store import EventStore, StreamEvent
+from codomyrmex.events.file_event_store import FileEventStore
+from codomyrmex.events.replayer import EventReplayer
+
+
+def _fill(store: EventStore, n: int) -> None:
+    for i in range(n):
+        store.append(
+            StreamEvent(
+                topic=f"t{i % 3}",
+                event_type="tick",
+                data={"i": i},
+                timestamp=1000.0 + i,
+            )
+        )
+
+
+def _seqs(events) -> list[int]:
+    return [e.sequence for e in events]
+
+
+@pytest.mark.unit
+class TestFileEventStore:
+    def test_matches_in_memory_store(self, tmp_path):
+        memory = EventStore()
+        store = FileEventStore(str(tmp_path), segment_size=2_000, index_interval=4)
+        _fill(memory, 300)
+        _fill(store, 300)
+        assert store.segment_count > 5
+        assert store.count == memory.count == 300
+        assert store.latest_sequence == 300
+        for from_seq, to_seq in [(1, 0), (17, 18), (150, 151), (299, 400), (5, 5)]:
+            assert _seqs(store.read(from_seq, to_seq)) == _seqs(
+                memory.read(from_seq, to_seq)
+            )
+        assert _seqs(store.read_by_time(1010.0, 1100.5)) == _seqs(
+            memory.read_by_time(1010.0, 1100.5)
+        )
+        assert _seqs(store.read_by_topic("t1", limit=5)) == _seqs(
+            memory.read_by_topic("t1", limit=5)
+        )
+        assert store.topics() == memory.topics()
+        assert store.read(7, 7)[0].data == {"i": 6}
+        store.close()
+
+    def test_time_reads_with_unordered_timestamps(self, tmp_path):
+        memory = EventStore()
+        path = str(tmp_path)
+        store = FileEventStore(path, segment_size=1_500, index_interval=2)
+        for i in range(120):
+            ts = 1000.0 + (i if i % 40 else i - 30)  # occasional step back
+            for s in (memory, store):
+                s.append(StreamEvent(topic="t", timestamp=ts))
+        store.close()
+        store = FileEventStore(path)
+        for lo, hi in [(1000.0, 1005.0), (1008.0, 1012.0), (1050.0, 1200.0)]:
+            assert _seqs(store.read_by_time(lo, hi)) == _seqs(
+                memory.read_by_time(lo, hi)
+            )
+        store.close()
+
+    def test_reopen_resumes_sequence(self, tmp_path):
+        with FileEventStore(str(tmp_path), segment_size=1_000) as store:
+            _fill(store, 50)
+        with FileEventStore(str(tmp_path), segment_size=1_000) as store:
+            assert store.count == 50
+            assert store.append(StreamEvent(topic="new")) == 51
+            assert _seqs(store.read(49)) == [49, 50, 51]
+            assert "new" in store.topics()
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        with FileEventStore(str(tmp_path)) as store:
+            _fill(store, 10)
+        log = os.path.join(str(tmp_path), f"{1:020d}.log")
+        with open(log, "ab") as f:
+            f.write(b'{"sequence": 11, "topic"')
+        with FileEventStore(str(tmp_path)) as store:
+            assert store.count == 10
+            assert store.append(StreamEvent(topic="t")) == 11
+            assert _seqs(store.read(10)) == [10, 11]
+
+    def test_compact(self, tmp_path):
+        path = str(tmp_path)
+        with FileEventStore(path, segment_size=1_000, index_interval=3) as store:
+            _fill(store, 100)
+            segments_before = store.segment_count
+            assert store.compact(before_seq=55) == 54
+            assert store.count == 46
+            assert store.segment_count < segments_before
+            assert _seqs(store.read())[:2] == [55, 56]
+            assert _seqs(store.read(1, 60)) == list(range(55, 61))
+        with FileEventStore(path) as store:
+            assert store.count == 46
+            assert store.read()[0].sequence == 55
+
+    @pytest.mark.parametrize(
+        "reader",
+        [lambda s: s.iter_read(), lambda s: s.iter_by_time(0.0, 5000.0)],
+        ids=["iter_read", "iter_by_time"],
+    )
+    def test_reads_continue_across_concurrent_compaction(self, tmp_path, reader):
+        with FileEventStore(str(tmp_path), segment_size=1_000) as store:
+            _fill(store, 100)
+            first, second = store._segments[:2]
+            before = second.first_seq + 3
+            events = reader(store)
+            assert next(events).sequence == 1
+            store.compact(before_seq=before)
+            # The open first segment is read through; the rewritten second
+            # one resumes from the events compaction carried over.
+            assert _seqs(events) == list(range(2, first.last_seq + 1)) + list(
+                range(before, 101)
+            )
+
+    def test_compact_everything_keeps_sequence(self, tmp_path):
+        path = str(tmp_path)
+        with FileEventStore(path) as store:
+            _fill(store, 10)
+            assert store.compact(before_seq=100) == 10
+            assert store.count == 0
+        with FileEventStore(path) as store:
+            assert store.append(StreamEvent(topic="t")) == 11
+
+    def test_clear(self, tmp_path):
+        with FileEventStore(str(tmp_path), segment_size=500) as store:
+            _fill(store, 20)
+            store.clear()
+            assert store.count == 0
+            assert store.append(StreamEvent(topic="t")) == 1
+        assert FileEventStore(str(tmp_path)).count == 1
+
+    def test_iter_read_is_lazy(self, tmp_path):
+        with FileEventStore(str(tmp_path), segment_size=1_000) as store:
+            _fill(store, 100)
+            events = store.iter_read(10)
+            assert next(events).sequence == 10
+            assert next(events).sequence == 11
+
+    def test_closed_store_raises(self, tmp_path):
+        store = FileEventStore(str(tmp_path))
+        store.close()
+        store.close()
+        with pytest.raises(ValueError, match="closed"):
+            store.append(StreamEvent(topic="t"))
+
+    def test_invalid_arguments(self, tmp_path):
+        with pytest.raises(ValueError):
+            FileEventStore(str(tmp_path), segment_size=0)
+
+
+@pytest.mark.unit
+class TestStreamingReplay:
+    def test_replayer_over_file_store(self, tmp_path):
+        with FileEventStore(str(tmp_path), segment_size=1_000) as store:
+            _fill(store, 60)
+            replayer = EventReplayer(store)
+            result = replayer.replay(
+                from_seq=11, to_seq=40, handlers={"t0": lambda e: e.data["i"]}
+            )
+            assert result.events_replayed == 30
+            assert result.handler_outputs == [i for i in range(10, 40) if i % 3 == 0]
+            by_time = replayer.replay_by_time(1000.0, 1004.0)
+            assert by_time.events_replayed == 5
+
+    def test_stream_yields_outputs(self, tmp_path):
+        with FileEventStore(str(tmp_path)) as store:
+            _fill(store, 6)
+            pairs = list(
+                EventReplayer(store).stream(handlers={"t1": lambda e: e.sequence})
+            )
+            assert [out for _, out in pairs] == [None, 2, None, None, 5, None]
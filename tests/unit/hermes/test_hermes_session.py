@@ -339,6 +339,22 @@ class TestSQLiteSearchFts:
         assert "messages_snippet" in results[0]
         assert "rank" in results[0]
 
+    def test_search_fts_one_row_per_session_with_best_snippet(self) -> None:
+        store = SQLiteSessionStore(":memory:")
+        s = HermesSession(session_id="fts5", name="notes")
+        s.add_message("user", "cache warmup before the release")
+        s.add_message("assistant", "cache cache cache everywhere")
+        store.save(s)
+        other = HermesSession(session_id="fts6", name="other")
+        other.add_message("user", "the cache is cold")
+        store.save(other)
+
+        results = store.search_fts("cache", limit=1)
+        assert [r["session_id"] for r in results] == ["fts5"]
+        assert results[0]["messages_snippet"] == (
+            "<b>cache</b> <b>cache</b> <b>cache</b> everywhere"
+        )
+
 
 # ── SQLiteSessionStore context manager ────────────────────────────────
 
@@ -0,0 +1,304 @@
+"""Tests for the row-per-message storage of SQLiteSessionStore.
+
+Zero-Mock: all tests use real SQLite databases.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+import sqlite3
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from codomyrmex.agents.hermes.session import (
+    HermesSession,
+    PagedMessages,
+    SQLiteSessionStore,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _rows(store: SQLiteSessionStore, session_id: str) -> list[tuple]:
+    return store._conn.execute(
+        "SELECT id, seq, role, content FROM hermes_messages "
+        "WHERE session_id = ? ORDER BY seq",
+        (session_id,),
+    ).fetchall()
+
+
+def _conversation(turns: int, session_id: str = "conv") -> HermesSession:
+    session = HermesSession(session_id=session_id)
+    for i in range(turns):
+        session.add_message("user" if i % 2 == 0 else "assistant", f"turn {i}")
+    return session
+
+
+@pytest.mark.unit
+class TestAppendOnlySave:
+    def test_append_keeps_existing_rows(self) -> None:
+        store = SQLiteSessionStore()
+        session = _conversation(4)
+        store.save(session)
+        before = _rows(store, "conv")
+
+        session.add_message("user", "turn 4")
+        store.save(session)
+        after = _rows(store, "conv")
+        assert after[:4] == before
+        assert [r[1] for r in after] == [0, 1, 2, 3, 4]
+        assert store.load("conv").messages[-1]["content"] == "turn 4"
+
+    def test_edited_prefix_is_rewritten(self) -> None:
+        store = SQLiteSessionStore()
+        session = _conversation(5)
+        store.save(session)
+        first_id = _rows(store, "conv")[0][0]
+
+        session.messages[2] = {"role": "user", "content": "edited"}
+        del session.messages[4]
+        store.save(session)
+        rows = _rows(store, "conv")
+        assert rows[0][0] == first_id
+        assert [r[3] for r in rows] == ["turn 0", "turn 1", "edited", "turn 3"]
+        assert store.get_detail("conv")["message_count"] == 4
+
+    def test_extra_fields_round_trip(self) -> None:
+        store = SQLiteSessionStore()
+        message = {"role": "tool", "content": "ok", "tool_call_id": "c1", "n": 3}
+        session = HermesSession(session_id="extra", messages=[message, {"x": 1}])
+        store.save(session)
+        assert store.load("extra").messages == [message, {"x": 1}]
+
+    def test_save_from_other_store_instance(self, tmp_path: Path) -> None:
+        db = tmp_path / "shared.db"
+        first = SQLiteSessionStore(db)
+        second = SQLiteSessionStore(db)
+        session = _conversation(3)
+        first.save(session)
+        session.add_message("user", "from second")
+        second.save(session)
+        session.messages[0] = {"role": "user", "content": "from first"}
+        first.save(session)
+        assert SQLiteSessionStore(db).load("conv").messages == session.messages
+
+    def test_same_length_edit_by_other_store(self, tmp_path: Path) -> None:
+        db = tmp_path / "shared.db"
+        first = SQLiteSessionStore(db)
+        second = SQLiteSessionStore(db)
+        session = _conversation(2)
+        first.save(session)
+
+        other = second.load("conv")
+        other.messages[1] = {"role": "assistant", "content": "edited by second"}
+        second.save(other)
+        first.save(session)
+        assert SQLiteSessionStore(db).load("conv").messages == session.messages
+
+    def test_lazy_save_after_other_store_write(self, tmp_path: Path) -> None:
+        db = tmp_path / "shared.db"
+        first = SQLiteSessionStore(db)
+        second = SQLiteSessionStore(db)
+        first.save(_conversation(4))
+        lazy = first.load("conv", lazy=True, page_size=2)
+        assert lazy.messages[0]["content"] == "turn 0"
+
+        replaced = _conversation(4)
+        replaced.messages[0] = {"role": "user", "content": "replaced"}
+        second.save(replaced)
+        lazy.add_message("user", "appended")
+        first.save(lazy)
+        stored = SQLiteSessionStore(db).load_messages("conv")
+        assert [m["content"] for m in stored] == [
+            "turn 0",
+            "turn 1",
+            "turn 2",
+            "turn 3",
+            "appended",
+        ]
+
+    def test_batch_commits_once(self, tmp_path: Path) -> None:
+        db = tmp_path / "batch.db"
+        store = SQLiteSessionStore(db)
+        with store.batch():
+            for i in range(3):
+                store.save(_conversation(2, f"s{i}"))
+            assert store._conn.in_transaction
+        assert not store._conn.in_transaction
+        assert sorted(SQLiteSessionStore(db).list_sessions()) == ["s0", "s1", "s2"]
+
+    def test_batch_rolls_back_on_error(self, tmp_path: Path) -> None:
+        db = tmp_path / "rollback.db"
+        store = SQLiteSessionStore(db)
+        with pytest.raises(RuntimeError), store.batch():
+            store.save(_conversation(2, "lost"))
+            raise RuntimeError("abort")
+        assert store.load("lost") is None
+
+
+@pytest.mark.unit
+class TestLegacyMigration:
+    def test_json_blob_rows_are_migrated(self, tmp_path: Path) -> None:
+        db = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db)
+        conn.execute(
+            "CREATE TABLE hermes_sessions (session_id TEXT PRIMARY KEY, name TEXT, "
+            "parent_session_id TEXT, messages TEXT NOT NULL, "
+            "metadata TEXT NOT NULL DEFAULT '{}', created_at REAL NOT NULL, "
+            "updated_at REAL NOT NULL)"
+        )
+        messages = [
+            {"role": "system", "content": "be brief"},
+            {"role": "user", "content": "legacy hello"},
+        ]
+        now = time.time()
+        conn.execute(
+            "INSERT INTO hermes_sessions VALUES (?, ?, NULL, ?, '{}', ?, ?)",
+            ("old", "legacy", json.dumps(messages), now, now),
+        )
+        conn.commit()
+        conn.close()
+
+        store = SQLiteSessionStore(db)
+        assert store.load("old").messages == messages
+        assert store.get_detail("old")["message_count"] == 2
+        assert store.search_fts("legacy")[0]["session_id"] == "old"
+        blob = store._conn.execute(
+            "SELECT messages FROM hermes_sessions WHERE session_id = 'old'"
+        ).fetchone()[0]
+        assert blob == "[]"
+
+
+@pytest.mark.unit
+class TestLazyLoading:
+    def test_pages_load_on_demand(self) -> None:
+        store = SQLiteSessionStore()
+        store.save(_conversation(25))
+        session = store.load("conv", lazy=True, page_size=10)
+        messages = session.messages
+        assert isinstance(messages, PagedMessages)
+        assert len(messages) == 25
+        assert messages._pages == {}
+        assert messages[-1]["content"] == "turn 24"
+        assert list(messages._pages) == [2]
+        assert messages[9:12] == [
+            {"role": "assistant", "content": "turn 9"},
+            {"role": "user", "content": "turn 10"},
+            {"role": "assistant", "content": "turn 11"},
+        ]
+        assert messages == store.load("conv").messages
+
+    def test_appends_save_without_loading(self) -> None:
+        store = SQLiteSessionStore()
+        store.save(_conversation(30))
+        before = _rows(store, "conv")
+        session = store.load("conv", lazy=True, page_size=5)
+        session.add_message("user", "new 1")
+        store.save(session)
+        session.add_message("assistant", "new 2")
+        store.save(session)
+        assert session.messages._pages == {}
+        rows = _rows(store, "conv")
+        assert rows[:30] == before
+        assert [r[3] for r in rows[30:]] == ["new 1", "new 2"]
+
+    def test_other_mutations_materialize(self) -> None:
+        store = SQLiteSessionStore()
+        store.save(_conversation(6))
+        session = store.load("conv", lazy=True, page_size=2)
+        session.messages.insert(0, {"role": "system", "content": "sys"})
+        store.save(session)
+        loaded = store.load("conv").messages
+        assert loaded[0] == {"role": "system", "content": "sys"}
+        assert len(loaded) == 7
+
+    def test_copy_and_pickle_give_lists(self) -> None:
+        store = SQLiteSessionStore()
+        store.save(_conversation(3))
+        messages = store.load("conv", lazy=True).messages
+        assert type(copy.copy(messages)) is list
+        assert type(copy.deepcopy(messages)) is list
+        assert pickle.loads(pickle.dumps(messages)) == list(messages)
+        fork = store.load("conv", lazy=True).fork("copy")
+        assert type(fork.messages) is list
+
+    def test_iter_messages(self) -> None:
+        store = SQLiteSessionStore()
+        store.save(_conversation(7))
+        contents = [m["content"] for m in store.iter_messages("conv", page_size=3)]
+        assert contents == [f"turn {i}" for i in range(7)]
+        assert store.load_messages("conv", offset=5) == store.load("conv").messages[5:]
+
+
+@pytest.mark.unit
+class TestTargetedUpdates:
+    def test_update_system_prompt_prepends_and_replaces(self) -> None:
+        store = SQLiteSessionStore()
+        store.save(_conversation(3))
+        assert store.update_system_prompt("conv", "first")
+        assert store.update_system_prompt("conv", "second")
+        messages = store.load("conv").messages
+        assert messages[0] == {"role": "system", "content": "second"}
+        assert [m["content"] for m in messages[1:]] == ["turn 0", "turn 1", "turn 2"]
+        assert not store.update_system_prompt("missing", "x")
+
+    def test_save_after_system_prompt_update(self) -> None:
+        store = SQLiteSessionStore()
+        session = _conversation(2)
+        store.save(session)
+        store.update_system_prompt("conv", "sys")
+        session = store.load("conv")
+        session.add_message("user", "later")
+        store.save(session)
+        assert [m["content"] for m in store.load("conv").messages] == [
+            "sys",
+            "turn 0",
+            "turn 1",
+            "later",
+        ]
+
+    def test_get_detail_reads_ends(self) -> None:
+        store = SQLiteSessionStore()
+        store.save(_conversation(40))
+        detail = store.get_detail("conv")
+        assert detail["message_count"] == 40
+        assert detail["last_message"]["content"] == "turn 39"
+        assert not detail["has_system_prompt"]
+
+    def test_delete_removes_message_rows(self) -> None:
+        store = SQLiteSessionStore()
+        store.save(_conversation(3))
+        assert store.delete("conv")
+        assert _rows(store, "conv") == []
+
+
+@pytest.mark.unit
+class TestMessageSearch:
+    def test_search_hits_message_content(self) -> None:
+        store = SQLiteSessionStore()
+        first = _conversation(2, "a")
+        first.add_message("user", "deploy the quokka cluster")
+        store.save(first)
+        second = HermesSession(session_id="b", name="quokka notes")
+        second.add_message("user", "unrelated")
+        store.save(second)
+        store.save(_conversation(3, "c"))
+
+        hits = store.search_fts("quokka")
+        assert {h["session_id"] for h in hits} == {"a", "b"}
+        assert len(hits) == 2
+
+    def test_edited_message_leaves_index(self) -> None:
+        store = SQLiteSessionStore()
+        session = HermesSession(session_id="s")
+        session.add_message("user", "platypus")
+        store.save(session)
+        session.messages[0] = {"role": "user", "content": "wombat"}
+        store.save(session)
+        assert store.search_fts("platypus") == []
+        assert store.search_fts("wombat")[0]["session_id"] == "s"
@@ -8,7 +8,11 @@ All tests use real object construction — no mocks.
 """
 
 import asyncio
+import io
 import json
+import os
+import threading
+import time
 
 import pytest
 
@@ -58,6 +62,7 @@ class TestMCPServerConfig:
         assert cfg.rate_limit_rate == 50.0
         assert cfg.rate_limit_burst == 100
         assert cfg.warm_up is True
+        assert cfg.max_in_flight == 16
 
     def test_custom_config_values(self):
         cfg = MCPServerConfig(
@@ -374,6 +379,127 @@ class TestMCPServerToolRegistration:
         assert "Wonderland" in text
 
 
+# =========================================================================
+# stdio transport
+# =========================================================================
+
+
+def _tool_call(request_id, name, **arguments):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments},
+    }
+
+
+def _tool_text(response):
+    return json.loads(response["result"]["content"][0]["text"])["result"]
+
+
+@pytest.mark.unit
+class TestMCPServerStdio:
+    """Tests for concurrent request handling in MCPServer.run_stdio."""
+
+    def _serve(self, srv, messages):
+        stdin = io.StringIO("".join(json.dumps(m) + "\n" for m in messages))
+        stdout = io.StringIO()
+        _run(srv.run_stdio(stdin, stdout))
+        return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def test_slow_request_does_not_block_later_ones(self):
+        srv = MCPServer(MCPServerConfig(name="stdio", max_in_flight=2))
+        gate = threading.Event()
+
+        @srv.tool(name="slow")
+        def slow() -> str:
+            return "released" if gate.wait(5) else "blocked"
+
+        @srv.tool(name="fast")
+        def fast() -> str:
+            gate.set()
+            return "fast"
+
+        responses = self._serve(srv, [_tool_call(1, "slow"), _tool_call(2, "fast")])
+        # Fast releases slow before returning, so the two may finish in
+        # either order; slow seeing the gate set proves fast ran meanwhile.
+        by_id = {r["id"]: r for r in responses}
+        assert sorted(by_id) == [1, 2]
+        assert _tool_text(by_id[1]) == "released"
+        assert _tool_text(by_id[2]) == "fast"
+
+    def test_max_in_flight_bounds_concurrency(self):
+        srv = MCPServer(MCPServerConfig(name="stdio", max_in_flight=1))
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        @srv.tool(name="work")
+        def work(n: int) -> int:
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return n
+
+        responses = self._serve(
+            srv,
+            [
+                {"jsonrpc": "2.0", "method": "notifications/initialized"},
+                *[_tool_call(i, "work", n=i) for i in range(5)],
+                "not a request",
+            ],
+        )
+        assert peak[0] == 1
+        assert [_tool_text(r) for r in responses] == [0, 1, 2, 3, 4]
+        assert srv._initialized
+
+    def test_cancelled_request_gets_no_response(self):
+        srv = MCPServer(MCPServerConfig(name="stdio"))
+        started = threading.Event()
+        release = threading.Event()
+
+        @srv.tool(name="slow")
+        def slow() -> str:
+            started.set()
+            release.wait(5)
+            return "slow"
+
+        @srv.tool(name="fast")
+        def fast() -> str:
+            # Read after the cancellation, so runs once it has been handled
+            release.set()
+            return "fast"
+
+        read_fd, write_fd = os.pipe()
+        stdout = io.StringIO()
+        with os.fdopen(read_fd) as stdin, os.fdopen(write_fd, "w") as client:
+
+            def send():
+                client.write(json.dumps(_tool_call(1, "slow")) + "\n")
+                client.flush()
+                started.wait(5)
+                cancel = {
+                    "jsonrpc": "2.0",
+                    "method": "notifications/cancelled",
+                    "params": {"requestId": 1, "reason": "user"},
+                }
+                client.write(json.dumps(cancel) + "\n")
+                client.write(json.dumps(_tool_call(2, "fast")) + "\n")
+                client.close()
+
+            sender = threading.Thread(target=send)
+            sender.start()
+            _run(srv.run_stdio(stdin, stdout))
+            sender.join()
+
+        responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert [r["id"] for r in responses] == [2]
+        assert srv._in_flight == {}
+
+
 # =========================================================================
 # Structured Error types (errors.py)
 # =========================================================================
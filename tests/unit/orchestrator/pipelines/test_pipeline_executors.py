@@ -0,0 +1,138 @@
+"""Tests for orchestrator pipeline stage executors."""
+
+import os
+
+import pytest
+
+from codomyrmex.orchestrator.pipelines import (
+    FunctionStage,
+    ParallelStage,
+    Pipeline,
+    PipelineBuilder,
+    PipelineStatus,
+    ProcessStageExecutor,
+    ThreadStageExecutor,
+)
+
+
+def _total(ctx):
+    return sum(ctx["numbers"])
+
+
+def _scaled(ctx):
+    return len(ctx["blob"]) * ctx["scale"]
+
+
+def _boom(ctx):
+    raise ValueError("boom")
+
+
+def _context_identity(ctx):
+    return os.getpid(), id(ctx)
+
+
+_initialized = []
+
+
+def _init_worker(tag):
+    _initialized.append(tag)
+
+
+def _init_tag(ctx):
+    return list(_initialized)
+
+
+def _shm_entries() -> set[str]:
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+@pytest.fixture(scope="module")
+def processes():
+    with ProcessStageExecutor(max_workers=2, warm_up=True) as executor:
+        yield executor
+
+
+@pytest.mark.unit
+class TestProcessStageExecutor:
+    def test_matches_thread_executor(self, processes):
+        stages = [
+            FunctionStage("total", _total),
+            FunctionStage("scaled", _scaled),
+            FunctionStage("boom", _boom),
+        ]
+        context = {"numbers": list(range(100)), "blob": b"x" * 10, "scale": 3}
+        with ThreadStageExecutor(max_workers=2) as threads:
+            expected = threads.map(stages, context)
+        assert processes.map(stages, context) == expected
+        assert expected == {"total": 4950, "scaled": 30, "boom": {"error": "boom"}}
+
+    def test_large_context_via_shared_memory(self):
+        before = _shm_entries()
+        with ProcessStageExecutor(max_workers=2, shared_threshold=1024) as executor:
+            context = {"blob": os.urandom(512 * 1024), "scale": 2}
+            stages = [FunctionStage(f"s{i}", _scaled) for i in range(6)]
+            results = executor.map(stages, context)
+        assert results == {f"s{i}": 1024 * 1024 for i in range(6)}
+        assert _shm_entries() <= before
+
+    def test_context_unpickled_once_per_worker(self):
+        with ProcessStageExecutor(max_workers=1, chunksize=1) as executor:
+            stages = [FunctionStage(f"s{i}", _context_identity) for i in range(5)]
+            results = executor.map(stages, {"blob": b"x" * 2048})
+        assert len(set(results.values())) == 1
+
+    def test_initializer_runs_in_workers(self):
+        with ProcessStageExecutor(
+            max_workers=2, initializer=_init_worker, initargs=("ready",)
+        ) as executor:
+            assert executor.warm_up() >= 1
+            results = executor.map([FunctionStage("tag", _init_tag)], {})
+        assert results == {"tag": ["ready"]}
+
+    def test_unpicklable_stage_reports_error(self, processes):
+        results = processes.map(
+            [FunctionStage("lambda", lambda ctx: 1), FunctionStage("ok", _total)],
+            {"numbers": [1, 2]},
+        )
+        assert "error" in results["lambda"]
+        assert results["ok"] == 3
+
+    def test_chunking(self):
+        executor = ProcessStageExecutor(max_workers=2, chunksize=3)
+        stages = [FunctionStage(f"s{i}", _total) for i in range(7)]
+        assert [len(c) for c in executor._chunks(stages)] == [3, 3, 1]
+        auto = ProcessStageExecutor(max_workers=2)
+        assert len(auto._chunks(stages * 4)) == 7
+        with pytest.raises(ValueError):
+            ProcessStageExecutor(chunksize=0)
+
+
+@pytest.mark.unit
+class TestPipelineExecutor:
+    def test_pipeline_executor_runs_parallel_stages(self, processes):
+        pipeline = Pipeline("proc", executor=processes)
+        pipeline.set_context("numbers", [1, 2, 3])
+        pipeline.add_stage(
+            ParallelStage(
+                "fan_out",
+                [FunctionStage("a", _total), FunctionStage("b", _context_identity)],
+            )
+        )
+        result = pipeline.run()
+        assert result.status == PipelineStatus.SUCCESS
+        output = result.stages[0].output
+        assert output["a"] == 6
+        assert output["b"][0] != os.getpid()
+
+    def test_stage_executor_takes_precedence(self, processes):
+        with ThreadStageExecutor() as threads:
+            pipeline = (
+                PipelineBuilder("mixed")
+                .executor(processes)
+                .parallel(
+                    "local", [FunctionStage("pid", _context_identity)], executor=threads
+                )
+                .build()
+            )
+            result = pipeline.run()
+        assert result.stages[0].output["pid"][0] == os.getpid()
@@ -0,0 +1,174 @@
+"""Tests for dependency-driven scheduling in orchestrator Workflow.run."""
+
+import asyncio
+
+import pytest
+
+from codomyrmex.orchestrator.workflows.workflow import (
+    TaskStatus,
+    Workflow,
+    WorkflowError,
+)
+
+
+def _recorder(log: list[str], name: str, delay: float = 0.0):
+    async def action(_task_results=None):
+        log.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        log.append(f"end:{name}")
+        return name
+
+    return action
+
+
+@pytest.mark.unit
+class TestEagerScheduling:
+    @pytest.mark.asyncio
+    async def test_successor_starts_before_slow_sibling_finishes(self):
+        log: list[str] = []
+        wf = Workflow("eager")
+        wf.add_task("slow", _recorder(log, "slow", 0.2))
+        wf.add_task("fast", _recorder(log, "fast"))
+        wf.add_task("after_fast", _recorder(log, "after_fast"), dependencies=["fast"])
+        wf.add_task("join", _recorder(log, "join"), dependencies=["slow", "after_fast"])
+        results = await wf.run()
+
+        assert log.index("end:after_fast") < log.index("end:slow")
+        assert log.index("start:join") > log.index("end:slow")
+        assert results["join"] == "join"
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self):
+        running = 0
+        peak = 0
+
+        async def action(_task_results=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        wf = Workflow("capped", max_concurrency=2)
+        for i in range(8):
+            wf.add_task(f"t{i}", action)
+        await wf.run()
+        assert peak == 2
+        assert all(t.status == TaskStatus.COMPLETED for t in wf.tasks.values())
+
+    @pytest.mark.asyncio
+    async def test_critical_path_first(self):
+        log: list[str] = []
+        wf = Workflow("critical", max_concurrency=1)
+        wf.add_task("leaf", _recorder(log, "leaf"))
+        wf.add_task("head", _recorder(log, "head"))
+        wf.add_task("mid", _recorder(log, "mid"), dependencies=["head"])
+        wf.add_task("tail", _recorder(log, "tail"), dependencies=["mid"])
+        await wf.run()
+        starts = [entry[6:] for entry in log if entry.startswith("start:")]
+        # ties on remaining path length fall back to insertion order
+        assert starts == ["head", "mid", "leaf", "tail"]
+
+    def test_critical_path_lengths(self):
+        wf = Workflow("lengths")
+        wf.add_task("a", lambda: None, metadata={"estimated_duration": 5})
+        wf.add_task("b", lambda: None, dependencies=["a"])
+        wf.add_task("c", lambda: None, dependencies=["a"])
+        wf.add_task(
+            "d",
+            lambda: None,
+            dependencies=["b", "c"],
+            metadata={"estimated_duration": 2.5},
+        )
+        assert wf.critical_path_lengths() == {"a": 8.5, "b": 3.5, "c": 3.5, "d": 2.5}
+
+    def test_invalid_max_concurrency(self):
+        with pytest.raises(WorkflowError):
+            Workflow("bad", max_concurrency=0)
+
+
+@pytest.mark.unit
+class TestSkipPropagation:
+    @pytest.mark.asyncio
+    async def test_failure_skips_all_descendants(self):
+        async def boom(_task_results=None):
+            raise RuntimeError("boom")
+
+        log: list[str] = []
+        wf = Workflow("failure", fail_fast=False)
+        wf.add_task("bad", boom)
+        wf.add_task("child", _recorder(log, "child"), dependencies=["bad"])
+        wf.add_task("grandchild", _recorder(log, "gc"), dependencies=["child"])
+        wf.add_task("other", _recorder(log, "other"))
+        await wf.run()
+
+        assert wf.tasks["bad"].status == TaskStatus.FAILED
+        assert wf.tasks["child"].status == TaskStatus.SKIPPED
+        assert wf.tasks["grandchild"].status == TaskStatus.SKIPPED
+        assert wf.tasks["other"].status == TaskStatus.COMPLETED
+        assert log == ["start:other", "end:other"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_task_is_recorded_as_failed(self):
+        async def cancelled(_task_results=None):
+            asyncio.current_task().cancel()
+            await asyncio.sleep(0)
+
+        log: list[str] = []
+        wf = Workflow("cancelled", fail_fast=False)
+        wf.add_task("gone", cancelled)
+        wf.add_task("child", _recorder(log, "child"), dependencies=["gone"])
+        wf.add_task("other", _recorder(log, "other"))
+        await wf.run()
+
+        assert wf.tasks["gone"].status == TaskStatus.FAILED
+        assert isinstance(wf.tasks["gone"].error, asyncio.CancelledError)
+        assert wf.tasks["child"].status == TaskStatus.SKIPPED
+        assert log == ["start:other", "end:other"]
+
+    @pytest.mark.asyncio
+    async def test_condition_skip_blocks_dependents(self):
+        log: list[str] = []
+        wf = Workflow("condition")
+        wf.add_task("gate", _recorder(log, "gate"), condition=lambda results: False)
+        wf.add_task("after", _recorder(log, "after"), dependencies=["gate"])
+        wf.add_task("other", _recorder(log, "other"))
+        with pytest.raises(WorkflowError, match="Deadlock"):
+            await wf.run()
+
+        assert wf.tasks["gate"].status == TaskStatus.SKIPPED
+        assert wf.tasks["after"].status == TaskStatus.PENDING
+        assert log == ["start:other", "end:other"]
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_stops_launching(self):
+        async def boom(_task_results=None):
+            raise RuntimeError("boom")
+
+        log: list[str] = []
+        wf = Workflow("fail_fast", max_concurrency=1)
+        wf.add_task("bad", boom, metadata={"estimated_duration": 10})
+        wf.add_task("later", _recorder(log, "later"))
+        await wf.run()
+        assert log == []
+        assert wf.tasks["later"].status == TaskStatus.PENDING
+
+
+@pytest.mark.unit
+class TestWorkflowTimeout:
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_running_tasks(self):
+        cancelled = asyncio.Event()
+
+        async def hang(_task_results=None):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        wf = Workflow("timeout", timeout=0.05)
+        wf.add_task("hang", hang)
+        with pytest.raises(WorkflowError, match="timeout"):
+            await wf.run()
+        assert cancelled.is_set()
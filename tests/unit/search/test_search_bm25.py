@@ -0,0 +1,119 @@
+"""Tests for search.hybrid.BM25Index — posting lists and MaxScore top-k."""
+
+from __future__ import annotations
+
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from codomyrmex.search.hybrid import BM25Index
+
+VOCAB = [f"w{i}" for i in range(60)]
+
+
+def _random_doc(rng: random.Random) -> str:
+    # Skewed term distribution so some terms are common and some rare.
+    length = rng.randint(1, 30)
+    return " ".join(VOCAB[min(int(rng.expovariate(0.12)), 59)] for _ in range(length))
+
+
+def _brute_force(docs: dict[str, str], query: str, k1=1.5, b=0.75):
+    """Score every document from scratch with the textbook BM25 formula."""
+    tokenized = {d: BM25Index._tokenize(t) for d, t in docs.items()}
+    n = len(tokenized)
+    avg_dl = sum(len(t) for t in tokenized.values()) / n
+    df = Counter(term for tokens in tokenized.values() for term in set(tokens))
+    scores = {}
+    for doc_id, tokens in tokenized.items():
+        tf_map = Counter(tokens)
+        score = 0.0
+        for term in BM25Index._tokenize(query):
+            tf = tf_map.get(term, 0)
+            if not tf:
+                continue
+            idf = math.log((n - df[term] + 0.5) / (df[term] + 0.5) + 1)
+            norm = 1 - b + b * len(tokens) / max(avg_dl, 1)
+            score += idf * tf * (k1 + 1) / (tf + k1 * norm)
+        if score > 0:
+            scores[doc_id] = score
+    return scores
+
+
+def _assert_matches(index: BM25Index, docs: dict[str, str], query: str, k: int):
+    expected = _brute_force(docs, query)
+    got = index.search(query, top_k=k)
+    want_scores = sorted(expected.values(), reverse=True)[:k]
+    assert [s for _, s in got] == pytest.approx(want_scores, rel=1e-9)
+    for doc_id, score in got:
+        assert expected[doc_id] == pytest.approx(score, rel=1e-9)
+
+
+@pytest.mark.unit
+class TestBM25Postings:
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        docs = {f"d{i}": _random_doc(rng) for i in range(400)}
+        index = BM25Index()
+        for doc_id, text in docs.items():
+            index.add_document(doc_id, text)
+        for q in range(40):
+            query = " ".join(rng.sample(VOCAB[:30], rng.randint(1, 5)))
+            for k in (1, 5, 20):
+                _assert_matches(index, docs, query, k)
+
+    def test_repeated_query_terms_weigh_more(self):
+        index = BM25Index()
+        index.add_document("a", "alpha alpha filler")
+        index.add_document("b", "beta filler filler")
+        index.add_document("c", "gamma")
+        single = dict(index.search("alpha beta"))
+        double = dict(index.search("alpha alpha beta"))
+        assert double["a"] == pytest.approx(2 * single["a"])
+        assert double["b"] == pytest.approx(single["b"])
+
+    def test_remove_and_replace(self):
+        rng = random.Random(1)
+        docs = {f"d{i}": _random_doc(rng) for i in range(200)}
+        index = BM25Index()
+        for doc_id, text in docs.items():
+            index.add_document(doc_id, text)
+        for i in range(0, 200, 3):
+            assert index.remove_document(f"d{i}") is True
+            del docs[f"d{i}"]
+        for i in range(1, 200, 7):
+            docs[f"d{i}"] = _random_doc(rng)
+            index.add_document(f"d{i}", docs[f"d{i}"])
+        assert index.remove_document("d0") is False
+        assert len(index) == len(docs)
+        for _ in range(20):
+            query = " ".join(rng.sample(VOCAB[:20], 3))
+            _assert_matches(index, docs, query, 10)
+
+    def test_compaction_keeps_results(self):
+        index = BM25Index()
+        docs = {}
+        for i in range(3000):
+            docs[f"d{i}"] = f"common t{i % 17} extra{i % 5}"
+            index.add_document(f"d{i}", docs[f"d{i}"])
+        for i in range(2500):
+            index.remove_document(f"d{i}")
+            del docs[f"d{i}"]
+        assert len(index._doc_ids) < 3000
+        _assert_matches(index, docs, "common t3 extra1", 10)
+
+    def test_average_length_is_incremental(self):
+        index = BM25Index()
+        index.add_document("a", "one two three four")
+        index.add_document("b", "one two")
+        assert index._avg_dl == 3.0
+        index.remove_document("a")
+        assert index._avg_dl == 2.0
+
+    def test_empty_cases(self):
+        index = BM25Index()
+        assert index.search("anything") == []
+        index.add_document("a", "hello world")
+        assert index.search("") == []
+        assert index.search("hello", top_k=0) == []
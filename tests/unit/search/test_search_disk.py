@@ -0,0 +1,175 @@
+"""Tests for search.disk — persistent segment-based DiskIndex."""
+
+from __future__ import annotations
+
+import os
+import random
+
+import pytest
+
+from codomyrmex.search import DiskIndex, Document, InMemoryIndex, create_index
+
+WORDS = [f"word{i}" for i in range(40)]
+
+
+def _docs(n: int, seed: int = 0) -> list[Document]:
+    rng = random.Random(seed)
+    return [
+        Document(
+            id=f"d{i}",
+            content=" ".join(rng.choices(WORDS, k=rng.randint(3, 15))),
+            metadata={"n": i},
+        )
+        for i in range(n)
+    ]
+
+
+def _ranked(results):
+    return sorted(
+        ((round(r.score, 9), r.document.id) for r in results),
+        key=lambda x: (-x[0], x[1]),
+    )
+
+
+@pytest.mark.unit
+class TestDiskIndex:
+    def test_persists_across_reopen(self, tmp_path):
+        path = str(tmp_path / "idx")
+        with DiskIndex(path) as index:
+            index.index(Document(id="1", content="Rate limiting protects APIs"))
+            index.index(Document(id="2", content="Token buckets control bursts"))
+        assert os.path.exists(os.path.join(path, "segments.json"))
+
+        reopened = DiskIndex(path)
+        assert reopened.count() == 2
+        results = reopened.search("rate limiting")
+        assert [r.document.id for r in results] == ["1"]
+        assert results[0].highlights
+        doc = reopened.get("2")
+        assert doc.content == "Token buckets control bursts"
+        reopened.close()
+
+    def test_scores_match_in_memory_index(self, tmp_path):
+        docs = _docs(300)
+        memory = InMemoryIndex()
+        index = DiskIndex(str(tmp_path), flush_threshold=64, background_merge=False)
+        for doc in docs:
+            memory.index(doc)
+            index.index(doc)
+        assert index.segment_count >= 1
+        for query in ("word1", "word2 word30", "word5 word5 word17", "missing"):
+            assert _ranked(index.search(query, k=300)) == _ranked(
+                memory.search(query, k=300)
+            )
+        index.close()
+
+    def test_buffer_is_searchable_but_not_durable_until_flush(self, tmp_path):
+        path = str(tmp_path)
+        index = DiskIndex(path)
+        index.index(Document(id="a", content="buffered document"))
+        assert index.search("buffered")[0].document.id == "a"
+        assert DiskIndex(path).count() == 0
+        index.flush()
+        assert DiskIndex(path).count() == 1
+
+    def test_delete_and_overwrite_across_segments(self, tmp_path):
+        path = str(tmp_path)
+        index = DiskIndex(path, background_merge=False)
+        index.index(Document(id="a", content="alpha original"))
+        index.index(Document(id="b", content="beta"))
+        index.flush()
+        index.index(Document(id="a", content="alpha replacement"))
+        assert index.delete("b") is True
+        assert index.delete("b") is False
+        assert index.delete("missing") is False
+        index.close()
+
+        reopened = DiskIndex(path)
+        assert reopened.count() == 1
+        assert reopened.get("b") is None
+        assert reopened.get("a").content == "alpha replacement"
+        assert reopened.search("original") == []
+        assert [r.document.id for r in reopened.search("alpha")] == ["a"]
+        reopened.close()
+
+    def test_background_merge_bounds_segment_count(self, tmp_path):
+        docs = _docs(200, seed=1)
+        memory = InMemoryIndex()
+        index = DiskIndex(str(tmp_path), flush_threshold=10, merge_factor=3)
+        for doc in docs:
+            memory.index(doc)
+            index.index(doc)
+        index.flush()
+        index.wait_for_merges()
+        assert index.segment_count <= 4
+        assert index.count() == 200
+        assert _ranked(index.search("word3 word9", k=200)) == _ranked(
+            memory.search("word3 word9", k=200)
+        )
+        index.close()
+
+    def test_force_merge_purges_deletions(self, tmp_path):
+        path = str(tmp_path)
+        index = DiskIndex(path, flush_threshold=20, background_merge=False)
+        memory = InMemoryIndex()
+        for doc in _docs(100, seed=2):
+            index.index(doc)
+            memory.index(doc)
+        for i in range(0, 100, 4):
+            index.delete(f"d{i}")
+            memory.delete(f"d{i}")
+        index.merge()
+        assert index.segment_count == 1
+        assert index.count() == 75
+        assert _ranked(index.search("word7", k=100)) == _ranked(
+            memory.search("word7", k=100)
+        )
+        index.close()
+        segment_files = [f for f in os.listdir(path) if f.startswith("seg-")]
+        assert len(segment_files) == 5
+
+    def test_uncommitted_segment_files_are_removed_on_open(self, tmp_path):
+        path = str(tmp_path)
+        DiskIndex(path).close()
+        stray = os.path.join(path, "seg-999999.dat")
+        with open(stray, "wb") as f:
+            f.write(b"partial")
+        DiskIndex(path).close()
+        assert not os.path.exists(stray)
+
+    def test_unrelated_files_survive_open(self, tmp_path):
+        path = str(tmp_path)
+        DiskIndex(path).close()
+        kept = ["notes.dat", "seg-1.tim", "seg-000001.dat.bak", "backup-seg.pst"]
+        for name in kept:
+            with open(os.path.join(path, name), "wb") as f:
+                f.write(b"user data")
+        DiskIndex(path).close()
+        assert all(os.path.exists(os.path.join(path, name)) for name in kept)
+
+    def test_documents_without_tokens(self, tmp_path):
+        path = str(tmp_path)
+        with DiskIndex(path) as index:
+            index.index(Document(id="empty", content="!"))
+        with DiskIndex(path) as index:
+            assert index.count() == 1
+            assert index.get("empty").content == "!"
+
+    def test_metadata_round_trip(self, tmp_path):
+        path = str(tmp_path)
+        with DiskIndex(path) as index:
+            index.index(Document(id="m", content="meta data", metadata={"k": [1, 2]}))
+        with DiskIndex(path) as index:
+            assert index.get("m").metadata == {"k": [1, 2]}
+
+    def test_closed_index_raises(self, tmp_path):
+        index = DiskIndex(str(tmp_path))
+        index.close()
+        index.close()
+        with pytest.raises(ValueError, match="closed"):
+            index.search("anything")
+
+    def test_factory_backend(self, tmp_path):
+        index = create_index(backend="disk", path=str(tmp_path))
+        assert isinstance(index, DiskIndex)
+        index.close()
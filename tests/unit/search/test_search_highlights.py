@@ -0,0 +1,116 @@
+"""Tests for position-based, top-k-only highlights in search.engine."""
+
+from __future__ import annotations
+
+import pytest
+
+from codomyrmex.search import engine
+from codomyrmex.search.engine import InMemoryIndex, build_highlights
+from codomyrmex.search.models import Document, SimpleTokenizer, Tokenizer
+
+
+class _SplitTokenizer(Tokenizer):
+    """Whitespace tokenizer relying on the default offset lookup."""
+
+    def tokenize(self, text: str) -> list[str]:
+        return text.lower().split()
+
+
+class _TrigramTokenizer(Tokenizer):
+    """Overlapping character trigrams."""
+
+    def tokenize(self, text: str) -> list[str]:
+        text = text.lower()
+        return [text[i : i + 3] for i in range(len(text) - 2)]
+
+
+class _SynonymTokenizer(Tokenizer):
+    """Maps words onto canonical synonyms that need not occur in the text."""
+
+    def tokenize(self, text: str) -> list[str]:
+        synonyms = {"automobile": "car"}
+        return [synonyms.get(t, t) for t in text.lower().split()]
+
+
+@pytest.mark.unit
+class TestHighlights:
+    def test_offsets_follow_token_boundaries(self):
+        tokens = SimpleTokenizer().tokenize_with_offsets("Accurate RATE, rate!")
+        assert tokens == [("accurate", 0), ("rate", 9), ("rate", 15)]
+
+    def test_default_offsets_scan_forward(self):
+        tokens = _SplitTokenizer().tokenize_with_offsets("a b A")
+        assert tokens == [("a", 0), ("b", 2), ("a", 4)]
+
+    def test_highlight_centres_on_whole_word(self):
+        index = InMemoryIndex()
+        content = "accurate " + "x" * 100 + " rate limiting"
+        index.index(Document(id="1", content=content))
+        (result,) = index.search("rate")
+        assert result.highlights == ["..." + content[80:] + "..."]
+
+    def test_highlights_limited_to_three(self):
+        index = InMemoryIndex()
+        index.index(Document(id="1", content="alpha beta gamma delta"))
+        (result,) = index.search("alpha beta gamma delta")
+        assert len(result.highlights) == 3
+
+    def test_only_returned_results_get_highlights(self, monkeypatch):
+        calls = []
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return build_highlights(*args, **kwargs)
+
+        monkeypatch.setattr(engine, "build_highlights", counting)
+        index = InMemoryIndex()
+        for i in range(100):
+            index.index(Document(id=str(i), content=f"shared term {i}"))
+        results = index.search("shared", k=5)
+        assert len(results) == 5
+        assert len(calls) == 5
+        assert all(r.highlights for r in results)
+
+    def test_reindex_and_delete_refresh_offsets(self):
+        index = InMemoryIndex(tokenizer=_SplitTokenizer())
+        index.index(Document(id="1", content="old words here"))
+        index.index(Document(id="1", content="some new words"))
+        (result,) = index.search("words")
+        assert result.highlights == ["...some new words..."]
+        index.delete("1")
+        assert index._doc_offsets == {}
+
+    def test_overlapping_tokens_are_all_indexed(self):
+        index = InMemoryIndex(tokenizer=_TrigramTokenizer())
+        index.index(Document(id="1", content="abcdefghijklmno"))
+        assert len(index._doc_term_freq["1"]) == 13
+        (result,) = index.search("bcd")
+        assert result.document.id == "1"
+        assert result.highlights == ["...abcdefghijklmno..."]
+
+    def test_tokens_without_offsets_are_indexed(self):
+        index = InMemoryIndex(tokenizer=_SynonymTokenizer())
+        index.index(Document(id="1", content="a red automobile"))
+        (result,) = index.search("car")
+        assert result.document.id == "1"
+        assert result.highlights == []
+        (result,) = index.search("red")
+        assert result.highlights == ["...a red automobile..."]
+
+    def test_unlocated_tokens_get_negative_offset(self):
+        tokens = _SynonymTokenizer().tokenize_with_offsets("a red automobile")
+        assert tokens == [("a", 0), ("red", 2), ("car", -1)]
+
+    def test_index_tokenizes_once(self):
+        calls = []
+
+        class _Counting(_SplitTokenizer):
+            def tokenize(self, text: str) -> list[str]:
+                calls.append(text)
+                return super().tokenize(text)
+
+        index = InMemoryIndex(tokenizer=_Counting())
+        index.index(Document(id="1", content="alpha beta alpha"))
+        assert calls == ["alpha beta alpha"]
+        assert index._doc_term_freq["1"] == {"alpha": 2, "beta": 1}
+        assert index._doc_offsets["1"] == {"alpha": 0, "beta": 6}
@@ -0,0 +1,92 @@
+"""Tests for codomyrmex.utils.file_cache module."""
+
+import json
+import os
+
+import pytest
+
+from codomyrmex.utils.file_cache import FileParseCache
+
+
+def _upper(path, data):
+    return {"text": data.decode().upper()}
+
+
+def _write(path, text, mtime_ns=None):
+    path.write_text(text)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.mark.unit
+class TestFileParseCache:
+    """Tests for FileParseCache.resolve and persistence."""
+
+    def test_parse_then_stat_hit(self, tmp_path):
+        path = tmp_path / "a.txt"
+        _write(path, "abc", mtime_ns=10**18)
+        cache = FileParseCache(_upper, version=1)
+        entry, parsed = cache.resolve([("a", str(path))])["a"]
+        assert (entry["text"], parsed) == ("ABC", True)
+        assert not entry["racy"]
+
+        # Same size and old mtime: trusted without reading the file
+        _write(path, "xyz", mtime_ns=10**18)
+        entry, parsed = cache.resolve([("a", str(path))])["a"]
+        assert (entry["text"], parsed) == ("ABC", False)
+
+    def test_racy_entry_is_rehashed(self, tmp_path):
+        path = tmp_path / "a.txt"
+        _write(path, "abc")
+        cache = FileParseCache(_upper, version=1)
+        stat = path.stat()
+        assert cache.resolve([("a", str(path))])["a"][0]["racy"]
+
+        _write(path, "xyz", mtime_ns=stat.st_mtime_ns)
+        entry, parsed = cache.resolve([("a", str(path))])["a"]
+        assert (entry["text"], parsed) == ("XYZ", True)
+
+    def test_touched_file_matches_by_hash(self, tmp_path):
+        path = tmp_path / "a.txt"
+        _write(path, "abc", mtime_ns=10**18)
+        cache = FileParseCache(_upper, version=1)
+        first, _ = cache.resolve([("a", str(path))])["a"]
+        os.utime(path, ns=(10**9, 10**9))
+        entry, parsed = cache.resolve([("a", str(path))])["a"]
+        assert entry is first
+        assert not parsed
+        assert entry["mtime_ns"] == 10**9
+
+    def test_missing_file_is_dropped(self, tmp_path):
+        path = tmp_path / "a.txt"
+        _write(path, "abc")
+        cache = FileParseCache(_upper, version=1)
+        cache.resolve([("a", str(path))])
+        path.unlink()
+        assert cache.resolve([("a", str(path))]) == {"a": (None, False)}
+        assert cache.entries == {}
+
+    def test_save_and_version_mismatch(self, tmp_path):
+        path = tmp_path / "a.txt"
+        _write(path, "abc", mtime_ns=10**18)
+        store = tmp_path / "cache" / "files.json"
+        cache = FileParseCache(_upper, version=3, cache_path=store)
+        cache.resolve([("a", str(path))])
+        cache.save()
+        assert json.loads(store.read_text())["version"] == 3
+
+        assert "a" in FileParseCache(_upper, version=3, cache_path=store).entries
+        assert FileParseCache(_upper, version=4, cache_path=store).entries == {}
+
+    def test_parallel_matches_serial(self, tmp_path):
+        files = []
+        for i in range(6):
+            _write(tmp_path / f"{i}.txt", f"file {i}")
+            files.append((str(i), str(tmp_path / f"{i}.txt")))
+        serial = FileParseCache(_upper, version=1).resolve(files)
+        parallel = FileParseCache(
+            _upper, version=1, max_workers=2, parallel_threshold=1
+        ).resolve(files)
+        assert {k: v[0]["text"] for k, v in parallel.items()} == {
+            k: v[0]["text"] for k, v in serial.items()
+        }
@@ -0,0 +1,177 @@
+"""Tests for vector_store.filters — declarative where filters and metadata index."""
+
+import random
+
+import pytest
+
+from codomyrmex.vector_store import InMemoryVectorStore, NamespacedVectorStore
+from codomyrmex.vector_store.filters import MetadataFilter, MetadataIndex
+from codomyrmex.vector_store.persistent import PersistentVectorStore
+
+_DOCS = {
+    "a": {"source": "paper", "year": 2019, "lang": "en", "score": 0.5},
+    "b": {"source": "paper", "year": 2021, "lang": "de"},
+    "c": {"source": "web", "year": 2022, "lang": "en", "flag": True},
+    "d": {"source": "web", "year": 2020.5, "lang": "fr", "tags": ["x"]},
+    "e": {"source": "blog", "year": "unknown", "flag": False},
+    "f": {},
+}
+
+_FILTERS = [
+    {"source": "paper"},
+    {"source": {"$eq": "web"}},
+    {"source": {"$ne": "web"}},
+    {"lang": {"$in": ["en", "de"]}},
+    {"lang": {"$nin": ["en"]}},
+    {"year": {"$gt": 2020}},
+    {"year": {"$gte": 2021, "$lt": 2022}},
+    {"year": {"$lte": 2020.5}},
+    {"year": {"$lt": "v"}},
+    {"flag": True},
+    {"flag": {"$ne": True}},
+    {"tags": {"$ne": "x"}},
+    {"source": "paper", "lang": "en"},
+    {"$or": [{"source": "blog"}, {"year": {"$gte": 2022}}]},
+    {
+        "$and": [
+            {"source": {"$in": ["paper", "web"]}},
+            {"$or": [{"lang": "fr"}, {"year": 2019}]},
+        ]
+    },
+    {"missing": "x"},
+]
+
+
+def _index() -> MetadataIndex:
+    index = MetadataIndex()
+    for doc_id, meta in _DOCS.items():
+        index.add(doc_id, meta)
+    return index
+
+
+@pytest.mark.unit
+class TestMetadataFilter:
+    @pytest.mark.parametrize("where", _FILTERS)
+    def test_index_agrees_with_predicate(self, where):
+        f = MetadataFilter(where)
+        expected = {i for i, m in _DOCS.items() if f.matches(m)}
+        assert _index().candidates(where) == expected
+
+    def test_known_results(self):
+        index = _index()
+        assert index.candidates({"source": "paper"}) == {"a", "b"}
+        assert index.candidates({"year": {"$gt": 2020}}) == {"b", "c", "d"}
+        assert index.candidates({"flag": {"$ne": True}}) == {"e"}
+        assert index.candidates({"lang": {"$nin": ["en"]}}) == {"b", "d"}
+
+    def test_bool_and_int_are_distinct(self):
+        index = MetadataIndex()
+        index.add("one", {"v": 1})
+        index.add("true", {"v": True})
+        assert index.candidates({"v": 1}) == {"one"}
+        assert index.candidates({"v": True}) == {"true"}
+        assert index.candidates({"v": {"$gte": 1}}) == {"one"}
+
+    def test_remove_and_replace(self):
+        index = _index()
+        index.remove("a")
+        index.remove("missing")
+        assert index.candidates({"source": "paper"}) == {"b"}
+        assert index.candidates({"year": {"$lt": 2020}}) == set()
+        index.add("b", {"source": "web"})
+        assert index.candidates({"source": "paper"}) == set()
+        assert index.candidates({"lang": "de"}) == set()
+        assert len(index) == 5
+
+    def test_index_copies_metadata(self):
+        index = MetadataIndex()
+        meta = {"k": "v"}
+        index.add("x", meta)
+        meta["k"] = "changed"
+        index.remove("x")
+        assert index.candidates({"k": "v"}) == set()
+
+    @pytest.mark.parametrize(
+        "where",
+        [
+            {},
+            {"$not": []},
+            {"$and": []},
+            {"f": {"$regex": "x"}},
+            {"f": {"$in": "abc"}},
+            {"f": {"$gt": True}},
+            {"f": ["list"]},
+            {"f": {}},
+        ],
+    )
+    def test_invalid_filters_raise(self, where):
+        with pytest.raises(ValueError):
+            MetadataFilter(where)
+
+    def test_randomized_against_predicate(self):
+        rng = random.Random(0)
+        index = MetadataIndex()
+        docs = {}
+        for i in range(300):
+            docs[f"d{i}"] = {"n": rng.randint(0, 20), "c": rng.choice("abcd")}
+            index.add(f"d{i}", docs[f"d{i}"])
+        for i in range(0, 300, 3):
+            index.remove(f"d{i}")
+            del docs[f"d{i}"]
+        for _ in range(50):
+            lo = rng.randint(0, 20)
+            where = {
+                "$or": [
+                    {"n": {"$gte": lo, "$lt": lo + 3}},
+                    {"c": {"$in": rng.sample("abcd", 2)}},
+                ]
+            }
+            f = MetadataFilter(where)
+            assert index.candidates(where) == {
+                i for i, m in docs.items() if f.matches(m)
+            }
+
+
+@pytest.mark.unit
+class TestStoresWithWhere:
+    def _check(self, store):
+        for i, (doc_id, meta) in enumerate(_DOCS.items()):
+            store.add(doc_id, [1.0, float(i)], meta)
+        results = store.search([1.0, 0.0], k=10, where={"source": "paper"})
+        assert {r.id for r in results} == {"a", "b"}
+        results = store.search(
+            [1.0, 0.0], k=10, where={"source": "paper"}, filter_fn=lambda m: "lang" in m
+        )
+        assert {r.id for r in results} == {"a", "b"}
+        assert store.search([1.0, 0.0], k=10, where={"missing": 1}) == []
+        store.delete("a")
+        assert {r.id for r in store.search([1.0, 0.0], where={"source": "paper"})} == {
+            "b"
+        }
+
+    def test_in_memory(self):
+        self._check(InMemoryVectorStore())
+
+    def test_persistent(self, tmp_path):
+        store = PersistentVectorStore(str(tmp_path / "v.json"), save_interval=1)
+        self._check(store)
+        reloaded = PersistentVectorStore(str(tmp_path / "v.json"))
+        assert {r.id for r in reloaded.search([1.0, 0.0], where={"lang": "en"})} == {
+            "c"
+        }
+
+    def test_namespaced(self):
+        store = NamespacedVectorStore()
+        store.use_namespace("ns")
+        self._check(store)
+
+    def test_numpy_backends(self, tmp_path):
+        pytest.importorskip("numpy")
+        from codomyrmex.vector_store import IVFVectorStore, MatrixVectorStore
+        from codomyrmex.vector_store.mmap_store import MmapVectorStore
+
+        self._check(MatrixVectorStore())
+        self._check(IVFVectorStore(n_lists=2, train_size=3))
+        mmap = MmapVectorStore(str(tmp_path / "db"), compact_interval=3)
+        self._check(mmap)
+        mmap.close()
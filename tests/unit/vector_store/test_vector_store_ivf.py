@@ -0,0 +1,109 @@
+"""Tests for vector_store.ivf — IVF-flat approximate nearest-neighbour store."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from codomyrmex.vector_store import (
+    IVFVectorStore,
+    MatrixVectorStore,
+    create_vector_store,
+    recall_at_k,
+)
+
+
+def _clustered(n: int = 2000, dim: int = 16, clusters: int = 20, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dim)) * 5
+    labels = rng.integers(0, clusters, n)
+    return (centres[labels] + rng.standard_normal((n, dim))).astype(np.float32)
+
+
+def _stores(metric: str = "cosine", **kwargs):
+    data = _clustered()
+    ivf = IVFVectorStore(distance_metric=metric, n_lists=20, **kwargs)
+    exact = MatrixVectorStore(distance_metric=metric)
+    entries = [(f"v{i}", row, {"even": i % 2 == 0}) for i, row in enumerate(data)]
+    ivf.add_batch(entries)
+    exact.add_batch(entries)
+    return ivf, exact, data
+
+
+@pytest.mark.unit
+class TestIVFVectorStore:
+    def test_untrained_store_is_exact(self):
+        store = IVFVectorStore(n_lists=10, train_size=100)
+        exact = MatrixVectorStore()
+        for i, row in enumerate(_clustered(n=50)):
+            store.add(f"v{i}", row)
+            exact.add(f"v{i}", row)
+        assert not store.is_trained
+        query = _clustered(n=1, seed=9)[0]
+        assert [r.id for r in store.search(query, k=5)] == [
+            r.id for r in exact.search(query, k=5)
+        ]
+
+    def test_auto_trains_at_train_size(self):
+        ivf, _, _ = _stores(train_size=500)
+        assert ivf.is_trained
+        assert sum(ivf.list_sizes()) == ivf.count()
+
+    @pytest.mark.parametrize("metric", ["cosine", "euclidean"])
+    def test_recall_increases_with_nprobe(self, metric):
+        ivf, exact, _ = _stores(metric)
+        queries = _clustered(n=30, seed=5).tolist()
+        ivf.nprobe = 1
+        low = recall_at_k(ivf, exact, queries, k=10)
+        ivf.nprobe = 20
+        full = recall_at_k(ivf, exact, queries, k=10)
+        assert full == pytest.approx(1.0)
+        assert low <= full
+        assert low > 0.3
+
+    def test_per_call_nprobe(self):
+        ivf, exact, _ = _stores()
+        query = _clustered(n=1, seed=11)[0]
+        got = ivf.search(query, k=10, nprobe=ivf.n_lists)
+        assert [r.id for r in got] == [r.id for r in exact.search(query, k=10)]
+
+    def test_incremental_insert_after_training(self):
+        ivf, _, data = _stores()
+        ivf.add("new", data[0] + 0.001)
+        assert sum(ivf.list_sizes()) == ivf.count()
+        assert "new" in {r.id for r in ivf.search(data[0], k=3)}
+
+    def test_delete_keeps_lists_consistent(self):
+        ivf, _, data = _stores()
+        for i in range(0, 2000, 7):
+            assert ivf.delete(f"v{i}")
+        assert not ivf.delete("v0")
+        assert sum(ivf.list_sizes()) == ivf.count()
+        results = ivf.search(data[0], k=50, nprobe=ivf.n_lists)
+        assert "v0" not in {r.id for r in results}
+        assert len(results) == 50
+
+    def test_overwrite_moves_between_lists(self):
+        ivf, _, data = _stores()
+        ivf.add("v1", data[1999])
+        assert sum(ivf.list_sizes()) == ivf.count()
+        assert ivf.search(data[1999], k=2)[0].id in {"v1", "v1999"}
+
+    def test_filter_fn_applies_to_candidates(self):
+        ivf, _, data = _stores()
+        results = ivf.search(data[3], k=5, filter_fn=lambda m: m["even"])
+        assert results
+        assert all(r.metadata["even"] for r in results)
+
+    def test_clear_resets_training(self):
+        ivf, _, _ = _stores()
+        ivf.clear()
+        assert not ivf.is_trained
+        assert ivf.count() == 0
+
+    def test_train_empty_raises(self):
+        with pytest.raises(ValueError):
+            IVFVectorStore().train()
+
+    def test_factory_backend(self):
+        store = create_vector_store(backend="ivf", n_lists=4)
+        assert isinstance(store, IVFVectorStore)
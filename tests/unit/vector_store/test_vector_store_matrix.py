@@ -0,0 +1,135 @@
+"""Tests for vector_store.matrix — NumPy matrix-backed store and batch search."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from codomyrmex.vector_store import (
+    InMemoryVectorStore,
+    MatrixVectorStore,
+    create_vector_store,
+)
+from codomyrmex.vector_store.models import random_embedding
+
+
+def _pair(metric: str, n: int = 200, dim: int = 16):
+    """Build a matrix store and a reference linear-scan store with equal data."""
+    matrix = MatrixVectorStore(distance_metric=metric, initial_capacity=4)
+    exact = InMemoryVectorStore(distance_metric=metric)
+    for i in range(n):
+        vec = random_embedding(dim, seed=i)
+        vec = [x * (1 + i % 3) for x in vec]
+        meta = {"bucket": i % 5}
+        matrix.add(f"v{i}", vec, meta)
+        exact.add(f"v{i}", vec, meta)
+    return matrix, exact
+
+
+@pytest.mark.unit
+class TestMatrixVectorStore:
+    def test_add_get_roundtrip(self):
+        store = MatrixVectorStore()
+        store.add("a", [3.0, 4.0], {"tag": "x"})
+        entry = store.get("a")
+        assert entry is not None
+        assert entry.embedding == pytest.approx([3.0, 4.0], rel=1e-6)
+        assert entry.metadata == {"tag": "x"}
+        assert store.get("missing") is None
+
+    @pytest.mark.parametrize("metric", ["cosine", "euclidean", "dot_product"])
+    def test_search_matches_linear_scan(self, metric):
+        matrix, exact = _pair(metric)
+        query = random_embedding(16, seed=999)
+        got = matrix.search(query, k=10)
+        want = exact.search(query, k=10)
+        assert [r.id for r in got] == [r.id for r in want]
+        for g, w in zip(got, want, strict=True):
+            assert g.score == pytest.approx(w.score, abs=1e-4)
+
+    def test_search_batch_matches_single_queries(self):
+        matrix, _ = _pair("cosine")
+        queries = [random_embedding(16, seed=1000 + i) for i in range(7)]
+        batched = matrix.search_batch(queries, k=5)
+        assert len(batched) == 7
+        for query, results in zip(queries, batched, strict=True):
+            assert [r.id for r in results] == [r.id for r in matrix.search(query, k=5)]
+
+    def test_filter_fn(self):
+        matrix, exact = _pair("cosine")
+        query = random_embedding(16, seed=7)
+        keep = lambda m: m["bucket"] == 2
+        got = matrix.search(query, k=5, filter_fn=keep)
+        assert all(r.metadata["bucket"] == 2 for r in got)
+        assert [r.id for r in got] == [
+            r.id for r in exact.search(query, k=5, filter_fn=keep)
+        ]
+        assert matrix.search(query, k=5, filter_fn=lambda m: False) == []
+
+    def test_delete_backfills_rows(self):
+        matrix, exact = _pair("euclidean", n=20)
+        for i in (0, 7, 19):
+            assert matrix.delete(f"v{i}") is True
+            exact.delete(f"v{i}")
+        assert matrix.delete("v0") is False
+        assert matrix.count() == 17
+        assert sorted(matrix.list_ids()) == sorted(exact.list_ids())
+        query = random_embedding(16, seed=3)
+        assert [r.id for r in matrix.search(query, k=17)] == [
+            r.id for r in exact.search(query, k=17)
+        ]
+
+    def test_overwrite_existing_id(self):
+        store = MatrixVectorStore()
+        store.add("a", [1.0, 0.0])
+        store.add("a", [0.0, 1.0], {"v": 2})
+        assert store.count() == 1
+        assert store.get("a").embedding == pytest.approx([0.0, 1.0])
+        assert store.get("a").metadata == {"v": 2}
+
+    def test_add_batch_and_growth(self):
+        store = MatrixVectorStore(initial_capacity=2)
+        added = store.add_batch([(f"id{i}", [float(i), 1.0], None) for i in range(50)])
+        assert added == 50
+        assert len(store) == 50
+        assert store.get("id49").metadata == {}
+
+    def test_zero_vector_scores_zero(self):
+        store = MatrixVectorStore()
+        store.add("zero", [0.0, 0.0])
+        store.add("one", [1.0, 0.0])
+        results = store.search([1.0, 0.0], k=2)
+        assert results[0].id == "one"
+        assert results[1].score == 0.0
+
+    def test_dimension_mismatch_raises(self):
+        store = MatrixVectorStore()
+        store.add("a", [1.0, 0.0, 0.0])
+        with pytest.raises(ValueError, match="dimension"):
+            store.add("b", [1.0, 0.0])
+        with pytest.raises(ValueError, match="dimension"):
+            store.search([1.0, 0.0])
+
+    def test_empty_and_clear(self):
+        store = MatrixVectorStore()
+        assert store.search([1.0, 0.0]) == []
+        assert store.search_batch([]) == []
+        store.add("a", [1.0, 0.0])
+        store.clear()
+        assert store.count() == 0
+        store.add("b", [1.0, 0.0, 0.0])
+        assert store.dimension == 3
+
+    def test_unknown_metric_raises(self):
+        with pytest.raises(ValueError):
+            MatrixVectorStore(distance_metric="hamming")
+
+    def test_factory_backend(self):
+        store = create_vector_store(backend="matrix", distance_metric="dot_product")
+        assert isinstance(store, MatrixVectorStore)
+
+    def test_default_search_batch_on_linear_store(self):
+        store = InMemoryVectorStore()
+        store.add("a", [1.0, 0.0])
+        store.add("b", [0.0, 1.0])
+        batched = store.search_batch([[1.0, 0.0], [0.0, 1.0]], k=1)
+        assert [r[0].id for r in batched] == ["a", "b"]
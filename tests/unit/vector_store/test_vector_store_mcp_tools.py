@@ -85,6 +85,16 @@ def test_vector_search_best_match_first() -> None:
     assert results[0]["id"] == "match"
 
 
+def test_vector_search_where_filter() -> None:
+    """A where filter restricts results to matching metadata."""
+    from codomyrmex.vector_store.mcp_tools import vector_add, vector_search
+
+    vector_add("paper", [1.0, 0.0], {"source": "paper", "year": 2021})
+    vector_add("web", [1.0, 0.0], {"source": "web", "year": 2023})
+    results = vector_search([1.0, 0.0], k=5, where={"year": {"$gte": 2022}})
+    assert [r["id"] for r in results] == ["web"]
+
+
 def test_vector_delete_returns_true() -> None:
     """vector_delete returns True when the vector exists."""
     from codomyrmex.vector_store.mcp_tools import vector_add, vector_delete
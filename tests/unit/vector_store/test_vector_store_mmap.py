@@ -0,0 +1,208 @@
+"""Tests for vector_store.mmap_store — mmap snapshot + write-ahead log."""
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from codomyrmex.vector_store import MatrixVectorStore, create_vector_store
+from codomyrmex.vector_store.mmap_store import MmapVectorStore
+from codomyrmex.vector_store.models import random_embedding
+
+
+def _fill(store, n=50, dim=8, start=0):
+    for i in range(start, start + n):
+        store.add(f"v{i}", random_embedding(dim, seed=i), {"i": i})
+
+
+@pytest.mark.unit
+class TestMmapVectorStore:
+    def test_add_get_search(self, tmp_path):
+        store = MmapVectorStore(str(tmp_path / "db"))
+        _fill(store)
+        assert store.count() == 50
+        entry = store.get("v3")
+        assert entry.metadata == {"i": 3}
+        assert entry.embedding == pytest.approx(random_embedding(8, seed=3), abs=1e-6)
+        assert store.search(random_embedding(8, seed=3), k=1)[0].id == "v3"
+        store.close()
+
+    def test_reopen_replays_wal(self, tmp_path):
+        path = str(tmp_path / "db")
+        store = MmapVectorStore(path, compact_interval=None)
+        _fill(store, n=20)
+        store.delete("v5")
+        store.close()
+
+        reopened = MmapVectorStore(path)
+        assert reopened.count() == 19
+        assert reopened.get("v5") is None
+        assert reopened.get("v6").metadata == {"i": 6}
+        reopened.close()
+
+    def test_compact_then_reopen_maps_snapshot(self, tmp_path):
+        path = tmp_path / "db"
+        store = MmapVectorStore(str(path), compact_interval=None)
+        _fill(store, n=30)
+        store.compact()
+        assert (path / "wal.log").stat().st_size == 0
+        store.close()
+
+        reopened = MmapVectorStore(str(path))
+        assert isinstance(reopened._base, np.memmap)
+        assert reopened.count() == 30
+        assert reopened.search(random_embedding(8, seed=12), k=1)[0].id == "v12"
+        reopened.close()
+
+    def test_writes_over_snapshot(self, tmp_path):
+        path = str(tmp_path / "db")
+        store = MmapVectorStore(path, compact_interval=None)
+        _fill(store, n=10)
+        store.compact()
+        store.add("v2", random_embedding(8, seed=99), {"i": "new"})
+        assert store.delete("v4")
+        assert not store.delete("v4")
+        _fill(store, n=5, start=10)
+        assert store.count() == 14
+        assert store.get("v2").metadata == {"i": "new"}
+        assert sorted(store.list_ids()) == sorted(
+            [f"v{i}" for i in range(15) if i != 4]
+        )
+        store.close()
+
+        reopened = MmapVectorStore(path)
+        assert reopened.count() == 14
+        assert reopened.get("v2").metadata == {"i": "new"}
+        assert reopened.get("v4") is None
+        reopened.compact()
+        assert reopened.count() == 14
+        assert reopened.get("v2").metadata == {"i": "new"}
+        reopened.close()
+
+    @pytest.mark.parametrize("metric", ["cosine", "euclidean", "dot_product"])
+    def test_search_matches_matrix_store(self, tmp_path, metric):
+        store = MmapVectorStore(str(tmp_path / "db"), metric, compact_interval=None)
+        exact = MatrixVectorStore(metric)
+        for i in range(60):
+            vec = [x * (1 + i % 4) for x in random_embedding(8, seed=i)]
+            store.add(f"v{i}", vec, {"even": i % 2 == 0})
+            exact.add(f"v{i}", vec, {"even": i % 2 == 0})
+            if i == 40:
+                store.compact()
+        store.delete("v7")
+        exact.delete("v7")
+        query = random_embedding(8, seed=500)
+        for filter_fn in (None, lambda m: m["even"]):
+            got = store.search(query, k=8, filter_fn=filter_fn)
+            want = exact.search(query, k=8, filter_fn=filter_fn)
+            assert [r.id for r in got] == [r.id for r in want]
+        store.close()
+
+    def test_auto_compaction(self, tmp_path):
+        path = tmp_path / "db"
+        store = MmapVectorStore(str(path), compact_interval=10)
+        _fill(store, n=25)
+        assert store._base is not None
+        assert store._wal_records == 5
+        assert store.count() == 25
+        store.close()
+
+    def test_torn_wal_tail_is_dropped(self, tmp_path):
+        path = tmp_path / "db"
+        store = MmapVectorStore(str(path), compact_interval=None)
+        _fill(store, n=5)
+        store.close()
+        wal = path / "wal.log"
+        wal.write_bytes(wal.read_bytes()[:-7])
+
+        reopened = MmapVectorStore(str(path))
+        assert reopened.count() == 4
+        assert reopened.get("v4") is None
+        reopened.add("v4", random_embedding(8, seed=4))
+        reopened.close()
+        assert MmapVectorStore(str(path)).count() == 5
+
+    def test_clear_removes_data(self, tmp_path):
+        path = str(tmp_path / "db")
+        store = MmapVectorStore(path)
+        _fill(store, n=5)
+        store.compact()
+        store.clear()
+        assert store.count() == 0
+        store.add("x", [1.0, 2.0])
+        store.close()
+        assert MmapVectorStore(path).get("x") is not None
+
+    def test_dimension_and_metric_checks(self, tmp_path):
+        path = str(tmp_path / "db")
+        store = MmapVectorStore(path)
+        store.add("a", [1.0, 0.0])
+        with pytest.raises(ValueError, match="dimension"):
+            store.add("b", [1.0, 0.0, 0.0])
+        store.compact()
+        store.close()
+        with pytest.raises(ValueError, match="distance metric"):
+            MmapVectorStore(path, distance_metric="euclidean")
+
+    def test_factory_backend(self, tmp_path):
+        store = create_vector_store(backend="mmap", path=str(tmp_path / "db"))
+        assert isinstance(store, MmapVectorStore)
+        store.close()
+
+    def test_open_does_not_decode_sidecar(self, tmp_path):
+        path = str(tmp_path / "db")
+        store = MmapVectorStore(path, compact_interval=None)
+        _fill(store, n=40)
+        store.compact()
+        store.close()
+
+        reopened = MmapVectorStore(path)
+        assert reopened._base_rows == {}
+        assert reopened.get("v17").metadata == {"i": 17}
+        assert reopened.get("missing") is None
+        assert len(reopened._base_rows) <= 2
+        assert (
+            reopened.search(random_embedding(8, seed=3), k=1, where={"i": 3})[0].id
+            == "v3"
+        )
+        assert reopened.delete("v3")
+        assert reopened.search(random_embedding(8, seed=3), k=1, where={"i": 3}) == []
+        reopened.close()
+
+    @pytest.mark.skipif(
+        not sys.platform.startswith("linux"), reason="reads /proc/self/fd"
+    )
+    def test_compaction_syncs_snapshot_before_manifest(self, tmp_path, monkeypatch):
+        path = tmp_path / "db"
+        store = MmapVectorStore(str(path), compact_interval=None)
+        _fill(store, n=5)
+        synced = []
+        real_fsync = os.fsync
+        real_replace = os.replace
+
+        def fsync(fd):
+            synced.append(os.readlink(f"/proc/self/fd/{fd}"))
+            real_fsync(fd)
+
+        def replace(src, dst):
+            synced.append("replace")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(os, "fsync", fsync)
+        monkeypatch.setattr(os, "replace", replace)
+        store.compact()
+        store.close()
+
+        committed = synced.index("replace")
+        before = {os.path.basename(p) for p in synced[:committed]}
+        assert {
+            "vectors-1.npy",
+            "norms-1.npy",
+            "entries-1.jsonl",
+            "offsets-1.npy",
+            "lookup-1.npy",
+            "manifest.json.tmp",
+        } <= before
+        assert str(path) in synced[committed + 1 :]
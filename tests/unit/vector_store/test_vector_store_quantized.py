@@ -0,0 +1,218 @@
+"""Tests for vector_store.quantized — int8 / product-quantized storage."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from codomyrmex.vector_store import (
+    MatrixVectorStore,
+    QuantizedVectorStore,
+    create_vector_store,
+    quantization_report,
+    recall_at_k,
+)
+from codomyrmex.vector_store.quantized import ProductQuantizer, ScalarQuantizer
+
+DIM = 32
+
+
+def _clustered(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((16, DIM)) * 0.8
+    labels = rng.integers(0, 16, n)
+    return (centres[labels] + rng.standard_normal((n, DIM))).astype(np.float32)
+
+
+def _pair(metric: str, method: str, n: int = 1500, **kwargs):
+    data = _clustered(n)
+    entries = [(f"v{i}", row, {"bucket": i % 5}) for i, row in enumerate(data)]
+    store = QuantizedVectorStore(
+        distance_metric=metric,
+        method=method,
+        pq_subspaces=8,
+        train_size=1000,
+        initial_capacity=64,
+        **kwargs,
+    )
+    store.add_batch(entries)
+    exact = MatrixVectorStore(distance_metric=metric)
+    exact.add_batch(entries)
+    return store, exact
+
+
+def _queries(n: int = 20):
+    return _clustered(n, seed=99).tolist()
+
+
+@pytest.mark.unit
+class TestQuantizers:
+    def test_scalar_roundtrip_error_is_small(self):
+        data = _clustered(500)
+        quantizer = ScalarQuantizer()
+        quantizer.fit(data)
+        codes = quantizer.encode(data)
+        assert codes.dtype == np.int8
+        assert codes.shape == data.shape
+        step = (data.max(axis=0) - data.min(axis=0)) / 255
+        assert np.all(np.abs(quantizer.decode(codes) - data) <= step * 0.51 + 1e-6)
+
+    def test_scalar_clips_out_of_range(self):
+        quantizer = ScalarQuantizer()
+        quantizer.fit(np.array([[0.0, 0.0], [1.0, 1.0]], dtype=np.float32))
+        codes = quantizer.encode(np.array([[-5.0, 5.0]], dtype=np.float32))
+        assert codes.tolist() == [[-128, 127]]
+
+    def test_product_codes_one_byte_per_subspace(self):
+        data = _clustered(600)
+        quantizer = ProductQuantizer(n_subspaces=4, iterations=5)
+        quantizer.fit(data)
+        codes = quantizer.encode(data)
+        assert codes.dtype == np.uint8
+        assert codes.shape == (600, 4)
+        assert quantizer.decode(codes).shape == data.shape
+
+    @pytest.mark.parametrize("metric", ["cosine", "euclidean", "dot_product"])
+    def test_product_adc_matches_decoded_scores(self, metric):
+        from codomyrmex.vector_store.matrix import _prepare_rows, _score_rows
+
+        data, _ = _prepare_rows(metric, _clustered(600))
+        quantizer = ProductQuantizer(n_subspaces=4, iterations=5)
+        quantizer.fit(data)
+        codes = quantizer.encode(data)
+        queries = _clustered(3, seed=5)
+        decoded = quantizer.decode(codes)
+        norms = np.einsum("ij,ij->i", decoded, decoded)
+        want = _score_rows(metric, queries, decoded, norms)
+        got = quantizer.scores(metric, queries, codes)
+        assert got == pytest.approx(want, rel=1e-3, abs=1e-3)
+
+
+@pytest.mark.unit
+class TestQuantizedVectorStore:
+    def test_exact_before_training(self):
+        store = QuantizedVectorStore(train_size=100)
+        store.add("a", [1.0, 0.0])
+        store.add("b", [0.0, 1.0])
+        assert not store.is_trained
+        assert store.search([1.0, 0.1], k=1)[0].id == "a"
+
+    def test_trains_at_train_size(self):
+        store, _ = _pair("cosine", "int8")
+        assert store.is_trained
+        assert store.code_size == DIM
+
+    @pytest.mark.parametrize("metric", ["cosine", "euclidean", "dot_product"])
+    @pytest.mark.parametrize("method", ["int8", "pq"])
+    def test_reranked_recall(self, metric, method):
+        store, exact = _pair(metric, method)
+        assert recall_at_k(store, exact, _queries(), k=10) >= 0.9
+
+    def test_reranked_scores_are_exact(self):
+        store, exact = _pair("euclidean", "pq")
+        query = _queries(1)[0]
+        want = {r.id: r.score for r in exact.search(query, k=50)}
+        for result in store.search(query, k=10):
+            assert result.score == pytest.approx(want[result.id], rel=1e-5)
+
+    def test_rerank_zero_returns_code_scores(self):
+        store, exact = _pair("cosine", "int8")
+        query = _queries(1)[0]
+        approx = store.search(query, k=10, rerank=0)
+        assert len(approx) == 10
+        want = {r.id: r.score for r in exact.search(query, k=store.count())}
+        assert any(abs(r.score - want[r.id]) > 1e-6 for r in approx)
+
+    def test_incremental_inserts_and_overwrites_are_encoded(self):
+        store, _ = _pair("cosine", "pq")
+        store.add("new", [1.0] * DIM, {"bucket": 9})
+        assert store.search([1.0] * DIM, k=1)[0].id == "new"
+        store.add("v3", [-1.0] * DIM)
+        assert store.search([-1.0] * DIM, k=1)[0].id == "v3"
+        assert store.count() == 1501
+
+    def test_delete_backfills_codes(self):
+        store, exact = _pair("euclidean", "int8")
+        for i in (0, 10, 1499):
+            assert store.delete(f"v{i}") is True
+            exact.delete(f"v{i}")
+        assert store.delete("v0") is False
+        queries = _queries()
+        assert recall_at_k(store, exact, queries, k=10) >= 0.9
+        assert all(r.id != "v1499" for q in queries for r in store.search(q, k=20))
+
+    def test_where_and_filter_fn(self):
+        store, exact = _pair("cosine", "pq")
+        query = _queries(1)[0]
+        got = store.search(query, k=5, where={"bucket": 2})
+        assert got
+        assert all(r.metadata["bucket"] == 2 for r in got)
+        want = exact.search(query, k=5, where={"bucket": 2})
+        assert {r.id for r in got} & {r.id for r in want}
+        keep = lambda m: m["bucket"] == 4
+        assert all(
+            r.metadata["bucket"] == 4 for r in store.search(query, filter_fn=keep)
+        )
+        assert store.search(query, where={"bucket": 42}) == []
+
+    def test_get_returns_full_precision(self):
+        store, exact = _pair("cosine", "pq")
+        assert store.get("v7").embedding == pytest.approx(
+            exact.get("v7").embedding, rel=1e-5
+        )
+
+    def test_originals_on_disk(self, tmp_path):
+        store, exact = _pair("cosine", "int8", originals_dir=str(tmp_path))
+        usage = store.memory_usage()
+        assert usage["originals_on_disk"] is True
+        assert usage["resident_bytes"] == usage["code_bytes"] == 1500 * DIM
+        assert usage["original_bytes"] == 1500 * DIM * 4
+        assert recall_at_k(store, exact, _queries(), k=10) >= 0.9
+        assert store.get("v3").embedding == pytest.approx(
+            exact.get("v3").embedding, rel=1e-5
+        )
+
+    def test_originals_default_to_disk(self):
+        store, _ = _pair("cosine", "int8", n=1200)
+        usage = store.memory_usage()
+        assert usage["originals_on_disk"] is True
+        assert usage["resident_bytes"] < usage["original_bytes"]
+
+    def test_originals_in_memory(self):
+        store, exact = _pair("cosine", "int8", originals="memory")
+        usage = store.memory_usage()
+        assert usage["originals_on_disk"] is False
+        assert usage["resident_bytes"] == usage["code_bytes"] + usage["original_bytes"]
+        assert recall_at_k(store, exact, _queries(), k=10) >= 0.9
+
+    def test_quantization_report(self):
+        store, exact = _pair("cosine", "pq")
+        report = quantization_report(store, exact, _queries(), k=10)
+        assert report["bytes_per_vector"] == 8
+        assert report["compression_ratio"] == DIM * 4 / 8
+        assert report["recall"] >= report["recall_without_rerank"]
+        assert 0.0 <= report["recall_without_rerank"] <= 1.0
+
+    def test_clear_drops_quantizer(self):
+        store, _ = _pair("cosine", "int8")
+        store.clear()
+        assert not store.is_trained
+        assert store.count() == 0
+        assert store.search([1.0] * DIM) == []
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="method"):
+            QuantizedVectorStore(method="binary")
+        with pytest.raises(ValueError, match="rerank"):
+            QuantizedVectorStore(rerank=-1)
+        with pytest.raises(ValueError, match="originals"):
+            QuantizedVectorStore(originals="gpu")
+        with pytest.raises(ValueError, match="divisible"):
+            QuantizedVectorStore(method="pq", pq_subspaces=8, dimension=30)
+        store = QuantizedVectorStore(method="pq", pq_subspaces=4)
+        with pytest.raises(ValueError, match="divisible"):
+            store.add("a", [1.0, 2.0, 3.0])
+
+    def test_factory_backend(self):
+        store = create_vector_store(backend="quantized", method="pq")
+        assert isinstance(store, QuantizedVectorStore)
+        assert store.method == "pq"
@@ -0,0 +1,85 @@
+"""Local stand-in for Ollama's ``/api/embed`` endpoint.
+
+Vectors are deterministic bag-of-words hashes, so texts sharing words get
+similar embeddings. Every request is recorded, and ``request_latency`` /
+``per_input_latency`` simulate the model cost for latency benchmarks.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DIMENSIONS = 32
+
+
+def fake_embedding(text: str) -> list[float]:
+    vector = [0.0] * DIMENSIONS
+    for word in text.lower().split():
+        digest = hashlib.blake2b(word.encode(), digest_size=2).digest()
+        vector[int.from_bytes(digest, "little") % DIMENSIONS] += 1.0
+    return vector
+
+
+class FakeEmbedServer:
+    """Context manager running the fake embed server on an ephemeral port."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        request_latency: float = 0.0,
+        per_input_latency: float = 0.0,
+    ):
+        self.requests: list[list[str]] = []
+        self.request_latency = request_latency
+        self.per_input_latency = per_input_latency
+        owner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                if self.path != "/api/embed":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                texts = body["input"]
+                if isinstance(texts, str):
+                    texts = [texts]
+                owner.requests.append(list(texts))
+                time.sleep(owner.request_latency + owner.per_input_latency * len(texts))
+                payload = json.dumps(
+                    {
+                        "model": body["model"],
+                        "embeddings": [fake_embedding(t) for t in texts],
+                    }
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.server = ThreadingHTTPServer((host, 0), Handler)
+        self.host, self.port = self.server.server_address[:2]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def inputs_embedded(self) -> int:
+        return sum(len(r) for r in self.requests)